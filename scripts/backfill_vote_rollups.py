@@ -0,0 +1,41 @@
+"""
+Rebuild the vote rollup tables from the votes table.
+
+The rollups (vote_rollup_daily, vote_rollup_hourly) are kept up to date by
+the database's vote methods and backfilled once by the schema migration.
+Run this after editing votes by hand or with a script that bypasses those
+methods.
+
+Run with: python scripts/backfill_vote_rollups.py
+"""
+
+import os
+import sys
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# Load .env BEFORE importing config
+from dotenv import load_dotenv
+env_path = os.path.join(project_root, ".env")
+load_dotenv(env_path)
+
+from src.core.logger import logger
+from src.services.debates.database import DebatesDatabase
+
+
+def main() -> None:
+    db = DebatesDatabase()
+    try:
+        stats = db.rebuild_vote_rollups()
+        logger.tree("Vote Rollup Backfill Complete", [
+            ("Day/Author Rows", str(stats["day_rows"])),
+            ("Hour Rows", str(stats["hour_rows"])),
+        ], emoji="✅")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
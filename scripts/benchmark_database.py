@@ -0,0 +1,93 @@
+"""
+Micro-benchmark for the bot database connection layer.
+
+Compares the old open-a-connection-per-call pattern against the persistent
+per-thread connection now used by Database._get_conn, using the hot
+operations the scrapers and schedulers call on every cycle.
+
+Runs against a throwaway database in a temp directory; data/othman.db is
+never touched.
+
+Run with: python scripts/benchmark_database.py [iterations]
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import src.services.database.core as db_core
+from src.services.database import Database
+
+DEFAULT_ITERATIONS = 2000
+
+
+class PerCallDatabase(Database):
+    """Database with the previous connect-per-call _get_conn, for comparison."""
+
+    @contextmanager
+    def _get_conn(self):
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def run_operations(db: Database, iterations: int) -> dict:
+    """Time each hot operation; returns microseconds per call."""
+    operations = {
+        "record_metric": lambda i: db.record_metric("news", "fetch_ms", float(i)),
+        "mark_url_posted": lambda i: db.mark_url_posted("news", f"article-{i}"),
+        "is_url_posted": lambda i: db.is_url_posted("news", f"article-{i}"),
+        "set_ai_cache": lambda i: db.set_ai_cache("title", f"key-{i % 200}", "value"),
+        "get_ai_cache": lambda i: db.get_ai_cache("title", f"key-{i % 200}"),
+        "is_quarantined": lambda i: db.is_quarantined("news", f"article-{i}"),
+        "store_content_hash": lambda i: db.store_content_hash("news", f"article-{i % 300}", "text " * 50),
+    }
+
+    results = {}
+    for name, op in operations.items():
+        started = time.perf_counter()
+        for i in range(iterations):
+            op(i)
+        elapsed = time.perf_counter() - started
+        results[name] = elapsed / iterations * 1_000_000
+    return results
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Point the database module at the temp directory
+        db_core.DATA_DIR = Path(tmp)
+        db_core.DB_PATH = Path(tmp) / "benchmark.db"
+
+        before = run_operations(PerCallDatabase(), iterations)
+        after_db = Database()
+        after = run_operations(after_db, iterations)
+        stats = after_db.get_connection_stats()
+        after_db.close()
+
+    print(f"Iterations per operation: {iterations}")
+    print(f"{'Operation':<22}{'Per-call (us)':>15}{'Persistent (us)':>18}{'Speedup':>10}")
+    for name in before:
+        speedup = before[name] / after[name] if after[name] else 0.0
+        print(f"{name:<22}{before[name]:>15.1f}{after[name]:>18.1f}{speedup:>9.1f}x")
+    print(f"Connections opened: {stats['opened']}, reused: {stats['reused']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Visual diff of the Pillow karma card renderer against the Playwright one.
+
+Renders a set of sample cards through both backends, checks that the
+images have identical dimensions, and reports how far the pixels drift.
+A card fails if its mean difference or its share of visibly changed
+pixels is over the threshold. Side-by-side and diff images are written
+to a temp directory for review.
+
+Samples include Arabic, mixed-direction and emoji names. Chromium draws
+those with system fonts, so install Arabic and emoji fonts (e.g. Noto
+Sans Arabic and Noto Color Emoji) on the host and the matching files in
+assets/fonts for a like-for-like comparison.
+
+Needs Pillow and Playwright (with Chromium) installed. Cards are rendered
+without avatar or banner URLs, so no network access is required apart
+from the web font the HTML template loads.
+
+Run with: python scripts/compare_karma_cards.py [max_mean_diff] [max_changed_percent]
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PIL import Image, ImageChops
+
+from src.services.karma_card import _generate_html, _render_with_playwright
+from src.services.karma_card_image import render_karma_card_image, warm_up, CANVAS_SIZE
+from src.services.playwright_pool import cleanup
+
+# Mean absolute difference per channel (0-255) above which a card fails
+DEFAULT_MAX_MEAN_DIFF = 12.0
+
+# Percent of visibly changed pixels above which a card fails (catches a
+# wrong glyph or missing text that barely moves the mean)
+DEFAULT_MAX_CHANGED_PERCENT = 5.0
+
+SAMPLES = [
+    dict(display_name="Othman", username="othman", karma=0, rank=1,
+         upvotes=0, downvotes=0, status="online"),
+    dict(display_name="A Longer Display N...", username="someone_long", karma=57, rank=12,
+         upvotes=80, downvotes=23, status="idle"),
+    dict(display_name="Debater", username="debater", karma=640, rank=3,
+         upvotes=700, downvotes=60, status="dnd"),
+    dict(display_name="Legend", username="legend", karma=12450, rank=1,
+         upvotes=13000, downvotes=550, status="offline"),
+    dict(display_name="Negative", username="negative", karma=-42, rank=999,
+         upvotes=3, downvotes=45, status="streaming"),
+    dict(display_name="حَـــــنَّـــــا", username="hanna", karma=320, rank=5,
+         upvotes=400, downvotes=80, status="online"),
+    dict(display_name="عثمان بن عفان", username="arabic_name", karma=1500, rank=2,
+         upvotes=1600, downvotes=100, status="idle"),
+    dict(display_name="Ahmad أحمد", username="mixed_direction", karma=12, rank=40,
+         upvotes=20, downvotes=8, status="dnd"),
+    dict(display_name="🔥 Debate King 👑", username="emoji_name", karma=7, rank=88,
+         upvotes=10, downvotes=3, status="online"),
+    dict(display_name="سوريا 🇸🇾", username="arabic_emoji", karma=99, rank=21,
+         upvotes=120, downvotes=21, status="offline"),
+]
+
+
+def _compare(reference: Image.Image, candidate: Image.Image) -> tuple[float, float, Image.Image]:
+    """Mean absolute channel difference, percent of visibly changed pixels, diff image."""
+    diff = ImageChops.difference(reference, candidate)
+    histogram = diff.histogram()
+    channels = len(diff.getbands())
+    total = sum(i * count for band in range(channels)
+                for i, count in enumerate(histogram[band * 256:(band + 1) * 256]))
+    pixels = reference.width * reference.height
+    mean = total / (pixels * channels)
+
+    # A pixel counts as changed if any channel moved by more than 16
+    changed_mask = diff.convert("L").point(lambda v: 255 if v > 16 else 0)
+    changed = changed_mask.histogram()[255] / pixels * 100
+    return mean, changed, diff
+
+
+async def main(max_mean_diff: float, max_changed: float) -> int:
+    out_dir = tempfile.mkdtemp(prefix="karma_card_diff_")
+    warm_up()
+    failures = 0
+
+    print(f"{'Sample':<24} {'Size':>10} {'Mean diff':>10} {'Changed':>9}")
+    try:
+        for index, fields in enumerate(SAMPLES):
+            html = _generate_html(avatar_url=None, banner_url=None, **fields)
+            reference = Image.open(io.BytesIO(
+                await _render_with_playwright(html, fields["display_name"])
+            )).convert("RGBA")
+            candidate = Image.open(io.BytesIO(
+                render_karma_card_image(avatar_url=None, banner_url=None, **fields)
+            )).convert("RGBA")
+
+            if reference.size != candidate.size or candidate.size != CANVAS_SIZE:
+                print(f"{fields['username']:<24} size mismatch: "
+                      f"{reference.size} vs {candidate.size}")
+                failures += 1
+                continue
+
+            mean, changed, diff = _compare(reference, candidate)
+            status = "" if mean <= max_mean_diff and changed <= max_changed else "  FAIL"
+            failures += bool(status)
+            print(f"{fields['username']:<24} {'x'.join(map(str, candidate.size)):>10} "
+                  f"{mean:>10.2f} {changed:>8.1f}%{status}")
+
+            sheet = Image.new("RGBA", (candidate.width, candidate.height * 3), (0, 0, 0, 255))
+            sheet.paste(reference, (0, 0))
+            sheet.paste(candidate, (0, candidate.height))
+            sheet.paste(diff.convert("RGB").point(lambda v: min(255, v * 4)), (0, candidate.height * 2))
+            sheet.save(os.path.join(out_dir, f"{index:02d}_{fields['username']}.png"))
+    finally:
+        await cleanup()
+
+    print(f"\nReference / Pillow / diff (x4) sheets written to {out_dir}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    threshold = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_MEAN_DIFF
+    changed_threshold = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MAX_CHANGED_PERCENT
+    sys.exit(asyncio.run(main(threshold, changed_threshold)))
@@ -98,6 +98,7 @@ async def rebuild_karma(bot: commands.Bot) -> dict:
             cursor.execute("DELETE FROM votes")
             cursor.execute("UPDATE users SET total_karma = 0, upvotes_received = 0, downvotes_received = 0")
             conn.commit()
+        db.rebuild_vote_rollups()
         logger.tree("Database Cleared", [], emoji="✅")
     except Exception as e:
         logger.tree("Failed to Clear Database", [("Error", str(e))], emoji="❌")
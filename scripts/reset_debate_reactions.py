@@ -6,6 +6,9 @@ This script will:
 2. Add the bot's upvote emoji to each starter message
 3. Clear all votes from the database
 4. Reset all user karma to 0
+5. Rebuild the vote rollup tables the leaderboard and rank index read
+
+Restart the bot afterwards so its in-memory rank index reloads.
 
 Run with: python scripts/reset_debate_reactions.py
 
@@ -178,14 +181,17 @@ async def reset_debate_reactions(bot: commands.Bot) -> dict:
             cursor.execute("DELETE FROM votes")
 
             # Reset all user karma
-            cursor.execute("SELECT COUNT(*) FROM user_karma WHERE total_karma != 0")
+            cursor.execute("SELECT COUNT(*) FROM users WHERE total_karma != 0")
             karma_count = cursor.fetchone()[0]
             stats["karma_reset"] = karma_count
 
-            cursor.execute("UPDATE user_karma SET total_karma = 0, upvotes_received = 0, downvotes_received = 0")
+            cursor.execute("UPDATE users SET total_karma = 0, upvotes_received = 0, downvotes_received = 0")
 
             conn.commit()
 
+        # Votes were deleted behind the rollup write paths
+        db.rebuild_vote_rollups()
+
         logger.tree("Database Cleared", [
             ("Votes Deleted", str(stats["votes_cleared"])),
             ("Karma Reset", str(stats["karma_reset"])),
@@ -33,6 +33,7 @@ from src.core.config import (
 )
 from src.handlers.shutdown import shutdown_handler
 from src.services.debates import DebatesService, OpenDiscussionService
+from src.services.debates.embed_scheduler import AnalyticsEmbedScheduler
 from src.services.status_webhook import get_status_service
 from src.services.case_log import CaseLogService
 from src.services.ban_notifier import BanNotifier
@@ -141,6 +142,7 @@ class OthmanBot(commands.Bot):
         self.soccer_scraper = None    # SoccerScraper - fetches Kooora soccer news
         self.content_rotation_scheduler = None  # Rotates content hourly
         self.debates_service = None   # Karma tracking and debate management
+        self.analytics_embed_scheduler = None  # Coalesces analytics embed edits
         self.open_discussion = None   # Open Discussion service (casual chat, no karma)
         self.stats_api = None         # Stats API for dashboard
 
@@ -206,6 +208,12 @@ class OthmanBot(commands.Bot):
         # Initialize debates service
         self.debates_service = DebatesService()
 
+        # Initialize analytics embed scheduler (worker starts on first update)
+        from src.handlers.debates_modules.analytics import update_analytics_embed
+        self.analytics_embed_scheduler = AnalyticsEmbedScheduler(
+            lambda thread: update_analytics_embed(self, thread, force=True)
+        )
+
         # Initialize open discussion service (casual chat, no karma tracking)
         self.open_discussion = OpenDiscussionService(self, self.debates_service.db)
 
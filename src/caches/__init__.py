@@ -10,10 +10,16 @@ Server: discord.gg/syria
 
 from src.caches.ban_evasion import BanEvasionAlertCache, ban_evasion_cache
 from src.caches.analytics_throttle import AnalyticsThrottleCache, analytics_throttle_cache
+from src.caches.card_image import CardImageCache, card_image_cache
+from src.caches.feed import FeedCache, feed_cache
 
 __all__ = [
     "BanEvasionAlertCache",
     "ban_evasion_cache",
     "AnalyticsThrottleCache",
     "analytics_throttle_cache",
+    "CardImageCache",
+    "card_image_cache",
+    "FeedCache",
+    "feed_cache",
 ]
@@ -0,0 +1,234 @@
+"""
+OthmanBot - Card Image Cache
+============================
+
+Content-addressed LRU cache for rendered karma cards, kept in memory
+for the hottest entries and on disk for the rest so it survives restarts.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from src.core.logger import logger
+from src.core.config import (
+    KARMA_CARD_CACHE_DIR,
+    KARMA_CARD_CACHE_MAX_ENTRIES,
+    KARMA_CARD_MEMORY_CACHE_ENTRIES,
+)
+
+
+# =============================================================================
+# Card Image Cache
+# =============================================================================
+
+class CardImageCache:
+    """
+    Two-tier LRU of rendered card images keyed by a hash of their inputs.
+
+    DESIGN: The old cache was a dict keyed on a tuple of card fields with
+    a 30 second TTL that was cleared wholesale past 100 entries, so a
+    restart or a busy minute threw every card away. Here the key is the
+    SHA-256 of everything that affects the pixels (callers hash the
+    rendered template), so an entry can never go stale and needs no TTL:
+    a changed karma, name, avatar or template simply hashes to a new key.
+
+    Files live under KARMA_CARD_CACHE_DIR as <key>.png. The LRU order is
+    rebuilt from file mtimes on first use and hits touch the file, so
+    recency survives restarts. A small in-memory tier serves repeat hits
+    without disk reads. All disk I/O runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        directory: Path = KARMA_CARD_CACHE_DIR,
+        max_entries: int = KARMA_CARD_CACHE_MAX_ENTRIES,
+        memory_entries: int = KARMA_CARD_MEMORY_CACHE_ENTRIES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Folder holding cached images
+            max_entries: Images kept on disk (least recently used evicted)
+            memory_entries: Images also kept in memory
+        """
+        self._dir = Path(directory)
+        self._max_entries = max(1, max_entries)
+        self._memory_entries = max(0, memory_entries)
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        # Metrics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the visual inputs of a card into a cache key."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached image bytes, or None on a miss."""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            if key in self._index:
+                self._index.move_to_end(key)
+            self.memory_hits += 1
+            return data
+
+        await self._ensure_loaded()
+        if key not in self._index:
+            self.misses += 1
+            return None
+
+        try:
+            data = await asyncio.to_thread(self._read, self._path(key))
+        except OSError:
+            self._index.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._index.move_to_end(key)
+        self._remember(key, data)
+        self.disk_hits += 1
+        return data
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store an image and evict the least recently used beyond capacity."""
+        await self._ensure_loaded()
+        self._remember(key, data)
+        self._index[key] = len(data)
+        self._index.move_to_end(key)
+
+        evicted = []
+        while len(self._index) > self._max_entries:
+            old_key, _ = self._index.popitem(last=False)
+            self._memory.pop(old_key, None)
+            evicted.append(self._path(old_key))
+        self.evictions += len(evicted)
+
+        try:
+            await asyncio.to_thread(self._write, self._path(key), data, evicted)
+        except OSError as e:
+            logger.warning("Card Image Cache Write Failed", [
+                ("Error", str(e)[:100]),
+            ])
+
+    def get_stats(self) -> dict:
+        """Tier sizes and hit/miss counters."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "entries": len(self._index),
+            "memory_entries": len(self._memory),
+            "disk_bytes": sum(self._index.values()),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        """File holding one cached image."""
+        return self._dir / f"{key}.png"
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Keep an image in the memory tier."""
+        if not self._memory_entries:
+            return
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _ensure_loaded(self) -> None:
+        """Rebuild the LRU index from the cache directory once."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                entries = await asyncio.to_thread(self._scan)
+            except OSError as e:
+                logger.warning("Card Image Cache Scan Failed", [
+                    ("Error", str(e)[:100]),
+                ])
+                entries = []
+            for key, size in entries:
+                self._index[key] = size
+            self._loaded = True
+            logger.debug("Card Image Cache Loaded", [
+                ("Entries", str(len(self._index))),
+                ("Directory", str(self._dir)),
+            ])
+
+    def _scan(self) -> list[tuple[str, int]]:
+        """List cached images, least recently used first."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        files = []
+        for entry in os.scandir(self._dir):
+            if entry.is_file() and entry.name.endswith(".png"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        files.sort()
+        return [(key, size) for _, key, size in files]
+
+    @staticmethod
+    def _read(path: Path) -> bytes:
+        """Read an image and mark it recently used."""
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+
+    def _write(self, path: Path, data: bytes, evicted: list[Path]) -> None:
+        """Write an image atomically and delete evicted ones."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        for old in evicted:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# =============================================================================
+# Module-level Instance
+# =============================================================================
+
+# Singleton instance (index loaded lazily on first lookup)
+card_image_cache = CardImageCache()
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["CardImageCache", "card_image_cache"]
@@ -0,0 +1,196 @@
+"""
+OthmanBot - RSS Feed Cache
+==========================
+
+Conditional-GET cache for RSS feeds. Keeps the ETag/Last-Modified
+validators and the parsed feed per URL, so an unchanged feed costs a
+header round trip instead of a download and a parse.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+import feedparser
+
+from src.core.logger import logger
+from src.core.config import SCRAPER_FEED_TIMEOUT, FEED_CACHE_FRESH_SECONDS
+
+
+# =============================================================================
+# Cached Feed
+# =============================================================================
+
+@dataclass
+class _CachedFeed:
+    """Validators and parsed entries of the last full download of a feed."""
+    feed: feedparser.FeedParserDict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+    checked_at: float
+
+
+# =============================================================================
+# Feed Cache
+# =============================================================================
+
+class FeedCache:
+    """
+    Per-URL cache of parsed RSS feeds revalidated with conditional GETs.
+
+    DESIGN: Every rotation tick downloaded and re-parsed the full feed, and
+    the rotation scheduler's content check downloaded it again minutes
+    before the post itself did. Here each URL keeps the validators and the
+    parsed feed from its last 200 response. Later fetches send
+    If-None-Match / If-Modified-Since; a 304 returns the cached feed
+    without reading or parsing a body.
+
+    A feed revalidated within fresh_seconds is served without any request,
+    which covers the check-then-post pair on one tick. Fetches of the same
+    URL are serialized so concurrent callers share one request. Servers
+    that send no validators are simply re-downloaded each time.
+    """
+
+    def __init__(
+        self,
+        fresh_seconds: float = FEED_CACHE_FRESH_SECONDS,
+        timeout: float = SCRAPER_FEED_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the feed cache.
+
+        Args:
+            fresh_seconds: Seconds a revalidated feed is reused without a request
+            timeout: Seconds to wait for a feed download
+        """
+        self._fresh_seconds = fresh_seconds
+        self._timeout = timeout
+        self._feeds: dict[str, _CachedFeed] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+        # Metrics
+        self.hits = 0
+        self.fresh_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_downloaded = 0
+        self.bytes_saved = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+    ) -> tuple[feedparser.FeedParserDict, bool]:
+        """
+        Get a parsed feed, revalidating the cached copy when there is one.
+
+        Args:
+            session: Shared HTTP session of the calling scraper
+            url: RSS feed URL
+
+        Returns:
+            Tuple of (parsed feed, True if served from cache)
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: Download failed and
+            no cached copy exists
+        """
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            cached = self._feeds.get(url)
+            now = time.monotonic()
+
+            if cached is not None and now - cached.checked_at < self._fresh_seconds:
+                self.fresh_hits += 1
+                self.bytes_saved += cached.size
+                return (cached.feed, True)
+
+            headers: dict[str, str] = {}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+            try:
+                timeout = aiohttp.ClientTimeout(total=self._timeout)
+                async with session.get(url, headers=headers, timeout=timeout) as response:
+                    if response.status == 304 and cached is not None:
+                        cached.checked_at = now
+                        self.hits += 1
+                        self.bytes_saved += cached.size
+                        logger.debug("Feed Not Modified", [
+                            ("URL", url[:60]),
+                            ("Saved", f"{cached.size // 1024} KB"),
+                        ])
+                        return (cached.feed, True)
+
+                    response.raise_for_status()
+                    body = await response.read()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.errors += 1
+                if cached is None:
+                    raise
+                # Serve the last good copy rather than skip the tick
+                logger.warning("Feed Fetch Failed - Using Cached Copy", [
+                    ("URL", url[:60]),
+                    ("Error", str(e)[:100]),
+                ])
+                return (cached.feed, True)
+
+            feed = await asyncio.to_thread(feedparser.parse, body)
+            self.misses += 1
+            self.bytes_downloaded += len(body)
+            self._feeds[url] = _CachedFeed(
+                feed=feed,
+                etag=etag,
+                last_modified=last_modified,
+                size=len(body),
+                checked_at=now,
+            )
+            return (feed, False)
+
+    def invalidate(self, url: str) -> None:
+        """Forget a feed so the next fetch downloads it in full."""
+        self._feeds.pop(url, None)
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters and bytes saved."""
+        lookups = self.hits + self.fresh_hits + self.misses
+        return {
+            "feeds": len(self._feeds),
+            "hits": self.hits,
+            "fresh_hits": self.fresh_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round((self.hits + self.fresh_hits) / lookups, 3) if lookups else 0.0,
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+# =============================================================================
+# Module-level Instance
+# =============================================================================
+
+# Singleton instance shared by all scrapers
+feed_cache = FeedCache()
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["FeedCache", "feed_cache"]
@@ -21,12 +21,8 @@ from discord.ext import commands
 
 from src.core.logger import logger
 from src.core.config import (
-    DEBATES_FORUM_ID, NY_TZ, BATCH_PROCESSING_DELAY, REACTION_DELAY,
-    DISCORD_API_DELAY, DISCORD_AUTOCOMPLETE_LIMIT, has_debates_management_role, EmbedColors
+    DEBATES_FORUM_ID, NY_TZ, DISCORD_AUTOCOMPLETE_LIMIT, has_debates_management_role, EmbedColors
 )
-from src.core.colors import EmbedIcons
-from src.utils.discord_rate_limit import log_http_error
-from src.utils import remove_reaction_safe
 from src.utils.footer import set_footer
 from src.utils.duration import parse_duration_timedelta as parse_duration, format_duration_timedelta as format_duration
 from src.utils.autocomplete import thread_id_autocomplete, duration_autocomplete
@@ -185,6 +181,7 @@ class DisallowCog(commands.Cog):
             user.id,
             target_thread_id,
             interaction.user.id,
+            reason,
             expires_at_str
         )
 
@@ -295,141 +292,34 @@ class DisallowCog(commands.Cog):
         user: discord.Member,
         target_thread_id: int | None
     ) -> None:
-        """Remove user's reactions from debate threads in background.
+        """Queue removal of the user's participation reactions as a background job.
 
-        DESIGN: Always fetches threads via API to avoid cache issues.
-        - For specific thread: Fetch directly by ID
-        - For all threads: Use database as source of truth, fetch each via API
+        DESIGN: The moderation job runner targets only the threads the user
+        is recorded as having reacted in, removes the reactions in parallel
+        under a shared rate-limit budget, and resumes after a restart.
         """
-        reactions_removed = 0
-        threads_to_process: list[discord.Thread] = []
-
-        try:
-            # Get thread IDs to process
-            if target_thread_id:
-                # Single thread - fetch directly via API (never rely on cache)
-                thread_ids = [target_thread_id]
-            else:
-                # All threads - use database as source of truth
-                if not hasattr(self.bot, 'debates_service') or not self.bot.debates_service:
-                    logger.warning("Debates Service Not Available For Reaction Cleanup", [
-                        ("Action", "Skipping cleanup"),
-                    ])
-                    return
-                thread_ids = await asyncio.to_thread(self.bot.debates_service.db.get_all_debate_thread_ids)
-
-            logger.info("Reaction Cleanup Starting", [
+        runner = getattr(self.bot, 'moderation_jobs', None)
+        if runner is None:
+            logger.warning("Moderation Job Runner Not Available For Reaction Cleanup", [
                 ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
-                ("Thread IDs To Fetch", str(len(thread_ids))),
-            ])
-
-            # Fetch each thread via API (guarantees fresh data)
-            for thread_id in thread_ids:
-                try:
-                    thread = await self.bot.fetch_channel(thread_id)
-                    if thread and isinstance(thread, discord.Thread):
-                        threads_to_process.append(thread)
-                except discord.NotFound:
-                    # Thread was deleted
-                    logger.debug("Thread Not Found (Deleted)", [
-                        ("Thread ID", str(thread_id)),
-                    ])
-                except discord.HTTPException as e:
-                    log_http_error(e, "Fetch Thread For Cleanup", [
-                        ("Thread ID", str(thread_id)),
-                        ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
-                    ])
-                # Small delay between fetches to avoid rate limits
-                await asyncio.sleep(BATCH_PROCESSING_DELAY)
-
-            logger.info("Threads Fetched For Cleanup", [
-                ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
-                ("Threads Found", str(len(threads_to_process))),
+                ("ID", str(user.id)),
+                ("Action", "Skipping cleanup"),
             ])
+            return
 
-            # Remove only the green checkmark (✅) reaction from the analytics embed
-            # The analytics embed is the pinned message with rules - NOT the starter message
-            for thread in threads_to_process:
-                try:
-                    # Get the analytics message ID from database
-                    analytics_msg_id = await self.bot.debates_service.db.get_analytics_message_async(thread.id)
-
-                    if not analytics_msg_id:
-                        logger.debug("No Analytics Message Found", [
-                            ("Thread ID", str(thread.id)),
-                        ])
-                        continue
-
-                    # Fetch the analytics message
-                    try:
-                        analytics_message = await thread.fetch_message(analytics_msg_id)
-                    except discord.NotFound:
-                        logger.debug("Analytics Message Not Found", [
-                            ("Message ID", str(analytics_msg_id)),
-                            ("Thread ID", str(thread.id)),
-                        ])
-                        continue
-
-                    # Log all reactions on this message for debugging
-                    reaction_summary = [(str(r.emoji), r.count) for r in analytics_message.reactions]
-                    logger.info("Checking Analytics Message For Reactions", [
-                        ("Thread", thread.name[:30]),
-                        ("Analytics Msg ID", str(analytics_msg_id)),
-                        ("Reactions", str(reaction_summary)),
-                    ])
-
-                    for reaction in analytics_message.reactions:
-                        # Only remove the verify/participate reaction
-                        emoji_str = str(reaction.emoji)
-                        if emoji_str == EmbedIcons.PARTICIPATE:
-                            # Check if user has this reaction by fetching users
-                            user_has_reaction = False
-                            async for reaction_user in reaction.users():
-                                if reaction_user.id == user.id:
-                                    user_has_reaction = True
-                                    break
-
-                            if user_has_reaction:
-                                success = await remove_reaction_safe(reaction, user)
-                                if success:
-                                    reactions_removed += 1
-                                    logger.info("Removed Checkmark Reaction", [
-                                        ("Thread", thread.name[:30]),
-                                        ("Thread ID", str(thread.id)),
-                                        ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
-                                    ])
-                                else:
-                                    logger.warning("Failed To Remove Checkmark Reaction", [
-                                        ("Thread", thread.name[:30]),
-                                        ("Thread ID", str(thread.id)),
-                                    ])
-                            await asyncio.sleep(REACTION_DELAY)  # Rate limit delay
-                except discord.NotFound:
-                    logger.debug("Message Not Found During Reaction Cleanup", [
-                        ("Thread ID", str(thread.id)),
-                    ])
-                except discord.HTTPException as e:
-                    log_http_error(e, "Process Thread Reactions", [
-                        ("Thread", thread.name[:30]),
-                        ("Thread ID", str(thread.id)),
-                    ])
-                await asyncio.sleep(DISCORD_API_DELAY)  # Delay between threads
-
-            logger.info("Ban Reactions Cleanup Complete", [
+        try:
+            job = await runner.submit_reaction_cleanup(user.id, target_thread_id)
+            logger.info("Reaction Cleanup Queued", [
                 ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
-                ("Threads Processed", str(len(threads_to_process))),
-                ("Reactions Removed", str(reactions_removed)),
+                ("ID", str(user.id)),
+                ("Job ID", str(job["id"])),
+                ("Threads Targeted", str(len({item["thread_id"] for item in job["items"]}))),
+                ("Embeds Targeted", str(len(job["items"]))),
             ])
-
         except Exception as e:
-            logger.error("Failed To Remove Reactions For Banned User", [
+            logger.error("Failed To Queue Reaction Cleanup For Banned User", [
                 ("User", f"{user.name} ({user.display_name})"),
-                    ("ID", str(user.id)),
+                ("ID", str(user.id)),
                 ("Error", str(e)),
             ])
 
@@ -11,6 +11,7 @@ Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
+import asyncio
 import io
 from typing import TYPE_CHECKING
 
@@ -22,7 +23,7 @@ from src.core.logger import logger
 from src.core.config import EmbedColors
 from src.core.emojis import LEADERBOARD_EMOJI
 from src.utils.footer import set_footer
-from src.services.karma_card import generate_karma_card
+from src.services.karma_card import generate_karma_card, prewarm_karma_renderer
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -83,8 +84,14 @@ class KarmaCog(commands.Cog):
             return
 
         target = user or interaction.user
-        karma_data = self.bot.debates_service.get_karma(target.id)
-        rank = self.bot.debates_service.get_rank(target.id)
+        # Both reads run off-loop on reader connections, concurrently,
+        # while the card renderer warms up (no-op if already warm)
+        db = self.bot.debates_service.db
+        karma_data, rank, _ = await asyncio.gather(
+            db.get_user_karma_async(target.id),
+            db.get_user_rank_async(target.id),
+            prewarm_karma_renderer(),
+        )
 
         # Get member status - always fetch from guild cache for latest presence data
         member = interaction.guild.get_member(target.id) if interaction.guild else None
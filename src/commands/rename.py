@@ -39,7 +39,7 @@ from src.utils import (
 )
 from src.handlers.debates import get_next_debate_number
 from src.services.debates.tags import detect_debate_tags
-from src.services.debates.analytics import calculate_debate_analytics, generate_analytics_embed
+from src.services.debates.analytics import generate_analytics_embed
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -318,7 +318,7 @@ class RenameCog(commands.Cog):
             if hasattr(self.bot, 'debates_service') and self.bot.debates_service is not None:
                 try:
                     # Calculate initial analytics
-                    analytics = await calculate_debate_analytics(thread, self.bot.debates_service.db)
+                    analytics = await self.bot.debates_service.analytics.calculate(thread)
 
                     # Generate and send analytics embed
                     embed = await generate_analytics_embed(self.bot, analytics)
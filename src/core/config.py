@@ -57,6 +57,17 @@ def _env_int(key: str, default: int = 0) -> int:
         return default
 
 
+def _env_float(key: str, default: float = 0.0) -> float:
+    """Get environment variable as float with default."""
+    value = os.getenv(key)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def _env_int_required(key: str) -> int:
     """Get required environment variable as int. Raises if not set."""
     value = os.getenv(key)
@@ -291,6 +302,8 @@ BASE_COMMAND_COUNT: int = 239
 
 AI_CACHE_MAX_ENTRIES: int = 5000
 CACHE_CLEANUP_RATIO: float = 0.8
+AI_CACHE_MEMORY_ENTRIES: int = 500  # Hot AI responses kept in memory in front of SQLite
+AI_CACHE_CLEANUP_INTERVAL: int = 6 * 3600  # Seconds between expiry/size sweeps of ai_cache
 
 
 # =============================================================================
@@ -316,6 +329,148 @@ from src.core.emojis import VERIFY_EMOJI as OPEN_DISCUSSION_ACKNOWLEDGMENT_EMOJI
 ANALYTICS_UPDATE_COOLDOWN: int = _env_int("ANALYTICS_UPDATE_COOLDOWN", 60)
 ANALYTICS_CACHE_MAX_SIZE: int = _env_int("ANALYTICS_CACHE_MAX_SIZE", 100)
 ANALYTICS_CACHE_CLEANUP_AGE: int = _env_int("ANALYTICS_CACHE_CLEANUP_AGE", 3600)
+ANALYTICS_EMBED_EDITS_PER_MINUTE: int = _env_int("ANALYTICS_EMBED_EDITS_PER_MINUTE", 30)  # Global edit budget
+ANALYTICS_EMBED_BURST: int = 5          # Edits allowed back-to-back before the budget paces them
+ANALYTICS_EMBED_MAX_LAG: int = 300      # Seconds a dirty thread may wait before it jumps the queue
+ANALYTICS_EMBED_MAX_BACKOFF: int = 900  # Cap on the retry delay of a thread whose flushes keep failing
+ANALYTICS_EMBED_SHUTDOWN_BUDGET: float = 3.0  # Seconds shutdown spends flushing dirty embeds
+
+
+# =============================================================================
+# Vote Ingestion
+# =============================================================================
+
+VOTE_BATCH_WINDOW: float = _env_float("VOTE_BATCH_WINDOW", 0.25)  # Seconds to collect votes after the first arrives
+VOTE_BATCH_MAX_SIZE: int = _env_int("VOTE_BATCH_MAX_SIZE", 500)  # Flush early once this many events are queued
+VOTE_BATCH_MAX_RETRIES: int = _env_int("VOTE_BATCH_MAX_RETRIES", 3)  # Attempts per batch on database lock errors
+
+
+# =============================================================================
+# Participation Buffer
+# =============================================================================
+
+PARTICIPATION_FLUSH_INTERVAL: float = _env_float("PARTICIPATION_FLUSH_INTERVAL", 10.0)  # Seconds between flushes
+PARTICIPATION_FLUSH_MAX_PENDING: int = _env_int("PARTICIPATION_FLUSH_MAX_PENDING", 1000)  # Flush early once this many messages are buffered
+
+
+# =============================================================================
+# Database Connection Pool
+# =============================================================================
+
+DB_READ_POOL_SIZE: int = _env_int("DB_READ_POOL_SIZE", 4)
+DB_READ_POOL_TIMEOUT: float = 10.0
+
+
+# =============================================================================
+# Leaderboard Rankings
+# =============================================================================
+
+RANK_SNAPSHOT_RETENTION_DAYS: int = 35  # Daily rank snapshots kept for week-over-week deltas
+
+
+# =============================================================================
+# Content Similarity
+# =============================================================================
+
+CONTENT_SIMILARITY_WINDOW: int = _env_int("CONTENT_SIMILARITY_WINDOW", 50)  # Recent articles compared per type
+CONTENT_SIMILARITY_MODE: str = _env("CONTENT_SIMILARITY_MODE", "exact")  # "exact" or "lsh" (MinHash candidates)
+MINHASH_PERMUTATIONS: int = 60
+LSH_BANDS: int = 20  # Must divide MINHASH_PERMUTATIONS
+
+
+# =============================================================================
+# Karma Reconciliation
+# =============================================================================
+
+RECONCILE_CHECKPOINT_MAX_AGE_HOURS: int = 24  # Older watermarks force a full thread rescan
+
+
+# =============================================================================
+# Forum Scanning
+# =============================================================================
+
+FORUM_SCAN_CONCURRENCY: int = _env_int("FORUM_SCAN_CONCURRENCY", 4)  # Threads processed in parallel by maintenance jobs
+FORUM_SCAN_MAX_RETRIES: int = 3  # Retries per thread after a 429
+FORUM_SCAN_RATE_LIMIT_DELAY: float = 5.0  # Backoff when a 429 carries no retry_after
+
+
+# =============================================================================
+# Participation Gate
+# =============================================================================
+
+PARTICIPATION_GATE_MAX_THREADS: int = 500  # Threads whose participant sets stay in memory
+
+
+# =============================================================================
+# Moderation Jobs
+# =============================================================================
+
+MODERATION_JOB_CONCURRENCY: int = _env_int("MODERATION_JOB_CONCURRENCY", 4)  # Threads a cleanup job works on in parallel
+MODERATION_JOB_RETENTION_DAYS: int = 30  # Finished jobs kept for inspection
+
+
+# =============================================================================
+# Message Mirror
+# =============================================================================
+
+MESSAGE_MIRROR_HISTORY_LIMIT: int = 1000  # Messages read per thread when syncing the mirror
+MESSAGE_MIRROR_CATCHUP_DAYS: int = 7  # Startup replays threads active within this many days
+
+
+# =============================================================================
+# Analytics Engine
+# =============================================================================
+
+ANALYTICS_ENGINE_MAX_THREADS: int = 200  # Threads whose analytics accumulators stay in memory
+
+
+# =============================================================================
+# Karma Card Rendering
+# =============================================================================
+
+KARMA_CARD_RENDER_CONCURRENCY: int = _env_int("KARMA_CARD_RENDER_CONCURRENCY", 2)  # Renders in flight at once
+KARMA_CARD_PAGE_POOL_SIZE: int = _env_int("KARMA_CARD_PAGE_POOL_SIZE", 2)  # Idle pages kept open for reuse
+KARMA_CARD_IDLE_TIMEOUT: int = 120  # Seconds idle before the browser closes (low demand)
+KARMA_CARD_WARM_WINDOW: int = 900  # Seconds of /karma demand considered for keep-warm
+KARMA_CARD_WARM_MIN_REQUESTS: int = 3  # Requests within the window that keep the browser warm
+KARMA_CARD_RESTART_AFTER_RENDERS: int = 200  # Browser recycled after this many renders (memory)
+KARMA_CARD_CACHE_DIR = DATA_DIR / "card_cache"
+KARMA_CARD_CACHE_MAX_ENTRIES: int = 500  # Rendered cards kept on disk (LRU)
+KARMA_CARD_MEMORY_CACHE_ENTRIES: int = 32  # Rendered cards also kept in memory
+KARMA_CARD_ASSET_CACHE_ENTRIES: int = 256  # Avatar/banner data URIs kept in memory
+KARMA_CARD_ASSET_TIMEOUT: int = 5  # Seconds to fetch an avatar or banner
+KARMA_CARD_LATENCY_SAMPLES: int = 500  # Recent latencies kept for p50/p99
+KARMA_CARD_RENDERER: str = _env("KARMA_CARD_RENDERER", "playwright").lower()  # "playwright" or "pillow"
+KARMA_CARD_FONT_DIR = ROOT_DIR / "assets" / "fonts"  # Inter-*.ttf plus Arabic/emoji fallbacks for the pillow renderer
+
+
+# =============================================================================
+# Scraper Pipeline
+# =============================================================================
+
+SCRAPER_EXTRACT_CONCURRENCY: int = _env_int("SCRAPER_EXTRACT_CONCURRENCY", 5)  # Article pages fetched at once
+SCRAPER_EXTRACT_LOOKAHEAD: int = 8  # Entries extracted ahead of the one being screened
+SCRAPER_AI_CONCURRENCY: int = _env_int("SCRAPER_AI_CONCURRENCY", 3)  # Articles enriched by AI at once
+SCRAPER_FEED_TIMEOUT: int = 15  # Seconds to download an RSS feed
+FEED_CACHE_FRESH_SECONDS: int = 60  # Revalidated feeds reused without a request for this long
+SCRAPER_HANDOFF_TTL: int = 600  # Seconds an article prepared by the rotation check stays postable
+
+
+# =============================================================================
+# LLM Gateway
+# =============================================================================
+
+LLM_MODEL: str = _env("LLM_MODEL", "gpt-4o-mini")  # Default chat model for all AI features
+LLM_MAX_CONCURRENCY: int = _env_int("LLM_MAX_CONCURRENCY", 4)  # OpenAI requests in flight at once
+LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Calls failing all retries in a row before the circuit opens
+LLM_CIRCUIT_RECOVERY_SECONDS: float = 60.0  # Seconds the circuit stays open before a probe call
+
+
+# =============================================================================
+# Ban Expiry
+# =============================================================================
+
+BAN_EXPIRY_MAX_SLEEP: float = 3600.0  # Longest the expiry timer sleeps before re-checking the table
 
 
 # =============================================================================
@@ -559,6 +714,8 @@ __all__ = [
     # Cache Constants
     "AI_CACHE_MAX_ENTRIES",
     "CACHE_CLEANUP_RATIO",
+    "AI_CACHE_MEMORY_ENTRIES",
+    "AI_CACHE_CLEANUP_INTERVAL",
     # Debate Content Rules
     "MIN_MESSAGE_LENGTH",
     "MIN_MESSAGE_LENGTH_ARABIC",
@@ -566,6 +723,73 @@ __all__ = [
     "ANALYTICS_UPDATE_COOLDOWN",
     "ANALYTICS_CACHE_MAX_SIZE",
     "ANALYTICS_CACHE_CLEANUP_AGE",
+    "ANALYTICS_EMBED_EDITS_PER_MINUTE",
+    "ANALYTICS_EMBED_BURST",
+    "ANALYTICS_EMBED_MAX_LAG",
+    "ANALYTICS_EMBED_MAX_BACKOFF",
+    "ANALYTICS_EMBED_SHUTDOWN_BUDGET",
+    # Vote Ingestion
+    "VOTE_BATCH_WINDOW",
+    "VOTE_BATCH_MAX_SIZE",
+    "VOTE_BATCH_MAX_RETRIES",
+    # Participation Buffer
+    "PARTICIPATION_FLUSH_INTERVAL",
+    "PARTICIPATION_FLUSH_MAX_PENDING",
+    # Database Connection Pool
+    "DB_READ_POOL_SIZE",
+    "DB_READ_POOL_TIMEOUT",
+    # Leaderboard Rankings
+    "RANK_SNAPSHOT_RETENTION_DAYS",
+    # Content Similarity
+    "CONTENT_SIMILARITY_WINDOW",
+    "CONTENT_SIMILARITY_MODE",
+    "MINHASH_PERMUTATIONS",
+    "LSH_BANDS",
+    # Karma Reconciliation
+    "RECONCILE_CHECKPOINT_MAX_AGE_HOURS",
+    # Forum Scanning
+    "FORUM_SCAN_CONCURRENCY",
+    "FORUM_SCAN_MAX_RETRIES",
+    "FORUM_SCAN_RATE_LIMIT_DELAY",
+    # Participation Gate
+    "PARTICIPATION_GATE_MAX_THREADS",
+    # Moderation Jobs
+    "MODERATION_JOB_CONCURRENCY",
+    "MODERATION_JOB_RETENTION_DAYS",
+    # Message Mirror
+    "MESSAGE_MIRROR_HISTORY_LIMIT",
+    "MESSAGE_MIRROR_CATCHUP_DAYS",
+    # Analytics Engine
+    "ANALYTICS_ENGINE_MAX_THREADS",
+    # Karma Card Rendering
+    "KARMA_CARD_RENDER_CONCURRENCY",
+    "KARMA_CARD_PAGE_POOL_SIZE",
+    "KARMA_CARD_IDLE_TIMEOUT",
+    "KARMA_CARD_WARM_WINDOW",
+    "KARMA_CARD_WARM_MIN_REQUESTS",
+    "KARMA_CARD_RESTART_AFTER_RENDERS",
+    "KARMA_CARD_CACHE_DIR",
+    "KARMA_CARD_CACHE_MAX_ENTRIES",
+    "KARMA_CARD_MEMORY_CACHE_ENTRIES",
+    "KARMA_CARD_ASSET_CACHE_ENTRIES",
+    "KARMA_CARD_ASSET_TIMEOUT",
+    "KARMA_CARD_LATENCY_SAMPLES",
+    "KARMA_CARD_RENDERER",
+    "KARMA_CARD_FONT_DIR",
+    # Scraper Pipeline
+    "SCRAPER_EXTRACT_CONCURRENCY",
+    "SCRAPER_EXTRACT_LOOKAHEAD",
+    "SCRAPER_AI_CONCURRENCY",
+    "SCRAPER_FEED_TIMEOUT",
+    "FEED_CACHE_FRESH_SECONDS",
+    "SCRAPER_HANDOFF_TTL",
+    # LLM Gateway
+    "LLM_MODEL",
+    "LLM_MAX_CONCURRENCY",
+    "LLM_CIRCUIT_FAILURE_THRESHOLD",
+    "LLM_CIRCUIT_RECOVERY_SECONDS",
+    # Ban Expiry
+    "BAN_EXPIRY_MAX_SLEEP",
     # Backwards compatibility exports
     "SYRIA_GUILD_ID",
     "MODS_GUILD_ID",
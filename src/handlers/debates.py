@@ -37,10 +37,7 @@ from src.utils import (
     send_webhook_alert_safe,
 )
 from src.utils.discord_rate_limit import log_http_error
-from src.services.debates.analytics import (
-    calculate_debate_analytics,
-    generate_analytics_embed,
-)
+from src.services.debates.analytics import generate_analytics_embed
 from src.services.debates.tags import detect_debate_tags, is_religion_debate
 
 # Import from sub-modules
@@ -57,8 +54,17 @@ from src.handlers.debates_modules.access_control import (
 from src.handlers.debates_modules.reactions import (
     on_debate_reaction_add,
     on_debate_reaction_remove,
+    on_participation_reaction,
     is_debates_forum_message,
 )
+from src.handlers.debates_modules.mirror import (
+    on_mirror_message,
+    on_mirror_message_edit,
+    on_mirror_message_delete,
+    on_mirror_bulk_delete,
+    on_mirror_reaction,
+    on_mirror_reaction_clear,
+)
 from src.handlers.debates_modules.member_lifecycle import (
     on_member_remove_handler,
     on_member_join_handler,
@@ -133,18 +139,14 @@ async def on_message_handler(bot: "OthmanBot", message: discord.Message) -> None
     # Track participation ALWAYS
     if hasattr(bot, 'debates_service') and bot.debates_service is not None:
         try:
-            await bot.debates_service.db.increment_participation_async(
-                message.channel.id, message.author.id
-            )
-            await bot.debates_service.db.update_user_streak_async(message.author.id)
+            # Buffered and journaled; written in periodic batches
+            bot.debates_service.participation.record(message.channel.id, message.author.id)
         except sqlite3.Error as e:
             logger.warning("📊 Failed To Track Participation (DB Error)", [("Error", str(e))])
             await send_webhook_alert_safe(
                 bot, "Database Error - Participation Tracking",
                 f"User: {message.author.id}, Thread: {message.channel.id}, Error: {str(e)}"
             )
-        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
-            logger.warning("📊 Failed To Track Participation (Async Error)", [("Error", str(e))])
 
     if bot_disabled:
         return
@@ -376,7 +378,7 @@ async def on_thread_create_handler(bot: "OthmanBot", thread: discord.Thread) ->
         # Post analytics embed
         if hasattr(bot, 'debates_service') and bot.debates_service is not None:
             try:
-                analytics = await calculate_debate_analytics(thread, bot.debates_service.db)
+                analytics = await bot.debates_service.analytics.calculate(thread)
                 embed = await generate_analytics_embed(bot, analytics)
                 analytics_message = await send_message_with_retry(thread, embed=embed)
 
@@ -443,12 +445,26 @@ class DebatesHandler(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        """Route message events to the debates handler."""
+        """Route message events to the message mirror and debates handler."""
+        await on_mirror_message(self.bot, message)
         await on_message_handler(self.bot, message)
 
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """Route raw message edit events (message mirror)."""
+        await on_mirror_message_edit(self.bot, payload)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """Route raw bulk delete events (message mirror)."""
+        await on_mirror_bulk_delete(self.bot, payload)
+
     @commands.Cog.listener()
     async def on_thread_create(self, thread: discord.Thread) -> None:
         """Route thread creation events."""
+        if thread.parent_id == DEBATES_FORUM_ID and getattr(self.bot, 'debates_service', None):
+            # Every message of a new thread arrives as an event
+            self.bot.debates_service.mirror.mark_live(thread.id)
         if getattr(self.bot, 'disabled', False):
             return
         await on_thread_create_handler(self.bot, thread)
@@ -470,6 +486,32 @@ class DebatesHandler(commands.Cog):
         """Route reaction remove events."""
         await on_debate_reaction_remove(self.bot, reaction, user)
 
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent) -> None:
+        """Route raw reaction add events (message mirror, participation gate)."""
+        await on_mirror_reaction(self.bot, payload, added=True)
+        if getattr(self.bot, 'disabled', False):
+            return
+        await on_participation_reaction(self.bot, payload, joined=True)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent) -> None:
+        """Route raw reaction remove events (message mirror, participation gate)."""
+        await on_mirror_reaction(self.bot, payload, added=False)
+        if getattr(self.bot, 'disabled', False):
+            return
+        await on_participation_reaction(self.bot, payload, joined=False)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear(self, payload: discord.RawReactionClearEvent) -> None:
+        """Route raw reaction clear events (message mirror)."""
+        await on_mirror_reaction_clear(self.bot, payload)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_clear_emoji(self, payload: discord.RawReactionClearEmojiEvent) -> None:
+        """Route raw single-emoji reaction clear events (message mirror)."""
+        await on_mirror_reaction_clear(self.bot, payload)
+
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
         """Route member remove events."""
@@ -486,7 +528,8 @@ class DebatesHandler(commands.Cog):
 
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
-        """Route raw message delete events (for starter message deletion detection)."""
+        """Route raw message delete events (message mirror, starter deletion detection)."""
+        await on_mirror_message_delete(self.bot, payload)
         if getattr(self.bot, 'disabled', False):
             return
         await on_starter_message_delete_handler(self.bot, payload)
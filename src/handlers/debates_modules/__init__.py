@@ -22,8 +22,17 @@ from src.handlers.debates_modules.access_control import (
 from src.handlers.debates_modules.reactions import (
     on_debate_reaction_add,
     on_debate_reaction_remove,
+    on_participation_reaction,
     is_debates_forum_message,
 )
+from src.handlers.debates_modules.mirror import (
+    on_mirror_message,
+    on_mirror_message_edit,
+    on_mirror_message_delete,
+    on_mirror_bulk_delete,
+    on_mirror_reaction,
+    on_mirror_reaction_clear,
+)
 from src.handlers.debates_modules.member_lifecycle import (
     on_member_remove_handler,
     on_member_join_handler,
@@ -48,7 +57,15 @@ __all__ = [
     # Reactions
     "on_debate_reaction_add",
     "on_debate_reaction_remove",
+    "on_participation_reaction",
     "is_debates_forum_message",
+    # Message mirror
+    "on_mirror_message",
+    "on_mirror_message_edit",
+    "on_mirror_message_delete",
+    "on_mirror_bulk_delete",
+    "on_mirror_reaction",
+    "on_mirror_reaction_clear",
     # Member lifecycle
     "on_member_remove_handler",
     "on_member_join_handler",
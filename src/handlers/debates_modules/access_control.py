@@ -86,20 +86,11 @@ async def check_user_participation(
         if not analytics_message_id:
             return True  # No analytics message, allow posting
 
-        # Fetch the analytics message
+        # Check the participation index (hydrates from Discord at most once per thread)
         try:
-            analytics_message = await message.channel.fetch_message(analytics_message_id)
-
-            # Check if the user has reacted with participation emoji
-            user_has_reacted = False
-            for reaction in analytics_message.reactions:
-                if str(reaction.emoji) == PARTICIPATE_EMOJI:
-                    # Check if the current user is in the list of users who reacted
-                    async for user in reaction.users(limit=None):
-                        if user.id == message.author.id:
-                            user_has_reacted = True
-                            break
-                    break
+            user_has_reacted = await bot.debates_service.participation_gate.is_participant(
+                message.channel, analytics_message_id, message.author.id
+            )
 
             if not user_has_reacted:
                 # Delete the user's message
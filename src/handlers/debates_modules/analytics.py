@@ -14,17 +14,14 @@ from typing import TYPE_CHECKING
 import discord
 
 from src.core.logger import logger
-from src.core.config import DEBATES_FORUM_ID, DISCORD_API_DELAY
+from src.core.config import DEBATES_FORUM_ID, DISCORD_API_DELAY, DISCORD_ERROR_THREAD_ARCHIVED
 from src.caches import analytics_throttle_cache
 from src.utils import (
     edit_message_with_retry,
     safe_fetch_message,
 )
 from src.utils.discord_rate_limit import log_http_error
-from src.services.debates.analytics import (
-    calculate_debate_analytics,
-    generate_analytics_embed,
-)
+from src.services.debates.analytics import generate_analytics_embed
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -34,26 +31,41 @@ if TYPE_CHECKING:
 # Analytics Embed Management
 # =============================================================================
 
-async def update_analytics_embed(bot: "OthmanBot", thread: discord.Thread, force: bool = False) -> None:
+async def update_analytics_embed(bot: "OthmanBot", thread: discord.Thread, force: bool = False) -> bool:
     """
     Update the analytics embed for a debate thread.
 
     Args:
         bot: The OthmanBot instance
         thread: The debate thread
-        force: If True, bypass throttle and update immediately
+        force: If True, edit the embed now instead of scheduling it
 
-    DESIGN: Updates analytics embed in-place without reposting
-    Throttled to 30 seconds per thread to avoid rate limits
-    Uses AnalyticsThrottleCache for thread-safe throttling
+    Returns:
+        False if the edit failed with an HTTP error (worth retrying), else True
+
+    Raises:
+        discord.HTTPException: On a forced edit that can never succeed
+            (NotFound, Forbidden, thread archived), so the scheduler drops
+            the thread instead of retrying it
+
+    DESIGN: Updates analytics embed in-place without reposting.
+    Non-forced updates only mark the thread dirty; AnalyticsEmbedScheduler
+    coalesces them and performs the forced edit within the cooldown window,
+    so the latest activity always reaches the embed.
+    Falls back to AnalyticsThrottleCache if the scheduler isn't set up.
     """
     # Check if debates service is available
     if not hasattr(bot, 'debates_service') or bot.debates_service is None:
-        return
+        return True
 
-    # Throttle check - skip if updated recently (unless forced)
-    if not force and not await analytics_throttle_cache.should_update(thread.id):
-        return
+    if not force:
+        scheduler = getattr(bot, 'analytics_embed_scheduler', None)
+        if scheduler is not None:
+            scheduler.mark_dirty(thread)
+            return True
+        # Throttle check - skip if updated recently
+        if not await analytics_throttle_cache.should_update(thread.id):
+            return True
 
     try:
         # Get analytics message ID from database
@@ -62,7 +74,7 @@ async def update_analytics_embed(bot: "OthmanBot", thread: discord.Thread, force
             logger.debug("📊 No Analytics Message Found", [
                 ("Thread ID", str(thread.id)),
             ])
-            return
+            return True
 
         # Fetch the analytics message using safe helper
         analytics_message = await safe_fetch_message(thread, analytics_message_id)
@@ -73,10 +85,10 @@ async def update_analytics_embed(bot: "OthmanBot", thread: discord.Thread, force
                 ("Message ID", str(analytics_message_id)),
                 ("Thread ID", str(thread.id)),
             ])
-            return
+            return True
 
         # Calculate updated analytics
-        analytics = await calculate_debate_analytics(thread, bot.debates_service.db)
+        analytics = await bot.debates_service.analytics.calculate(thread)
 
         # Generate updated embed
         embed = await generate_analytics_embed(bot, analytics)
@@ -90,15 +102,24 @@ async def update_analytics_embed(bot: "OthmanBot", thread: discord.Thread, force
         logger.debug("📊 Updated Analytics Embed", [
             ("Thread", thread.name[:50]),
         ])
+        return True
 
     except discord.HTTPException as e:
         log_http_error(e, "Update Analytics Embed", [
             ("Thread ID", str(thread.id)),
         ])
+        permanent = isinstance(e, (discord.NotFound, discord.Forbidden)) or e.code == DISCORD_ERROR_THREAD_ARCHIVED
+        if permanent:
+            if force:
+                # Retrying can't fix these
+                raise
+            return True
+        return False
     except (ValueError, KeyError, TypeError) as e:
         logger.error("📊 Data Error Updating Analytics Embed", [
             ("Error", str(e)),
         ])
+        return True
 
 
 async def refresh_all_analytics_embeds(bot: "OthmanBot") -> int:
@@ -108,11 +129,15 @@ async def refresh_all_analytics_embeds(bot: "OthmanBot") -> int:
     This is a one-time migration function to update existing embeds
     with new fields (e.g., created_at timestamp).
 
+    DESIGN: Marks every active thread dirty and lets the analytics embed
+    scheduler pace the edits, instead of editing them one by one here.
+    Without the scheduler, falls back to editing serially.
+
     Args:
         bot: The OthmanBot instance
 
     Returns:
-        Number of embeds updated
+        Number of embeds queued (or updated, without the scheduler)
     """
     if not hasattr(bot, 'debates_service') or bot.debates_service is None:
         logger.warning("Cannot Refresh Analytics", [
@@ -133,6 +158,20 @@ async def refresh_all_analytics_embeds(bot: "OthmanBot") -> int:
         ])
         return 0
 
+    # Get all active (non-archived) threads
+    threads = [thread for thread in forum.threads if not thread.archived]
+
+    scheduler = getattr(bot, 'analytics_embed_scheduler', None)
+    if scheduler is not None:
+        for thread in threads:
+            scheduler.mark_dirty(thread)
+        logger.info("📊 Analytics Embed Refresh Queued", [
+            ("Forum", forum.name),
+            ("Threads", str(len(threads))),
+            ("Queue Depth", str(scheduler.get_stats()["queue_depth"])),
+        ])
+        return len(threads)
+
     updated_count = 0
     error_count = 0
 
@@ -140,11 +179,7 @@ async def refresh_all_analytics_embeds(bot: "OthmanBot") -> int:
         ("Forum", forum.name),
     ])
 
-    # Get all active (non-archived) threads
-    for thread in forum.threads:
-        if thread.archived:
-            continue
-
+    for thread in threads:
         try:
             await update_analytics_embed(bot, thread, force=True)
             updated_count += 1
@@ -0,0 +1,157 @@
+"""
+OthmanBot - Debates Message Mirror Events
+=========================================
+
+Feeds gateway events for the debates forum into the local message mirror.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.handlers.debates_modules.reactions import is_debates_forum_message
+
+if TYPE_CHECKING:
+    from src.bot import OthmanBot
+    from src.services.debates.message_mirror import MessageMirror
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+def _get_mirror(bot: "OthmanBot") -> Optional["MessageMirror"]:
+    """Return the message mirror, or None before the service is up."""
+    service = getattr(bot, 'debates_service', None)
+    return service.mirror if service is not None else None
+
+
+def _is_mirrored_channel(bot: "OthmanBot", mirror: "MessageMirror", channel_id: int) -> bool:
+    """
+    Check if events in a channel belong in the mirror.
+
+    Archived threads are usually not in the channel cache, so a thread
+    the mirror already tracks is accepted without resolving it.
+    """
+    if mirror.is_live(channel_id):
+        return True
+    return is_debates_forum_message(bot.get_channel(channel_id))
+
+
+def _log_failure(event: str, error: Exception, channel_id: int) -> None:
+    """Log a mirror write that failed."""
+    logger.warning("🪞 Message Mirror Event Failed", [
+        ("Event", event),
+        ("Channel ID", str(channel_id)),
+        ("Error Type", type(error).__name__),
+        ("Error", str(error)[:100]),
+    ])
+
+
+# =============================================================================
+# Message Events
+# =============================================================================
+
+async def on_mirror_message(bot: "OthmanBot", message: discord.Message) -> None:
+    """Record a new debate-forum message (bots and starters included)."""
+    mirror = _get_mirror(bot)
+    if mirror is None or message is None or not is_debates_forum_message(message.channel):
+        return
+    try:
+        await mirror.record_message(message)
+    except Exception as e:
+        _log_failure("Message", e, message.channel.id)
+
+
+async def on_mirror_message_edit(bot: "OthmanBot", payload: discord.RawMessageUpdateEvent) -> None:
+    """Record a message edit's timestamp."""
+    mirror = _get_mirror(bot)
+    edited = payload.data.get("edited_timestamp") if payload.data else None
+    if mirror is None or not edited or not _is_mirrored_channel(bot, mirror, payload.channel_id):
+        return
+    try:
+        await mirror.record_edit(payload.channel_id, payload.message_id, discord.utils.parse_time(edited))
+    except Exception as e:
+        _log_failure("Edit", e, payload.channel_id)
+
+
+async def on_mirror_message_delete(bot: "OthmanBot", payload: discord.RawMessageDeleteEvent) -> None:
+    """Flag a deleted message."""
+    mirror = _get_mirror(bot)
+    if mirror is None or not _is_mirrored_channel(bot, mirror, payload.channel_id):
+        return
+    try:
+        await mirror.record_delete(payload.channel_id, [payload.message_id])
+    except Exception as e:
+        _log_failure("Delete", e, payload.channel_id)
+
+
+async def on_mirror_bulk_delete(bot: "OthmanBot", payload: discord.RawBulkMessageDeleteEvent) -> None:
+    """Flag bulk-deleted messages."""
+    mirror = _get_mirror(bot)
+    if mirror is None or not _is_mirrored_channel(bot, mirror, payload.channel_id):
+        return
+    try:
+        await mirror.record_delete(payload.channel_id, list(payload.message_ids))
+    except Exception as e:
+        _log_failure("Bulk Delete", e, payload.channel_id)
+
+
+# =============================================================================
+# Reaction Events
+# =============================================================================
+
+async def on_mirror_reaction(
+    bot: "OthmanBot",
+    payload: discord.RawReactionActionEvent,
+    added: bool
+) -> None:
+    """Record a tracked reaction being added or removed."""
+    mirror = _get_mirror(bot)
+    if mirror is None or not _is_mirrored_channel(bot, mirror, payload.channel_id):
+        return
+    if bot.user and payload.user_id == bot.user.id:
+        return
+    if payload.member is not None and payload.member.bot:
+        return
+    try:
+        await mirror.record_reaction(
+            payload.channel_id, payload.message_id, str(payload.emoji), payload.user_id, added
+        )
+    except Exception as e:
+        _log_failure("Reaction", e, payload.channel_id)
+
+
+async def on_mirror_reaction_clear(
+    bot: "OthmanBot",
+    payload: discord.RawReactionClearEvent | discord.RawReactionClearEmojiEvent
+) -> None:
+    """Record all reactions (or one emoji's) being cleared from a message."""
+    mirror = _get_mirror(bot)
+    if mirror is None or not _is_mirrored_channel(bot, mirror, payload.channel_id):
+        return
+    emoji = getattr(payload, "emoji", None)
+    try:
+        await mirror.clear_reactions(
+            payload.channel_id, payload.message_id, str(emoji) if emoji is not None else None
+        )
+    except Exception as e:
+        _log_failure("Reaction Clear", e, payload.channel_id)
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = [
+    "on_mirror_message",
+    "on_mirror_message_edit",
+    "on_mirror_message_delete",
+    "on_mirror_bulk_delete",
+    "on_mirror_reaction",
+    "on_mirror_reaction_clear",
+]
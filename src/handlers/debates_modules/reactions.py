@@ -14,7 +14,7 @@ import discord
 
 from src.core.logger import logger
 from src.core.config import DEBATES_FORUM_ID
-from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI
+from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI, PARTICIPATE_EMOJI
 from src.utils.discord_rate_limit import log_http_error
 from src.handlers.debates_modules.analytics import update_analytics_embed
 
@@ -234,7 +234,7 @@ async def on_debate_reaction_remove(
 
         # Remove the vote
         vote_type = "Upvote" if emoji == UPVOTE_EMOJI else "Downvote"
-        removed = bot.debates_service.remove_vote(user.id, reaction.message.id)
+        removed = await bot.debates_service.remove_vote_async(user.id, reaction.message.id)
 
         if not removed:
             logger.debug("Vote Already Removed Or Not Found", [
@@ -271,6 +271,58 @@ async def on_debate_reaction_remove(
         ])
 
 
+# =============================================================================
+# Participation Reaction Handler
+# =============================================================================
+
+async def on_participation_reaction(
+    bot: "OthmanBot",
+    payload: discord.RawReactionActionEvent,
+    joined: bool
+) -> None:
+    """
+    Keep the participation gate in step with analytics embed reactions.
+
+    Uses raw events because analytics messages are usually not in the
+    message cache (e.g. after a restart), so on_reaction_add never fires
+    for them.
+
+    Args:
+        bot: The OthmanBot instance
+        payload: Raw reaction add/remove event
+        joined: True for an added reaction, False for a removed one
+    """
+    try:
+        if str(payload.emoji) != PARTICIPATE_EMOJI:
+            return
+
+        if not _is_bot_ready(bot):
+            return
+
+        if bot.user and payload.user_id == bot.user.id:
+            return
+
+        channel = bot.get_channel(payload.channel_id)
+        if not is_debates_forum_message(channel):
+            return
+
+        analytics_message_id = await bot.debates_service.db.get_analytics_message_async(channel.id)
+        if analytics_message_id != payload.message_id:
+            return
+
+        await bot.debates_service.participation_gate.record(
+            channel.id, payload.message_id, payload.user_id, joined
+        )
+
+    except Exception as e:
+        logger.error("🔐 Unhandled Exception In Participation Reaction Handler", [
+            ("Error Type", type(e).__name__),
+            ("Error", str(e)),
+            ("User ID", str(payload.user_id)),
+            ("Message ID", str(payload.message_id)),
+        ])
+
+
 # =============================================================================
 # Module Export
 # =============================================================================
@@ -278,5 +330,6 @@ async def on_debate_reaction_remove(
 __all__ = [
     "on_debate_reaction_add",
     "on_debate_reaction_remove",
+    "on_participation_reaction",
     "is_debates_forum_message",
 ]
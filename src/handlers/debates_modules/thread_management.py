@@ -261,6 +261,10 @@ async def on_thread_delete_handler(bot: "OthmanBot", thread: discord.Thread) ->
     if hasattr(bot, 'debates_service') and bot.debates_service is not None:
         try:
             await asyncio.to_thread(bot.debates_service.db.delete_thread_data, thread.id)
+            bot.debates_service.participation_gate.forget(thread.id)
+            bot.debates_service.mirror.forget(thread.id)
+            if bot.analytics_embed_scheduler is not None:
+                bot.analytics_embed_scheduler.forget(thread.id)
             logger.debug("🗄️ Thread Database Records Cleaned", [
                 ("Thread ID", str(thread.id)),
             ])
@@ -437,6 +441,10 @@ async def on_starter_message_delete_handler(
         if hasattr(bot, 'debates_service') and bot.debates_service is not None:
             try:
                 await asyncio.to_thread(bot.debates_service.db.delete_thread_data, thread_id)
+                bot.debates_service.participation_gate.forget(thread_id)
+                bot.debates_service.mirror.forget(thread_id)
+                if bot.analytics_embed_scheduler is not None:
+                    bot.analytics_embed_scheduler.forget(thread_id)
                 logger.debug("Thread Database Records Cleaned", [
                     ("Thread ID", str(thread_id)),
                 ])
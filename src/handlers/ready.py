@@ -15,7 +15,7 @@ import discord
 from discord.ext import commands
 
 from src.core.logger import logger
-from src.core.config import SYRIA_GUILD_ID, ALLOWED_GUILD_IDS, BOT_STARTUP_DELAY
+from src.core.config import SYRIA_GUILD_ID, ALLOWED_GUILD_IDS, BOT_STARTUP_DELAY, MODERATION_JOB_CONCURRENCY
 from src.core.constants import TIMEOUT_LONG, TIMEOUT_MEDIUM, TIMEOUT_EXTENDED, SLEEP_STARTUP_DELAY
 from src.core.health import HealthCheckServer
 from src.services.presence import setup_presence
@@ -34,6 +34,7 @@ from src.services.debates.maintenance_scheduler import DebateMaintenanceSchedule
 from src.services.debates.reconciliation import reconcile_karma
 from src.services.debates.numbering_scheduler import reconcile_debate_numbering
 from src.services.debates.ban_expiry_scheduler import BanExpiryScheduler
+from src.services.debates.moderation_jobs import ModerationJobRunner
 from src.services.debates.closed_debate_delete_scheduler import ClosedDebateDeleteScheduler
 from src.services.case_archive_scheduler import CaseArchiveScheduler
 from src.posting.news import post_news
@@ -145,11 +146,14 @@ class ReadyHandler(commands.Cog):
         # Initialize all services
         init_results.append(("Content Rotation", await self._safe_init("Content Rotation", self._init_content_rotation)))
         init_results.append(("Maintenance Scheduler", await self._safe_init("Maintenance Scheduler", self._init_maintenance_scheduler)))
+        init_results.append(("Thread Metadata", await self._safe_init("Thread Metadata", self._init_thread_metadata)))
+        init_results.append(("Participation Flusher", await self._safe_init("Participation Flusher", self._init_participation_flusher)))
         init_results.append(("Debates Scheduler", await self._safe_init("Debates Scheduler", self._init_debates_scheduler)))
         init_results.append(("Debate Maintenance", await self._safe_init("Debate Maintenance", self._init_debate_maintenance)))
         init_results.append(("Open Discussion", await self._safe_init("Open Discussion", self._init_open_discussion)))
         init_results.append(("Startup Reconciliation", await self._safe_init("Startup Reconciliation", self._init_startup_reconciliation)))
         init_results.append(("Ban Expiry Scheduler", await self._safe_init("Ban Expiry Scheduler", self._init_ban_expiry_scheduler)))
+        init_results.append(("Moderation Jobs", await self._safe_init("Moderation Jobs", self._init_moderation_jobs)))
         init_results.append(("Closed Debate Delete Scheduler", await self._safe_init("Closed Debate Delete Scheduler", self._init_closed_debate_delete_scheduler)))
         init_results.append(("Case Archive Scheduler", await self._safe_init("Case Archive Scheduler", self._init_case_archive_scheduler)))
         init_results.append(("Backup Scheduler", await self._safe_init("Backup Scheduler", self._init_backup_scheduler)))
@@ -329,6 +333,33 @@ class ReadyHandler(commands.Cog):
             ("Cache", "warmed"),
         ], emoji="🔧")
 
+    async def _init_thread_metadata(self) -> None:
+        """Load per-thread debate state so message handling never queries it."""
+        bot = self.bot
+        if not hasattr(bot, 'debates_service') or not bot.debates_service:
+            logger.info("Skipping Thread Metadata", [
+                ("Reason", "Debates service not initialized"),
+            ])
+            return
+
+        meta = await bot.debates_service.db.ensure_thread_meta_async()
+        stats = meta.get_stats()
+        logger.tree("Thread Metadata Cached", [
+            ("Threads", str(stats["threads"])),
+            ("Creators", str(stats["creators"])),
+        ], emoji="🗂️")
+
+    async def _init_participation_flusher(self) -> None:
+        """Replay leftover participation journals before messages are flushed."""
+        bot = self.bot
+        if not hasattr(bot, 'debates_service') or not bot.debates_service:
+            logger.info("Skipping Participation Flusher", [
+                ("Reason", "Debates service not initialized"),
+            ])
+            return
+
+        await bot.debates_service.participation.start()
+
     async def _init_debates_scheduler(self) -> None:
         """Initialize debates scheduler."""
         bot = self.bot
@@ -393,21 +424,37 @@ class ReadyHandler(commands.Cog):
         bot = self.bot
         await asyncio.sleep(BOT_STARTUP_DELAY)
 
+        # Replay recently active threads into the message mirror (events missed while offline)
+        try:
+            if bot.debates_service:
+                await bot.debates_service.mirror.catch_up(bot)
+        except Exception as e:
+            logger.error("Startup Message Mirror Catch-Up Failed", [("Error", str(e))])
+
         # Karma reconciliation
         logger.info("Running Startup Karma Reconciliation", [
-            ("Mode", "Full scan"),
+            ("Mode", "Incremental (watermarks)"),
             ("Days Back", "All"),
         ])
         try:
-            karma_stats = await reconcile_karma(bot, days_back=None)
+            karma_stats = await reconcile_karma(bot, days_back=None, incremental=True)
             logger.tree("Startup Karma Reconciliation Complete", [
                 ("Threads Scanned", str(karma_stats['threads_scanned'])),
+                ("Threads Unchanged", str(karma_stats['threads_skipped'])),
                 ("Votes Added", f"+{karma_stats['votes_added']}"),
                 ("Votes Removed", f"-{karma_stats['votes_removed']}"),
+                ("Throughput", f"{karma_stats['messages_per_second']} msg/s, {karma_stats['votes_per_second']} votes/s"),
             ], emoji="🔄")
         except Exception as e:
             logger.error("Startup Karma Reconciliation Failed", [("Error", str(e))])
 
+        # Rank snapshot (idempotent per day) so rank changes have a baseline
+        try:
+            if bot.debates_service:
+                await bot.debates_service.db.take_rank_snapshot_async()
+        except Exception as e:
+            logger.error("Startup Rank Snapshot Failed", [("Error", str(e))])
+
         # Numbering reconciliation
         logger.info("Running Startup Numbering Reconciliation", [
             ("Mode", "Full scan"),
@@ -453,7 +500,20 @@ class ReadyHandler(commands.Cog):
 
         bot.ban_expiry_scheduler = BanExpiryScheduler(bot)
         await bot.ban_expiry_scheduler.start()
-        logger.tree("Ban Expiry Scheduler Started", [("Check Interval", "every 1 minute")], emoji="⏰")
+        logger.tree("Ban Expiry Scheduler Started", [("Check Interval", "at each ban's expiry")], emoji="⏰")
+
+    async def _init_moderation_jobs(self) -> None:
+        """Initialize the moderation job runner and resume unfinished jobs."""
+        bot = self.bot
+        if not hasattr(bot, 'debates_service') or not bot.debates_service:
+            logger.info("Skipping Moderation Jobs", [
+                ("Reason", "Debates service not initialized"),
+            ])
+            return
+
+        bot.moderation_jobs = ModerationJobRunner(bot)
+        await bot.moderation_jobs.start()
+        logger.tree("Moderation Job Runner Started", [("Concurrency", str(MODERATION_JOB_CONCURRENCY))], emoji="🧹")
 
     async def _init_closed_debate_delete_scheduler(self) -> None:
         """Initialize closed debate auto-delete scheduler."""
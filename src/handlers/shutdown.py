@@ -15,6 +15,7 @@ from src.core.logger import logger
 from src.services.presence import stop_presence
 from src.services.status_webhook import get_status_service
 from src.services import playwright_pool
+from src.services.database import close_db
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -160,14 +161,22 @@ async def shutdown_handler(bot: "OthmanBot") -> None:
     if hasattr(bot, 'ban_expiry_scheduler') and bot.ban_expiry_scheduler:
         cleanup_tasks.append(("Ban Expiry Scheduler", bot.ban_expiry_scheduler.stop()))
 
+    # 12b. Stop moderation job runner (unfinished jobs resume on next start)
+    if hasattr(bot, 'moderation_jobs') and bot.moderation_jobs:
+        cleanup_tasks.append(("Moderation Job Runner", bot.moderation_jobs.stop()))
+
     # 13. Stop case archive scheduler
     if hasattr(bot, 'case_archive_scheduler') and bot.case_archive_scheduler:
         cleanup_tasks.append(("Case Archive Scheduler", bot.case_archive_scheduler.stop()))
 
-    # 14. Close database connection
+    # 14. Flush queued votes, participation and pending analytics embeds, then close database connection
     if hasattr(bot, 'debates_service') and bot.debates_service:
-        if hasattr(bot.debates_service, 'db') and bot.debates_service.db:
-            cleanup_tasks.append(("Debates Database", _close_database(bot.debates_service.db)))
+        cleanup_tasks.append(("Debates Database", _close_debates_service(
+            bot.debates_service, getattr(bot, 'analytics_embed_scheduler', None)
+        )))
+
+    # 14b. Close shared bot database connections
+    cleanup_tasks.append(("Bot Database", asyncio.to_thread(close_db)))
 
     # 13. Stop health check HTTP server
     if hasattr(bot, 'health_server') and bot.health_server:
@@ -220,6 +229,30 @@ async def _cancel_task(task: asyncio.Task) -> None:
         pass
 
 
+async def _close_debates_service(service: Any, embed_scheduler: Any = None) -> None:
+    """
+    Flush queued vote writes and buffered participation, then pending
+    analytics embeds, then close the debates database.
+
+    DESIGN: Runs as one cleanup task so every flush always
+    finishes before the connection it writes through is closed.
+    Votes go first because nothing else holds them; the embed flush
+    is best-effort within its own budget (the startup refresh redraws
+    any embed left behind), so it can't push the votes past
+    SHUTDOWN_TIMEOUT.
+    """
+    vote_queue = getattr(service, 'vote_queue', None)
+    if vote_queue:
+        await vote_queue.stop()
+    participation = getattr(service, 'participation', None)
+    if participation:
+        await participation.stop()
+    if embed_scheduler:
+        await embed_scheduler.stop()
+    if getattr(service, 'db', None):
+        await _close_database(service.db)
+
+
 async def _close_database(db: Any) -> None:
     """Close database connection."""
     if hasattr(db, 'close'):
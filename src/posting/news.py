@@ -56,10 +56,17 @@ async def post_news(bot: "OthmanBot") -> None:
         return
 
     try:
-        logger.info("📰 Fetching Latest News Articles", [
-            ("Max Articles", "1"),
-        ])
-        articles = await bot.news_scraper.fetch_latest_news(max_articles=1)
+        # Reuse the article prepared by the rotation check, if any
+        articles = bot.news_scraper.take_handed_off()
+        if articles:
+            logger.info("📰 Using Prepared News Article", [
+                ("Title", articles[0].title[:50]),
+            ])
+        else:
+            logger.info("📰 Fetching Latest News Articles", [
+                ("Max Articles", "1"),
+            ])
+            articles = await bot.news_scraper.fetch_latest_news(max_articles=1)
 
         if not articles:
             logger.warning("📰 No New Articles Found To Post", [
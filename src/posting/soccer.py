@@ -55,13 +55,20 @@ async def post_soccer_news(bot: "OthmanBot") -> None:
         return
 
     try:
-        logger.info("⚽ Fetching Latest Soccer News Articles", [
-            ("Max Articles", "1"),
-            ("Hours Back", "24"),
-        ])
-        articles = await bot.soccer_scraper.fetch_latest_soccer_news(
-            max_articles=1, hours_back=24
-        )
+        # Reuse the article prepared by the rotation check, if any
+        articles = bot.soccer_scraper.take_handed_off()
+        if articles:
+            logger.info("⚽ Using Prepared Soccer Article", [
+                ("Title", articles[0].title[:50]),
+            ])
+        else:
+            logger.info("⚽ Fetching Latest Soccer News Articles", [
+                ("Max Articles", "1"),
+                ("Hours Back", "24"),
+            ])
+            articles = await bot.soccer_scraper.fetch_latest_soccer_news(
+                max_articles=1, hours_back=24
+            )
 
         if not articles:
             logger.warning("⚽ No New Soccer Articles Found To Post", [
@@ -71,10 +71,17 @@ def get_db() -> Database:
     return _db_instance
 
 
+def close_db() -> None:
+    """Close the global database's connections if it was ever opened."""
+    if _db_instance is not None:
+        _db_instance.close()
+
+
 # Re-export for backwards compatibility
 __all__ = [
     "Database",
     "get_db",
+    "close_db",
     "DatabaseUnavailableError",
     "DB_PATH",
     "DATA_DIR",
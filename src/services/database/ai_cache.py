@@ -20,25 +20,32 @@ class AICacheMixin:
 
     def get_ai_cache(self, cache_type: str, cache_key: str) -> Optional[str]:
         """Get cached AI response if not expired."""
+        entry = self.get_ai_cache_entry(cache_type, cache_key)
+        return entry[0] if entry else None
+
+    def get_ai_cache_entry(
+        self, cache_type: str, cache_key: str
+    ) -> Optional[tuple[str, int, float]]:
+        """Get (value, tokens, created_at) of a cached AI response if not expired."""
         expiry_time = time.time() - (AI_CACHE_EXPIRATION_DAYS * 86400)
         with self._get_conn() as conn:
             cur = conn.cursor()
             cur.execute(
-                """SELECT value FROM ai_cache
+                """SELECT value, tokens, created_at FROM ai_cache
                    WHERE cache_type = ? AND cache_key = ? AND created_at > ?""",
                 (cache_type, cache_key, expiry_time)
             )
             row = cur.fetchone()
-            return row["value"] if row else None
+            return (row["value"], row["tokens"] or 0, row["created_at"]) if row else None
 
-    def set_ai_cache(self, cache_type: str, cache_key: str, value: str) -> None:
-        """Set AI cache value with timestamp."""
+    def set_ai_cache(self, cache_type: str, cache_key: str, value: str, tokens: int = 0) -> None:
+        """Set AI cache value with timestamp and the tokens it cost to produce."""
         with self._get_conn() as conn:
             cur = conn.cursor()
             cur.execute(
-                """INSERT OR REPLACE INTO ai_cache (cache_type, cache_key, value, created_at)
-                   VALUES (?, ?, ?, ?)""",
-                (cache_type, cache_key, value, time.time())
+                """INSERT OR REPLACE INTO ai_cache (cache_type, cache_key, value, created_at, tokens)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (cache_type, cache_key, value, time.time(), tokens)
             )
 
     def cleanup_ai_cache(self) -> int:
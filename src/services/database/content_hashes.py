@@ -8,15 +8,27 @@ Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
+import json
 import time
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
+from src.core.config import CONTENT_SIMILARITY_WINDOW
 from src.core.logger import logger
 from .core import CONTENT_HASH_RETENTION_DAYS, CONTENT_HASH_MAX_ENTRIES
 
+if TYPE_CHECKING:
+    from src.utils.similarity import SimilarityIndex
+
 
 class ContentHashesMixin:
-    """Mixin for content hash database operations."""
+    """
+    Mixin for content hash database operations.
+
+    DESIGN: Each stored article also keeps its token counts (token_vector)
+    and is added to a per-type SimilarityIndex held in memory, so duplicate
+    checks score the whole window without reloading or re-tokenizing text.
+    The index is loaded lazily from the newest rows and dropped on cleanup.
+    """
 
     def store_content_hash(
         self,
@@ -25,18 +37,83 @@ class ContentHashesMixin:
         content_text: str
     ) -> None:
         """Store content text for similarity comparison."""
+        # Deferred: src.utils imports the database package
+        from src.utils.similarity import word_counts
+
         # Store truncated content for similarity checking
         truncated = content_text[:2000] if len(content_text) > 2000 else content_text
+        counts = word_counts(truncated)
 
         with self._get_conn() as conn:
             cur = conn.cursor()
             cur.execute(
                 """INSERT OR REPLACE INTO content_hashes
-                   (content_type, article_id, content_text, created_at)
-                   VALUES (?, ?, ?, ?)""",
-                (content_type, article_id, truncated, time.time())
+                   (content_type, article_id, content_text, created_at, token_vector)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (content_type, article_id, truncated, time.time(), json.dumps(counts))
             )
 
+        index = self._similarity_indexes.get(content_type)
+        if index is not None:
+            index.add(article_id, counts, len(truncated))
+
+    def get_similarity_index(self, content_type: str) -> "SimilarityIndex":
+        """
+        Get the near-duplicate index for a content type, loading it if needed.
+
+        Rows stored before token_vector existed are tokenized once here
+        and their counts written back.
+        """
+        index = self._similarity_indexes.get(content_type)
+        if index is not None:
+            return index
+
+        from src.utils.similarity import SimilarityIndex, word_counts
+
+        with self._similarity_lock:
+            index = self._similarity_indexes.get(content_type)
+            if index is not None:
+                return index
+
+            with self._get_conn() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    """SELECT article_id, content_text, token_vector FROM content_hashes
+                       WHERE content_type = ?
+                       ORDER BY created_at DESC
+                       LIMIT ?""",
+                    (content_type, CONTENT_SIMILARITY_WINDOW)
+                )
+                rows = cur.fetchall()
+
+                index = SimilarityIndex()
+                backfill = []
+                # Oldest first so the newest rows end up newest in the window
+                for row in reversed(rows):
+                    text = row["content_text"] or ""
+                    if row["token_vector"]:
+                        counts = json.loads(row["token_vector"])
+                    else:
+                        counts = word_counts(text)
+                        backfill.append((json.dumps(counts), content_type, row["article_id"]))
+                    index.add(row["article_id"], counts, len(text))
+
+                if backfill:
+                    cur.executemany(
+                        """UPDATE content_hashes SET token_vector = ?
+                           WHERE content_type = ? AND article_id = ?""",
+                        backfill
+                    )
+
+            self._similarity_indexes[content_type] = index
+
+        logger.debug("Similarity Index Loaded", [
+            ("Type", content_type),
+            ("Articles", str(len(index))),
+            ("Backfilled", str(len(backfill))),
+        ])
+        return index
+
     def get_recent_content(
         self,
         content_type: str,
@@ -58,6 +135,8 @@ class ContentHashesMixin:
     def cleanup_content_hashes(self) -> int:
         """Remove old content hashes."""
         cutoff = time.time() - (CONTENT_HASH_RETENTION_DAYS * 86400)
+        # Never trim below the similarity window
+        max_entries = max(CONTENT_HASH_MAX_ENTRIES, CONTENT_SIMILARITY_WINDOW)
 
         with self._get_conn() as conn:
             cur = conn.cursor()
@@ -79,8 +158,8 @@ class ContentHashesMixin:
                 row = cur.fetchone()
                 total = row["cnt"] if row else 0
 
-                if total > CONTENT_HASH_MAX_ENTRIES:
-                    to_remove = total - CONTENT_HASH_MAX_ENTRIES
+                if total > max_entries:
+                    to_remove = total - max_entries
                     cur.execute(
                         """DELETE FROM content_hashes
                            WHERE content_type = ? AND id IN (
@@ -95,6 +174,8 @@ class ContentHashesMixin:
 
             total_removed = expired + excess_removed
             if total_removed > 0:
+                # Reload from what's left on the next check
+                self._similarity_indexes.clear()
                 logger.tree("Content Hash Cleanup Complete", [
                     ("Expired Removed", str(expired)),
                     ("Excess Removed", str(excess_removed)),
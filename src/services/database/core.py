@@ -10,6 +10,7 @@ Server: discord.gg/syria
 
 import os
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
@@ -38,6 +39,19 @@ DEAD_LETTER_QUARANTINE_HOURS: int = 24
 CONTENT_HASH_RETENTION_DAYS: int = 7
 CONTENT_HASH_MAX_ENTRIES: int = 500
 
+# Connection settings
+DB_CONNECT_TIMEOUT: float = 10.0
+DB_STATEMENT_CACHE_SIZE: int = 256
+
+# Error strings that mean the file itself is damaged, not just busy
+CORRUPTION_MARKERS: tuple = (
+    "disk i/o error",
+    "database disk image is malformed",
+    "file is not a database",
+    "file is encrypted",
+    "unable to open database",
+)
+
 
 # =============================================================================
 # Exceptions
@@ -61,6 +75,19 @@ class DatabaseCore:
         self._healthy = True
         self._corruption_reason: Optional[str] = None
 
+        # Persistent per-thread connections (see _get_conn)
+        self._local = threading.local()
+        self._conns: dict[int, sqlite3.Connection] = {}
+        self._conns_lock = threading.Lock()
+        self._conns_busy: set[int] = set()
+        self._conn_generation = 0
+        self._conn_opens = 0
+        self._conn_reuses = 0
+
+        # Near-duplicate indexes per content type (see ContentHashesMixin)
+        self._similarity_indexes: dict = {}
+        self._similarity_lock = threading.Lock()
+
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
@@ -142,7 +169,7 @@ class DatabaseCore:
     def _check_integrity(self) -> bool:
         """Check database integrity. Returns True if healthy."""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = sqlite3.connect(self.db_path, timeout=DB_CONNECT_TIMEOUT)
             cur = conn.cursor()
             cur.execute("PRAGMA integrity_check")
             result = cur.fetchone()
@@ -168,10 +195,98 @@ class DatabaseCore:
                 ("Error", str(e)[:100]),
             ], emoji="❌")
 
+    def _open_conn(self) -> sqlite3.Connection:
+        """Open and configure a connection for the current thread."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DB_CONNECT_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        ident = threading.get_ident()
+        with self._conns_lock:
+            # Drop connections left behind by threads that have exited
+            alive = {t.ident for t in threading.enumerate()}
+            for dead in [i for i in self._conns if i not in alive]:
+                try:
+                    self._conns.pop(dead).close()
+                except sqlite3.Error:
+                    pass
+            self._conns[ident] = conn
+            self._conn_opens += 1
+            self._local.generation = self._conn_generation
+
+        self._local.conn = conn
+        return conn
+
+    def _thread_conn(self) -> sqlite3.Connection:
+        """Get this thread's persistent connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._is_stale() and getattr(self._local, "depth", 0) <= 1:
+            # Invalidated by close() while idle or busy; never reused
+            self._discard_thread_conn()
+            conn = None
+        if conn is None:
+            return self._open_conn()
+        self._conn_reuses += 1
+        return conn
+
+    def _is_stale(self) -> bool:
+        """True if this thread's connection predates the last close()."""
+        return getattr(self._local, "generation", None) != self._conn_generation
+
+    def _enter_conn(self) -> None:
+        """Mark this thread's connection as in use (nested blocks share it)."""
+        depth = getattr(self._local, "depth", 0) + 1
+        self._local.depth = depth
+        if depth == 1:
+            with self._conns_lock:
+                self._conns_busy.add(threading.get_ident())
+
+    def _exit_conn(self) -> None:
+        """Return this thread's connection, closing it if close() invalidated it."""
+        depth = getattr(self._local, "depth", 1) - 1
+        self._local.depth = depth
+        if depth:
+            return
+        with self._conns_lock:
+            self._conns_busy.discard(threading.get_ident())
+        if self._is_stale():
+            self._discard_thread_conn()
+
+    def _discard_thread_conn(self) -> None:
+        """Close and forget this thread's connection so the next call reopens."""
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is None:
+            return
+        with self._conns_lock:
+            if self._conns.get(threading.get_ident()) is conn:
+                del self._conns[threading.get_ident()]
+        try:
+            conn.close()
+        except Exception:
+            pass
+
     @contextmanager
     def _get_conn(self):
-        """Get database connection context manager."""
+        """
+        Get database connection context manager.
+
+        DESIGN: Each thread keeps one long-lived connection instead of
+        opening a new one per call. That skips the open + WAL/synchronous
+        PRAGMAs every time and lets sqlite3's statement cache reuse the
+        prepared statements the mixins run over and over. The block still
+        commits on success; on error the transaction is rolled back so the
+        reused connection is clean for the next caller on this thread.
+        """
         if not self._healthy:
+            if self._is_stale():
+                self._discard_thread_conn()
             logger.tree("Database Unhealthy", [
                 ("Status", "Operation rejected"),
                 ("Reason", self._corruption_reason or "Unknown"),
@@ -181,40 +296,76 @@ class DatabaseCore:
             )
 
         conn = None
+        self._enter_conn()
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
+            conn = self._thread_conn()
             yield conn
             conn.commit()
         except sqlite3.DatabaseError as e:
             error_msg = str(e).lower()
-            is_corruption = any(x in error_msg for x in [
-                "disk i/o error",
-                "database disk image is malformed",
-                "file is not a database",
-                "file is encrypted",
-                "unable to open database",
-            ])
+            is_corruption = any(x in error_msg for x in CORRUPTION_MARKERS)
             if is_corruption:
                 self._healthy = False
                 self._corruption_reason = str(e)
                 logger.tree("Database Corruption Detected", [
                     ("Error", str(e)[:100]),
                 ], emoji="🚨")
+                # Never keep handles to a damaged file around
+                self.close()
                 self._backup_corrupted()
             else:
                 logger.tree("Database Error", [
                     ("Type", type(e).__name__),
                     ("Message", str(e)[:100]),
                 ], emoji="⚠️")
+                self._rollback(conn)
+        except BaseException:
+            self._rollback(conn)
+            raise
         finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
+            self._exit_conn()
+
+    def _rollback(self, conn: Optional[sqlite3.Connection]) -> None:
+        """Roll back an open transaction, discarding the connection if that fails."""
+        if conn is None or not conn.in_transaction:
+            return
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            self._discard_thread_conn()
+
+    def close(self) -> None:
+        """
+        Invalidate every thread's connection.
+
+        Idle connections are closed now. A connection another thread is
+        using at this moment is left open and closed by that thread when
+        its block ends, so close() (which also runs on the corruption path)
+        never pulls a handle out from under a running query. Every thread
+        opens a fresh connection on its next call.
+        """
+        with self._conns_lock:
+            self._conn_generation += 1
+            idle = [ident for ident in self._conns if ident not in self._conns_busy]
+            conns = [self._conns.pop(ident) for ident in idle]
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def get_connection_stats(self) -> dict:
+        """Get persistent connection counters."""
+        with self._conns_lock:
+            open_conns = len(self._conns)
+            busy_conns = len(self._conns_busy)
+        return {
+            "open": open_conns,
+            "busy": busy_conns,
+            "opened": self._conn_opens,
+            "reused": self._conn_reuses,
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        }
 
     # =========================================================================
     # Table Initialization
@@ -265,6 +416,11 @@ class DatabaseCore:
                 ON ai_cache(cache_type, cache_key)
             """)
 
+            # Tokens spent producing each entry, for saved-token reporting
+            cur.execute("PRAGMA table_info(ai_cache)")
+            if "tokens" not in {row[1] for row in cur.fetchall()}:
+                cur.execute("ALTER TABLE ai_cache ADD COLUMN tokens INTEGER DEFAULT 0")
+
             # -----------------------------------------------------------------
             # Posted URLs Table
             # -----------------------------------------------------------------
@@ -450,6 +606,11 @@ class DatabaseCore:
                 ON content_hashes(content_type)
             """)
 
+            # Token counts (JSON) so the similarity index never re-tokenizes
+            cur.execute("PRAGMA table_info(content_hashes)")
+            if "token_vector" not in {row[1] for row in cur.fetchall()}:
+                cur.execute("ALTER TABLE content_hashes ADD COLUMN token_vector TEXT")
+
             # -----------------------------------------------------------------
             # Article Engagement Table
             # -----------------------------------------------------------------
@@ -17,12 +17,15 @@ import discord
 if TYPE_CHECKING:
     from src.bot import OthmanBot
     from src.services.debates.database import DebatesDatabase
+    from src.services.debates.message_mirror import MessageMirror
 
 from src.core.logger import logger
 from src.core.config import NY_TZ, LOG_TITLE_PREVIEW_LENGTH, EmbedColors
 from src.core.colors import EmbedIcons
 from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI
 from src.utils.footer import set_footer
+from src.services.debates.db.models import MirrorMessage
+from src.services.debates.message_mirror import message_row
 
 import math
 
@@ -38,12 +41,12 @@ THREAD_HISTORY_TIMEOUT: float = 30.0
 # Helper Functions
 # =============================================================================
 
-def _calculate_avg_response_time(messages: List[discord.Message]) -> Optional[float]:
+def _calculate_avg_response_time(messages: List["MirrorMessage"]) -> Optional[float]:
     """
     Calculate average time between consecutive messages in minutes.
 
     Args:
-        messages: List of Discord messages (should be non-bot messages)
+        messages: Human messages (anything with created_at)
 
     Returns:
         Average response time in minutes, or None if not enough messages
@@ -142,6 +145,73 @@ async def _collect_messages_with_timeout(
     return messages, is_complete
 
 
+async def _collect_from_history(
+    thread: discord.Thread
+) -> tuple[List["MirrorMessage"], Dict[int, tuple[int, int]]]:
+    """
+    Read human messages and vote counts straight from Discord.
+
+    Returns:
+        (messages oldest first, message_id -> (upvotes, downvotes))
+    """
+    raw_messages, data_complete = await _collect_messages_with_timeout(thread)
+    if not data_complete:
+        logger.debug("Analytics Using Partial Data", [
+            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ("Messages", str(len(raw_messages))),
+        ])
+
+    messages: List[MirrorMessage] = []
+    votes: Dict[int, tuple[int, int]] = {}
+    for message in raw_messages:
+        # Skip bot messages (analytics embed)
+        if message.author.bot:
+            continue
+        messages.append(MirrorMessage(*message_row(message)))
+
+        upvotes = 0
+        downvotes = 0
+        for reaction in message.reactions:
+            emoji_str = str(reaction.emoji)
+            if emoji_str == UPVOTE_EMOJI:
+                async for user in reaction.users():
+                    if not user.bot:
+                        upvotes += 1
+            elif emoji_str == DOWNVOTE_EMOJI:
+                async for user in reaction.users():
+                    if not user.bot:
+                        downvotes += 1
+        votes[message.id] = (upvotes, downvotes)
+
+    messages.sort(key=lambda m: m.message_id)
+    return messages, votes
+
+
+async def _collect_from_mirror(
+    thread: discord.Thread,
+    database: "DebatesDatabase",
+    mirror: "MessageMirror"
+) -> tuple[List["MirrorMessage"], Dict[int, tuple[int, int]]]:
+    """
+    Read human messages and vote counts from the local mirror.
+
+    Syncs the thread from Discord first if it isn't live yet.
+
+    Returns:
+        (messages oldest first, message_id -> (upvotes, downvotes))
+    """
+    await mirror.ensure(thread)
+    messages = await asyncio.to_thread(database.get_mirror_messages, thread.id)
+    reactions = await asyncio.to_thread(
+        database.get_mirror_reactions, thread.id, (UPVOTE_EMOJI, DOWNVOTE_EMOJI)
+    )
+    votes = {
+        message_id: (len(by_emoji.get(UPVOTE_EMOJI, ())), len(by_emoji.get(DOWNVOTE_EMOJI, ())))
+        for message_id, by_emoji in reactions.items()
+    }
+    return messages, votes
+
+
 # =============================================================================
 # Analytics Data Structures
 # =============================================================================
@@ -195,7 +265,8 @@ class DebateAnalytics:
 
 async def calculate_debate_analytics(
     thread: discord.Thread,
-    database: "DebatesDatabase"
+    database: "DebatesDatabase",
+    mirror: Optional["MessageMirror"] = None
 ) -> DebateAnalytics:
     """
     Calculate analytics for a debate thread.
@@ -203,12 +274,12 @@ async def calculate_debate_analytics(
     Args:
         thread: Discord thread object
         database: DebatesDatabase instance
+        mirror: Message mirror to read from instead of thread history
 
     Returns:
         DebateAnalytics object with calculated statistics
     """
     try:
-        # Fetch all messages in the thread with timeout protection
         participants = set()
         reply_counts: Dict[int, int] = {}  # user_id -> count
         total_replies = 0
@@ -216,48 +287,32 @@ async def calculate_debate_analytics(
         hourly_activity: List[int] = [0] * 5  # Last 5 hours
         total_thread_karma = 0  # Track karma earned from votes in THIS thread
 
-        # Get all messages from the thread (with timeout)
-        messages, data_complete = await _collect_messages_with_timeout(thread)
-        if not data_complete:
-            logger.debug("Analytics Using Partial Data", [
-                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                ("Messages", str(len(messages))),
-            ])
-        for message in messages:
-            # Skip bot messages (analytics embed)
-            if message.author.bot:
-                continue
+        # Human messages oldest first, plus (upvotes, downvotes) per message
+        if mirror is not None:
+            messages, votes = await _collect_from_mirror(thread, database, mirror)
+        else:
+            messages, votes = await _collect_from_history(thread)
 
+        for message in messages:
             # Add all human message authors as participants (including OP)
-            participants.add(message.author.id)
+            participants.add(message.author_id)
 
             # Track last activity from any message
             if message.created_at > last_activity:
                 last_activity = message.created_at
 
             # Count votes (upvotes - downvotes) on this message for thread karma
-            upvotes = 0
-            downvotes = 0
-            for reaction in message.reactions:
-                emoji_str = str(reaction.emoji)
-                if emoji_str == UPVOTE_EMOJI:
-                    async for user in reaction.users():
-                        if not user.bot:
-                            upvotes += 1
-                elif emoji_str == DOWNVOTE_EMOJI:
-                    async for user in reaction.users():
-                        if not user.bot:
-                            downvotes += 1
+            upvotes, downvotes = votes.get(message.message_id, (0, 0))
             total_thread_karma += upvotes - downvotes
 
             # Skip the original post for reply counting
-            if message.id == thread.id:
+            if message.message_id == thread.id:
                 continue
 
             total_replies += 1
 
             # Count replies per user
-            user_id = message.author.id
+            user_id = message.author_id
             reply_counts[user_id] = reply_counts.get(user_id, 0) + 1
 
             # Calculate hourly activity (for graph)
@@ -280,8 +335,8 @@ async def calculate_debate_analytics(
             # Build user_id -> username mapping from messages
             user_names: Dict[int, str] = {}
             for message in messages:
-                if message.author.id not in user_names:
-                    user_names[message.author.id] = message.author.display_name
+                if message.author_id not in user_names:
+                    user_names[message.author_id] = message.author_name
 
             # Build top contributors list (store user IDs for mention format)
             for user_id, count in sorted_contributors:
@@ -297,9 +352,7 @@ async def calculate_debate_analytics(
         activity_graph = generate_activity_graph(hourly_activity)
 
         # Calculate quality metrics
-        # Filter non-bot messages for response time calculation
-        non_bot_messages = [m for m in messages if not m.author.bot]
-        avg_response_minutes = _calculate_avg_response_time(non_bot_messages)
+        avg_response_minutes = _calculate_avg_response_time(messages)
         diversity_score = _calculate_diversity_score(reply_counts)
 
         return DebateAnalytics(
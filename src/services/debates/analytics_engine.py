@@ -0,0 +1,458 @@
+"""
+OthmanBot - Incremental Debate Analytics
+========================================
+
+Per-thread analytics accumulators updated from message mirror events,
+so an analytics embed refresh doesn't recompute over the whole thread.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import heapq
+import math
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import ANALYTICS_ENGINE_MAX_THREADS, LOG_TITLE_PREVIEW_LENGTH, NY_TZ
+from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI
+from src.services.debates.analytics import (
+    DebateAnalytics,
+    calculate_debate_analytics,
+    generate_activity_graph,
+)
+
+if TYPE_CHECKING:
+    from src.services.debates.db import DebatesDatabase, MirrorMessage
+    from src.services.debates.db.mirror import MirrorMessageRow
+    from src.services.debates.message_mirror import MessageMirror
+
+
+# Gaps of a day or more don't count towards average response time
+RESPONSE_GAP_LIMIT_SECONDS = 86400
+
+# Hours shown in the activity graph
+ACTIVITY_GRAPH_HOURS = 5
+
+
+def _c_log_c(count: int) -> float:
+    """count * log2(count), the per-user term of the entropy sum."""
+    return count * math.log2(count) if count > 0 else 0.0
+
+
+# =============================================================================
+# Thread Accumulator
+# =============================================================================
+
+class ThreadAnalyticsAccumulator:
+    """
+    Running analytics state for one thread.
+
+    Holds each human message's author, timestamp and voter sets, plus
+    the aggregates calculate_debate_analytics derives from them:
+    participant and reply counts, thread karma, the sorted timeline with
+    the sum of response gaps, and the sum of c*log2(c) over reply counts
+    (entropy is log2(T) - S/T for T replies). Every update is O(log n)
+    at worst; a snapshot only walks the last few hours of the timeline
+    and the participant list.
+
+    All updates are idempotent so events can be replayed safely.
+    """
+
+    def __init__(self, thread_id: int) -> None:
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            thread_id: Thread ID (also the starter message ID)
+        """
+        self.thread_id = thread_id
+        # message_id -> (author_id, timestamp)
+        self._messages: dict[int, tuple[int, float]] = {}
+        self._upvoters: dict[int, set[int]] = {}
+        self._downvoters: dict[int, set[int]] = {}
+        self._timeline: list[tuple[float, int]] = []
+
+        self._author_messages: dict[int, int] = {}
+        self._reply_counts: dict[int, int] = {}
+        self._names: dict[int, str] = {}
+        self._total_replies = 0
+        self._karma = 0
+        self._gap_sum = 0.0
+        self._gap_count = 0
+        self._entropy_sum = 0.0
+
+    # -------------------------------------------------------------------------
+    # Messages
+    # -------------------------------------------------------------------------
+
+    def add_message(self, message_id: int, author_id: int, author_name: str, created_at: datetime) -> None:
+        """Add a human message (no-op if already present)."""
+        if message_id in self._messages:
+            return
+        timestamp = created_at.timestamp()
+        self._messages[message_id] = (author_id, timestamp)
+        self._upvoters.setdefault(message_id, set())
+        self._downvoters.setdefault(message_id, set())
+        self._karma += len(self._upvoters[message_id]) - len(self._downvoters[message_id])
+        self._names[author_id] = author_name or self._names.get(author_id, "")
+
+        # Splice into the timeline, replacing the gap it lands in
+        entry = (timestamp, message_id)
+        index = bisect_left(self._timeline, entry)
+        before = self._timeline[index - 1][0] if index > 0 else None
+        after = self._timeline[index][0] if index < len(self._timeline) else None
+        if before is not None and after is not None:
+            self._count_gap(after - before, -1)
+        if before is not None:
+            self._count_gap(timestamp - before, 1)
+        if after is not None:
+            self._count_gap(after - timestamp, 1)
+        self._timeline.insert(index, entry)
+
+        self._author_messages[author_id] = self._author_messages.get(author_id, 0) + 1
+        if message_id != self.thread_id:
+            self._change_replies(author_id, 1)
+
+    def remove_message(self, message_id: int) -> None:
+        """Remove a deleted message (no-op if unknown)."""
+        known = self._messages.pop(message_id, None)
+        if known is None:
+            return
+        author_id, timestamp = known
+        self._karma -= len(self._upvoters.pop(message_id, ())) - len(self._downvoters.pop(message_id, ()))
+
+        index = bisect_left(self._timeline, (timestamp, message_id))
+        before = self._timeline[index - 1][0] if index > 0 else None
+        after = self._timeline[index + 1][0] if index + 1 < len(self._timeline) else None
+        if before is not None:
+            self._count_gap(timestamp - before, -1)
+        if after is not None:
+            self._count_gap(after - timestamp, -1)
+        if before is not None and after is not None:
+            self._count_gap(after - before, 1)
+        del self._timeline[index]
+
+        remaining = self._author_messages[author_id] - 1
+        if remaining:
+            self._author_messages[author_id] = remaining
+        else:
+            del self._author_messages[author_id]
+        if message_id != self.thread_id:
+            self._change_replies(author_id, -1)
+
+    def _count_gap(self, seconds: float, sign: int) -> None:
+        """Add or remove one gap between consecutive messages."""
+        if seconds < RESPONSE_GAP_LIMIT_SECONDS:
+            self._gap_sum += sign * seconds
+            self._gap_count += sign
+
+    def _change_replies(self, author_id: int, change: int) -> None:
+        """Adjust a user's reply count and the entropy sum."""
+        old = self._reply_counts.get(author_id, 0)
+        new = old + change
+        self._entropy_sum += _c_log_c(new) - _c_log_c(old)
+        self._total_replies += change
+        if new:
+            self._reply_counts[author_id] = new
+        else:
+            self._reply_counts.pop(author_id, None)
+
+    # -------------------------------------------------------------------------
+    # Votes
+    # -------------------------------------------------------------------------
+
+    def set_vote(self, message_id: int, emoji: str, user_id: int, present: bool) -> None:
+        """Apply a vote reaction being added or removed."""
+        voters = self._voters(message_id, emoji)
+        if voters is None or (user_id in voters) == present:
+            return
+        if present:
+            voters.add(user_id)
+        else:
+            voters.discard(user_id)
+        if message_id in self._messages:
+            change = 1 if present else -1
+            self._karma += change if emoji == UPVOTE_EMOJI else -change
+
+    def clear_votes(self, message_id: int, emoji: Optional[str] = None) -> None:
+        """Apply reactions being cleared from a message."""
+        for vote_emoji in (UPVOTE_EMOJI, DOWNVOTE_EMOJI):
+            if emoji is None or emoji == vote_emoji:
+                for user_id in list(self._voters(message_id, vote_emoji) or ()):
+                    self.set_vote(message_id, vote_emoji, user_id, False)
+
+    def _voters(self, message_id: int, emoji: str) -> Optional[set[int]]:
+        """Voter set for a message and vote emoji (None for other emojis)."""
+        if emoji == UPVOTE_EMOJI:
+            return self._upvoters.setdefault(message_id, set())
+        if emoji == DOWNVOTE_EMOJI:
+            return self._downvoters.setdefault(message_id, set())
+        return None
+
+    # -------------------------------------------------------------------------
+    # Snapshot
+    # -------------------------------------------------------------------------
+
+    def snapshot(self, created_at: Optional[datetime]) -> DebateAnalytics:
+        """Build the analytics the embed shows from the running totals."""
+        now = time.time()
+        if self._timeline:
+            last_activity = datetime.fromtimestamp(self._timeline[-1][0], timezone.utc)
+        else:
+            last_activity = datetime.now(NY_TZ)
+
+        # Walk back through the last few hours only
+        hourly_activity = [0] * ACTIVITY_GRAPH_HOURS
+        for timestamp, message_id in reversed(self._timeline):
+            hours_ago = (now - timestamp) / 3600
+            if hours_ago >= ACTIVITY_GRAPH_HOURS:
+                break
+            if message_id != self.thread_id and hours_ago >= 0:
+                hourly_activity[int(hours_ago)] += 1
+
+        top_contributors = heapq.nlargest(3, self._reply_counts.items(), key=lambda item: item[1])
+        top_contributor = None
+        if top_contributors:
+            first_user_id, first_count = top_contributors[0]
+            top_contributor = (self._names.get(first_user_id) or f"User {first_user_id}", first_count)
+
+        avg_response_minutes = None
+        if len(self._timeline) >= 2 and self._gap_count > 0:
+            avg_response_minutes = max(0.0, self._gap_sum) / self._gap_count / 60.0
+
+        return DebateAnalytics(
+            participants=len(self._author_messages),
+            total_replies=self._total_replies,
+            total_karma=self._karma,
+            last_activity=last_activity,
+            created_at=created_at,
+            top_contributor=top_contributor,
+            top_contributors=top_contributors,
+            activity_graph=generate_activity_graph(hourly_activity),
+            avg_response_minutes=avg_response_minutes,
+            diversity_score=self._diversity(),
+        )
+
+    def _diversity(self) -> Optional[float]:
+        """Normalized Shannon entropy of reply counts (matches the full recompute)."""
+        users = len(self._reply_counts)
+        total = self._total_replies
+        if users < 2 or total <= 0:
+            return None
+        entropy = math.log2(total) - self._entropy_sum / total
+        return min(1.0, max(0.0, entropy / math.log2(users)))
+
+    @property
+    def message_count(self) -> int:
+        """Human messages held."""
+        return len(self._messages)
+
+
+# =============================================================================
+# Analytics Engine
+# =============================================================================
+
+class DebateAnalyticsEngine:
+    """
+    Serves analytics embeds from per-thread accumulators.
+
+    DESIGN: update_analytics_embed recomputed everything on each refresh
+    (up to every 30s per thread), walking every message and vote in the
+    thread. The engine registers as a MessageMirror listener and applies
+    each message, deletion and vote reaction to the thread's accumulator
+    as it happens, so a refresh is a snapshot of running totals.
+
+    An accumulator is built from the mirror on first use (a cache miss)
+    and dropped when the mirror re-syncs or forgets the thread, or when
+    it is evicted (least recently used beyond ANALYTICS_ENGINE_MAX_THREADS).
+    Events that arrive while a build is reading the mirror are replayed
+    on top of it.
+    """
+
+    def __init__(
+        self,
+        db: "DebatesDatabase",
+        mirror: "MessageMirror",
+        max_threads: int = ANALYTICS_ENGINE_MAX_THREADS,
+    ) -> None:
+        """
+        Initialize the engine and subscribe to mirror events.
+
+        Args:
+            db: Debates database (mirror tables)
+            mirror: Message mirror feeding events
+            max_threads: Accumulators kept in memory
+        """
+        self._db = db
+        self._mirror = mirror
+        self._max_threads = max(1, max_threads)
+        self._threads: OrderedDict[int, ThreadAnalyticsAccumulator] = OrderedDict()
+        self._building: dict[int, list[Callable[[ThreadAnalyticsAccumulator], None]]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        mirror.add_listener(self)
+
+        # Metrics
+        self.hits = 0
+        self.rebuilds = 0
+        self.fallbacks = 0
+        self.events = 0
+        self.rebuild_seconds = 0.0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def calculate(self, thread: discord.Thread) -> DebateAnalytics:
+        """
+        Get current analytics for a thread.
+
+        Falls back to a full recompute from Discord if the accumulator
+        can't be built.
+        """
+        accumulator = self._threads.get(thread.id)
+        if accumulator is not None:
+            self.hits += 1
+            self._threads.move_to_end(thread.id)
+            return accumulator.snapshot(thread.created_at)
+
+        try:
+            accumulator = await self._rebuild(thread)
+        except Exception as e:
+            self.fallbacks += 1
+            logger.warning("Analytics Accumulator Build Failed", [
+                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+                ("Error Type", type(e).__name__),
+                ("Error", str(e)[:100]),
+                ("Action", "Full recompute"),
+            ])
+            return await calculate_debate_analytics(thread, self._db, self._mirror)
+        return accumulator.snapshot(thread.created_at)
+
+    def get_stats(self) -> dict:
+        """Cache size and hit/rebuild counters."""
+        return {
+            "threads": len(self._threads),
+            "messages": sum(acc.message_count for acc in self._threads.values()),
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "fallbacks": self.fallbacks,
+            "events": self.events,
+            "rebuild_seconds": round(self.rebuild_seconds, 2),
+        }
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    async def _rebuild(self, thread: discord.Thread) -> ThreadAnalyticsAccumulator:
+        """Build a thread's accumulator from the mirror (once per miss)."""
+        lock = self._locks.setdefault(thread.id, asyncio.Lock())
+        async with lock:
+            accumulator = self._threads.get(thread.id)
+            if accumulator is not None:
+                return accumulator
+
+            started = time.perf_counter()
+            pending: list[Callable[[ThreadAnalyticsAccumulator], None]] = []
+            self._building[thread.id] = pending
+            try:
+                await self._mirror.ensure(thread)
+                messages = await asyncio.to_thread(self._db.get_mirror_messages, thread.id)
+                reactions = await asyncio.to_thread(
+                    self._db.get_mirror_reactions, thread.id, (UPVOTE_EMOJI, DOWNVOTE_EMOJI)
+                )
+                accumulator = self._build(thread.id, messages, reactions)
+                for apply in pending:
+                    apply(accumulator)
+            finally:
+                self._building.pop(thread.id, None)
+
+            self._threads[thread.id] = accumulator
+            while len(self._threads) > self._max_threads:
+                evicted, _ = self._threads.popitem(last=False)
+                self._locks.pop(evicted, None)
+
+            elapsed = time.perf_counter() - started
+            self.rebuilds += 1
+            self.rebuild_seconds += elapsed
+            logger.debug("Analytics Accumulator Built", [
+                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+                ("Messages", str(accumulator.message_count)),
+                ("Replayed Events", str(len(pending))),
+                ("Duration", f"{elapsed * 1000:.1f}ms"),
+            ])
+            return accumulator
+
+    @staticmethod
+    def _build(
+        thread_id: int,
+        messages: Iterable["MirrorMessage"],
+        reactions: dict[int, dict[str, set[int]]],
+    ) -> ThreadAnalyticsAccumulator:
+        """Fold mirrored messages and votes into a fresh accumulator."""
+        accumulator = ThreadAnalyticsAccumulator(thread_id)
+        for message in messages:
+            for emoji, users in reactions.get(message.message_id, {}).items():
+                for user_id in users:
+                    accumulator.set_vote(message.message_id, emoji, user_id, True)
+            accumulator.add_message(message.message_id, message.author_id, message.author_name, message.created_at)
+        return accumulator
+
+    # -------------------------------------------------------------------------
+    # Mirror Listener
+    # -------------------------------------------------------------------------
+
+    def _dispatch(self, thread_id: int, apply: Callable[[ThreadAnalyticsAccumulator], None]) -> None:
+        """Apply an event to the thread's accumulator and any build in progress."""
+        accumulator = self._threads.get(thread_id)
+        pending = self._building.get(thread_id)
+        if accumulator is None and pending is None:
+            return
+        self.events += 1
+        if accumulator is not None:
+            apply(accumulator)
+        if pending is not None:
+            pending.append(apply)
+
+    def on_mirror_message(self, row: "MirrorMessageRow") -> None:
+        """A message was posted."""
+        message_id, thread_id, author_id, author_name, is_bot, created_at, _ = row
+        if is_bot:
+            return
+        self._dispatch(thread_id, lambda acc: acc.add_message(message_id, author_id, author_name, created_at))
+
+    def on_mirror_delete(self, thread_id: int, message_ids: list[int]) -> None:
+        """Messages were deleted."""
+        def apply(acc: ThreadAnalyticsAccumulator) -> None:
+            for message_id in message_ids:
+                acc.remove_message(message_id)
+        self._dispatch(thread_id, apply)
+
+    def on_mirror_reaction(self, thread_id: int, message_id: int, emoji: str, user_id: int, added: bool) -> None:
+        """A tracked reaction was added or removed."""
+        if emoji not in (UPVOTE_EMOJI, DOWNVOTE_EMOJI):
+            return
+        self._dispatch(thread_id, lambda acc: acc.set_vote(message_id, emoji, user_id, added))
+
+    def on_mirror_clear(self, thread_id: int, message_id: int, emoji: Optional[str]) -> None:
+        """Reactions were cleared from a message."""
+        self._dispatch(thread_id, lambda acc: acc.clear_votes(message_id, emoji))
+
+    def on_mirror_reset(self, thread_id: int) -> None:
+        """The mirror re-synced or forgot the thread; rebuild on next use."""
+        self._threads.pop(thread_id, None)
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["DebateAnalyticsEngine", "ThreadAnalyticsAccumulator"]
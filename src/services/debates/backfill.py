@@ -90,6 +90,7 @@ async def backfill_debate_stats(bot: "OthmanBot") -> dict:
         ])
 
         unique_users = set()
+        mirror = bot.debates_service.mirror
 
         for thread in all_threads:
             # Skip deprecated threads
@@ -105,18 +106,14 @@ async def backfill_debate_stats(bot: "OthmanBot") -> dict:
                     stats["creators_recorded"] += 1
                     unique_users.add(thread.owner_id)
 
-                # Count messages per user in this thread
-                message_counts: dict[int, int] = {}
-
-                async for message in thread.history(limit=1000):
-                    # Skip bot messages
-                    if message.author.bot:
-                        continue
-
-                    user_id = message.author.id
-                    message_counts[user_id] = message_counts.get(user_id, 0) + 1
-                    stats["messages_counted"] += 1
-                    unique_users.add(user_id)
+                # Count messages per user in this thread (from the local mirror)
+                was_live = mirror.is_live(thread.id)
+                await mirror.ensure(thread)
+                message_counts = await asyncio.to_thread(
+                    bot.debates_service.db.get_mirror_message_counts, thread.id
+                )
+                stats["messages_counted"] += sum(message_counts.values())
+                unique_users.update(message_counts)
 
                 # Batch insert participation counts
                 for user_id, count in message_counts.items():
@@ -131,8 +128,9 @@ async def backfill_debate_stats(bot: "OthmanBot") -> dict:
                     ("Users", str(len(message_counts))),
                 ])
 
-                # Rate limit protection
-                await asyncio.sleep(DISCORD_API_DELAY)
+                # Rate limit protection (only when the mirror had to read Discord)
+                if not was_live:
+                    await asyncio.sleep(DISCORD_API_DELAY)
 
             except discord.HTTPException as e:
                 logger.warning("📊 Error Scanning Thread", [
@@ -214,6 +212,7 @@ async def reconcile_debate_stats(bot: "OthmanBot") -> dict:
         ])
 
         unique_users = set()
+        mirror = bot.debates_service.mirror
 
         for thread in all_threads:
             # Skip deprecated threads
@@ -229,18 +228,14 @@ async def reconcile_debate_stats(bot: "OthmanBot") -> dict:
                     stats["creators_recorded"] += 1
                     unique_users.add(thread.owner_id)
 
-                # Count messages per user in this thread
-                message_counts: dict[int, int] = {}
-
-                async for message in thread.history(limit=1000):
-                    # Skip bot messages
-                    if message.author.bot:
-                        continue
-
-                    user_id = message.author.id
-                    message_counts[user_id] = message_counts.get(user_id, 0) + 1
-                    stats["messages_counted"] += 1
-                    unique_users.add(user_id)
+                # Count messages per user in this thread (from the local mirror)
+                was_live = mirror.is_live(thread.id)
+                await mirror.ensure(thread)
+                message_counts = await asyncio.to_thread(
+                    bot.debates_service.db.get_mirror_message_counts, thread.id
+                )
+                stats["messages_counted"] += sum(message_counts.values())
+                unique_users.update(message_counts)
 
                 # Update participation counts (overwrites existing data)
                 for user_id, count in message_counts.items():
@@ -248,8 +243,9 @@ async def reconcile_debate_stats(bot: "OthmanBot") -> dict:
                         thread.id, user_id, count
                     )
 
-                # Rate limit protection
-                await asyncio.sleep(DISCORD_API_DELAY)
+                # Rate limit protection (only when the mirror had to read Discord)
+                if not was_live:
+                    await asyncio.sleep(DISCORD_API_DELAY)
 
             except discord.HTTPException as e:
                 logger.warning("📊 Error Scanning Thread", [
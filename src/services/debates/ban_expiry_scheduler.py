@@ -9,17 +9,18 @@ Server: discord.gg/syria
 """
 
 import asyncio
-from datetime import datetime
-from typing import TYPE_CHECKING
-
-from discord.ext import tasks
+import time
+from typing import TYPE_CHECKING, Callable, Optional
 
 from src.core.logger import logger
-from src.core.config import SYRIA_GUILD_ID
+from src.core.config import BAN_EXPIRY_MAX_SLEEP
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
 
+# Seconds to wait before retrying an expiry whose removal failed
+EXPIRY_RETRY_DELAY: float = 30.0
+
 
 # =============================================================================
 # Ban Expiry Scheduler
@@ -27,11 +28,14 @@ if TYPE_CHECKING:
 
 class BanExpiryScheduler:
     """
-    Scheduler that periodically checks for and removes expired debate bans.
+    Timer that removes debate bans the moment they expire.
 
     DESIGN:
-    - Runs every 1 minute to check for expired bans
-    - Automatically removes bans that have passed their expires_at timestamp
+    - Sleeps until the earliest expiry in the in-memory ban index's heap
+      instead of polling the table every minute, so unbans happen on time
+    - New bans wake the timer so an earlier expiry re-arms it
+    - Sleeps at most BAN_EXPIRY_MAX_SLEEP, and sweeps once at startup, to
+      catch bans that expired while the bot was offline
     - Logs all automatic unbans for audit trail
     """
 
@@ -43,24 +47,84 @@ class BanExpiryScheduler:
             bot: The OthmanBot instance
         """
         self.bot = bot
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._last_due: float = 0.0
 
     async def start(self) -> None:
         """Start the scheduler."""
-        if not self._check_expired_bans.is_running():
-            self._check_expired_bans.start()
-            logger.info("Ban Expiry Scheduler Started", [
-                ("Interval", "1 minute"),
-            ])
+        if self._task is not None and not self._task.done():
+            return
+
+        bans = await self.bot.debates_service.db.ensure_bans_async()
+        loop = asyncio.get_running_loop()
+
+        def wake() -> None:
+            # Ban writes run in worker threads
+            try:
+                loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass  # Loop closed during shutdown
+
+        self._unsubscribe = bans.add_listener(wake)
+        self._task = asyncio.create_task(self._run(), name="ban_expiry_scheduler")
+        logger.info("Ban Expiry Scheduler Started", [
+            ("Mode", "Timer at next expiry"),
+            ("Max Sleep", f"{BAN_EXPIRY_MAX_SLEEP:.0f}s"),
+        ])
 
     async def stop(self) -> None:
         """Stop the scheduler."""
-        if self._check_expired_bans.is_running():
-            self._check_expired_bans.cancel()
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
             logger.info("Ban Expiry Scheduler Stopped", [
                 ("Status", "Task cancelled"),
             ])
+        self._task = None
+
+    async def _run(self) -> None:
+        """Sleep until the next expiry (or a wake-up), then process due bans."""
+        await self.bot.wait_until_ready()
+
+        # Catch up on bans that expired while the bot was offline
+        await self._check_expired_bans()
+
+        while True:
+            try:
+                bans = await self.bot.debates_service.db.ensure_bans_async()
+                next_expiry = bans.next_expiry()
+            except Exception as e:
+                logger.error("Ban Expiry Timer Failed To Read Ban Index", [
+                    ("Error", str(e)),
+                ])
+                next_expiry = None
+
+            delay = BAN_EXPIRY_MAX_SLEEP
+            if next_expiry is not None:
+                delay = min(delay, max(0.0, next_expiry - time.time()))
+                if next_expiry <= self._last_due:
+                    # Same ban still due after a check: removal failed, back off
+                    delay = max(delay, EXPIRY_RETRY_DELAY)
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                # Woken by a new ban; re-arm for its expiry
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            self._last_due = next_expiry or 0.0
+            await self._check_expired_bans()
 
-    @tasks.loop(minutes=1)
     async def _check_expired_bans(self) -> None:
         """Check for and remove expired bans."""
         try:
@@ -74,7 +138,7 @@ class BanExpiryScheduler:
 
             # Get expired bans before removing them (for logging)
             try:
-                expired_bans = db.get_expired_bans()
+                expired_bans = await asyncio.to_thread(db.get_expired_bans)
             except Exception as e:
                 logger.error("Failed to Query Expired Bans", [
                     ("Error", str(e)),
@@ -88,7 +152,7 @@ class BanExpiryScheduler:
             # This ensures users only receive "unbanned" notifications after the ban
             # is actually removed from the database
             try:
-                removed_count = db.remove_expired_bans()
+                removed_count = await asyncio.to_thread(db.remove_expired_bans)
 
                 if removed_count > 0:
                     logger.tree("Auto-Unban Complete", [
@@ -177,11 +241,6 @@ class BanExpiryScheduler:
             except Exception:
                 pass  # Don't fail on webhook error
 
-    @_check_expired_bans.before_loop
-    async def _before_check(self) -> None:
-        """Wait until the bot is ready before starting."""
-        await self.bot.wait_until_ready()
-
 
 # =============================================================================
 # Module Export
@@ -261,8 +261,7 @@ class ClosedDebateDeleteScheduler:
 
             # Check appeals table for approved appeal with action_type='close' and action_id=thread_id
             def check_appeal():
-                with db._lock:
-                    conn = db._get_connection()
+                with db._read_connection() as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         """SELECT 1 FROM appeals
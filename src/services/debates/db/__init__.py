@@ -23,6 +23,7 @@ from src.services.debates.db.models import (
     ThreadAnalytics,
     AppealRecord,
     UserStreak,
+    MirrorMessage,
 )
 
 __all__ = [
@@ -41,4 +42,5 @@ __all__ = [
     "ThreadAnalytics",
     "AppealRecord",
     "UserStreak",
+    "MirrorMessage",
 ]
@@ -9,17 +9,19 @@ Server: discord.gg/syria
 """
 
 import asyncio
+import sqlite3
 from datetime import datetime, timedelta
 from typing import Optional
 
+from src.services.debates.db.participation_buffer import ParticipationBuffer
+
 
 class AnalyticsMixin:
     """Mixin for analytics and participation operations."""
 
     def get_user_analytics(self, user_id: int) -> dict:
         """Get detailed analytics for a user's debate participation."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT COUNT(*) FROM debate_participation WHERE user_id = ?", (user_id,))
@@ -43,8 +45,7 @@ class AnalyticsMixin:
 
     def has_debate_participation(self, user_id: int) -> bool:
         """Check if a user has ever participated in debates."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT 1 FROM debate_participation WHERE user_id = ? LIMIT 1", (user_id,))
@@ -66,43 +67,46 @@ class AnalyticsMixin:
         with self._lock:
             conn = self._get_connection()
             cursor = conn.cursor()
+            result = self._apply_streak(cursor, user_id, today)
+            conn.commit()
+            return result
 
-            cursor.execute(
-                "SELECT current_streak, longest_streak, last_active_date FROM user_streaks WHERE user_id = ?",
-                (user_id,)
-            )
-            row = cursor.fetchone()
-
-            if row:
-                current_streak, longest_streak, last_active_date = row
+    def _apply_streak(self, cursor, user_id: int, today: str) -> dict:
+        """Extend or reset a user's streak for activity on `today` (writer lock held)."""
+        cursor.execute(
+            "SELECT current_streak, longest_streak, last_active_date FROM user_streaks WHERE user_id = ?",
+            (user_id,)
+        )
+        row = cursor.fetchone()
 
-                if last_active_date == today:
-                    return {"current_streak": current_streak, "longest_streak": longest_streak, "streak_extended": False}
+        if row:
+            current_streak, longest_streak, last_active_date = row
 
-                yesterday = (datetime.now(NY_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
-                           - timedelta(days=1)).strftime("%Y-%m-%d")
+            if last_active_date is not None and last_active_date >= today:
+                return {"current_streak": current_streak, "longest_streak": longest_streak, "streak_extended": False}
 
-                if last_active_date == yesterday:
-                    current_streak += 1
-                    if current_streak > longest_streak:
-                        longest_streak = current_streak
-                else:
-                    current_streak = 1
+            yesterday = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
 
-                cursor.execute(
-                    "UPDATE user_streaks SET current_streak = ?, longest_streak = ?, last_active_date = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?",
-                    (current_streak, longest_streak, today, user_id)
-                )
+            if last_active_date == yesterday:
+                current_streak += 1
+                if current_streak > longest_streak:
+                    longest_streak = current_streak
             else:
                 current_streak = 1
-                longest_streak = 1
-                cursor.execute(
-                    "INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_active_date) VALUES (?, 1, 1, ?)",
-                    (user_id, today)
-                )
 
-            conn.commit()
-            return {"current_streak": current_streak, "longest_streak": longest_streak, "streak_extended": True}
+            cursor.execute(
+                "UPDATE user_streaks SET current_streak = ?, longest_streak = ?, last_active_date = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ?",
+                (current_streak, longest_streak, today, user_id)
+            )
+        else:
+            current_streak = 1
+            longest_streak = 1
+            cursor.execute(
+                "INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_active_date) VALUES (?, 1, 1, ?)",
+                (user_id, today)
+            )
+
+        return {"current_streak": current_streak, "longest_streak": longest_streak, "streak_extended": True}
 
     async def update_user_streak_async(self, user_id: int) -> dict:
         """Async wrapper for update_user_streak."""
@@ -110,8 +114,7 @@ class AnalyticsMixin:
 
     def get_user_streak(self, user_id: int) -> dict:
         """Get a user's current streak data."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT current_streak, longest_streak, last_active_date FROM user_streaks WHERE user_id = ?",
@@ -128,8 +131,7 @@ class AnalyticsMixin:
 
     def get_top_streaks(self, limit: int = 3) -> list[dict]:
         """Get users with the highest current streaks."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT user_id, current_streak, longest_streak FROM user_streaks ORDER BY current_streak DESC LIMIT ?",
@@ -154,6 +156,100 @@ class AnalyticsMixin:
         """Async wrapper for increment_participation."""
         await asyncio.to_thread(self.increment_participation, thread_id, user_id)
 
+    # =========================================================================
+    # Buffered Participation
+    # =========================================================================
+
+    def recover_participation(self) -> ParticipationBuffer:
+        """
+        Return the participation buffer, replaying leftover journals if needed.
+
+        Recovers under the writer lock so no flush can commit between reading
+        the last committed batch and the replay. Reads the database, so call
+        it off the event loop.
+        """
+        buffer = self._participation
+        if buffer.is_loaded:
+            return buffer
+
+        with self._lock:
+            if buffer.is_loaded:
+                return buffer
+            cursor = self._get_connection().cursor()
+            cursor.execute("SELECT last_batch FROM participation_flush WHERE id = 1")
+            row = cursor.fetchone()
+            buffer.recover(row[0] if row else 0)
+        return buffer
+
+    async def recover_participation_async(self) -> ParticipationBuffer:
+        """Async wrapper for recover_participation."""
+        return await asyncio.to_thread(self.recover_participation)
+
+    def record_participation(self, thread_id: int, user_id: int) -> bool:
+        """
+        Count a debate message and, on the user's first message today, queue
+        a streak update. Nothing is written until flush_participation, and
+        the database is never read here; events recorded before
+        recover_participation are held by the buffer until it runs.
+
+        Returns:
+            True if a streak update was queued
+        """
+        from src.core.config import NY_TZ
+        today = datetime.now(NY_TZ).strftime("%Y-%m-%d")
+        return self._participation.record(thread_id, user_id, today)
+
+    def get_pending_participation(self) -> int:
+        """Number of recorded messages not yet flushed."""
+        return self._participation.pending
+
+    def get_participation_buffer_stats(self) -> dict:
+        """Get participation buffer size and recording counters."""
+        return self._participation.get_stats()
+
+    def flush_participation(self) -> dict:
+        """
+        Write every buffered participation count and streak in one transaction.
+
+        Returns:
+            Dict with rows and streaks written
+        """
+        buffer = self.recover_participation()
+        with self._lock:
+            batch = buffer.seal()
+            if batch is None:
+                return {"rows": 0, "messages": 0, "streaks": 0}
+
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    """INSERT INTO debate_participation (thread_id, user_id, message_count)
+                       VALUES (?, ?, ?)
+                       ON CONFLICT(thread_id, user_id) DO UPDATE SET message_count = message_count + excluded.message_count""",
+                    [(thread_id, user_id, count) for (thread_id, user_id), count in batch.counts.items()]
+                )
+                for user_id, day in batch.streaks:
+                    self._apply_streak(cursor, user_id, day)
+                cursor.execute(
+                    """INSERT INTO participation_flush (id, last_batch) VALUES (1, ?)
+                       ON CONFLICT(id) DO UPDATE SET last_batch = excluded.last_batch""",
+                    (batch.batch_id,)
+                )
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                buffer.restore(batch)
+                raise
+
+        buffer.committed(batch)
+        return {
+            "rows": len(batch.counts),
+            "messages": sum(batch.counts.values()),
+            "streaks": len(batch.streaks),
+        }
+
     def set_debate_creator(self, thread_id: int, user_id: int) -> None:
         """Set the creator of a debate thread."""
         with self._lock:
@@ -164,6 +260,7 @@ class AnalyticsMixin:
                 (thread_id, user_id)
             )
             conn.commit()
+            self._thread_meta.set_creator(thread_id, user_id)
 
     async def set_debate_creator_async(self, thread_id: int, user_id: int) -> None:
         """Async wrapper for set_debate_creator."""
@@ -181,11 +278,11 @@ class AnalyticsMixin:
                 (thread_id, user_id, count, count)
             )
             conn.commit()
+            self._participation.discard(thread_id, user_id)
 
     def get_user_recent_debates(self, user_id: int, limit: int = 5) -> list[dict]:
         """Get a user's recent debate participation."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT thread_id, message_count, created_at FROM debate_participation
@@ -196,8 +293,7 @@ class AnalyticsMixin:
 
     def get_most_active_participants(self, limit: int = 3) -> list[dict]:
         """Get most active participants across all debates."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT user_id, COUNT(*) as debate_count, SUM(message_count) as total_messages
@@ -208,16 +304,14 @@ class AnalyticsMixin:
 
     def get_active_debate_count(self) -> int:
         """Get count of active debates."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM debate_threads")
             return cursor.fetchone()[0]
 
     def get_monthly_stats(self, year: int, month: int) -> dict:
         """Get statistics for a specific month."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -241,8 +335,7 @@ class AnalyticsMixin:
         Returns:
             Dict with total_debates, total_votes, total_karma, total_participants, total_messages
         """
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
             # Total debates created
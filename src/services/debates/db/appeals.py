@@ -20,8 +20,7 @@ class AppealsMixin:
 
     def has_appeal(self, user_id: int, action_type: str, action_id: int) -> bool:
         """Check if a pending appeal already exists."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT 1 FROM appeals
@@ -75,8 +74,7 @@ class AppealsMixin:
 
     def get_appeal(self, appeal_id: int) -> Optional[dict]:
         """Get an appeal by ID."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, user_id, action_type, action_id, reason, additional_context,
@@ -156,8 +154,7 @@ class AppealsMixin:
 
     def get_appeal_by_message_id(self, message_id: int) -> Optional[dict]:
         """Get an appeal by its message ID."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, user_id, action_type, action_id, reason, additional_context,
@@ -185,8 +182,7 @@ class AppealsMixin:
 
     def get_pending_appeals(self, limit: int = 50) -> list[dict]:
         """Get all pending appeals."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, user_id, action_type, action_id, reason, additional_context, created_at
@@ -209,8 +205,7 @@ class AppealsMixin:
 
     def get_user_appeals(self, user_id: int, limit: int = 10) -> list[dict]:
         """Get appeals submitted by a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, action_type, action_id, reason, status, created_at, reviewed_at
@@ -0,0 +1,219 @@
+"""
+OthmanBot - Active Ban Index
+============================
+
+In-memory view of active debate bans kept in step with ban writes.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import heapq
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+
+def parse_expires_at(expires_at: Optional[str]) -> Optional[float]:
+    """
+    Convert a stored expires_at (UTC, "YYYY-MM-DD HH:MM:SS") to a timestamp.
+
+    Returns:
+        Unix timestamp, or None for a permanent ban
+    """
+    if not expires_at:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(expires_at))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class BanIndex:
+    """
+    Active bans per user with a min-heap of expiry times.
+
+    DESIGN: Every debate message used to hop to a worker thread and query
+    debate_bans with datetime('now'), and the expiry scheduler polled the
+    table once a minute. This holds user -> {thread_id (None = global):
+    expiry timestamp (None = permanent)}, so a ban check is two dict
+    lookups, plus a heap of (expiry, user_id, thread_id) so the scheduler
+    can sleep until exactly the next expiry.
+
+    The ban write paths update the index after committing, under the same
+    writer lock the load runs under. Heap entries are never removed in
+    place: an entry whose ban was lifted or replaced is skipped when it
+    reaches the top. Listeners are told about new expiries so a sleeping
+    timer can re-arm; they may be called from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        self._bans: dict[int, dict[Optional[int], Optional[float]]] = {}
+        self._heap: list[tuple[float, int, int]] = []
+        self._listeners: list[Callable[[], None]] = []
+
+        # Metrics
+        self.loads = 0
+        self.lookups = 0
+        self.updates = 0
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the index holds a complete view."""
+        return self._loaded
+
+    def load(self, rows: Iterable[tuple[int, Optional[int], Optional[str]]]) -> None:
+        """
+        Install the active bans read from the database.
+
+        Args:
+            rows: (user_id, thread_id, expires_at) of every unexpired ban
+        """
+        bans: dict[int, dict[Optional[int], Optional[float]]] = {}
+        heap: list[tuple[float, int, int]] = []
+        for user_id, thread_id, expires_at in rows:
+            expires = parse_expires_at(expires_at)
+            bans.setdefault(user_id, {})[thread_id] = expires
+            if expires is not None:
+                heap.append((expires, user_id, thread_id or 0))
+        heapq.heapify(heap)
+
+        with self._lock:
+            self._bans = bans
+            self._heap = heap
+            self._loaded = True
+            self.loads += 1
+        self._notify()
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def add(self, user_id: int, thread_id: Optional[int], expires_at: Optional[str]) -> None:
+        """Record a committed ban (replacing any ban with the same scope)."""
+        expires = parse_expires_at(expires_at)
+        with self._lock:
+            if not self._loaded:
+                return
+            self._bans.setdefault(user_id, {})[thread_id] = expires
+            if expires is not None:
+                heapq.heappush(self._heap, (expires, user_id, thread_id or 0))
+            self.updates += 1
+        if expires is not None:
+            self._notify()
+
+    def remove(self, user_id: int, thread_id: Optional[int]) -> None:
+        """Drop a lifted ban; thread_id None drops every ban of the user."""
+        with self._lock:
+            if thread_id is None:
+                self._bans.pop(user_id, None)
+            else:
+                scopes = self._bans.get(user_id)
+                if scopes is not None:
+                    scopes.pop(thread_id, None)
+                    if not scopes:
+                        del self._bans[user_id]
+            self.updates += 1
+
+    def remove_thread(self, thread_id: int) -> None:
+        """Drop every ban scoped to a deleted thread."""
+        with self._lock:
+            for user_id in [u for u, scopes in self._bans.items() if thread_id in scopes]:
+                del self._bans[user_id][thread_id]
+                if not self._bans[user_id]:
+                    del self._bans[user_id]
+            self.updates += 1
+
+    def remove_expired(self, now: Optional[float] = None) -> None:
+        """Drop every ban whose expiry has passed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires, user_id, thread_key = heapq.heappop(self._heap)
+                thread_id = thread_key or None
+                scopes = self._bans.get(user_id)
+                if scopes is not None and scopes.get(thread_id, -1) == expires:
+                    del scopes[thread_id]
+                    if not scopes:
+                        del self._bans[user_id]
+            self.updates += 1
+
+    def add_listener(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call callback whenever the next expiry may have moved earlier.
+
+        Returns:
+            Function that unregisters the callback
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+        return unsubscribe
+
+    def _notify(self) -> None:
+        """Wake listeners (outside the lock)."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback()
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def is_banned(self, user_id: int, thread_id: int, now: Optional[float] = None) -> bool:
+        """True if the user has an unexpired global or thread ban."""
+        self.lookups += 1
+        scopes = self._bans.get(user_id)
+        if not scopes:
+            return False
+        now = time.time() if now is None else now
+        for scope in (None, thread_id):
+            if scope in scopes:
+                expires = scopes[scope]
+                if expires is None or expires > now:
+                    return True
+        return False
+
+    def next_expiry(self) -> Optional[float]:
+        """Timestamp of the earliest pending expiry, or None if there is none."""
+        with self._lock:
+            while self._heap:
+                expires, user_id, thread_key = self._heap[0]
+                scopes = self._bans.get(user_id)
+                if scopes is not None and scopes.get(thread_key or None, -1) == expires:
+                    return expires
+                # Ban was lifted or replaced since this entry was pushed
+                heapq.heappop(self._heap)
+            return None
+
+    def get_stats(self) -> dict:
+        """Index size and lookup/update counters."""
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "banned_users": len(self._bans),
+                "bans": sum(len(scopes) for scopes in self._bans.values()),
+                "pending_expiries": len(self._heap),
+                "loads": self.loads,
+                "lookups": self.lookups,
+                "updates": self.updates,
+            }
+
+
+__all__ = ["BanIndex", "parse_expires_at"]
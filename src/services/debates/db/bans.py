@@ -13,11 +13,45 @@ import sqlite3
 from typing import Optional
 
 from src.core.logger import logger
+from src.services.debates.db.ban_index import BanIndex
 
 
 class BansMixin:
     """Mixin for ban management operations."""
 
+    def _ensure_bans(self) -> BanIndex:
+        """
+        Return the active ban index, loading it if needed.
+
+        Loads under the writer lock from the writer connection so no ban
+        write can slip between the query and the index going live.
+        """
+        bans = self._bans
+        if bans.is_loaded:
+            return bans
+
+        with self._lock:
+            if bans.is_loaded:
+                return bans
+            cursor = self._get_connection().cursor()
+            cursor.execute(
+                """SELECT user_id, thread_id, expires_at FROM debate_bans
+                   WHERE expires_at IS NULL OR expires_at > datetime('now')"""
+            )
+            rows = cursor.fetchall()
+            bans.load(rows)
+
+        logger.debug("Ban Index Loaded", [
+            ("Active Bans", str(len(rows))),
+        ])
+        return bans
+
+    async def ensure_bans_async(self) -> BanIndex:
+        """Async wrapper for _ensure_bans."""
+        if self._bans.is_loaded:
+            return self._bans
+        return await asyncio.to_thread(self._ensure_bans)
+
     def add_debate_ban(
         self,
         user_id: int,
@@ -38,6 +72,7 @@ class BansMixin:
                 )
                 conn.commit()
                 success = True
+                self._bans.add(user_id, thread_id, expires_at)
             except sqlite3.IntegrityError as e:
                 conn.rollback()
                 logger.debug("Ban Already Exists", [
@@ -77,6 +112,7 @@ class BansMixin:
                 )
             removed = cursor.rowcount > 0
             conn.commit()
+            self._bans.remove(user_id, thread_id)
         return removed
 
     async def remove_debate_ban_async(self, user_id: int, thread_id: Optional[int]) -> bool:
@@ -85,26 +121,20 @@ class BansMixin:
 
     def is_user_banned(self, user_id: int, thread_id: int) -> bool:
         """Check if user is banned from a specific thread."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """SELECT 1 FROM debate_bans
-                   WHERE user_id = ? AND (thread_id = ? OR thread_id IS NULL)
-                   AND (expires_at IS NULL OR expires_at > datetime('now'))
-                   LIMIT 1""",
-                (user_id, thread_id)
-            )
-            return cursor.fetchone() is not None
+        return self._ensure_bans().is_banned(user_id, thread_id)
 
     async def is_user_banned_async(self, user_id: int, thread_id: int) -> bool:
-        """Async wrapper for is_user_banned."""
-        return await asyncio.to_thread(self.is_user_banned, user_id, thread_id)
+        """Check a ban without leaving the event loop once the index is loaded."""
+        bans = await self.ensure_bans_async()
+        return bans.is_banned(user_id, thread_id)
+
+    def get_ban_index_stats(self) -> dict:
+        """Get active ban index size and lookup counters."""
+        return self._bans.get_stats()
 
     def get_user_bans(self, user_id: int) -> list[dict]:
         """Get all active bans for a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT thread_id, banned_by, reason, expires_at, created_at
@@ -119,8 +149,7 @@ class BansMixin:
 
     def get_all_banned_users(self) -> list[int]:
         """Get all unique user IDs that have active bans."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT DISTINCT user_id FROM debate_bans WHERE expires_at IS NULL OR expires_at > datetime('now')"
@@ -129,8 +158,7 @@ class BansMixin:
 
     def get_banned_users_with_info(self) -> list[dict]:
         """Get all banned users with their ban details."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT user_id, expires_at, thread_id FROM debate_bans
@@ -141,8 +169,7 @@ class BansMixin:
 
     def get_expired_bans(self) -> list[dict]:
         """Get all expired bans that need to be removed."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, user_id, thread_id, banned_by, reason, expires_at, created_at
@@ -163,6 +190,7 @@ class BansMixin:
             )
             removed = cursor.rowcount
             conn.commit()
+            self._bans.remove_expired()
         return removed
 
     def _add_to_ban_history(
@@ -212,16 +240,14 @@ class BansMixin:
 
     def get_user_ban_count(self, user_id: int) -> int:
         """Get total number of times a user has been banned."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM ban_history WHERE user_id = ?", (user_id,))
             return cursor.fetchone()[0]
 
     def get_user_ban_history(self, user_id: int, limit: int = 10) -> list[dict]:
         """Get a user's ban history."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, thread_id, banned_by, reason, duration_hours, expires_at, created_at, removed_at, removed_by, removal_reason
@@ -235,8 +261,7 @@ class BansMixin:
 
     def get_ban_history_at_time(self, user_id: int, appeal_created_at: str) -> Optional[dict]:
         """Get the ban from ban_history that was active at the time of an appeal."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, thread_id, banned_by, reason, duration_hours, expires_at, created_at
@@ -16,8 +16,7 @@ class CasesMixin:
 
     def get_case_log(self, user_id: int) -> Optional[dict]:
         """Get case log for a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT case_id, thread_id, ban_count, last_unban_at, created_at FROM case_logs WHERE user_id = ?",
@@ -47,8 +46,7 @@ class CasesMixin:
 
     def get_next_case_id(self) -> int:
         """Get the next available case ID."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(case_id) FROM case_logs")
             row = cursor.fetchone()
@@ -56,8 +54,7 @@ class CasesMixin:
 
     def get_all_case_logs(self) -> list[dict]:
         """Get all case logs."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT user_id, case_id, thread_id, ban_count, last_unban_at, created_at FROM case_logs ORDER BY case_id"
@@ -87,8 +84,7 @@ class CacheMixin:
 
     def get_cached_user(self, user_id: int) -> Optional[dict]:
         """Get cached user info."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT username, display_name, is_member FROM user_cache WHERE user_id = ?",
@@ -123,8 +119,7 @@ class CacheMixin:
 
     def get_leaderboard_users_in_cache(self) -> list[int]:
         """Get user IDs that are in the cache."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT user_id FROM user_cache")
             return [row[0] for row in cursor.fetchall()]
@@ -139,6 +134,7 @@ class CacheMixin:
             cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
             result["users_deleted"] = cursor.rowcount
 
+            self._subtract_vote_rollups(cursor, "voter_id = ? OR author_id = ?", (user_id, user_id))
             cursor.execute("DELETE FROM votes WHERE voter_id = ? OR author_id = ?", (user_id, user_id))
             result["votes_deleted"] = cursor.rowcount
 
@@ -152,6 +148,9 @@ class CacheMixin:
             cursor.execute("DELETE FROM user_streaks WHERE user_id = ?", (user_id,))
 
             conn.commit()
+            self._rankings.invalidate()
+            self._thread_meta.remove_creator(user_id)
+            self._participation.discard(user_id=user_id)
             return result
 
     async def delete_user_data_async(self, user_id: int) -> dict:
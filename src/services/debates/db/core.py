@@ -10,11 +10,17 @@ Server: discord.gg/syria
 
 import sqlite3
 import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.core.logger import logger
+from src.services.debates.db.pool import InstrumentedLock, ReadConnectionPool
+from src.services.debates.db.ranking import RankIndex
+from src.services.debates.db.ban_index import BanIndex
+from src.services.debates.db.thread_meta import ThreadMetaCache
+from src.services.debates.db.participation_buffer import ParticipationBuffer
 
 
 @dataclass
@@ -30,12 +36,13 @@ class DatabaseCore:
     """
     Base database class with connection handling and schema management.
 
-    Uses a persistent connection with WAL mode for better concurrency.
-    Thread-safe via a threading lock for all operations.
+    Uses one persistent writer connection with WAL mode, serialized by a
+    threading lock, plus a bounded pool of read-only connections so reads
+    run concurrently with each other and with writes.
     """
 
     # Current schema version - increment when adding migrations
-    SCHEMA_VERSION = 17
+    SCHEMA_VERSION = 20
 
     # Valid table names for SQL injection prevention
     VALID_TABLES = frozenset({
@@ -43,7 +50,10 @@ class DatabaseCore:
         'debate_participation', 'debate_creators', 'case_logs',
         'analytics_messages', 'schema_version', 'user_streaks', 'linked_accounts',
         'appeals', 'debate_counter', 'audit_log', 'open_discussion', 'user_cache',
-        'ban_history', 'closure_history'
+        'ban_history', 'closure_history', 'rank_snapshots',
+        'vote_rollup_daily', 'vote_rollup_hourly', 'reconcile_checkpoints',
+        'participation_gate', 'mirror_messages', 'mirror_reactions', 'mirror_threads',
+        'participation_flush', 'moderation_jobs', 'moderation_job_items'
     })
 
     def __init__(self, db_path: str = "data/othman.db") -> None:
@@ -51,14 +61,32 @@ class DatabaseCore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
 
-        # Thread lock for connection access
-        self._lock = threading.Lock()
+        # Thread lock for writer connection access
+        self._lock = InstrumentedLock()
 
-        # Create persistent connection
+        # Create persistent writer connection
         self._connection: Optional[sqlite3.Connection] = None
         self._connect()
         self._init_database()
 
+        # Reader pool (opened after schema exists)
+        self._read_pool = ReadConnectionPool(self.db_path)
+
+        # Per-thread pinned reader for read_snapshot()
+        self._snapshot = threading.local()
+
+        # Materialized rankings, loaded on first read
+        self._rankings = RankIndex()
+
+        # Active bans, loaded on first check
+        self._bans = BanIndex()
+
+        # Per-thread bot state, loaded on first lookup
+        self._thread_meta = ThreadMetaCache()
+
+        # Buffered participation counts and streaks, journaled next to the database
+        self._participation = ParticipationBuffer(self.db_path.parent, self.db_path.stem)
+
     def _connect(self) -> None:
         """Create persistent connection with optimized settings."""
         self._connection = sqlite3.connect(
@@ -84,8 +112,52 @@ class DatabaseCore:
             self._connect()
         return self._connection
 
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the reader pool."""
+        pinned = getattr(self._snapshot, "conn", None)
+        if pinned is not None:
+            yield pinned
+            return
+        with self._read_pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[None]:
+        """
+        Run every read on this thread inside one read transaction.
+
+        DESIGN: Pins a single pooled reader to the calling thread and opens
+        a transaction on it, so all _read_connection() calls made inside the
+        block see the same WAL snapshot. Writers are never blocked; they just
+        aren't visible until the block ends.
+        """
+        if getattr(self._snapshot, "conn", None) is not None:
+            # Already inside a snapshot on this thread
+            yield
+            return
+
+        with self._read_pool.connection() as conn:
+            conn.execute("BEGIN")
+            self._snapshot.conn = conn
+            try:
+                yield
+            finally:
+                self._snapshot.conn = None
+                if conn.in_transaction:
+                    conn.rollback()
+
+    def get_pool_stats(self) -> dict:
+        """Get reader pool and writer lock contention counters."""
+        return {
+            "readers": self._read_pool.get_stats(),
+            "writer": self._lock.get_stats(),
+        }
+
     def close(self) -> None:
-        """Close the database connection and checkpoint WAL."""
+        """Close the database connections and checkpoint WAL."""
+        self._read_pool.close()
+        self._participation.close()
         with self._lock:
             if self._connection:
                 try:
@@ -304,6 +376,14 @@ class DatabaseCore:
             )
         """)
 
+        # Open Discussion thread table (hydrates the thread metadata cache)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS open_discussion (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                thread_id INTEGER
+            )
+        """)
+
         # Appeals table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS appeals (
@@ -323,11 +403,130 @@ class DatabaseCore:
             )
         """)
 
+        # Rank snapshots - daily leaderboard positions for week-over-week deltas
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rank_snapshots (
+                snapshot_date TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                rank INTEGER NOT NULL,
+                total_karma INTEGER NOT NULL,
+                PRIMARY KEY (snapshot_date, user_id)
+            )
+        """)
+
+        # Vote rollups - aggregates of the votes table by created_at bucket
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vote_rollup_daily (
+                day TEXT NOT NULL,
+                author_id INTEGER NOT NULL,
+                votes INTEGER NOT NULL DEFAULT 0,
+                karma INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, author_id)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vote_rollup_hourly (
+                hour TEXT PRIMARY KEY,
+                votes INTEGER NOT NULL DEFAULT 0,
+                karma INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        # Reconciliation watermarks - newest message reconciled per thread
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS reconcile_checkpoints (
+                thread_id INTEGER PRIMARY KEY,
+                last_message_id INTEGER NOT NULL,
+                message_count INTEGER,
+                reconciled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Last participation batch committed (journal segments up to it are applied)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS participation_flush (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_batch INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+        # Background moderation jobs and their per-message progress
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS moderation_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                thread_id INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS moderation_job_items (
+                job_id INTEGER NOT NULL,
+                thread_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                recorded INTEGER NOT NULL DEFAULT 1,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job_id, message_id)
+            )
+        """)
+
+        # Participation gate - users who reacted to a thread's analytics embed
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS participation_gate (
+                thread_id INTEGER NOT NULL,
+                message_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                PRIMARY KEY (message_id, user_id)
+            )
+        """)
+
+        # Message mirror - local copy of debate-forum messages and reactions
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS mirror_messages (
+                message_id INTEGER PRIMARY KEY,
+                thread_id INTEGER NOT NULL,
+                author_id INTEGER NOT NULL,
+                author_name TEXT,
+                is_bot INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL,
+                edited_at TEXT,
+                deleted INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS mirror_reactions (
+                message_id INTEGER NOT NULL,
+                emoji TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                PRIMARY KEY (message_id, emoji, user_id)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS mirror_threads (
+                thread_id INTEGER PRIMARY KEY,
+                last_message_id INTEGER,
+                message_count INTEGER,
+                synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         # Create indexes for query optimization
         # Votes table indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_votes_message ON votes(message_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_votes_author ON votes(author_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_participation_gate_thread ON participation_gate(thread_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_participation_gate_user ON participation_gate(user_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes(voter_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_votes_created ON votes(created_at)")
+
+        # Rollup indexes
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_vote_rollup_author ON vote_rollup_daily(author_id, day)")
+
+        # Mirror indexes
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_mirror_messages_thread ON mirror_messages(thread_id, message_id)")
 
         # Users table indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_karma ON users(total_karma DESC)")
@@ -373,6 +572,37 @@ class DatabaseCore:
                 cursor.execute("ALTER TABLE closure_history ADD COLUMN scheduled_deletion_at TIMESTAMP")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_closure_history_deletion ON closure_history(scheduled_deletion_at)")
 
+        # Migration 18: Index votes by time and add rank snapshots for the materialized leaderboard
+        if current_version < 18:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_votes_created ON votes(created_at)")
+
+        # Migration 19: Backfill vote rollups from existing votes
+        if current_version < 19:
+            self._backfill_vote_rollups(cursor)
+
+        # Migration 20: Key moderation job items by message so a job can target
+        # every recorded analytics embed of a thread, and flag recorded reactions
+        if current_version < 20:
+            cursor.execute("PRAGMA table_info(moderation_job_items)")
+            if any(row[1] == "thread_id" and row[5] for row in cursor.fetchall()):
+                cursor.execute("ALTER TABLE moderation_job_items RENAME TO moderation_job_items_v19")
+                cursor.execute("""
+                    CREATE TABLE moderation_job_items (
+                        job_id INTEGER NOT NULL,
+                        thread_id INTEGER NOT NULL,
+                        message_id INTEGER NOT NULL,
+                        recorded INTEGER NOT NULL DEFAULT 1,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (job_id, message_id)
+                    )
+                """)
+                cursor.execute(
+                    """INSERT OR IGNORE INTO moderation_job_items (job_id, thread_id, message_id, status, attempts)
+                       SELECT job_id, thread_id, message_id, status, attempts FROM moderation_job_items_v19"""
+                )
+                cursor.execute("DROP TABLE moderation_job_items_v19")
+
         if current_version < self.SCHEMA_VERSION:
             # Update schema version
             cursor.execute(
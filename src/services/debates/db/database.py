@@ -16,6 +16,9 @@ from src.services.debates.db.analytics import AnalyticsMixin
 from src.services.debates.db.threads import ThreadsMixin
 from src.services.debates.db.cases import CasesMixin, CacheMixin
 from src.services.debates.db.appeals import AppealsMixin
+from src.services.debates.db.rollups import RollupsMixin
+from src.services.debates.db.mirror import MirrorMixin
+from src.services.debates.db.moderation_jobs import ModerationJobsMixin
 
 
 class DebatesDatabase(
@@ -27,6 +30,9 @@ class DebatesDatabase(
     CasesMixin,
     CacheMixin,
     AppealsMixin,
+    RollupsMixin,
+    MirrorMixin,
+    ModerationJobsMixin,
     DatabaseCore
 ):
     """
@@ -42,6 +48,9 @@ class DebatesDatabase(
     - CasesMixin: Case log operations
     - CacheMixin: User cache operations
     - AppealsMixin: Appeal management operations
+    - RollupsMixin: Per-day/per-hour vote aggregates
+    - MirrorMixin: Local message/reaction mirror
+    - ModerationJobsMixin: Persisted background moderation jobs
     """
 
     def __init__(self, db_path: str = "data/othman.db") -> None:
@@ -67,15 +76,13 @@ class DebatesDatabase(
         if not user_ids:
             return {}
 
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             placeholders = ",".join("?" * len(user_ids))
             cursor.execute(
-                f"""SELECT author_id, SUM(vote_type) FROM votes
-                    WHERE author_id IN ({placeholders})
-                    AND DATE(created_at) = DATE('now')
-                    GROUP BY author_id""",
+                f"""SELECT author_id, karma FROM vote_rollup_daily
+                    WHERE day = DATE('now') AND author_id IN ({placeholders})
+                    AND votes > 0""",
                 user_ids
             )
             return {row[0]: row[1] for row in cursor.fetchall()}
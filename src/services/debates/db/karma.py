@@ -14,6 +14,10 @@ from typing import Optional
 
 from src.core.logger import logger
 from src.services.debates.db.core import UserKarma
+from src.services.debates.db.rollups import VOTE_HOUR_SQL, utc_hour
+
+# Message IDs per IN (...) query (SQLite's default variable limit is 999)
+VOTE_QUERY_CHUNK_SIZE = 500
 
 
 class KarmaMixin:
@@ -35,13 +39,13 @@ class KarmaMixin:
                 cursor.execute("BEGIN IMMEDIATE")
 
                 cursor.execute(
-                    "SELECT vote_type FROM votes WHERE voter_id = ? AND message_id = ?",
+                    f"SELECT vote_type, {VOTE_HOUR_SQL} FROM votes WHERE voter_id = ? AND message_id = ?",
                     (voter_id, message_id)
                 )
                 existing = cursor.fetchone()
 
                 if existing:
-                    old_vote = existing[0]
+                    old_vote, vote_hour = existing
                     if old_vote == vote_type:
                         conn.rollback()
                         logger.debug("Vote Unchanged (Already Voted)", [
@@ -56,7 +60,7 @@ class KarmaMixin:
                         (vote_type, voter_id, message_id)
                     )
                     karma_change = vote_type - old_vote
-                    self._update_user_karma(cursor, author_id, karma_change, vote_type)
+                    self._update_user_karma(cursor, author_id, karma_change, vote_type, vote_hour=vote_hour)
                     logger.debug("Vote Changed", [
                         ("Voter ID", str(voter_id)),
                         ("Message ID", str(message_id)),
@@ -69,7 +73,8 @@ class KarmaMixin:
                         "INSERT INTO votes (voter_id, message_id, author_id, vote_type) VALUES (?, ?, ?, ?)",
                         (voter_id, message_id, author_id, vote_type)
                     )
-                    self._update_user_karma(cursor, author_id, vote_type, vote_type)
+                    karma_change, vote_hour = vote_type, utc_hour()
+                    self._update_user_karma(cursor, author_id, vote_type, vote_type, vote_hour=vote_hour, is_new=True)
                     logger.debug("Vote Added", [
                         ("Voter ID", str(voter_id)),
                         ("Message ID", str(message_id)),
@@ -78,6 +83,7 @@ class KarmaMixin:
                     ])
 
                 conn.commit()
+                self._rankings.apply(author_id, karma_change, vote_hour[:10])
                 return True
             except sqlite3.OperationalError as e:
                 conn.rollback()
@@ -135,7 +141,7 @@ class KarmaMixin:
                 cursor.execute("BEGIN IMMEDIATE")
 
                 cursor.execute(
-                    "SELECT author_id, vote_type FROM votes WHERE voter_id = ? AND message_id = ?",
+                    f"SELECT author_id, vote_type, {VOTE_HOUR_SQL} FROM votes WHERE voter_id = ? AND message_id = ?",
                     (voter_id, message_id)
                 )
                 existing = cursor.fetchone()
@@ -148,14 +154,15 @@ class KarmaMixin:
                     ])
                     return None
 
-                author_id, vote_type = existing
+                author_id, vote_type, vote_hour = existing
                 vote_emoji = "⬆️" if vote_type > 0 else "⬇️"
                 cursor.execute(
                     "DELETE FROM votes WHERE voter_id = ? AND message_id = ?",
                     (voter_id, message_id)
                 )
-                self._update_user_karma(cursor, author_id, -vote_type, vote_type, is_removal=True)
+                self._update_user_karma(cursor, author_id, -vote_type, vote_type, is_removal=True, vote_hour=vote_hour)
                 conn.commit()
+                self._rankings.apply(author_id, -vote_type, vote_hour[:10])
                 logger.debug("Vote Removed", [
                     ("Voter ID", str(voter_id)),
                     ("Message ID", str(message_id)),
@@ -176,10 +183,288 @@ class KarmaMixin:
         """Async wrapper for remove_vote."""
         return await asyncio.to_thread(self.remove_vote, voter_id, message_id)
 
-    def get_message_votes(self, message_id: int) -> dict[int, int]:
-        """Get all votes for a message."""
+    def apply_vote_batch(
+        self,
+        events: list[tuple[int, int, Optional[int], int]]
+    ) -> list:
+        """
+        Apply a batch of vote events in a single transaction.
+
+        Events are (voter_id, message_id, author_id, vote_type) tuples, where
+        vote_type 0 means the vote was removed. Events are replayed in order
+        against the stored state so each one gets the same result add_vote /
+        remove_vote would have returned, but only the net change per
+        (voter, message) is written.
+
+        Args:
+            events: Ordered vote events
+
+        Returns:
+            One result per event: bool for adds, author_id or None for removals
+        """
+        if not events:
+            return []
+
+        message_ids = {message_id for _, message_id, _, _ in events}
+
         with self._lock:
             conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                rows = self._load_message_vote_rows(cursor, message_ids)
+                results, rank_changes, written, authors = self._replay_vote_events(cursor, events, rows)
+
+                conn.commit()
+                for author_id, karma_change, vote_day in rank_changes:
+                    self._rankings.apply(author_id, karma_change, vote_day)
+                logger.debug("Vote Batch Applied", [
+                    ("Events", str(len(events))),
+                    ("Rows Written", str(written)),
+                    ("Authors", str(authors)),
+                ])
+                return results
+            except sqlite3.OperationalError as e:
+                conn.rollback()
+                logger.warning("Vote Batch DB Lock Error", [
+                    ("Events", str(len(events))),
+                    ("Error", str(e)[:50]),
+                ])
+                raise
+            except sqlite3.IntegrityError as e:
+                conn.rollback()
+                logger.warning("Vote Batch Integrity Error", [
+                    ("Events", str(len(events))),
+                    ("Error", str(e)[:50]),
+                ])
+                return [None if vote_type == 0 else False for _, _, _, vote_type in events]
+
+    def reconcile_message_votes(
+        self,
+        observed: dict[int, tuple[int, set[int], set[int]]]
+    ) -> dict:
+        """
+        Make stored votes match the reactions observed on Discord.
+
+        Stored votes for every message are loaded with one IN (...) query,
+        diffed against the observed voters, and the whole delta set is
+        written in a single transaction. The diff replays exactly the
+        add_vote / remove_vote calls reconciliation used to make one by one.
+
+        Args:
+            observed: message_id -> (author_id, upvoter_ids, downvoter_ids)
+
+        Returns:
+            Dict with votes_added and votes_removed
+        """
+        result = {"votes_added": 0, "votes_removed": 0}
+        if not observed:
+            return result
+
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+
+                rows = self._load_message_vote_rows(cursor, set(observed))
+                stored: dict[int, dict[int, int]] = {}
+                for voter_id, message_id, _, vote_type, _ in rows:
+                    stored.setdefault(message_id, {})[voter_id] = vote_type
+
+                events: list[tuple[int, int, Optional[int], int]] = []
+                for message_id, (author_id, upvoters, downvoters) in observed.items():
+                    votes = stored.get(message_id, {})
+                    events.extend(
+                        (voter_id, message_id, author_id, 1)
+                        for voter_id in upvoters if votes.get(voter_id) != 1
+                    )
+                    events.extend(
+                        (voter_id, message_id, author_id, -1)
+                        for voter_id in downvoters if votes.get(voter_id) != -1
+                    )
+                    events.extend(
+                        (voter_id, message_id, author_id, 0)
+                        for voter_id in votes
+                        if voter_id not in upvoters and voter_id not in downvoters
+                    )
+
+                if not events:
+                    conn.rollback()
+                    return result
+
+                results, rank_changes, _, _ = self._replay_vote_events(cursor, events, rows)
+                conn.commit()
+                for author_id, karma_change, vote_day in rank_changes:
+                    self._rankings.apply(author_id, karma_change, vote_day)
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.warning("Vote Reconciliation DB Error", [
+                    ("Messages", str(len(observed))),
+                    ("Error", str(e)[:50]),
+                ])
+                raise
+
+        for (_, _, _, vote_type), outcome in zip(events, results):
+            if vote_type == 0:
+                result["votes_removed"] += outcome is not None
+            else:
+                result["votes_added"] += outcome is True
+        return result
+
+    async def reconcile_message_votes_async(
+        self,
+        observed: dict[int, tuple[int, set[int], set[int]]]
+    ) -> dict:
+        """Async wrapper for reconcile_message_votes."""
+        return await asyncio.to_thread(self.reconcile_message_votes, observed)
+
+    @staticmethod
+    def _load_message_vote_rows(cursor: sqlite3.Cursor, message_ids: set[int]) -> list[tuple]:
+        """
+        Load (voter_id, message_id, author_id, vote_type, vote_hour) rows
+        for a set of messages, chunked to stay under SQLite's variable limit.
+        """
+        ids = list(message_ids)
+        rows: list[tuple] = []
+        for i in range(0, len(ids), VOTE_QUERY_CHUNK_SIZE):
+            chunk = ids[i:i + VOTE_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT voter_id, message_id, author_id, vote_type, {VOTE_HOUR_SQL} FROM votes WHERE message_id IN ({placeholders})",
+                chunk
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def _replay_vote_events(
+        self,
+        cursor: sqlite3.Cursor,
+        events: list[tuple[int, int, Optional[int], int]],
+        rows: list[tuple]
+    ) -> tuple[list, list[tuple[int, int, str]], int, int]:
+        """
+        Replay vote events against stored rows and write the net change.
+
+        Runs inside the caller's transaction. Each event gets the result
+        add_vote / remove_vote would have returned; only the final state
+        per (voter, message) is written.
+
+        Args:
+            cursor: Cursor inside a BEGIN IMMEDIATE transaction
+            events: Ordered (voter_id, message_id, author_id, vote_type) events
+            rows: Stored rows for the events' messages (_load_message_vote_rows)
+
+        Returns:
+            Tuple of (results, rank_changes, rows_written, authors_touched)
+        """
+        keys = {(voter_id, message_id) for voter_id, message_id, _, _ in events}
+        rows = [r for r in rows if (r[0], r[1]) in keys]
+        initial = {(r[0], r[1]): (r[2], r[3]) for r in rows}
+        # Upserts keep the original row, so its created_at hour sticks
+        vote_hours = {(r[0], r[1]): r[4] for r in rows}
+        now_hour = utc_hour()
+
+        current = dict(initial)
+        karma_deltas: dict[int, list[int]] = {}
+        rollup_deltas: dict[tuple[str, int], list[int]] = {}
+        rank_changes: list[tuple[int, int, str]] = []
+        results: list = []
+
+        for voter_id, message_id, author_id, vote_type in events:
+            key = (voter_id, message_id)
+            existing = current.get(key)
+
+            if vote_type == 0:
+                if existing is None:
+                    results.append(None)
+                    continue
+                old_author, old_vote = existing
+                del current[key]
+                vote_hour = vote_hours.get(key, now_hour)
+                self._add_karma_delta(karma_deltas, old_author, -old_vote, old_vote, is_removal=True)
+                self._add_rollup_delta(rollup_deltas, vote_hour, old_author, -1, -old_vote)
+                rank_changes.append((old_author, -old_vote, vote_hour[:10]))
+                results.append(old_author)
+                continue
+
+            if existing is not None:
+                old_author, old_vote = existing
+                if old_vote == vote_type:
+                    results.append(False)
+                    continue
+                vote_hour = vote_hours.get(key, now_hour)
+                current[key] = (old_author, vote_type)
+                self._add_karma_delta(karma_deltas, author_id, vote_type - old_vote, vote_type)
+                self._add_rollup_delta(rollup_deltas, vote_hour, author_id, 0, vote_type - old_vote)
+                rank_changes.append((author_id, vote_type - old_vote, vote_hour[:10]))
+            else:
+                vote_hour = vote_hours.get(key, now_hour)
+                current[key] = (author_id, vote_type)
+                self._add_karma_delta(karma_deltas, author_id, vote_type, vote_type)
+                self._add_rollup_delta(rollup_deltas, vote_hour, author_id, 1, vote_type)
+                rank_changes.append((author_id, vote_type, vote_hour[:10]))
+            results.append(True)
+
+        deletes = [key for key in initial if key not in current]
+        upserts = [
+            (voter_id, message_id, author_id, vote_type)
+            for (voter_id, message_id), (author_id, vote_type) in current.items()
+            if initial.get((voter_id, message_id)) != (author_id, vote_type)
+        ]
+
+        cursor.executemany(
+            "DELETE FROM votes WHERE voter_id = ? AND message_id = ?",
+            deletes
+        )
+        cursor.executemany(
+            """INSERT INTO votes (voter_id, message_id, author_id, vote_type) VALUES (?, ?, ?, ?)
+               ON CONFLICT(voter_id, message_id) DO UPDATE SET
+               author_id = excluded.author_id, vote_type = excluded.vote_type""",
+            upserts
+        )
+        self._apply_karma_deltas(cursor, karma_deltas)
+        self._write_vote_rollups(cursor, rollup_deltas)
+        return results, rank_changes, len(deletes) + len(upserts), len(karma_deltas)
+
+    @staticmethod
+    def _add_karma_delta(
+        deltas: dict[int, list[int]],
+        user_id: int,
+        karma_change: int,
+        vote_type: int,
+        is_removal: bool = False
+    ) -> None:
+        """Accumulate a karma change the same way _update_user_karma applies it."""
+        delta = deltas.setdefault(user_id, [0, 0, 0])
+        counter_change = -1 if is_removal else 1
+        delta[0] += karma_change
+        if vote_type > 0:
+            delta[1] += counter_change
+        elif vote_type < 0:
+            delta[2] += counter_change
+
+    def _apply_karma_deltas(self, cursor: sqlite3.Cursor, deltas: dict[int, list[int]]) -> None:
+        """Write accumulated per-author karma deltas with executemany."""
+        if not deltas:
+            return
+        cursor.executemany(
+            "INSERT OR IGNORE INTO users (user_id) VALUES (?)",
+            [(user_id,) for user_id in deltas]
+        )
+        cursor.executemany(
+            """UPDATE users SET
+               total_karma = total_karma + ?,
+               upvotes_received = MAX(0, upvotes_received + ?),
+               downvotes_received = MAX(0, downvotes_received + ?)
+               WHERE user_id = ?""",
+            [(total, up, down, user_id) for user_id, (total, up, down) in deltas.items()]
+        )
+
+    def get_message_votes(self, message_id: int) -> dict[int, int]:
+        """Get all votes for a message."""
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT voter_id, vote_type FROM votes WHERE message_id = ?",
@@ -197,12 +482,25 @@ class KarmaMixin:
         user_id: int,
         karma_change: int,
         vote_type: int,
-        is_removal: bool = False
+        is_removal: bool = False,
+        vote_hour: Optional[str] = None,
+        is_new: bool = False
     ) -> None:
-        """Update user karma totals."""
+        """
+        Update user karma totals and the vote rollups.
+
+        Args:
+            vote_hour: created_at hour bucket of the vote row (defaults to now)
+            is_new: True when the vote row was just inserted
+        """
         cursor.execute("INSERT OR IGNORE INTO users (user_id) VALUES (?)", (user_id,))
         counter_change = -1 if is_removal else 1
 
+        rollup_count = -1 if is_removal else (1 if is_new else 0)
+        rollup_deltas: dict[tuple[str, int], list[int]] = {}
+        self._add_rollup_delta(rollup_deltas, vote_hour or utc_hour(), user_id, rollup_count, karma_change)
+        self._write_vote_rollups(cursor, rollup_deltas)
+
         if vote_type > 0:
             cursor.execute(
                 """UPDATE users SET
@@ -222,8 +520,7 @@ class KarmaMixin:
 
     def get_user_karma(self, user_id: int) -> UserKarma:
         """Get karma data for a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT user_id, total_karma, upvotes_received, downvotes_received FROM users WHERE user_id = ?",
@@ -271,11 +568,13 @@ class KarmaMixin:
                         )
                     result["votes_cast_removed"] += 1
 
+                self._subtract_vote_rollups(cursor, "voter_id = ? OR author_id = ?", (user_id, user_id))
                 cursor.execute("DELETE FROM votes WHERE voter_id = ?", (user_id,))
                 cursor.execute("DELETE FROM votes WHERE author_id = ?", (user_id,))
                 result["votes_received_removed"] = cursor.rowcount
 
                 conn.commit()
+                self._rankings.invalidate()
                 return result
             except sqlite3.Error:
                 conn.rollback()
@@ -287,8 +586,7 @@ class KarmaMixin:
 
     def get_votes_by_user(self, user_id: int) -> list[dict]:
         """Get all votes cast by a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT message_id, author_id, vote_type, created_at FROM votes WHERE voter_id = ?",
@@ -301,18 +599,17 @@ class KarmaMixin:
 
     def get_votes_today(self) -> int:
         """Get total votes cast today."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT COUNT(*) FROM votes WHERE DATE(created_at) = DATE('now')"
+                """SELECT COALESCE(SUM(votes), 0) FROM vote_rollup_hourly
+                   WHERE hour >= strftime('%Y-%m-%d 00', 'now')"""
             )
             return cursor.fetchone()[0]
 
     def get_total_votes(self) -> int:
         """Get total vote count."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM votes")
             return cursor.fetchone()[0]
@@ -342,9 +639,11 @@ class KarmaMixin:
                             (author_id,)
                         )
 
+                self._subtract_vote_rollups(cursor, "voter_id = ?", (user_id,))
                 cursor.execute("DELETE FROM votes WHERE voter_id = ?", (user_id,))
                 result["votes_removed"] = cursor.rowcount
                 conn.commit()
+                self._rankings.invalidate()
                 return result
             except sqlite3.Error:
                 conn.rollback()
@@ -357,8 +656,7 @@ class KarmaMixin:
         Returns:
             Set of message IDs with at least one vote
         """
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT DISTINCT message_id FROM votes")
             return {row[0] for row in cursor.fetchall()}
@@ -416,10 +714,12 @@ class KarmaMixin:
                         result["karma_reversed"] += 1
 
                     # Delete all votes for this message
+                    self._subtract_vote_rollups(cursor, "message_id = ?", (msg_id,))
                     cursor.execute("DELETE FROM votes WHERE message_id = ?", (msg_id,))
                     result["votes_deleted"] += cursor.rowcount
 
                 conn.commit()
+                self._rankings.invalidate()
 
                 # Log success
                 if result["votes_deleted"] > 0:
@@ -456,8 +756,7 @@ class KarmaMixin:
         if not message_ids:
             return []
 
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             placeholders = ",".join("?" * len(message_ids))
             cursor.execute(
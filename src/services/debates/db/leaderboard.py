@@ -9,18 +9,79 @@ Server: discord.gg/syria
 """
 
 import asyncio
+import sqlite3
+from datetime import timedelta
 from typing import Optional
 
+from src.core.config import RANK_SNAPSHOT_RETENTION_DAYS
+from src.core.logger import logger
 from src.services.debates.db.core import UserKarma
+from src.services.debates.db.ranking import RankIndex, period_start, utc_today
 
 
 class LeaderboardMixin:
     """Mixin for leaderboard operations."""
 
+    def _ensure_rankings(self) -> RankIndex:
+        """
+        Return the materialized rank index, loading it if needed.
+
+        Loads under the writer lock from the writer connection so no vote
+        commit can slip between the snapshot and the index going live.
+        """
+        rankings = self._rankings
+        if rankings.is_loaded:
+            return rankings
+
+        today = utc_today()
+        oldest_day = period_start(today).isoformat()
+        baseline_cutoff = (today - timedelta(days=7)).isoformat()
+
+        with self._lock:
+            if rankings.is_loaded:
+                return rankings
+            token = rankings.begin_load()
+            cursor = self._get_connection().cursor()
+
+            cursor.execute("SELECT user_id, total_karma FROM users")
+            karma_rows = cursor.fetchall()
+
+            cursor.execute(
+                "SELECT day, author_id, karma FROM vote_rollup_daily WHERE day >= ? AND votes > 0",
+                (oldest_day,)
+            )
+            day_rows = cursor.fetchall()
+
+            baseline_date, baseline_rows = self._load_rank_baseline(cursor, baseline_cutoff)
+
+            rankings.finish_load(token, karma_rows, day_rows, oldest_day, baseline_rows, baseline_date)
+
+        logger.debug("Rank Index Loaded", [
+            ("Users", str(len(karma_rows))),
+            ("Day Buckets", str(len(day_rows))),
+            ("Baseline", baseline_date or "None"),
+        ])
+        return rankings
+
+    @staticmethod
+    def _load_rank_baseline(cursor, cutoff: str) -> tuple[Optional[str], list[tuple[int, int]]]:
+        """Get the newest rank snapshot at least a week old."""
+        cursor.execute(
+            "SELECT MAX(snapshot_date) FROM rank_snapshots WHERE snapshot_date <= ?",
+            (cutoff,)
+        )
+        baseline_date = cursor.fetchone()[0]
+        if not baseline_date:
+            return None, []
+        cursor.execute(
+            "SELECT user_id, rank FROM rank_snapshots WHERE snapshot_date = ?",
+            (baseline_date,)
+        )
+        return baseline_date, cursor.fetchall()
+
     def get_leaderboard(self, limit: int = 10) -> list[UserKarma]:
         """Get top users by karma."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT user_id, total_karma, upvotes_received, downvotes_received FROM users ORDER BY total_karma DESC LIMIT ?",
@@ -34,15 +95,7 @@ class LeaderboardMixin:
 
     def get_user_rank(self, user_id: int) -> int:
         """Get user's rank on leaderboard (1-indexed)."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """SELECT COUNT(*) + 1 FROM users
-                   WHERE total_karma > (SELECT COALESCE(total_karma, 0) FROM users WHERE user_id = ?)""",
-                (user_id,)
-            )
-            return cursor.fetchone()[0]
+        return self._ensure_rankings().rank(user_id)
 
     async def get_user_rank_async(self, user_id: int) -> int:
         """Async wrapper for get_user_rank."""
@@ -50,24 +103,49 @@ class LeaderboardMixin:
 
     def get_monthly_leaderboard(self, year: int, month: int, limit: int = 10) -> list[dict]:
         """Get leaderboard for a specific month based on votes in that month."""
-        with self._lock:
-            conn = self._get_connection()
+        rankings = self._ensure_rankings()
+        if rankings.covers_month(year, month):
+            return [
+                {"user_id": user_id, "monthly_karma": karma}
+                for user_id, karma in rankings.top_monthly(year, month, limit)
+            ]
+
+        # Older months: sum the daily rollups
+        start = f"{year:04d}-{month:02d}-01"
+        end = f"{year + 1:04d}-01-01" if month == 12 else f"{year:04d}-{month + 1:02d}-01"
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """SELECT author_id, SUM(vote_type) as monthly_karma
-                   FROM votes
-                   WHERE strftime('%Y', created_at) = ? AND strftime('%m', created_at) = ?
+                """SELECT author_id, SUM(karma) as monthly_karma
+                   FROM vote_rollup_daily
+                   WHERE day >= ? AND day < ?
                    GROUP BY author_id
+                   HAVING SUM(votes) > 0
                    ORDER BY monthly_karma DESC
                    LIMIT ?""",
-                (str(year), f"{month:02d}", limit)
+                (start, end, limit)
             )
             return [{"user_id": r[0], "monthly_karma": r[1]} for r in cursor.fetchall()]
 
+    def get_weekly_leaderboard(self, limit: int = 10) -> list[dict]:
+        """Get top users by karma received over the last 7 days."""
+        return [
+            {"user_id": user_id, "weekly_karma": karma}
+            for user_id, karma in self._ensure_rankings().top_weekly(limit)
+        ]
+
+    def get_period_karma(self, user_id: int) -> dict:
+        """Get a user's karma for the last 7 days and the current month."""
+        rankings = self._ensure_rankings()
+        today = utc_today()
+        return {
+            "weekly": rankings.weekly_total(user_id),
+            "monthly": rankings.monthly_total(user_id, today.year, today.month),
+        }
+
     def get_category_leaderboards(self, limit: int = 10) -> dict:
         """Get leaderboards for different categories."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             result = {}
 
@@ -96,44 +174,66 @@ class LeaderboardMixin:
 
     def get_rank_change(self, user_id: int) -> int:
         """Get user's rank change over the past week."""
+        return self._ensure_rankings().rank_change(user_id)
+
+    def take_rank_snapshot(self) -> int:
+        """
+        Store today's ranks for every user and prune old snapshots.
+
+        Returns:
+            Number of users snapshotted
+        """
+        rankings = self._ensure_rankings()
+        today = utc_today()
+        rows = [
+            (today.isoformat(), user_id, rank, karma)
+            for user_id, rank, karma in rankings.ranked_users()
+        ]
+        retention_cutoff = (today - timedelta(days=RANK_SNAPSHOT_RETENTION_DAYS)).isoformat()
+        baseline_cutoff = (today - timedelta(days=7)).isoformat()
+
         with self._lock:
             conn = self._get_connection()
             cursor = conn.cursor()
-
-            # Get current rank
-            cursor.execute(
-                "SELECT COUNT(*) + 1 FROM users WHERE total_karma > (SELECT COALESCE(total_karma, 0) FROM users WHERE user_id = ?)",
-                (user_id,)
-            )
-            current_rank = cursor.fetchone()[0]
-
-            # Get karma gained in past week
-            cursor.execute(
-                """SELECT COALESCE(SUM(vote_type), 0) FROM votes
-                   WHERE author_id = ? AND created_at >= datetime('now', '-7 days')""",
-                (user_id,)
-            )
-            recent_karma = cursor.fetchone()[0]
-
-            # Estimate previous rank
-            cursor.execute(
-                """SELECT COUNT(*) + 1 FROM users
-                   WHERE total_karma - ? > (SELECT COALESCE(total_karma, 0) - ? FROM users WHERE user_id = ?)""",
-                (recent_karma, recent_karma, user_id)
-            )
-            estimated_old_rank = cursor.fetchone()[0]
-
-            return estimated_old_rank - current_rank
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("DELETE FROM rank_snapshots WHERE snapshot_date = ?", (today.isoformat(),))
+                cursor.executemany(
+                    "INSERT INTO rank_snapshots (snapshot_date, user_id, rank, total_karma) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                cursor.execute("DELETE FROM rank_snapshots WHERE snapshot_date < ?", (retention_cutoff,))
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+
+            baseline_date, baseline_rows = self._load_rank_baseline(cursor, baseline_cutoff)
+            rankings.set_baseline(baseline_rows, baseline_date)
+
+        logger.tree("Rank Snapshot Saved", [
+            ("Date", today.isoformat()),
+            ("Users", str(len(rows))),
+            ("Baseline", baseline_date or "None"),
+        ], emoji="📸")
+        return len(rows)
+
+    async def take_rank_snapshot_async(self) -> int:
+        """Async wrapper for take_rank_snapshot."""
+        return await asyncio.to_thread(self.take_rank_snapshot)
+
+    def get_ranking_stats(self) -> dict:
+        """Get rank index size and update counters."""
+        return self._rankings.get_stats()
 
     def get_karma_history(self, user_id: int, days: int = 7) -> list[int]:
         """Get daily karma changes for a user over the past N days."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """SELECT DATE(created_at), SUM(vote_type)
-                   FROM votes WHERE author_id = ? AND created_at >= datetime('now', ?)
-                   GROUP BY DATE(created_at) ORDER BY DATE(created_at)""",
+                """SELECT day, karma FROM vote_rollup_daily
+                   WHERE author_id = ? AND day >= DATE('now', ?) AND votes > 0
+                   ORDER BY day""",
                 (user_id, f"-{days} days")
             )
             return [r[1] for r in cursor.fetchall()]
@@ -0,0 +1,434 @@
+"""
+OthmanBot - Message Mirror Database Mixin
+=========================================
+
+Local copy of debate-forum messages and vote/participation reactions,
+so analytics and maintenance jobs read SQLite instead of paging
+thread history from Discord.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime
+from typing import Iterable, Optional
+
+from src.services.debates.db.models import MirrorMessage
+
+
+# Rows per IN (...) chunk, kept under SQLite's variable limit
+MIRROR_QUERY_CHUNK_SIZE = 500
+
+# (message_id, thread_id, author_id, author_name, is_bot, created_at, edited_at)
+MirrorMessageRow = tuple[int, int, int, str, bool, datetime, Optional[datetime]]
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    """Serialize a timestamp for storage."""
+    return value.isoformat() if value else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored timestamp."""
+    return datetime.fromisoformat(value) if value else None
+
+
+class MirrorMixin:
+    """
+    Mixin for the message/reaction mirror.
+
+    DESIGN: mirror_messages is append-only: rows are inserted from
+    on_message and thread syncs and only ever flagged deleted, never
+    removed (except with the whole thread). mirror_reactions holds the
+    current user set per (message, emoji) for the tracked emojis.
+    mirror_threads records when each thread was last synced from Discord
+    and its watermark: the newest message ID the mirror is known to hold
+    everything up to, so a restart only replays history after it.
+
+    The mirror itself doesn't know whether it is complete; MessageMirror
+    decides which threads are live and only reads those.
+    """
+
+    # =========================================================================
+    # Live Event Writes
+    # =========================================================================
+
+    def upsert_mirror_messages(self, rows: Iterable[MirrorMessageRow], advance_watermark: bool = False) -> None:
+        """
+        Insert messages, refreshing author name and edit time of known ones.
+
+        Args:
+            rows: Messages to store
+            advance_watermark: Move each thread's watermark up to these
+                messages (only for threads the mirror holds completely)
+        """
+        rows = list(rows)
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            self._write_mirror_messages(cursor, rows)
+            if advance_watermark:
+                self._advance_mirror_watermarks(cursor, rows)
+            conn.commit()
+
+    def set_mirror_message_edited(self, message_id: int, edited_at: datetime) -> None:
+        """Record a message edit."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE mirror_messages SET edited_at = ? WHERE message_id = ?",
+                (_to_text(edited_at), message_id)
+            )
+            conn.commit()
+
+    def mark_mirror_messages_deleted(self, message_ids: Iterable[int]) -> int:
+        """
+        Flag messages as deleted.
+
+        Returns:
+            Number of rows newly flagged
+        """
+        ids = list(message_ids)
+        if not ids:
+            return 0
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE mirror_messages SET deleted = 1 WHERE message_id = ? AND deleted = 0",
+                [(message_id,) for message_id in ids]
+            )
+            changed = cursor.rowcount
+            conn.commit()
+            return changed
+
+    def set_mirror_reaction(self, message_id: int, emoji: str, user_id: int, present: bool) -> None:
+        """Record one reaction being added (present) or removed."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            if present:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO mirror_reactions (message_id, emoji, user_id) VALUES (?, ?, ?)",
+                    (message_id, emoji, user_id)
+                )
+            else:
+                cursor.execute(
+                    "DELETE FROM mirror_reactions WHERE message_id = ? AND emoji = ? AND user_id = ?",
+                    (message_id, emoji, user_id)
+                )
+            conn.commit()
+
+    def clear_mirror_reactions(self, message_id: int, emoji: Optional[str] = None) -> None:
+        """Drop all reactions on a message, or just one emoji's."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            if emoji is None:
+                cursor.execute("DELETE FROM mirror_reactions WHERE message_id = ?", (message_id,))
+            else:
+                cursor.execute(
+                    "DELETE FROM mirror_reactions WHERE message_id = ? AND emoji = ?",
+                    (message_id, emoji)
+                )
+            conn.commit()
+
+    # =========================================================================
+    # Thread Sync
+    # =========================================================================
+
+    def apply_mirror_sync(
+        self,
+        thread_id: int,
+        rows: list[MirrorMessageRow],
+        reactions: dict[int, dict[str, set[int]]],
+        complete: bool
+    ) -> dict:
+        """
+        Store one thread's history as read from Discord.
+
+        Args:
+            thread_id: Synced thread
+            rows: Every message returned by the history read
+            reactions: message_id -> {emoji: user IDs} for the tracked emojis
+            complete: True if the read reached the start of the thread
+
+        Messages inside the window that was read but missing from it are
+        flagged deleted; older rows are left alone unless complete.
+
+        Returns:
+            Dict with messages and deleted counts
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                self._write_mirror_messages(cursor, rows)
+
+                synced_ids = [row[0] for row in rows]
+                for start in range(0, len(synced_ids), MIRROR_QUERY_CHUNK_SIZE):
+                    chunk = synced_ids[start:start + MIRROR_QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"DELETE FROM mirror_reactions WHERE message_id IN ({placeholders})",
+                        chunk
+                    )
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO mirror_reactions (message_id, emoji, user_id) VALUES (?, ?, ?)",
+                    [
+                        (message_id, emoji, user_id)
+                        for message_id, by_emoji in reactions.items()
+                        for emoji, users in by_emoji.items()
+                        for user_id in users
+                    ]
+                )
+
+                # Rows in the window that Discord no longer returns were deleted
+                floor = 0 if complete or not synced_ids else min(synced_ids)
+                cursor.execute(
+                    "SELECT message_id FROM mirror_messages WHERE thread_id = ? AND deleted = 0 AND message_id >= ?",
+                    (thread_id, floor)
+                )
+                seen = set(synced_ids)
+                missing = [(row[0],) for row in cursor.fetchall() if row[0] not in seen]
+                cursor.executemany("UPDATE mirror_messages SET deleted = 1 WHERE message_id = ?", missing)
+
+                cursor.execute(
+                    """INSERT INTO mirror_threads (thread_id, last_message_id, message_count, synced_at)
+                       VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                       ON CONFLICT(thread_id) DO UPDATE SET
+                       last_message_id = excluded.last_message_id,
+                       message_count = excluded.message_count,
+                       synced_at = excluded.synced_at""",
+                    (thread_id, max(synced_ids) if synced_ids else None, len(rows))
+                )
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+        return {"messages": len(rows), "deleted": len(missing)}
+
+    def apply_mirror_increment(
+        self,
+        thread_id: int,
+        after_id: int,
+        rows: list[MirrorMessageRow],
+        reactions: dict[int, dict[str, set[int]]],
+    ) -> dict:
+        """
+        Store the messages a thread gained after its watermark.
+
+        Args:
+            thread_id: Replayed thread
+            after_id: Watermark the replay started from
+            rows: Every message newer than after_id
+            reactions: message_id -> {emoji: user IDs} for the tracked emojis
+
+        Rows already stored are trusted as they are; only the replayed
+        messages and their reactions are written.
+
+        Returns:
+            Dict with messages and deleted counts
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                self._write_mirror_messages(cursor, rows)
+                replayed_ids = [row[0] for row in rows]
+                for start in range(0, len(replayed_ids), MIRROR_QUERY_CHUNK_SIZE):
+                    chunk = replayed_ids[start:start + MIRROR_QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"DELETE FROM mirror_reactions WHERE message_id IN ({placeholders})",
+                        chunk
+                    )
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO mirror_reactions (message_id, emoji, user_id) VALUES (?, ?, ?)",
+                    [
+                        (message_id, emoji, user_id)
+                        for message_id, by_emoji in reactions.items()
+                        for emoji, users in by_emoji.items()
+                        for user_id in users
+                    ]
+                )
+                cursor.execute(
+                    """INSERT INTO mirror_threads (thread_id, last_message_id, message_count, synced_at)
+                       VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                       ON CONFLICT(thread_id) DO UPDATE SET
+                       last_message_id = MAX(COALESCE(last_message_id, 0), excluded.last_message_id),
+                       message_count = COALESCE(message_count, 0) + excluded.message_count,
+                       synced_at = excluded.synced_at""",
+                    (thread_id, max([after_id, *replayed_ids]), len(rows))
+                )
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+        return {"messages": len(rows), "deleted": 0}
+
+    async def apply_mirror_increment_async(
+        self,
+        thread_id: int,
+        after_id: int,
+        rows: list[MirrorMessageRow],
+        reactions: dict[int, dict[str, set[int]]],
+    ) -> dict:
+        """Async wrapper for apply_mirror_increment."""
+        return await asyncio.to_thread(self.apply_mirror_increment, thread_id, after_id, rows, reactions)
+
+    def get_mirror_watermarks(self) -> dict[int, int]:
+        """Get every thread's watermark (newest message ID held completely)."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT thread_id, last_message_id FROM mirror_threads WHERE last_message_id IS NOT NULL")
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    async def get_mirror_watermarks_async(self) -> dict[int, int]:
+        """Async wrapper for get_mirror_watermarks."""
+        return await asyncio.to_thread(self.get_mirror_watermarks)
+
+    @staticmethod
+    def _advance_mirror_watermarks(cursor: sqlite3.Cursor, rows: list[MirrorMessageRow]) -> None:
+        """Raise each thread's watermark to its newest row (caller owns the transaction)."""
+        newest: dict[int, int] = {}
+        for row in rows:
+            newest[row[1]] = max(newest.get(row[1], 0), row[0])
+        cursor.executemany(
+            """INSERT INTO mirror_threads (thread_id, last_message_id, message_count, synced_at)
+               VALUES (?, ?, 0, CURRENT_TIMESTAMP)
+               ON CONFLICT(thread_id) DO UPDATE SET
+               last_message_id = MAX(COALESCE(last_message_id, 0), excluded.last_message_id)""",
+            list(newest.items())
+        )
+
+    async def apply_mirror_sync_async(
+        self,
+        thread_id: int,
+        rows: list[MirrorMessageRow],
+        reactions: dict[int, dict[str, set[int]]],
+        complete: bool
+    ) -> dict:
+        """Async wrapper for apply_mirror_sync."""
+        return await asyncio.to_thread(self.apply_mirror_sync, thread_id, rows, reactions, complete)
+
+    @staticmethod
+    def _write_mirror_messages(cursor: sqlite3.Cursor, rows: Iterable[MirrorMessageRow]) -> None:
+        """Upsert message rows (caller owns the transaction)."""
+        cursor.executemany(
+            """INSERT INTO mirror_messages
+               (message_id, thread_id, author_id, author_name, is_bot, created_at, edited_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(message_id) DO UPDATE SET
+               author_name = excluded.author_name,
+               edited_at = COALESCE(excluded.edited_at, edited_at),
+               deleted = 0""",
+            [
+                (message_id, thread_id, author_id, author_name, int(is_bot), _to_text(created_at), _to_text(edited_at))
+                for message_id, thread_id, author_id, author_name, is_bot, created_at, edited_at in rows
+            ]
+        )
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def get_mirror_messages(
+        self,
+        thread_id: int,
+        include_bots: bool = False,
+        after_id: Optional[int] = None
+    ) -> list[MirrorMessage]:
+        """
+        Get a thread's live messages, oldest first.
+
+        Args:
+            thread_id: Thread to read
+            include_bots: Include messages from bot accounts
+            after_id: Only messages newer than this ID
+        """
+        query = (
+            "SELECT message_id, thread_id, author_id, author_name, is_bot, created_at, edited_at "
+            "FROM mirror_messages WHERE thread_id = ? AND deleted = 0 AND message_id > ?"
+        )
+        if not include_bots:
+            query += " AND is_bot = 0"
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query + " ORDER BY message_id", (thread_id, after_id or 0))
+            return [
+                MirrorMessage(
+                    message_id=row[0],
+                    thread_id=row[1],
+                    author_id=row[2],
+                    author_name=row[3] or "",
+                    is_bot=bool(row[4]),
+                    created_at=_from_text(row[5]),
+                    edited_at=_from_text(row[6]),
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def get_mirror_reactions(self, thread_id: int, emojis: Iterable[str]) -> dict[int, dict[str, set[int]]]:
+        """
+        Get current reactions on a thread's live messages.
+
+        Returns:
+            message_id -> {emoji: user IDs}, for the given emojis only
+        """
+        emoji_list = list(emojis)
+        placeholders = ",".join("?" * len(emoji_list))
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""SELECT r.message_id, r.emoji, r.user_id FROM mirror_reactions r
+                    JOIN mirror_messages m ON m.message_id = r.message_id
+                    WHERE m.thread_id = ? AND m.deleted = 0 AND r.emoji IN ({placeholders})""",
+                (thread_id, *emoji_list)
+            )
+            result: dict[int, dict[str, set[int]]] = {}
+            for message_id, emoji, user_id in cursor.fetchall():
+                result.setdefault(message_id, {}).setdefault(emoji, set()).add(user_id)
+            return result
+
+    def get_mirror_message_ids(self, thread_id: int) -> set[int]:
+        """Get IDs of a thread's live messages from human authors."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT message_id FROM mirror_messages WHERE thread_id = ? AND deleted = 0 AND is_bot = 0",
+                (thread_id,)
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def get_mirror_message_counts(self, thread_id: int) -> dict[int, int]:
+        """Get live human message counts per author in a thread."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT author_id, COUNT(*) FROM mirror_messages
+                   WHERE thread_id = ? AND deleted = 0 AND is_bot = 0
+                   GROUP BY author_id""",
+                (thread_id,)
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def get_mirror_stats(self) -> dict:
+        """Row counts for logging."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(deleted), 0) FROM mirror_messages")
+            messages, deleted = cursor.fetchone()
+            cursor.execute("SELECT COUNT(*) FROM mirror_reactions")
+            reactions = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM mirror_threads")
+            threads = cursor.fetchone()[0]
+            return {"messages": messages, "deleted": deleted, "reactions": reactions, "threads": threads}
+
+
+__all__ = ["MirrorMixin", "MirrorMessageRow"]
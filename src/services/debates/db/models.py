@@ -163,6 +163,22 @@ class ThreadAnalytics:
     approval_rate: float = 0.0
 
 
+# =============================================================================
+# Mirror Models
+# =============================================================================
+
+@dataclass
+class MirrorMessage:
+    """Debate-forum message as recorded in the local mirror."""
+    message_id: int
+    thread_id: int
+    author_id: int
+    author_name: str
+    is_bot: bool
+    created_at: datetime
+    edited_at: Optional[datetime] = None
+
+
 # =============================================================================
 # Appeal Models
 # =============================================================================
@@ -204,6 +220,8 @@ __all__ = [
     # Analytics models
     "AnalyticsMessage",
     "ThreadAnalytics",
+    # Mirror models
+    "MirrorMessage",
     # Appeal models
     "AppealRecord",
 ]
@@ -0,0 +1,178 @@
+"""
+OthmanBot - Moderation Jobs Database Mixin
+==========================================
+
+Persisted background moderation jobs and their per-message progress.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+from typing import Optional
+
+
+class ModerationJobsMixin:
+    """
+    Mixin for background moderation jobs.
+
+    A job is one action against one user (currently removing their
+    participation reactions) split into per-message items. Items are
+    marked as they finish, so a job interrupted by a restart resumes
+    with only the messages it had not reached.
+    """
+
+    def create_reaction_cleanup_job(self, user_id: int, thread_id: Optional[int] = None) -> dict:
+        """
+        Queue removal of a user's participation reactions.
+
+        Targets are the analytics embeds participation_gate records the
+        user as having reacted to. For a single-thread ban the thread's
+        current analytics message is targeted too, even without a recorded
+        reaction, since that record can miss reactions made while the bot
+        was offline; such items are flagged unrecorded.
+
+        Args:
+            user_id: User whose reactions to remove
+            thread_id: Only this thread, or None for every debate thread
+
+        Returns:
+            The job, shaped like get_unfinished_moderation_jobs entries
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+
+            if thread_id is None:
+                cursor.execute(
+                    """SELECT thread_id, message_id, 1 FROM participation_gate
+                       WHERE user_id = ? ORDER BY thread_id, message_id""",
+                    (user_id,)
+                )
+            else:
+                # Recorded reactions sort first, so they win over the same unrecorded message
+                cursor.execute(
+                    """SELECT thread_id, message_id, recorded FROM (
+                           SELECT thread_id, message_id, 1 AS recorded FROM participation_gate
+                           WHERE user_id = ? AND thread_id = ?
+                           UNION ALL
+                           SELECT thread_id, analytics_message_id, 0 FROM debate_threads
+                           WHERE thread_id = ? AND analytics_message_id IS NOT NULL
+                       ) ORDER BY recorded DESC, message_id""",
+                    (user_id, thread_id, thread_id)
+                )
+            # One item per message
+            targets: dict[int, tuple[int, int, int]] = {}
+            for target_thread, message_id, recorded in cursor.fetchall():
+                targets.setdefault(message_id, (target_thread, message_id, recorded))
+
+            cursor.execute(
+                "INSERT INTO moderation_jobs (kind, user_id, thread_id) VALUES ('remove_reactions', ?, ?)",
+                (user_id, thread_id)
+            )
+            job_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT INTO moderation_job_items (job_id, thread_id, message_id, recorded) VALUES (?, ?, ?, ?)",
+                [(job_id, *target) for target in targets.values()]
+            )
+            conn.commit()
+            return {
+                "id": job_id,
+                "kind": "remove_reactions",
+                "user_id": user_id,
+                "thread_id": thread_id,
+                "items": [
+                    {"thread_id": target_thread, "message_id": message_id, "recorded": bool(recorded), "attempts": 0}
+                    for target_thread, message_id, recorded in targets.values()
+                ],
+            }
+
+    async def create_reaction_cleanup_job_async(
+        self, user_id: int, thread_id: Optional[int] = None
+    ) -> dict:
+        """Async wrapper for create_reaction_cleanup_job."""
+        return await asyncio.to_thread(self.create_reaction_cleanup_job, user_id, thread_id)
+
+    def get_unfinished_moderation_jobs(self) -> list[dict]:
+        """Get every job not yet finished, with its pending items."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, kind, user_id, thread_id FROM moderation_jobs WHERE finished_at IS NULL ORDER BY id"
+            )
+            jobs = [
+                {"id": r[0], "kind": r[1], "user_id": r[2], "thread_id": r[3], "items": []}
+                for r in cursor.fetchall()
+            ]
+            by_id = {job["id"]: job for job in jobs}
+            cursor.execute(
+                """SELECT i.job_id, i.thread_id, i.message_id, i.recorded, i.attempts
+                   FROM moderation_job_items i JOIN moderation_jobs j ON j.id = i.job_id
+                   WHERE j.finished_at IS NULL AND i.status = 'pending'
+                   ORDER BY i.job_id, i.thread_id, i.message_id"""
+            )
+            for job_id, thread_id, message_id, recorded, attempts in cursor.fetchall():
+                by_id[job_id]["items"].append(
+                    {"thread_id": thread_id, "message_id": message_id, "recorded": bool(recorded), "attempts": attempts}
+                )
+            return jobs
+
+    def set_moderation_job_item_status(
+        self,
+        job_id: int,
+        message_id: int,
+        status: str,
+        attempts: int
+    ) -> None:
+        """Record an item's outcome ('done', 'unconfirmed', 'missing', 'failed') or a retry ('pending')."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE moderation_job_items SET status = ?, attempts = ? WHERE job_id = ? AND message_id = ?",
+                (status, attempts, job_id, message_id)
+            )
+            conn.commit()
+
+    def finish_moderation_job(self, job_id: int) -> dict:
+        """
+        Mark a job finished.
+
+        Returns:
+            Item counts per status
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE moderation_jobs SET finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (job_id,)
+            )
+            cursor.execute(
+                "SELECT status, COUNT(*) FROM moderation_job_items WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            )
+            counts = dict(cursor.fetchall())
+            conn.commit()
+            return counts
+
+    def cleanup_moderation_jobs(self, days: int = 30) -> int:
+        """Delete finished jobs older than the given number of days."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                """DELETE FROM moderation_job_items WHERE job_id IN (
+                       SELECT id FROM moderation_jobs
+                       WHERE finished_at IS NOT NULL AND finished_at < datetime('now', ?)
+                   )""",
+                (f"-{days} days",)
+            )
+            cursor.execute(
+                "DELETE FROM moderation_jobs WHERE finished_at IS NOT NULL AND finished_at < datetime('now', ?)",
+                (f"-{days} days",)
+            )
+            deleted = cursor.rowcount
+            conn.commit()
+            return deleted
@@ -0,0 +1,402 @@
+"""
+OthmanBot - Participation Buffer
+================================
+
+In-memory accumulator for participation counts and streak updates,
+backed by an append-only journal until each batch is committed.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TextIO
+
+from src.core.logger import logger
+
+
+# Journal record shapes: P thread user count / S user day / D thread user
+_JOURNAL_LINE = re.compile(r"P (\d+) (\d+) (\d+)|S (\d+) (\d{4}-\d{2}-\d{2})|D (\d+) (\d+)")
+
+
+def _valid_day(day: str) -> bool:
+    """True if a journaled streak day is a real %Y-%m-%d date."""
+    try:
+        datetime.strptime(day, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass
+class ParticipationBatch:
+    """Deltas sealed for one flush transaction."""
+    batch_id: int
+    counts: dict[tuple[int, int], int]
+    streaks: list[tuple[int, str]]
+    paths: list[Path] = field(default_factory=list)
+
+
+class ParticipationBuffer:
+    """
+    Pending per-(thread, user) message counts and per-user streak days.
+
+    DESIGN: Every debate message used to cost two thread hops, two lock
+    acquisitions and two commits (participation upsert, then a streak
+    read-modify-write). Messages now only bump a counter here, and a user's
+    streak is queued once per day: later messages that day are answered
+    from the set of users already seen. The flusher writes all of it in
+    one transaction.
+
+    Each event is appended to a journal before it is acknowledged. A flush
+    seals the journal as a numbered segment, and the transaction records
+    that number in participation_flush, so after a crash a segment is
+    replayed only if its batch never committed. Recovery seals a leftover
+    live journal the same way, so new events never follow a torn line, and
+    skips records whose fields don't parse. Discards (thread or user
+    deletion, reconciliation overwrites) are journaled too, so a replay
+    cannot resurrect deleted rows.
+
+    Recovery reads the database, so it runs off the event loop at startup.
+    Events recorded before it finishes are held as journal lines and
+    applied, in order, after the leftover journals have been replayed.
+    """
+
+    def __init__(self, journal_dir: Path, name: str) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        self._journal_dir = journal_dir
+        self._name = name
+        self._journal: Optional[TextIO] = None
+        self._early: list[str] = []
+        self._sealed: list[Path] = []
+        self._next_batch = 1
+
+        self._counts: dict[tuple[int, int], int] = {}
+        self._pending = 0
+        self._streaks: dict[tuple[int, str], None] = {}
+        self._streak_day: Optional[str] = None
+        self._streaked: set[int] = set()
+
+        # Metrics
+        self.messages = 0
+        self.streaks_queued = 0
+        self.streaks_skipped = 0
+        self.replayed = 0
+        self.replay_skipped = 0
+        self.journal_errors = 0
+
+    # =========================================================================
+    # Journal Files
+    # =========================================================================
+
+    @property
+    def journal_path(self) -> Path:
+        """Journal receiving new events."""
+        return self._journal_dir / f"{self._name}.participation.journal"
+
+    def _segment_path(self, batch_id: int) -> Path:
+        """Sealed journal for a batch."""
+        return self._journal_dir / f"{self._name}.participation.{batch_id}.journal"
+
+    def _append(self, line: str) -> None:
+        """Write journal lines (lock held). Events stay buffered if this fails."""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(line)
+            self._journal.flush()
+        except OSError as e:
+            self.journal_errors += 1
+            if self.journal_errors == 1:
+                logger.warning("Participation Journal Write Failed", [
+                    ("Path", str(self.journal_path)),
+                    ("Error", str(e)),
+                ])
+
+    def _close_journal(self) -> None:
+        """Close the journal file handle (lock held)."""
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except OSError:
+                pass
+            self._journal = None
+
+    def _replay(self, path: Path) -> None:
+        """Merge a journal's events into the pending state (lock held)."""
+        try:
+            lines = path.read_text(encoding="utf-8").split("\n")
+        except (OSError, UnicodeDecodeError):
+            return
+        # Every record ends in a newline, so an unterminated last line is torn
+        if lines[-1]:
+            self.replay_skipped += 1
+        self.replayed += self._apply_lines(lines[:-1])
+
+    def _apply_lines(self, lines: list[str]) -> int:
+        """Apply journal records to the pending state (lock held). Returns records applied."""
+        applied = 0
+        for line in lines:
+            if not line:
+                continue
+            match = _JOURNAL_LINE.fullmatch(line)
+            if match is None:
+                self.replay_skipped += 1
+                continue
+            if line[0] == "P":
+                key, count = (int(match.group(1)), int(match.group(2))), int(match.group(3))
+                self._counts[key] = self._counts.get(key, 0) + count
+                self._pending += count
+            elif line[0] == "S":
+                if not _valid_day(match.group(5)):
+                    self.replay_skipped += 1
+                    continue
+                self._streaks[(int(match.group(4)), match.group(5))] = None
+            else:
+                self._discard_pending(int(match.group(6)) or None, int(match.group(7)) or None)
+            applied += 1
+        return applied
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once leftover journals have been recovered."""
+        return self._loaded
+
+    def recover(self, last_batch: int) -> None:
+        """
+        Replay journals left by a previous run.
+
+        Args:
+            last_batch: Highest batch ID recorded as committed in the database
+        """
+        pattern = re.compile(rf"{re.escape(self._name)}\.participation\.(\d+)\.journal$")
+        with self._lock:
+            if self._loaded:
+                return
+            segments = []
+            for path in self._journal_dir.glob(f"{self._name}.participation.*.journal"):
+                match = pattern.match(path.name)
+                if match:
+                    segments.append((int(match.group(1)), path))
+
+            for batch_id, path in sorted(segments):
+                self._next_batch = max(self._next_batch, batch_id + 1)
+                if batch_id <= last_batch:
+                    # Committed before the crash; only the delete was lost
+                    path.unlink(missing_ok=True)
+                    continue
+                self._replay(path)
+                self._sealed.append(path)
+
+            self._next_batch = max(self._next_batch, last_batch + 1)
+            if self.journal_path.exists():
+                self._replay(self.journal_path)
+                self._rotate_recovered()
+
+            # Events recorded while recovery was pending go after the replay
+            if self._early:
+                self._apply_lines("".join(self._early).splitlines())
+                self._append("".join(self._early))
+                self._early = []
+
+            self._loaded = True
+            replayed = self.replayed
+            skipped = self.replay_skipped
+
+        if replayed or skipped:
+            logger.info("Participation Journal Recovered", [
+                ("Events", str(replayed)),
+                ("Skipped Lines", str(skipped)),
+                ("Pending Keys", str(len(self._counts))),
+                ("Pending Streaks", str(len(self._streaks))),
+            ])
+
+    def _rotate_recovered(self) -> None:
+        """
+        Seal the replayed live journal so new events start a clean file (lock held).
+
+        Appending to it could glue the next event onto a torn last line and
+        lose both. If the rename fails, the journal is newline-terminated
+        instead so the next record starts on its own line.
+        """
+        segment = self._segment_path(self._next_batch)
+        try:
+            self.journal_path.replace(segment)
+        except OSError as e:
+            self.journal_errors += 1
+            logger.warning("Participation Journal Rotate Failed", [
+                ("Path", str(self.journal_path)),
+                ("Error", str(e)),
+            ])
+            self._append("\n")
+            return
+        self._next_batch += 1
+        self._sealed.append(segment)
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def record(self, thread_id: int, user_id: int, day: str) -> bool:
+        """
+        Count one message and queue the user's streak if it is their first today.
+
+        Before recover() has run, the event is held and applied once the
+        leftover journals have been replayed.
+
+        Returns:
+            True if a streak update was queued
+        """
+        with self._lock:
+            self.messages += 1
+            line = f"P {thread_id} {user_id} 1\n"
+
+            if day != self._streak_day:
+                self._streak_day = day
+                self._streaked = set()
+            queued = user_id not in self._streaked
+            if queued:
+                self._streaked.add(user_id)
+                self.streaks_queued += 1
+                line += f"S {user_id} {day}\n"
+            else:
+                self.streaks_skipped += 1
+
+            if not self._loaded:
+                self._early.append(line)
+                return queued
+
+            key = (thread_id, user_id)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            self._pending += 1
+            if queued:
+                self._streaks[(user_id, day)] = None
+            self._append(line)
+            return queued
+
+    def discard(self, thread_id: Optional[int] = None, user_id: Optional[int] = None) -> None:
+        """Drop pending events of a thread, a user, or one (thread, user) pair."""
+        with self._lock:
+            if thread_id is None and user_id is not None:
+                self._streaked.discard(user_id)
+            if not self._loaded:
+                # Held so it also applies to the journals recover() replays
+                self._early.append(f"D {thread_id or 0} {user_id or 0}\n")
+                return
+            # Pending mirrors the journals, so nothing removed means nothing journaled
+            if self._discard_pending(thread_id, user_id):
+                self._append(f"D {thread_id or 0} {user_id or 0}\n")
+
+    def _discard_pending(self, thread_id: Optional[int], user_id: Optional[int]) -> bool:
+        """Remove matching pending counts, and streaks of a deleted user (lock held)."""
+        counts = {
+            (t, u): n for (t, u), n in self._counts.items()
+            if not ((thread_id is None or t == thread_id) and (user_id is None or u == user_id))
+        }
+        removed = len(counts) != len(self._counts)
+        self._counts = counts
+        self._pending = sum(counts.values())
+        if thread_id is None and user_id is not None:
+            streaks = {key: None for key in self._streaks if key[0] != user_id}
+            removed = removed or len(streaks) != len(self._streaks)
+            self._streaks = streaks
+        return removed
+
+    # =========================================================================
+    # Flushing
+    # =========================================================================
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered messages not yet flushed."""
+        return self._pending
+
+    def seal(self) -> Optional[ParticipationBatch]:
+        """
+        Take every pending event for a flush and start a fresh journal.
+
+        Returns:
+            The batch to write, or None if nothing is pending
+        """
+        with self._lock:
+            if not self._counts and not self._streaks:
+                return None
+
+            batch_id = self._next_batch
+            self._next_batch += 1
+            self._close_journal()
+            if self.journal_path.exists():
+                segment = self._segment_path(batch_id)
+                try:
+                    self.journal_path.replace(segment)
+                    self._sealed.append(segment)
+                except OSError as e:
+                    self.journal_errors += 1
+                    logger.warning("Participation Journal Seal Failed", [
+                        ("Path", str(self.journal_path)),
+                        ("Error", str(e)),
+                    ])
+
+            batch = ParticipationBatch(
+                batch_id=batch_id,
+                counts=self._counts,
+                streaks=list(self._streaks),
+                paths=list(self._sealed),
+            )
+            self._counts = {}
+            self._pending = 0
+            self._streaks = {}
+            return batch
+
+    def restore(self, batch: ParticipationBatch) -> None:
+        """Put a batch whose transaction failed back in front of newer events."""
+        with self._lock:
+            for key, count in batch.counts.items():
+                self._counts[key] = self._counts.get(key, 0) + count
+                self._pending += count
+            streaks = dict.fromkeys(batch.streaks)
+            streaks.update(self._streaks)
+            self._streaks = streaks
+
+    def committed(self, batch: ParticipationBatch) -> None:
+        """Delete the journals a committed batch covered."""
+        with self._lock:
+            for path in batch.paths:
+                path.unlink(missing_ok=True)
+                if path in self._sealed:
+                    self._sealed.remove(path)
+
+    def close(self) -> None:
+        """Close the journal file handle."""
+        with self._lock:
+            self._close_journal()
+
+    def get_stats(self) -> dict:
+        """Buffer size and recording counters."""
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "pending_messages": self._pending,
+                "pending_keys": len(self._counts),
+                "pending_streaks": len(self._streaks),
+                "sealed_journals": len(self._sealed),
+                "messages": self.messages,
+                "streaks_queued": self.streaks_queued,
+                "streaks_skipped": self.streaks_skipped,
+                "replayed": self.replayed,
+                "replay_skipped": self.replay_skipped,
+                "journal_errors": self.journal_errors,
+            }
+
+
+__all__ = ["ParticipationBatch", "ParticipationBuffer"]
@@ -0,0 +1,233 @@
+"""
+OthmanBot - Database Connection Pool
+====================================
+
+Read-only WAL connection pool and an instrumented writer lock
+for the debates database.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from src.core.config import DATABASE_TIMEOUT, DB_READ_POOL_SIZE, DB_READ_POOL_TIMEOUT
+
+
+# =============================================================================
+# Instrumented Writer Lock
+# =============================================================================
+
+class InstrumentedLock:
+    """
+    threading.Lock drop-in that counts contention and wait time.
+
+    DESIGN: Every mixin uses `with self._lock:` for writes, so swapping the
+    lock object is enough to measure how often writers queue behind each
+    other without touching any call site.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock, recording wait time when it was already held."""
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return True
+        if not blocking:
+            return False
+
+        started = time.perf_counter()
+        acquired = self._lock.acquire(timeout=timeout)
+        if acquired:
+            waited_ms = (time.perf_counter() - started) * 1000
+            self.acquisitions += 1
+            self.contended += 1
+            self.total_wait_ms += waited_ms
+            self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+        return acquired
+
+    def release(self) -> None:
+        """Release the lock."""
+        self._lock.release()
+
+    def locked(self) -> bool:
+        """Return True if the lock is held."""
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def get_stats(self) -> dict:
+        """Get contention counters."""
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "total_wait_ms": round(self.total_wait_ms, 1),
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+
+# =============================================================================
+# Read Connection Pool
+# =============================================================================
+
+class ReadConnectionPool:
+    """
+    Bounded pool of read-only SQLite connections.
+
+    DESIGN: WAL mode lets readers run alongside the single writer, but only
+    if they use their own connections. Connections are opened lazily up to
+    `size`; when all are busy, callers wait (counted as contention) until one
+    is returned or `timeout` expires.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        size: int = DB_READ_POOL_SIZE,
+        timeout: float = DB_READ_POOL_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            db_path: Path to the SQLite database (must already exist)
+            size: Maximum number of reader connections
+            timeout: Seconds to wait for a free connection before failing
+        """
+        self._db_path = Path(db_path)
+        self._size = max(1, size)
+        self._timeout = timeout
+        self._cond = threading.Condition()
+        self._idle: list[sqlite3.Connection] = []
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+
+        # Metrics
+        self.acquisitions = 0
+        self.contended = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new read-only connection."""
+        conn = sqlite3.connect(
+            f"file:{self._db_path.resolve()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=DATABASE_TIMEOUT,
+        )
+        conn.execute("PRAGMA mmap_size=67108864")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one, or wait for one."""
+        with self._cond:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Read pool is closed")
+
+            started = None
+            while not self._idle and self._created >= self._size:
+                if started is None:
+                    started = time.perf_counter()
+                    self.contended += 1
+                remaining = self._timeout - (time.perf_counter() - started)
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    if not self._idle and self._created >= self._size:
+                        self.timeouts += 1
+                        raise sqlite3.OperationalError("Timed out waiting for a read connection")
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Read pool is closed")
+
+            if started is not None:
+                waited_ms = (time.perf_counter() - started) * 1000
+                self.total_wait_ms += waited_ms
+                self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+
+            self.acquisitions += 1
+            self._in_use += 1
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return self._open()
+        except sqlite3.Error:
+            with self._cond:
+                self._created -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._in_use -= 1
+            if self._closed:
+                self._created -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; busy ones are closed when released."""
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._created -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict:
+        """Get pool size and contention counters."""
+        with self._cond:
+            return {
+                "size": self._size,
+                "open": self._created,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_ms, 1),
+                "max_wait_ms": round(self.max_wait_ms, 1),
+            }
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["InstrumentedLock", "ReadConnectionPool"]
@@ -0,0 +1,293 @@
+"""
+OthmanBot - Leaderboard Rank Index
+==================================
+
+In-memory materialized leaderboard kept in step with vote writes.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import threading
+from bisect import bisect_right, insort
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+
+def utc_today() -> date:
+    """Today's date in UTC (votes.created_at is stored as UTC)."""
+    return datetime.now(timezone.utc).date()
+
+
+def period_start(today: date) -> date:
+    """First day kept in the daily buckets: the 1st of last month."""
+    first = today.replace(day=1)
+    return (first - timedelta(days=1)).replace(day=1)
+
+
+class RankIndex:
+    """
+    Materialized karma rankings with per-day rolling totals.
+
+    DESIGN: get_user_rank used to COUNT(*) the users table on every profile
+    view and /karma card, and the monthly leaderboard filtered votes with
+    strftime(), which can't use an index. This keeps:
+
+    - every user's total karma plus a sorted list of all totals, so a rank
+      is one bisect (O(log n)) instead of a table scan
+    - per-day, per-author karma buckets from the 1st of last month onward,
+      plus per-month sums, for weekly and monthly totals
+    - the rank snapshot from a week ago for week-over-week deltas
+
+    The vote write paths apply their deltas after committing. Bulk
+    maintenance paths just call invalidate() and the next read reloads.
+    A version counter makes a load that raced a write discard itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._version = 0
+
+        self._karma: dict[int, int] = {}
+        self._sorted: list[int] = []
+        self._days: dict[str, dict[int, int]] = {}
+        self._months: dict[str, dict[int, int]] = {}
+        self._oldest_day: Optional[str] = None
+
+        self._baseline: dict[int, int] = {}
+        self._baseline_date: Optional[str] = None
+
+        # Metrics
+        self.loads = 0
+        self.updates = 0
+        self.invalidations = 0
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the index holds a complete view."""
+        return self._loaded
+
+    def begin_load(self) -> int:
+        """Return the version token a load must present to finish."""
+        with self._lock:
+            return self._version
+
+    def finish_load(
+        self,
+        token: int,
+        karma_rows: Iterable[tuple[int, int]],
+        day_rows: Iterable[tuple[str, int, int]],
+        oldest_day: str,
+        baseline_rows: Iterable[tuple[int, int]],
+        baseline_date: Optional[str],
+    ) -> bool:
+        """
+        Install freshly queried state.
+
+        Args:
+            token: Value returned by begin_load() before querying
+            karma_rows: (user_id, total_karma) for every user
+            day_rows: (day, author_id, karma) sums for days >= oldest_day
+            oldest_day: First day covered by day_rows (YYYY-MM-DD)
+            baseline_rows: (user_id, rank) from the comparison snapshot
+            baseline_date: Date of that snapshot, if any
+
+        Returns:
+            False if a write happened mid-load (state is discarded)
+        """
+        karma = {user_id: total or 0 for user_id, total in karma_rows}
+        days: dict[str, dict[int, int]] = {}
+        months: dict[str, dict[int, int]] = {}
+        for day, author_id, total in day_rows:
+            days.setdefault(day, {})[author_id] = total
+            month = months.setdefault(day[:7], {})
+            month[author_id] = month.get(author_id, 0) + total
+
+        with self._lock:
+            if token != self._version:
+                return False
+            self._karma = karma
+            self._sorted = sorted(karma.values())
+            self._days = days
+            self._months = months
+            self._oldest_day = oldest_day
+            self._baseline = dict(baseline_rows)
+            self._baseline_date = baseline_date
+            self._loaded = True
+            self.loads += 1
+            return True
+
+    def invalidate(self) -> None:
+        """Drop the index; the next read reloads it from the database."""
+        with self._lock:
+            self._version += 1
+            self._loaded = False
+            self.invalidations += 1
+
+    def set_baseline(self, rows: Iterable[tuple[int, int]], snapshot_date: Optional[str]) -> None:
+        """Replace the comparison snapshot used for rank changes."""
+        with self._lock:
+            self._baseline = dict(rows)
+            self._baseline_date = snapshot_date
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def apply(self, author_id: int, karma_change: int, day: str) -> None:
+        """
+        Apply one committed karma change.
+
+        Args:
+            author_id: User whose karma changed
+            karma_change: Signed change to total karma
+            day: created_at date (YYYY-MM-DD) of the vote row it belongs to
+        """
+        with self._lock:
+            self._version += 1
+            if not self._loaded or karma_change == 0:
+                return
+
+            old = self._karma.get(author_id)
+            if old is None:
+                old = 0
+                self._karma[author_id] = 0
+                insort(self._sorted, 0)
+            new = old + karma_change
+            self._karma[author_id] = new
+            del self._sorted[bisect_right(self._sorted, old) - 1]
+            insort(self._sorted, new)
+
+            if self._oldest_day is None or day >= self._oldest_day:
+                bucket = self._days.setdefault(day, {})
+                bucket[author_id] = bucket.get(author_id, 0) + karma_change
+                month = self._months.setdefault(day[:7], {})
+                month[author_id] = month.get(author_id, 0) + karma_change
+
+            self._prune(utc_today())
+            self.updates += 1
+
+    def _prune(self, today: date) -> None:
+        """Drop buckets older than the 1st of last month (lock held)."""
+        oldest = period_start(today).isoformat()
+        if self._oldest_day is not None and oldest <= self._oldest_day:
+            return
+        self._oldest_day = oldest
+        for day in [d for d in self._days if d < oldest]:
+            del self._days[day]
+        for month in [m for m in self._months if m < oldest[:7]]:
+            del self._months[month]
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def rank(self, user_id: int) -> int:
+        """1-indexed rank: one more than the number of users with more karma."""
+        with self._lock:
+            karma = self._karma.get(user_id, 0)
+            return len(self._sorted) - bisect_right(self._sorted, karma) + 1
+
+    def karma(self, user_id: int) -> int:
+        """Materialized total karma for a user."""
+        with self._lock:
+            return self._karma.get(user_id, 0)
+
+    def covers_month(self, year: int, month: int) -> bool:
+        """True if the month's totals are fully held in memory."""
+        with self._lock:
+            return self._oldest_day is not None and f"{year:04d}-{month:02d}" >= self._oldest_day[:7]
+
+    def monthly_total(self, user_id: int, year: int, month: int) -> int:
+        """Karma received in a calendar month (UTC)."""
+        with self._lock:
+            return self._months.get(f"{year:04d}-{month:02d}", {}).get(user_id, 0)
+
+    def weekly_total(self, user_id: int) -> int:
+        """Karma received over the last 7 days, today included (UTC)."""
+        with self._lock:
+            return sum(
+                self._days.get(day, {}).get(user_id, 0)
+                for day in self._week_days(utc_today())
+            )
+
+    def top_monthly(self, year: int, month: int, limit: int) -> list[tuple[int, int]]:
+        """Top (user_id, karma) for a calendar month."""
+        with self._lock:
+            totals = self._months.get(f"{year:04d}-{month:02d}", {})
+            return sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def top_weekly(self, limit: int) -> list[tuple[int, int]]:
+        """Top (user_id, karma) over the last 7 days."""
+        with self._lock:
+            totals: dict[int, int] = {}
+            for day in self._week_days(utc_today()):
+                for user_id, karma in self._days.get(day, {}).items():
+                    totals[user_id] = totals.get(user_id, 0) + karma
+            return sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    def rank_change(self, user_id: int) -> int:
+        """
+        Positions gained since the baseline snapshot (positive = moved up).
+
+        Without a week-old snapshot, last week's ranks are estimated by
+        subtracting everyone's 7-day karma from their current total.
+        """
+        with self._lock:
+            karma = self._karma.get(user_id, 0)
+            current = len(self._sorted) - bisect_right(self._sorted, karma) + 1
+
+            previous = self._baseline.get(user_id)
+            if previous is not None:
+                return previous - current
+            if self._baseline:
+                # Snapshot exists but the user wasn't ranked yet
+                return 0
+
+            week = self._week_days(utc_today())
+            weekly: dict[int, int] = {}
+            for day in week:
+                for uid, change in self._days.get(day, {}).items():
+                    weekly[uid] = weekly.get(uid, 0) + change
+            mine = karma - weekly.get(user_id, 0)
+            previous = 1 + sum(
+                1 for uid, total in self._karma.items()
+                if total - weekly.get(uid, 0) > mine
+            )
+            return previous - current
+
+    def ranked_users(self) -> list[tuple[int, int, int]]:
+        """All users as (user_id, rank, karma), for snapshots."""
+        with self._lock:
+            ordered = sorted(self._karma.items(), key=lambda item: -item[1])
+            count = len(self._sorted)
+            return [
+                (user_id, count - bisect_right(self._sorted, karma) + 1, karma)
+                for user_id, karma in ordered
+            ]
+
+    def get_stats(self) -> dict:
+        """Index size and update counters."""
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "users": len(self._karma),
+                "days": len(self._days),
+                "baseline_date": self._baseline_date,
+                "loads": self.loads,
+                "updates": self.updates,
+                "invalidations": self.invalidations,
+            }
+
+    @staticmethod
+    def _week_days(today: date) -> list[str]:
+        """The 7 dates (YYYY-MM-DD) ending today."""
+        return [(today - timedelta(days=offset)).isoformat() for offset in range(7)]
+
+
+__all__ = ["RankIndex", "utc_today", "period_start"]
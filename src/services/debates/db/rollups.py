@@ -0,0 +1,206 @@
+"""
+OthmanBot - Vote Rollups Database Mixin
+=======================================
+
+Per-day/per-author and per-hour vote aggregates kept in step with
+the votes table, so time-bucketed stats never scan raw votes.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+
+from src.core.logger import logger
+
+
+# SQL expression for a vote row's hour bucket ('YYYY-MM-DD HH', UTC)
+VOTE_HOUR_SQL = "strftime('%Y-%m-%d %H', created_at)"
+
+
+def utc_hour() -> str:
+    """Current hour bucket in UTC, matching VOTE_HOUR_SQL."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H")
+
+
+class RollupsMixin:
+    """
+    Mixin for vote rollup maintenance.
+
+    DESIGN: vote_rollup_daily (day, author) and vote_rollup_hourly (hour)
+    hold COUNT(*) and SUM(vote_type) of the rows currently in votes, keyed
+    by each row's created_at. Every path that inserts, changes or deletes
+    vote rows adjusts them in the same transaction, so "today", history and
+    sparkline queries read a handful of rollup rows instead of applying
+    DATE() to the whole votes table.
+    """
+
+    @staticmethod
+    def _add_rollup_delta(
+        deltas: dict[tuple[str, int], list[int]],
+        vote_hour: str,
+        author_id: int,
+        count_change: int,
+        karma_change: int
+    ) -> None:
+        """Accumulate a rollup change for one (hour, author) bucket."""
+        delta = deltas.setdefault((vote_hour, author_id), [0, 0])
+        delta[0] += count_change
+        delta[1] += karma_change
+
+    def _write_vote_rollups(
+        self,
+        cursor: sqlite3.Cursor,
+        deltas: dict[tuple[str, int], list[int]]
+    ) -> None:
+        """Apply accumulated rollup deltas (caller owns the transaction)."""
+        if not deltas:
+            return
+
+        daily: dict[tuple[str, int], list[int]] = {}
+        hourly: dict[str, list[int]] = {}
+        for (vote_hour, author_id), (count, karma) in deltas.items():
+            if count == 0 and karma == 0:
+                continue
+            day = daily.setdefault((vote_hour[:10], author_id), [0, 0])
+            day[0] += count
+            day[1] += karma
+            hour = hourly.setdefault(vote_hour, [0, 0])
+            hour[0] += count
+            hour[1] += karma
+
+        cursor.executemany(
+            """INSERT INTO vote_rollup_daily (day, author_id, votes, karma) VALUES (?, ?, ?, ?)
+               ON CONFLICT(day, author_id) DO UPDATE SET
+               votes = votes + excluded.votes, karma = karma + excluded.karma""",
+            [(day, author_id, count, karma) for (day, author_id), (count, karma) in daily.items()]
+        )
+        cursor.executemany(
+            """INSERT INTO vote_rollup_hourly (hour, votes, karma) VALUES (?, ?, ?)
+               ON CONFLICT(hour) DO UPDATE SET
+               votes = votes + excluded.votes, karma = karma + excluded.karma""",
+            [(hour, count, karma) for hour, (count, karma) in hourly.items()]
+        )
+
+    def _subtract_vote_rollups(self, cursor: sqlite3.Cursor, where: str, params: tuple) -> None:
+        """
+        Remove the rollup contribution of vote rows about to be deleted.
+
+        Args:
+            cursor: Cursor inside the caller's transaction
+            where: SQL condition selecting the rows (e.g. "voter_id = ?")
+            params: Parameters for the condition
+        """
+        cursor.execute(
+            f"""SELECT {VOTE_HOUR_SQL}, author_id, COUNT(*), SUM(vote_type) FROM votes
+                WHERE ({where}) AND created_at IS NOT NULL
+                GROUP BY {VOTE_HOUR_SQL}, author_id""",
+            params
+        )
+        deltas: dict[tuple[str, int], list[int]] = {}
+        for vote_hour, author_id, count, karma in cursor.fetchall():
+            self._add_rollup_delta(deltas, vote_hour, author_id, -count, -(karma or 0))
+        self._write_vote_rollups(cursor, deltas)
+
+    @staticmethod
+    def _backfill_vote_rollups(cursor: sqlite3.Cursor) -> None:
+        """Recompute both rollup tables from votes (caller owns the transaction)."""
+        cursor.execute("DELETE FROM vote_rollup_daily")
+        cursor.execute("DELETE FROM vote_rollup_hourly")
+        cursor.execute(
+            """INSERT INTO vote_rollup_daily (day, author_id, votes, karma)
+               SELECT DATE(created_at), author_id, COUNT(*), SUM(vote_type) FROM votes
+               WHERE created_at IS NOT NULL
+               GROUP BY DATE(created_at), author_id"""
+        )
+        cursor.execute(
+            f"""INSERT INTO vote_rollup_hourly (hour, votes, karma)
+                SELECT {VOTE_HOUR_SQL}, COUNT(*), SUM(vote_type) FROM votes
+                WHERE created_at IS NOT NULL
+                GROUP BY {VOTE_HOUR_SQL}"""
+        )
+
+    def rebuild_vote_rollups(self) -> dict:
+        """
+        Rebuild the rollup tables from the votes table.
+
+        Use after anything that edits votes outside the database
+        methods (e.g. maintenance scripts).
+
+        Returns:
+            Dict with day_rows and hour_rows written
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                self._backfill_vote_rollups(cursor)
+                cursor.execute("SELECT COUNT(*) FROM vote_rollup_daily")
+                day_rows = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM vote_rollup_hourly")
+                hour_rows = cursor.fetchone()[0]
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            self._rankings.invalidate()
+
+        logger.tree("Vote Rollups Rebuilt", [
+            ("Day/Author Rows", str(day_rows)),
+            ("Hour Rows", str(hour_rows)),
+        ], emoji="📊")
+        return {"day_rows": day_rows, "hour_rows": hour_rows}
+
+    async def rebuild_vote_rollups_async(self) -> dict:
+        """Async wrapper for rebuild_vote_rollups."""
+        return await asyncio.to_thread(self.rebuild_vote_rollups)
+
+    def get_daily_vote_counts(self, days: int = 7) -> dict[str, int]:
+        """
+        Get vote counts per UTC day for the last N days (plus today).
+
+        Returns:
+            Dict of 'YYYY-MM-DD' -> vote count (days without votes omitted)
+        """
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT substr(hour, 1, 10), SUM(votes) FROM vote_rollup_hourly
+                   WHERE hour >= strftime('%Y-%m-%d %H', DATE('now', ?))
+                   GROUP BY substr(hour, 1, 10)""",
+                (f"-{days} days",)
+            )
+            return {row[0]: row[1] for row in cursor.fetchall() if row[1]}
+
+    def get_hourly_vote_counts(self, hours: int = 24, day: Optional[str] = None) -> list[tuple[str, int]]:
+        """
+        Get vote counts per UTC hour.
+
+        Args:
+            hours: Number of most recent hours (ignored if day is given)
+            day: Restrict to one 'YYYY-MM-DD' day
+
+        Returns:
+            List of ('YYYY-MM-DD HH', count) in chronological order
+        """
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            if day:
+                cursor.execute(
+                    "SELECT hour, votes FROM vote_rollup_hourly WHERE hour >= ? AND hour < ? ORDER BY hour",
+                    (f"{day} 00", f"{day} 24")
+                )
+            else:
+                cursor.execute(
+                    """SELECT hour, votes FROM vote_rollup_hourly
+                       WHERE hour >= strftime('%Y-%m-%d %H', 'now', ?) ORDER BY hour""",
+                    (f"-{hours - 1} hours",)
+                )
+            return [(row[0], row[1]) for row in cursor.fetchall() if row[1]]
+
+
+__all__ = ["RollupsMixin", "VOTE_HOUR_SQL", "utc_hour"]
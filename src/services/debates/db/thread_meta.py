@@ -0,0 +1,169 @@
+"""
+OthmanBot - Thread Metadata Cache
+=================================
+
+In-memory view of per-thread bot state kept in step with its writes.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import threading
+from typing import Iterable, Optional
+
+
+class ThreadMetaCache:
+    """
+    Analytics message and creator per debate thread, plus the Open
+    Discussion thread ID.
+
+    DESIGN: Every debate message looked up the thread's analytics message
+    through a worker thread, and the Open Discussion handler read its
+    thread ID with a blocking query on the event loop. All of this state
+    is small and only changes through a handful of setters, so it is read
+    once from debate_threads, debate_creators and open_discussion and
+    then served from dicts.
+
+    The setters update the cache after committing, under the same writer
+    lock the load runs under, so the cache is a complete view: a thread
+    missing from it has no row in the database either. Updates that
+    arrive before the first load are dropped; the load picks them up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        self._analytics: dict[int, Optional[int]] = {}
+        self._creators: dict[int, int] = {}
+        self._open_discussion_id: Optional[int] = None
+
+        # Metrics
+        self.loads = 0
+        self.lookups = 0
+        self.hits = 0
+        self.updates = 0
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the cache holds a complete view."""
+        return self._loaded
+
+    def load(
+        self,
+        analytics_rows: Iterable[tuple[int, Optional[int]]],
+        creator_rows: Iterable[tuple[int, int]],
+        open_discussion_id: Optional[int],
+    ) -> None:
+        """
+        Install the thread state read from the database.
+
+        Args:
+            analytics_rows: (thread_id, analytics_message_id) of every tracked thread
+            creator_rows: (thread_id, user_id) of every recorded creator
+            open_discussion_id: Stored Open Discussion thread ID, if any
+        """
+        analytics = dict(analytics_rows)
+        creators = dict(creator_rows)
+
+        with self._lock:
+            self._analytics = analytics
+            self._creators = creators
+            self._open_discussion_id = open_discussion_id
+            self._loaded = True
+            self.loads += 1
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def set_analytics(self, thread_id: int, message_id: Optional[int]) -> None:
+        """Record a committed analytics message change (None clears it)."""
+        with self._lock:
+            if not self._loaded:
+                return
+            if message_id is not None or thread_id in self._analytics:
+                self._analytics[thread_id] = message_id
+            self.updates += 1
+
+    def set_creator(self, thread_id: int, user_id: int) -> None:
+        """Record a thread creator; the first one recorded wins, like the table."""
+        with self._lock:
+            if not self._loaded:
+                return
+            self._creators.setdefault(thread_id, user_id)
+            self.updates += 1
+
+    def remove_creator(self, user_id: int) -> None:
+        """Forget every thread creator entry of a deleted user."""
+        with self._lock:
+            for thread_id in [t for t, u in self._creators.items() if u == user_id]:
+                del self._creators[thread_id]
+            self.updates += 1
+
+    def set_open_discussion(self, thread_id: int) -> None:
+        """Record a committed Open Discussion thread ID."""
+        with self._lock:
+            if not self._loaded:
+                return
+            self._open_discussion_id = thread_id
+            self.updates += 1
+
+    def remove_thread(self, thread_id: int) -> None:
+        """Drop the analytics and creator entries of a deleted thread."""
+        with self._lock:
+            self._analytics.pop(thread_id, None)
+            self._creators.pop(thread_id, None)
+            self.updates += 1
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def _count(self, hit: bool) -> None:
+        """Update lookup counters."""
+        self.lookups += 1
+        if hit:
+            self.hits += 1
+
+    def analytics_message(self, thread_id: int) -> Optional[int]:
+        """Analytics message ID of a thread, or None if it has none."""
+        message_id = self._analytics.get(thread_id)
+        self._count(message_id is not None)
+        return message_id
+
+    def threads_by_creator(self, user_id: int) -> list[int]:
+        """Every thread recorded as created by the user."""
+        with self._lock:
+            threads = [t for t, u in self._creators.items() if u == user_id]
+        self._count(bool(threads))
+        return threads
+
+    @property
+    def open_discussion_id(self) -> Optional[int]:
+        """Stored Open Discussion thread ID, if any."""
+        self._count(self._open_discussion_id is not None)
+        return self._open_discussion_id
+
+    def get_stats(self) -> dict:
+        """Cache size and lookup/update counters."""
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "threads": len(self._analytics),
+                "analytics_messages": sum(1 for m in self._analytics.values() if m is not None),
+                "creators": len(self._creators),
+                "open_discussion": self._open_discussion_id,
+                "loads": self.loads,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+                "updates": self.updates,
+            }
+
+
+__all__ = ["ThreadMetaCache"]
@@ -11,10 +11,60 @@ Server: discord.gg/syria
 import asyncio
 from typing import Optional
 
+from src.core.logger import logger
+from src.services.debates.db.thread_meta import ThreadMetaCache
+
 
 class ThreadsMixin:
     """Mixin for thread management operations."""
 
+    # =========================================================================
+    # Thread Metadata Cache
+    # =========================================================================
+
+    def _ensure_thread_meta(self) -> ThreadMetaCache:
+        """
+        Return the thread metadata cache, loading it if needed.
+
+        Loads under the writer lock from the writer connection so no setter
+        can slip between the queries and the cache going live.
+        """
+        meta = self._thread_meta
+        if meta.is_loaded:
+            return meta
+
+        with self._lock:
+            if meta.is_loaded:
+                return meta
+            cursor = self._get_connection().cursor()
+            cursor.execute("SELECT thread_id, analytics_message_id FROM debate_threads")
+            analytics_rows = cursor.fetchall()
+            cursor.execute("SELECT thread_id, user_id FROM debate_creators")
+            creator_rows = cursor.fetchall()
+            cursor.execute("SELECT thread_id FROM open_discussion WHERE id = 1")
+            row = cursor.fetchone()
+            meta.load(analytics_rows, creator_rows, row[0] if row else None)
+
+        logger.debug("Thread Metadata Loaded", [
+            ("Threads", str(len(analytics_rows))),
+            ("Creators", str(len(creator_rows))),
+        ])
+        return meta
+
+    async def ensure_thread_meta_async(self) -> ThreadMetaCache:
+        """Async wrapper for _ensure_thread_meta."""
+        if self._thread_meta.is_loaded:
+            return self._thread_meta
+        return await asyncio.to_thread(self._ensure_thread_meta)
+
+    def get_thread_meta_stats(self) -> dict:
+        """Get thread metadata cache size and hit counters."""
+        return self._thread_meta.get_stats()
+
+    # =========================================================================
+    # Thread Data
+    # =========================================================================
+
     def set_analytics_message(self, thread_id: int, message_id: int) -> None:
         """Store the analytics message ID for a thread."""
         with self._lock:
@@ -27,6 +77,7 @@ class ThreadsMixin:
                 (thread_id, message_id, message_id)
             )
             conn.commit()
+            self._thread_meta.set_analytics(thread_id, message_id)
 
     async def set_analytics_message_async(self, thread_id: int, message_id: int) -> None:
         """Async wrapper for set_analytics_message."""
@@ -34,19 +85,12 @@ class ThreadsMixin:
 
     def get_analytics_message(self, thread_id: int) -> Optional[int]:
         """Get the analytics message ID for a thread."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT analytics_message_id FROM debate_threads WHERE thread_id = ?",
-                (thread_id,)
-            )
-            row = cursor.fetchone()
-            return row[0] if row else None
+        return self._ensure_thread_meta().analytics_message(thread_id)
 
     async def get_analytics_message_async(self, thread_id: int) -> Optional[int]:
-        """Async wrapper for get_analytics_message."""
-        return await asyncio.to_thread(self.get_analytics_message, thread_id)
+        """Get the analytics message ID without leaving the event loop once loaded."""
+        meta = await self.ensure_thread_meta_async()
+        return meta.analytics_message(thread_id)
 
     def clear_analytics_message(self, thread_id: int) -> None:
         """Clear the analytics message ID for a thread."""
@@ -58,6 +102,7 @@ class ThreadsMixin:
                 (thread_id,)
             )
             conn.commit()
+            self._thread_meta.set_analytics(thread_id, None)
 
     async def clear_analytics_message_async(self, thread_id: int) -> None:
         """Async wrapper for clear_analytics_message."""
@@ -65,8 +110,7 @@ class ThreadsMixin:
 
     def get_all_debate_thread_ids(self) -> list[int]:
         """Get all tracked debate thread IDs."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT thread_id FROM debate_threads")
             return [row[0] for row in cursor.fetchall()]
@@ -84,8 +128,19 @@ class ThreadsMixin:
             cursor.execute("DELETE FROM debate_creators WHERE thread_id = ?", (thread_id,))
             result["creator_deleted"] = cursor.rowcount
             cursor.execute("DELETE FROM debate_bans WHERE thread_id = ?", (thread_id,))
+            cursor.execute("DELETE FROM reconcile_checkpoints WHERE thread_id = ?", (thread_id,))
+            cursor.execute("DELETE FROM participation_gate WHERE thread_id = ?", (thread_id,))
+            cursor.execute(
+                "DELETE FROM mirror_reactions WHERE message_id IN (SELECT message_id FROM mirror_messages WHERE thread_id = ?)",
+                (thread_id,)
+            )
+            cursor.execute("DELETE FROM mirror_messages WHERE thread_id = ?", (thread_id,))
+            cursor.execute("DELETE FROM mirror_threads WHERE thread_id = ?", (thread_id,))
 
             conn.commit()
+            self._bans.remove_thread(thread_id)
+            self._thread_meta.remove_thread(thread_id)
+            self._participation.discard(thread_id=thread_id)
             return result
 
     def get_next_debate_number(self) -> int:
@@ -132,8 +187,7 @@ class ThreadsMixin:
 
     def get_debate_counter(self) -> int:
         """Get the current debate counter value."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT counter FROM debate_counter WHERE id = 1")
             row = cursor.fetchone()
@@ -141,8 +195,7 @@ class ThreadsMixin:
 
     def get_most_active_debates(self, limit: int = 3) -> list[dict]:
         """Get debates with most participation."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT thread_id, COUNT(*) as participant_count, SUM(message_count) as total_messages
@@ -153,8 +206,7 @@ class ThreadsMixin:
 
     def get_top_debate_starters(self, limit: int = 3) -> list[dict]:
         """Get users who have started the most debates."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT user_id, COUNT(*) as debate_count FROM debate_creators GROUP BY user_id ORDER BY debate_count DESC LIMIT ?",
@@ -164,14 +216,7 @@ class ThreadsMixin:
 
     def get_threads_by_creator(self, user_id: int) -> list[int]:
         """Get all thread IDs created by a user."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT thread_id FROM debate_creators WHERE user_id = ?",
-                (user_id,)
-            )
-            return [row[0] for row in cursor.fetchall()]
+        return self._ensure_thread_meta().threads_by_creator(user_id)
 
     def add_to_closure_history(
         self,
@@ -203,16 +248,14 @@ class ThreadsMixin:
 
     def get_user_closure_count(self, user_id: int) -> int:
         """Get number of times a user's debates have been closed."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM closure_history WHERE user_id = ?", (user_id,))
             return cursor.fetchone()[0]
 
     def get_user_closure_history(self, user_id: int, limit: int = 10) -> list[dict]:
         """Get closure history for debates involving a user."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT thread_id, thread_name, closed_by, reason, created_at, reopened_at, reopened_by
@@ -226,8 +269,7 @@ class ThreadsMixin:
 
     def get_closure_by_thread_id(self, thread_id: int) -> Optional[dict]:
         """Get closure info for a specific thread."""
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT thread_name, closed_by, reason, created_at, reopened_at, reopened_by FROM closure_history WHERE thread_id = ? ORDER BY created_at DESC LIMIT 1",
@@ -255,13 +297,8 @@ class ThreadsMixin:
     # =========================================================================
 
     def get_open_discussion_thread_id(self) -> Optional[int]:
-        """Get the Open Discussion thread ID from the database."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT thread_id FROM open_discussion WHERE id = 1")
-            row = cursor.fetchone()
-            return row[0] if row else None
+        """Get the Open Discussion thread ID (served from the metadata cache)."""
+        return self._ensure_thread_meta().open_discussion_id
 
     def set_open_discussion_thread_id(self, thread_id: int) -> None:
         """Set the Open Discussion thread ID in the database."""
@@ -275,6 +312,109 @@ class ThreadsMixin:
                 (thread_id, thread_id)
             )
             conn.commit()
+            self._thread_meta.set_open_discussion(thread_id)
+
+    # =========================================================================
+    # Reconciliation Checkpoints
+    # =========================================================================
+
+    def get_reconcile_checkpoints(self, max_age_hours: int) -> dict[int, dict]:
+        """
+        Get reconciliation watermarks newer than max_age_hours.
+
+        Returns:
+            Dict of thread_id -> {"last_message_id", "message_count"}
+        """
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT thread_id, last_message_id, message_count FROM reconcile_checkpoints
+                   WHERE reconciled_at >= datetime('now', ?)""",
+                (f"-{max_age_hours} hours",)
+            )
+            return {
+                row[0]: {"last_message_id": row[1], "message_count": row[2]}
+                for row in cursor.fetchall()
+            }
+
+    async def get_reconcile_checkpoints_async(self, max_age_hours: int) -> dict[int, dict]:
+        """Async wrapper for get_reconcile_checkpoints."""
+        return await asyncio.to_thread(self.get_reconcile_checkpoints, max_age_hours)
+
+    def save_reconcile_checkpoints(self, checkpoints: list[tuple[int, int, Optional[int]]]) -> None:
+        """
+        Store reconciliation watermarks.
+
+        Args:
+            checkpoints: (thread_id, last_message_id, message_count) tuples
+        """
+        if not checkpoints:
+            return
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.executemany(
+                """INSERT INTO reconcile_checkpoints (thread_id, last_message_id, message_count, reconciled_at)
+                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(thread_id) DO UPDATE SET
+                   last_message_id = excluded.last_message_id,
+                   message_count = excluded.message_count,
+                   reconciled_at = excluded.reconciled_at""",
+                checkpoints
+            )
+            conn.commit()
+
+    async def save_reconcile_checkpoints_async(self, checkpoints: list[tuple[int, int, Optional[int]]]) -> None:
+        """Async wrapper for save_reconcile_checkpoints."""
+        await asyncio.to_thread(self.save_reconcile_checkpoints, checkpoints)
+
+    # =========================================================================
+    # Participation Gate
+    # =========================================================================
+
+    def get_participants(self, message_id: int) -> set[int]:
+        """Get users recorded as reacting to an analytics message."""
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT user_id FROM participation_gate WHERE message_id = ?",
+                (message_id,)
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def set_participant(self, thread_id: int, message_id: int, user_id: int, joined: bool) -> None:
+        """Record a participation reaction being added (joined) or removed."""
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            if joined:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO participation_gate (thread_id, message_id, user_id) VALUES (?, ?, ?)",
+                    (thread_id, message_id, user_id)
+                )
+            else:
+                cursor.execute(
+                    "DELETE FROM participation_gate WHERE message_id = ? AND user_id = ?",
+                    (message_id, user_id)
+                )
+            conn.commit()
+
+    def replace_participants(self, thread_id: int, message_id: int, user_ids: set[int]) -> None:
+        """
+        Replace a thread's participant set with a fresh read from Discord.
+
+        Rows for older analytics messages of the thread are dropped too.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DELETE FROM participation_gate WHERE thread_id = ?", (thread_id,))
+            cursor.executemany(
+                "INSERT OR IGNORE INTO participation_gate (thread_id, message_id, user_id) VALUES (?, ?, ?)",
+                [(thread_id, message_id, user_id) for user_id in user_ids]
+            )
+            conn.commit()
 
     # =========================================================================
     # Closed Debate Auto-Deletion
@@ -287,8 +427,7 @@ class ThreadsMixin:
         - scheduled_deletion_at <= now
         - reopened_at IS NULL (not reopened via appeal)
         """
-        with self._lock:
-            conn = self._get_connection()
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """SELECT id, thread_id, thread_name, closed_by, reason, user_id,
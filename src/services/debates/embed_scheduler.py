@@ -0,0 +1,376 @@
+"""
+OthmanBot - Analytics Embed Scheduler
+=====================================
+
+Coalescing background scheduler for analytics embed edits. Threads are
+marked dirty on activity and each dirty thread is flushed once per
+window, paced by a global edit budget.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import (
+    ANALYTICS_UPDATE_COOLDOWN,
+    ANALYTICS_EMBED_EDITS_PER_MINUTE,
+    ANALYTICS_EMBED_BURST,
+    ANALYTICS_EMBED_MAX_LAG,
+    ANALYTICS_EMBED_MAX_BACKOFF,
+    ANALYTICS_EMBED_SHUTDOWN_BUDGET,
+    DISCORD_API_DELAY,
+    DISCORD_ERROR_THREAD_ARCHIVED,
+)
+
+
+# =============================================================================
+# Dirty Thread
+# =============================================================================
+
+@dataclass
+class _DirtyThread:
+    """A thread whose analytics embed is behind its activity."""
+    thread: discord.Thread
+    dirty_since: float
+    last_activity: float
+    marks: int = 1
+    attempts: int = 0
+    retry_at: float = 0.0
+
+
+# =============================================================================
+# Analytics Embed Scheduler
+# =============================================================================
+
+class AnalyticsEmbedScheduler:
+    """
+    Marks threads dirty on activity and flushes their embeds in the background.
+
+    DESIGN: The old path edited the embed inline and let AnalyticsThrottleCache
+    drop any update inside the cooldown, so the last burst of activity in a
+    thread could stay off the embed until someone posted again. Here every
+    update marks the thread dirty instead; marks on an already dirty thread
+    coalesce. A single worker flushes a dirty thread once its window since
+    the last flush has passed, so each thread gets at most one edit per
+    window and the final state is never skipped.
+
+    Total edit traffic is bounded by a token bucket (edits per minute plus
+    a small burst) shared by all threads. When more threads are ready than
+    the budget allows, the most recently active go first; a thread that
+    has been dirty longer than max_lag jumps ahead so quiet threads are
+    not starved by busy ones.
+
+    The thread is taken off the dirty map before its flush runs, so
+    activity during the edit marks it dirty again and gets its own flush
+    in the next window. A failed flush puts the thread back with an
+    exponential backoff capped at max_backoff; it stays dirty until a
+    flush succeeds or the thread is forgotten. Failures a retry can't fix
+    (the thread or message is gone, access is missing, the thread is
+    archived) drop the thread instead of requeueing it forever.
+
+    stop() flushes what it can within a time budget, so a large backlog
+    cannot hold up the rest of shutdown. Threads still dirty then are
+    picked up by the startup refresh of every active embed.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[discord.Thread], Awaitable[bool]],
+        window: float = ANALYTICS_UPDATE_COOLDOWN,
+        edits_per_minute: int = ANALYTICS_EMBED_EDITS_PER_MINUTE,
+        burst: int = ANALYTICS_EMBED_BURST,
+        max_lag: float = ANALYTICS_EMBED_MAX_LAG,
+        max_backoff: float = ANALYTICS_EMBED_MAX_BACKOFF,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            flush: Coroutine that edits one thread's embed; returns False on a
+                retryable failure and raises NotFound/Forbidden on a permanent one
+            window: Minimum seconds between flushes of the same thread
+            edits_per_minute: Global edit budget across all threads
+            burst: Edits allowed back-to-back before the budget paces them
+            max_lag: Seconds dirty before a thread is flushed ahead of busier ones
+            max_backoff: Longest retry delay after repeated failed flushes
+        """
+        self._flush = flush
+        self._window = window
+        self._rate = max(1, edits_per_minute) / 60.0
+        self._burst = max(1, burst)
+        self._max_lag = max_lag
+        self._max_backoff = max(window, max_backoff)
+
+        self._dirty: dict[int, _DirtyThread] = {}
+        self._last_flush: dict[int, float] = {}
+        self._tokens = float(self._burst)
+        self._token_time = time.monotonic()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.marks = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.failed = 0
+        self.dropped = 0
+        self.left_dirty = 0
+        self.last_lag = 0.0
+        self.max_lag_seen = 0.0
+        self.total_lag = 0.0
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def mark_dirty(self, thread: discord.Thread) -> None:
+        """Record activity on a thread; its embed is refreshed in the background."""
+        if self._closed:
+            return
+        now = time.monotonic()
+        self.marks += 1
+        entry = self._dirty.get(thread.id)
+        if entry is not None:
+            entry.thread = thread
+            entry.last_activity = now
+            entry.marks += 1
+            self.coalesced += 1
+        else:
+            self._dirty[thread.id] = _DirtyThread(thread=thread, dirty_since=now, last_activity=now)
+        self._ensure_started()
+        self._wakeup.set()
+
+    def forget(self, thread_id: int) -> None:
+        """Drop a deleted thread's pending flush."""
+        self._dirty.pop(thread_id, None)
+        self._last_flush.pop(thread_id, None)
+
+    def get_stats(self) -> dict:
+        """Queue depth, lag and flush counters."""
+        now = time.monotonic()
+        oldest = min((entry.dirty_since for entry in self._dirty.values()), default=now)
+        return {
+            "queue_depth": len(self._dirty),
+            "oldest_lag_seconds": round(now - oldest, 1),
+            "marks": self.marks,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "retrying": sum(1 for entry in self._dirty.values() if entry.attempts),
+            "left_dirty_at_shutdown": self.left_dirty,
+            "last_lag_seconds": round(self.last_lag, 1),
+            "max_lag_seconds": round(self.max_lag_seen, 1),
+            "avg_lag_seconds": round(self.total_lag / self.flushes, 1) if self.flushes else 0.0,
+            "edits_per_minute": round(self._rate * 60),
+        }
+
+    async def stop(self, budget: float = ANALYTICS_EMBED_SHUTDOWN_BUDGET) -> None:
+        """
+        Stop the worker and flush dirty threads for up to budget seconds.
+
+        Oldest dirty threads go first. Whatever is still dirty when the
+        budget runs out is left for the startup refresh.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+
+        try:
+            async with asyncio.timeout(budget):
+                if self._task and not self._task.done():
+                    # The worker exits at its next check, after any in-flight edit
+                    await asyncio.wait({self._task})
+
+                remaining = sorted(self._dirty.values(), key=lambda entry: entry.dirty_since)
+                for index, entry in enumerate(remaining):
+                    if index:
+                        await asyncio.sleep(DISCORD_API_DELAY)
+                    await self._run(entry)
+        except TimeoutError:
+            if self._task and not self._task.done():
+                self._task.cancel()
+
+        self.left_dirty = len(self._dirty)
+        logger.tree("Analytics Embed Scheduler Flushed", [
+            ("Flushes", str(self.flushes)),
+            ("Marks", str(self.marks)),
+            ("Coalesced", str(self.coalesced)),
+            ("Avg Lag", f"{self.get_stats()['avg_lag_seconds']}s"),
+            ("Left Dirty", str(self.left_dirty)),
+        ], emoji="📊")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _ensure_started(self) -> None:
+        """Start the worker on first use (needs a running loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+            self._task.add_done_callback(self._handle_task_exception)
+
+    def _handle_task_exception(self, task: asyncio.Task) -> None:
+        """Handle exceptions from the worker task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.tree("Analytics Embed Scheduler Task Exception", [
+                ("Error Type", type(exc).__name__),
+                ("Error", str(exc)[:100]),
+            ], emoji="❌")
+
+    async def _sleep(self, seconds: Optional[float]) -> None:
+        """Wait for the given time, or until a mark or stop() wakes the worker."""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _refill(self, now: float) -> None:
+        """Top up the edit budget for the time elapsed."""
+        self._tokens = min(self._burst, self._tokens + (now - self._token_time) * self._rate)
+        self._token_time = now
+
+    def _next_ready(self, now: float) -> tuple[Optional[_DirtyThread], Optional[float]]:
+        """
+        Pick the dirty thread to flush next.
+
+        Returns:
+            (entry, None) if one is ready, else (None, seconds until the
+            earliest becomes ready)
+        """
+        best: Optional[_DirtyThread] = None
+        best_key: Optional[tuple] = None
+        wait: Optional[float] = None
+        for thread_id, entry in self._dirty.items():
+            ready_at = max(self._last_flush.get(thread_id, float("-inf")) + self._window, entry.retry_at)
+            if ready_at > now:
+                delay = ready_at - now
+                wait = delay if wait is None else min(wait, delay)
+                continue
+            # Overdue threads first (oldest first), then most recently active
+            if now - entry.dirty_since >= self._max_lag:
+                key = (0, entry.dirty_since)
+            else:
+                key = (1, -entry.last_activity)
+            if best_key is None or key < best_key:
+                best, best_key = entry, key
+        return (best, None) if best is not None else (None, wait)
+
+    async def _worker(self) -> None:
+        """Flush ready threads as the edit budget allows."""
+        while not self._closed:
+            if not self._dirty:
+                await self._sleep(None)
+                continue
+
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self._rate)
+                continue
+
+            entry, wait = self._next_ready(now)
+            if entry is None:
+                await self._sleep(wait)
+                continue
+
+            self._tokens -= 1
+            await self._run(entry)
+
+    async def _run(self, entry: _DirtyThread) -> None:
+        """Flush one thread and record the outcome."""
+        thread_id = entry.thread.id
+        self._dirty.pop(thread_id, None)
+        started = time.monotonic()
+        self._last_flush[thread_id] = started
+
+        try:
+            ok = await self._flush(entry.thread)
+        except asyncio.CancelledError:
+            # Cut off by shutdown: still dirty
+            self._dirty.setdefault(thread_id, entry)
+            raise
+        except discord.HTTPException as e:
+            if isinstance(e, (discord.NotFound, discord.Forbidden)) or e.code == DISCORD_ERROR_THREAD_ARCHIVED:
+                self._drop(entry, e)
+                return
+            ok = False
+            logger.warning("📊 Analytics Embed Flush Failed", [
+                ("Thread ID", str(thread_id)),
+                ("Error Type", type(e).__name__),
+                ("Error", str(e)[:100]),
+            ])
+        except Exception as e:
+            ok = False
+            logger.warning("📊 Analytics Embed Flush Failed", [
+                ("Thread ID", str(thread_id)),
+                ("Error Type", type(e).__name__),
+                ("Error", str(e)[:100]),
+            ])
+
+        if ok:
+            lag = started - entry.dirty_since
+            self.flushes += 1
+            self.last_lag = lag
+            self.max_lag_seen = max(self.max_lag_seen, lag)
+            self.total_lag += lag
+        else:
+            self.failed += 1
+            self._requeue(entry, started)
+
+        # Only threads flushed within the last window still gate anything
+        cutoff = started - self._window
+        for stale in [tid for tid, at in self._last_flush.items() if at < cutoff]:
+            del self._last_flush[stale]
+
+    def _drop(self, entry: _DirtyThread, error: discord.HTTPException) -> None:
+        """Stop flushing a thread whose embed can no longer be edited."""
+        self.failed += 1
+        self.dropped += 1
+        self._dirty.pop(entry.thread.id, None)
+        logger.warning("📊 Analytics Embed Dropped", [
+            ("Thread ID", str(entry.thread.id)),
+            ("Error Type", type(error).__name__),
+            ("Error Code", str(error.code)),
+            ("Attempts", str(entry.attempts + 1)),
+        ])
+
+    def _requeue(self, entry: _DirtyThread, now: float) -> None:
+        """Put a failed thread back, merged with any activity since, after a backoff."""
+        entry.attempts += 1
+        current = self._dirty.get(entry.thread.id)
+        if current is not None:
+            # Marked again during the flush: keep its backoff and original lag
+            current.dirty_since = min(current.dirty_since, entry.dirty_since)
+            current.attempts = entry.attempts
+            entry = current
+        delay = min(self._window * 2 ** (entry.attempts - 1), self._max_backoff)
+        entry.retry_at = now + delay
+        self._dirty[entry.thread.id] = entry
+
+        if entry.attempts == 1 or delay >= self._max_backoff:
+            logger.warning("📊 Analytics Embed Update Retrying", [
+                ("Thread ID", str(entry.thread.id)),
+                ("Attempts", str(entry.attempts)),
+                ("Retry In", f"{delay:.0f}s"),
+            ])
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["AnalyticsEmbedScheduler"]
@@ -0,0 +1,344 @@
+"""
+OthmanBot - Forum Scanner
+=========================
+
+Shared engine for maintenance jobs that walk every debate thread:
+enumerates the forum once and runs per-thread work with bounded,
+rate-limit-aware concurrency.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import (
+    DISCORD_API_DELAY,
+    DISCORD_ARCHIVED_THREADS_LIMIT,
+    FORUM_SCAN_CONCURRENCY,
+    FORUM_SCAN_MAX_RETRIES,
+    FORUM_SCAN_RATE_LIMIT_DELAY,
+    LOG_TITLE_PREVIEW_LENGTH,
+)
+
+
+# =============================================================================
+# Thread Enumeration
+# =============================================================================
+
+async def collect_forum_threads(
+    forum: discord.ForumChannel,
+    include_archived: bool = True,
+    skip_prefixes: tuple[str, ...] = ("[DEPRECATED]",),
+    skip_ids: Iterable[Optional[int]] = (),
+    archived_limit: int = DISCORD_ARCHIVED_THREADS_LIMIT,
+) -> list[discord.Thread]:
+    """
+    List a forum's active (and optionally archived) threads once.
+
+    Args:
+        forum: Forum channel to enumerate
+        include_archived: Also page through archived threads
+        skip_prefixes: Thread name prefixes to leave out
+        skip_ids: Thread IDs to leave out (e.g. Open Discussion)
+        archived_limit: Maximum archived threads to fetch
+
+    Returns:
+        Threads in forum order, active first, without duplicates
+    """
+    excluded = {thread_id for thread_id in skip_ids if thread_id}
+    seen: set[int] = set()
+    threads: list[discord.Thread] = []
+
+    def _keep(thread: Optional[discord.Thread]) -> bool:
+        if thread is None or thread.id in seen or thread.id in excluded:
+            return False
+        if skip_prefixes and thread.name.startswith(skip_prefixes):
+            return False
+        seen.add(thread.id)
+        return True
+
+    threads.extend(thread for thread in forum.threads if _keep(thread))
+    if include_archived:
+        async for thread in forum.archived_threads(limit=archived_limit):
+            if _keep(thread):
+                threads.append(thread)
+    return threads
+
+
+# =============================================================================
+# Forum Scanner
+# =============================================================================
+
+class ForumScanner:
+    """
+    Runs an async worker over many threads with bounded concurrency.
+
+    DESIGN: Hot tags, stale archival, karma reconciliation and numbering
+    used to walk the forum one thread at a time with a fixed sleep between
+    threads, so the nightly window grew linearly with the thread count.
+    The scanner keeps up to `concurrency` threads in flight; each slot
+    still waits DISCORD_API_DELAY after its thread, so every slot paces
+    like the old serial loop and total time shrinks by roughly the
+    concurrency factor.
+
+    A 429 that reaches the scanner (or is reported via backoff()) pauses
+    all slots until its retry_after has passed and halves the concurrency
+    limit; the limit grows back by one after each run of clean threads.
+    Rate-limited threads are retried up to FORUM_SCAN_MAX_RETRIES times.
+    Other exceptions are logged and counted, never propagated.
+
+    Because a retry runs the worker again from the top, workers should
+    return their per-thread counts instead of bumping shared counters
+    part-way through; merge_counts() sums the results once run() returns.
+
+    A scanner can be reused for several runs. The metrics describe the
+    latest run and are reset when the next one starts, while the adaptive
+    concurrency limit and any 429 pause carry over between runs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = FORUM_SCAN_CONCURRENCY,
+        delay: float = DISCORD_API_DELAY,
+        max_retries: int = FORUM_SCAN_MAX_RETRIES,
+    ) -> None:
+        """
+        Initialize the scanner.
+
+        Args:
+            name: Job name for logs
+            concurrency: Maximum threads in flight
+            delay: Pause each slot takes after finishing a thread
+            max_retries: Retries per thread after a 429
+        """
+        self.name = name
+        self.max_concurrency = max(1, concurrency)
+        self._delay = delay
+        self._max_retries = max_retries
+
+        self._limit = self.max_concurrency
+        self._active = 0
+        self._clean_streak = 0
+        self._resume_at = 0.0
+        self._slots: Optional[asyncio.Condition] = None
+
+        # Metrics
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.rate_limits = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.peak_concurrency = 0
+        self._started = 0.0
+        self._finished = 0.0
+        self._next_progress = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def run(
+        self,
+        threads: list[discord.Thread],
+        worker: Callable[[discord.Thread], Awaitable[Any]],
+    ) -> list[Any]:
+        """
+        Run the worker on every thread.
+
+        Args:
+            threads: Threads to process
+            worker: Coroutine function taking one thread
+
+        Returns:
+            Worker results in thread order (None where the worker failed)
+        """
+        self._slots = asyncio.Condition()
+        self._reset_metrics(len(threads))
+        results: list[Any] = [None] * len(threads)
+
+        async def _process(index: int, thread: discord.Thread) -> None:
+            for attempt in range(self._max_retries + 1):
+                await self._acquire()
+                try:
+                    results[index] = await worker(thread)
+                    self._clean_streak += 1
+                    break
+                except discord.HTTPException as e:
+                    if e.status == 429 and attempt < self._max_retries:
+                        self.backoff(getattr(e, "retry_after", None) or FORUM_SCAN_RATE_LIMIT_DELAY)
+                        self.retries += 1
+                        continue
+                    self._fail(thread, e)
+                    break
+                except Exception as e:
+                    self._fail(thread, e)
+                    break
+                finally:
+                    await asyncio.sleep(self._delay)
+                    await self._release()
+            self._advance()
+
+        await asyncio.gather(*(_process(i, thread) for i, thread in enumerate(threads)))
+        self._finished = time.perf_counter()
+
+        logger.tree(f"{self.name} Scan Complete", [
+            ("Threads", str(self.total)),
+            ("Failed", str(self.failed)),
+            ("Rate Limits", str(self.rate_limits)),
+            ("Duration", f"{self.duration:.1f}s"),
+            ("Throughput", f"{self.threads_per_second:.2f} threads/s"),
+            ("Concurrency", f"{self.peak_concurrency}/{self.max_concurrency}"),
+        ], emoji="📂")
+        return results
+
+    def backoff(self, retry_after: float) -> None:
+        """
+        Pause every slot for retry_after seconds and halve concurrency.
+
+        Workers that swallow their own 429s should call this with the
+        retry_after Discord returned.
+        """
+        now = time.monotonic()
+        resume_at = now + max(0.0, retry_after)
+        if resume_at > self._resume_at:
+            self.backoff_seconds += resume_at - max(self._resume_at, now)
+            self._resume_at = resume_at
+        self._limit = max(1, self._limit // 2)
+        self._clean_streak = 0
+        self.rate_limits += 1
+        logger.warning(f"{self.name} Scan Rate Limited", [
+            ("Retry After", f"{retry_after:.1f}s"),
+            ("Concurrency", f"{self._limit}/{self.max_concurrency}"),
+        ])
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to finish (or to now while running)."""
+        if not self._started:
+            return 0.0
+        return (self._finished or time.perf_counter()) - self._started
+
+    @property
+    def threads_per_second(self) -> float:
+        """Completed threads per second."""
+        duration = self.duration
+        return self.done / duration if duration > 0 else 0.0
+
+    def get_stats(self) -> dict:
+        """Progress and throughput metrics, merged into job stats."""
+        return {
+            "scan_threads": self.total,
+            "scan_failed": self.failed,
+            "scan_rate_limits": self.rate_limits,
+            "scan_retries": self.retries,
+            "scan_backoff_seconds": round(self.backoff_seconds, 1),
+            "scan_concurrency": self.peak_concurrency,
+            "scan_duration_seconds": round(self.duration, 1),
+            "scan_threads_per_second": round(self.threads_per_second, 2),
+        }
+
+    # -------------------------------------------------------------------------
+    # Slot Management
+    # -------------------------------------------------------------------------
+
+    async def _acquire(self) -> None:
+        """Wait for a free slot, then for any rate-limit pause to pass."""
+        async with self._slots:
+            while self._active >= self._limit:
+                await self._slots.wait()
+            self._active += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._active)
+
+        while (wait := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(wait)
+
+    async def _release(self) -> None:
+        """Free a slot, growing the limit back after a clean streak."""
+        async with self._slots:
+            self._active -= 1
+            if self._limit < self.max_concurrency and self._clean_streak >= self._limit * 2:
+                self._limit += 1
+                self._clean_streak = 0
+            self._slots.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Bookkeeping
+    # -------------------------------------------------------------------------
+
+    def _reset_metrics(self, total: int) -> None:
+        """Start a run's metrics from zero so each run reports only itself."""
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.rate_limits = 0
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.peak_concurrency = 0
+        self._next_progress = self._progress_step()
+        self._started = time.perf_counter()
+        self._finished = 0.0
+
+    def _fail(self, thread: discord.Thread, error: Exception) -> None:
+        """Count and log a thread the worker couldn't finish."""
+        self.failed += 1
+        logger.warning(f"{self.name} Scan Thread Failed", [
+            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ("Thread ID", str(thread.id)),
+            ("Error Type", type(error).__name__),
+            ("Error", str(error)[:100]),
+        ])
+
+    def _progress_step(self) -> int:
+        """Log progress every quarter of the run (at least every thread)."""
+        return max(1, self.total // 4)
+
+    def _advance(self) -> None:
+        """Mark one thread done and log progress at each quarter."""
+        self.done += 1
+        if self.done >= self._next_progress and self.done < self.total:
+            self._next_progress += self._progress_step()
+            logger.info(f"{self.name} Scan Progress", [
+                ("Done", f"{self.done}/{self.total}"),
+                ("Throughput", f"{self.threads_per_second:.2f} threads/s"),
+                ("Concurrency", f"{self._limit}/{self.max_concurrency}"),
+            ])
+
+
+# =============================================================================
+# Result Helpers
+# =============================================================================
+
+def merge_counts(stats: dict, results: Iterable[Optional[dict]]) -> None:
+    """Add the per-thread counts workers returned into a job's stats dict."""
+    for counts in results:
+        if counts:
+            for key, value in counts.items():
+                stats[key] = stats.get(key, 0) + value
+
+
+def scan_report_items(stats: dict) -> list[tuple[str, str]]:
+    """Log/report rows for the scanner metrics merged into a job's stats."""
+    if "scan_threads" not in stats:
+        return []
+    return [
+        ("Scan Duration", f"{stats['scan_duration_seconds']}s"),
+        ("Throughput", f"{stats['scan_threads_per_second']} threads/s"),
+        ("Concurrency", f"{stats['scan_concurrency']}x"),
+        ("Scan Failed", str(stats["scan_failed"])),
+        ("Rate Limits", f"{stats['scan_rate_limits']} ({stats['scan_backoff_seconds']}s backoff)"),
+    ]
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["ForumScanner", "collect_forum_threads", "merge_counts", "scan_report_items"]
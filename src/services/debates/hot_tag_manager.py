@@ -9,13 +9,13 @@ Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
-import asyncio
 import discord
 from datetime import datetime, timezone
 from typing import List, TYPE_CHECKING
 from src.core.logger import logger
-from src.core.config import DEBATES_FORUM_ID, DISCORD_ARCHIVED_THREADS_LIMIT, NY_TZ, LOG_TITLE_PREVIEW_LENGTH
+from src.core.config import DEBATES_FORUM_ID, NY_TZ, LOG_TITLE_PREVIEW_LENGTH
 from src.utils import edit_thread_with_retry
+from src.services.debates.forum_scanner import ForumScanner, collect_forum_threads, merge_counts
 from src.services.debates.tags import DEBATE_TAGS, should_have_hot_tag, HOT_MIN_MESSAGES, HOT_MAX_INACTIVITY_HOURS
 
 if TYPE_CHECKING:
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 # =============================================================================
 
 RATE_LIMIT_DELAY: float = 0.5
-"""Delay between thread evaluations to avoid rate limits (seconds)."""
+"""Delay each scanner slot takes between thread evaluations (seconds)."""
 
 
 # =============================================================================
@@ -40,7 +40,7 @@ class HotTagManager:
 
     DESIGN:
     - Called by MaintenanceScheduler at 00:00 EST
-    - Evaluates all threads against activity thresholds
+    - Evaluates all threads against activity thresholds (via ForumScanner)
     - Adds "Hot" tag to threads that meet criteria
     - Removes "Hot" tag from threads that no longer meet criteria
     """
@@ -102,80 +102,40 @@ class HotTagManager:
                 "archived_checked": 0,
             }
 
-            # Track threads for summary
-            added_threads: List[str] = []
-            removed_threads: List[str] = []
-            kept_threads: List[str] = []
-
-            # Process all active threads
-            logger.info("📋 Processing Active Threads", [
-                ("Status", "Starting active thread scan"),
-            ])
-            active_thread_count = len(debates_forum.threads)
-            logger.debug("Active Threads Found", [("Count", str(active_thread_count))])
-
-            for idx, thread in enumerate(debates_forum.threads, 1):
-                if thread is None:
-                    logger.warning("Null Thread Encountered", [("Index", str(idx))])
-                    continue
-
-                result, thread_name = await self._evaluate_thread_with_logging(thread, idx, active_thread_count)
-                stats["active_checked"] += 1
-
-                if result == "added":
-                    stats["added"] += 1
-                    added_threads.append(thread_name)
-                elif result == "removed":
-                    stats["removed"] += 1
-                    removed_threads.append(thread_name)
-                elif result == "kept":
-                    stats["kept"] += 1
-                    kept_threads.append(thread_name)
-                elif result == "skipped_deprecated":
-                    stats["skipped_deprecated"] += 1
-                elif result == "error":
-                    stats["errors"] += 1
-                else:
-                    stats["skipped_no_change"] += 1
-
-                # Rate limit delay
-                await asyncio.sleep(RATE_LIMIT_DELAY)
-
-            # Process recently archived threads
-            logger.info("📋 Processing Archived Threads", [
-                ("Status", "Starting archived thread scan"),
+            # Enumerate active and recently archived threads once
+            threads = await collect_forum_threads(debates_forum, skip_prefixes=())
+            total = len(threads)
+            positions = {thread.id: idx for idx, thread in enumerate(threads, 1)}
+            logger.info("📋 Processing Threads", [
+                ("Active", str(sum(1 for t in threads if not t.archived))),
+                ("Archived", str(sum(1 for t in threads if t.archived))),
             ])
-            archived_idx = 0
-
-            async for thread in debates_forum.archived_threads(limit=DISCORD_ARCHIVED_THREADS_LIMIT):
-                archived_idx += 1
-                if thread is None:
-                    logger.warning("Null Archived Thread Encountered", [("Index", str(archived_idx))])
-                    continue
 
+            async def _evaluate(thread: discord.Thread) -> tuple[dict, str, str]:
+                # Counts are returned, not applied, so a 429 retry can't double count
+                idx = positions[thread.id]
                 result, thread_name = await self._evaluate_thread_with_logging(
-                    thread, archived_idx, DISCORD_ARCHIVED_THREADS_LIMIT, is_archived=True
+                    thread, idx, total, is_archived=thread.archived
                 )
-                stats["archived_checked"] += 1
-
-                if result == "added":
-                    stats["added"] += 1
-                    added_threads.append(thread_name)
-                elif result == "removed":
-                    stats["removed"] += 1
-                    removed_threads.append(thread_name)
-                elif result == "kept":
-                    stats["kept"] += 1
-                    kept_threads.append(thread_name)
-                elif result == "skipped_deprecated":
-                    stats["skipped_deprecated"] += 1
+                counts = {"archived_checked" if thread.archived else "active_checked": 1}
+                if result in ("added", "removed", "kept", "skipped_deprecated"):
+                    counts[result] = 1
                 elif result == "error":
-                    stats["errors"] += 1
+                    counts["errors"] = 1
                 else:
-                    stats["skipped_no_change"] += 1
+                    counts["skipped_no_change"] = 1
+                return counts, result, thread_name
 
-                # Rate limit delay
-                await asyncio.sleep(RATE_LIMIT_DELAY)
+            scanner = ForumScanner("Hot Tag", delay=RATE_LIMIT_DELAY)
+            evaluated = [entry for entry in await scanner.run(threads, _evaluate) if entry]
+            merge_counts(stats, (counts for counts, _, _ in evaluated))
+            stats["errors"] += scanner.failed
+
+            # Track threads for summary
+            added_threads: List[str] = [name for _, result, name in evaluated if result == "added"]
+            removed_threads: List[str] = [name for _, result, name in evaluated if result == "removed"]
+            kept_threads: List[str] = [name for _, result, name in evaluated if result == "kept"]
+            stats.update(scanner.get_stats())
 
             # Calculate duration
             end_time = datetime.now(NY_TZ)
@@ -339,6 +299,9 @@ class HotTagManager:
             return "none", thread_preview
 
         except discord.HTTPException as e:
+            if e.status == 429:
+                # Let the scanner back off and retry this thread
+                raise
             logger.warning(f"[{idx}/{total}] Discord API Error Evaluating Thread", [
                 ("Thread", thread_preview),
                 ("Error", str(e)),
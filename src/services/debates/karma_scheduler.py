@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Callable, Awaitable, Optional, Any
 
 from src.core.logger import logger
 from src.core.config import SECONDS_PER_HOUR, NY_TZ
+from src.services.debates.forum_scanner import scan_report_items
 from src.services.debates.reconciliation import cleanup_orphan_votes
 from src.utils.footer import refresh_avatar
 
@@ -135,6 +136,8 @@ class KarmaReconciliationScheduler:
                             ("Messages", str(stats.get('messages_scanned', 0))),
                             ("Added", f"+{stats.get('votes_added', 0)}"),
                             ("Removed", f"-{stats.get('votes_removed', 0)}"),
+                            ("Scan", f"{stats.get('scan_threads_per_second', 0)} threads/s at {stats.get('scan_concurrency', 0)}x"),
+                            ("Rate Limits", str(stats.get('scan_rate_limits', 0))),
                         ])
                         # Log success to webhook
                         await self._send_reconciliation_webhook("Nightly (00:00 EST)", stats, success=True)
@@ -143,6 +146,10 @@ class KarmaReconciliationScheduler:
                         if self.bot:
                             await self._run_orphan_cleanup()
 
+                        # Snapshot ranks for week-over-week deltas
+                        if self.bot:
+                            await self._run_rank_snapshot()
+
                         # Refresh footer avatar at midnight
                         await refresh_avatar()
 
@@ -176,9 +183,21 @@ class KarmaReconciliationScheduler:
             pass  # Don't fail on webhook error
 
     async def _send_reconciliation_webhook(self, trigger: str, stats: dict, success: bool) -> None:
-        """Send reconciliation results to webhook if bot is available."""
-        # Logging now handled by tree logger automatically
-        pass
+        """Report reconciliation results, with forum scan progress and throughput."""
+        # The tree logger forwards reports to the logging webhook
+        items = [("Trigger", trigger), ("Status", "Success" if success else "Failed")]
+        if success:
+            items += [
+                ("Threads", str(stats.get("threads_scanned", 0))),
+                ("Unchanged (Skipped)", str(stats.get("threads_skipped", 0))),
+                ("Messages", str(stats.get("messages_scanned", 0))),
+                ("Votes", f"+{stats.get('votes_added', 0)} / -{stats.get('votes_removed', 0)}"),
+                ("Errors", str(stats.get("errors", 0))),
+            ]
+            items += scan_report_items(stats)
+        else:
+            items.append(("Error", str(stats.get("error", "Unknown"))[:100]))
+        logger.tree("Karma Reconciliation Report", items, emoji="📊" if success else "❌")
 
     async def _run_orphan_cleanup(self) -> None:
         """Run orphan vote cleanup and log results."""
@@ -209,6 +228,19 @@ class KarmaReconciliationScheduler:
             ])
             await self._send_error_webhook("Orphan Vote Cleanup Failed", str(e))
 
+    async def _run_rank_snapshot(self) -> None:
+        """Save today's leaderboard ranks (used for rank change deltas)."""
+        service = getattr(self.bot, 'debates_service', None)
+        if not service:
+            return
+        try:
+            await service.db.take_rank_snapshot_async()
+        except Exception as e:
+            logger.error("Rank Snapshot Failed", [
+                ("Error Type", type(e).__name__),
+                ("Error", str(e)),
+            ])
+
     async def _send_orphan_cleanup_webhook(self, stats: dict) -> None:
         """Send orphan cleanup results to webhook if bot is available."""
         # Logging now handled by tree logger automatically
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Callable, Awaitable, Optional, Any
 
 from src.core.logger import logger
 from src.core.config import NY_TZ, SECONDS_PER_HOUR
+from src.services.debates.forum_scanner import scan_report_items
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -333,8 +334,9 @@ class DebateMaintenanceScheduler:
             log_items = [("Duration", f"{duration:.1f}s")]
             if isinstance(stats, dict):
                 for key, value in stats.items():
-                    if key != "error":
+                    if key != "error" and not key.startswith("scan_"):
                         log_items.append((key.replace("_", " ").title(), str(value)))
+                log_items.extend(scan_report_items(stats))
 
             logger.tree(f"Completed: {name}", log_items, emoji="✅")
 
@@ -0,0 +1,358 @@
+"""
+OthmanBot - Message Mirror
+==========================
+
+Keeps a local copy of debate-forum messages and vote/participation
+reactions, fed from gateway events, so analytics and maintenance jobs
+query SQLite instead of re-reading thread history from Discord.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import (
+    DEBATES_FORUM_ID,
+    MESSAGE_MIRROR_HISTORY_LIMIT,
+    MESSAGE_MIRROR_CATCHUP_DAYS,
+    LOG_TITLE_PREVIEW_LENGTH,
+)
+from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI, PARTICIPATE_EMOJI
+from src.services.debates.forum_scanner import ForumScanner, collect_forum_threads, merge_counts
+
+if TYPE_CHECKING:
+    from src.bot import OthmanBot
+    from src.services.debates.db import DebatesDatabase
+    from src.services.debates.db.mirror import MirrorMessageRow
+
+
+# Reactions whose user sets are mirrored
+TRACKED_EMOJIS: tuple[str, ...] = (UPVOTE_EMOJI, DOWNVOTE_EMOJI, PARTICIPATE_EMOJI)
+
+
+def message_row(message: discord.Message) -> "MirrorMessageRow":
+    """Build a mirror row from a Discord message."""
+    return (
+        message.id,
+        message.channel.id,
+        message.author.id,
+        message.author.display_name,
+        message.author.bot,
+        message.created_at,
+        message.edited_at,
+    )
+
+
+class MessageMirror:
+    """
+    Event-fed mirror of the debates forum with per-thread coverage.
+
+    DESIGN: Analytics, karma reconciliation, orphan cleanup and the stats
+    backfill each re-read up to 1000 messages per thread and re-paged
+    every vote reaction. The mirror records messages, edits, deletions
+    and tracked reactions from gateway events (raw events, so uncached
+    messages are covered) into the mirror tables.
+
+    Each thread keeps a persisted watermark (mirror_threads.last_message_id):
+    the newest message the mirror holds everything up to. A full sync
+    sets it, and new messages on live threads advance it. After a
+    restart, ensure() trusts the rows already stored and replays only
+    history after the watermark; a full re-sync happens only for threads
+    with no watermark. Downtime reactions, edits and deletions on
+    messages older than the watermark are not replayed; the nightly full
+    karma reconcile re-reads threads with ensure(resync=True). catch_up()
+    replays recently active threads on startup so the first jobs don't
+    pay for it. Events that arrive during a sync are written immediately
+    and replayed after the sync's snapshot lands, so none are overwritten.
+    """
+
+    def __init__(self, db: "DebatesDatabase") -> None:
+        """
+        Initialize the mirror.
+
+        Args:
+            db: Debates database holding the mirror tables
+        """
+        self._db = db
+        self._live: set[int] = set()
+        self._watermarks: Optional[dict[int, int]] = None
+        self._syncing: dict[int, list[tuple[Callable[..., Any], tuple]]] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._listeners: list[Any] = []
+
+        # Metrics
+        self.events = 0
+        self.syncs = 0
+        self.incremental_syncs = 0
+        self.synced_messages = 0
+        self.sync_seconds = 0.0
+        self.local_reads = 0
+
+    # -------------------------------------------------------------------------
+    # Coverage
+    # -------------------------------------------------------------------------
+
+    def is_live(self, thread_id: int) -> bool:
+        """True if the mirror is complete for the thread in this process."""
+        return thread_id in self._live
+
+    def mark_live(self, thread_id: int) -> None:
+        """Trust a thread created while the bot is running (events see it all)."""
+        self._live.add(thread_id)
+
+    def forget(self, thread_id: int) -> None:
+        """Drop a deleted thread from the live set."""
+        self._live.discard(thread_id)
+        self._locks.pop(thread_id, None)
+        if self._watermarks is not None:
+            self._watermarks.pop(thread_id, None)
+        self._notify("on_mirror_reset", thread_id)
+
+    def add_listener(self, listener: Any) -> None:
+        """
+        Register an object to be told about every applied event.
+
+        Listeners may implement any of on_mirror_message(row),
+        on_mirror_delete(thread_id, message_ids), on_mirror_reaction(
+        thread_id, message_id, emoji, user_id, added), on_mirror_clear(
+        thread_id, message_id, emoji) and on_mirror_reset(thread_id);
+        the last fires when a thread is re-synced or forgotten.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, hook: str, *args: Any) -> None:
+        """Call a hook on every listener that implements it."""
+        for listener in self._listeners:
+            handler = getattr(listener, hook, None)
+            if handler is not None:
+                handler(*args)
+
+    async def ensure(self, thread: discord.Thread, after_id: Optional[int] = None, resync: bool = False) -> None:
+        """
+        Make sure the thread is live, syncing it from Discord if not.
+
+        Args:
+            thread: Thread to make live
+            after_id: Message ID the caller knows the mirror is complete up
+                to (e.g. a reconcile checkpoint), used when the thread has
+                no watermark of its own
+            resync: Ignore watermarks and read the full history, so changes
+                to older messages made while offline are picked up
+
+        Raises:
+            discord.HTTPException: If the sync's history read fails
+        """
+        if thread.id in self._live:
+            self.local_reads += 1
+            return
+        lock = self._locks.setdefault(thread.id, asyncio.Lock())
+        async with lock:
+            if thread.id not in self._live:
+                if resync:
+                    await self.sync_thread(thread)
+                    return
+                watermarks = await self._load_watermarks()
+                await self.sync_thread(thread, watermarks.get(thread.id) or after_id)
+
+    async def _load_watermarks(self) -> dict[int, int]:
+        """Read the persisted watermarks once per process."""
+        if self._watermarks is None:
+            self._watermarks = await self._db.get_mirror_watermarks_async()
+        return self._watermarks
+
+    def _advance(self, thread_id: int, message_id: int) -> None:
+        """Raise a thread's in-memory watermark."""
+        if self._watermarks is not None and message_id > self._watermarks.get(thread_id, 0):
+            self._watermarks[thread_id] = message_id
+
+    # -------------------------------------------------------------------------
+    # Event Writes
+    # -------------------------------------------------------------------------
+
+    async def record_message(self, message: discord.Message) -> None:
+        """Record a new message, advancing the watermark of a live thread."""
+        row = message_row(message)
+        live = message.channel.id in self._live
+        await self._write(message.channel.id, self._db.upsert_mirror_messages, [row], live)
+        if live:
+            self._advance(message.channel.id, message.id)
+        self._notify("on_mirror_message", row)
+
+    async def record_edit(self, thread_id: int, message_id: int, edited_at: datetime) -> None:
+        """Record a message edit."""
+        await self._write(thread_id, self._db.set_mirror_message_edited, message_id, edited_at)
+
+    async def record_delete(self, thread_id: int, message_ids: list[int]) -> None:
+        """Flag deleted messages."""
+        await self._write(thread_id, self._db.mark_mirror_messages_deleted, message_ids)
+        self._notify("on_mirror_delete", thread_id, message_ids)
+
+    async def record_reaction(self, thread_id: int, message_id: int, emoji: str, user_id: int, added: bool) -> None:
+        """Record a tracked reaction being added or removed."""
+        if emoji not in TRACKED_EMOJIS:
+            return
+        await self._write(thread_id, self._db.set_mirror_reaction, message_id, emoji, user_id, added)
+        self._notify("on_mirror_reaction", thread_id, message_id, emoji, user_id, added)
+
+    async def clear_reactions(self, thread_id: int, message_id: int, emoji: Optional[str] = None) -> None:
+        """Record reactions being cleared from a message."""
+        if emoji is not None and emoji not in TRACKED_EMOJIS:
+            return
+        await self._write(thread_id, self._db.clear_mirror_reactions, message_id, emoji)
+        self._notify("on_mirror_clear", thread_id, message_id, emoji)
+
+    async def _write(self, thread_id: int, func: Callable[..., Any], *args: Any) -> None:
+        """Apply an event now and queue it for replay if a sync is running."""
+        self.events += 1
+        pending = self._syncing.get(thread_id)
+        if pending is not None:
+            pending.append((func, args))
+        await asyncio.to_thread(func, *args)
+
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+
+    async def sync_thread(self, thread: discord.Thread, after_id: Optional[int] = None) -> dict:
+        """
+        Read a thread's history and tracked reactions into the mirror.
+
+        Args:
+            thread: Thread to sync
+            after_id: Watermark to replay from; None re-syncs the thread
+                from its latest MESSAGE_MIRROR_HISTORY_LIMIT messages
+
+        Returns:
+            Dict with messages and deleted counts
+
+        Raises:
+            discord.HTTPException: If the history read fails
+        """
+        started = time.perf_counter()
+        pending: list[tuple[Callable[..., Any], tuple]] = []
+        self._syncing[thread.id] = pending
+        try:
+            if after_id is None:
+                history = thread.history(limit=MESSAGE_MIRROR_HISTORY_LIMIT)
+            else:
+                history = thread.history(limit=None, after=discord.Object(id=after_id))
+            rows: list["MirrorMessageRow"] = []
+            reactions: dict[int, dict[str, set[int]]] = {}
+            async for message in history:
+                rows.append(message_row(message))
+                if message.author.bot:
+                    continue
+                for reaction in message.reactions:
+                    emoji = str(reaction.emoji)
+                    if emoji not in TRACKED_EMOJIS or reaction.count == 0:
+                        continue
+                    users = {user.id async for user in reaction.users() if not user.bot}
+                    if users:
+                        reactions.setdefault(message.id, {})[emoji] = users
+
+            if after_id is None:
+                complete = len(rows) < MESSAGE_MIRROR_HISTORY_LIMIT
+                result = await self._db.apply_mirror_sync_async(thread.id, rows, reactions, complete)
+            else:
+                result = await self._db.apply_mirror_increment_async(thread.id, after_id, rows, reactions)
+
+            # Re-apply events that raced the history read
+            for func, args in pending:
+                await asyncio.to_thread(func, *args)
+        finally:
+            self._syncing.pop(thread.id, None)
+
+        self._live.add(thread.id)
+        if self._watermarks is not None:
+            if after_id is None:
+                self._watermarks.pop(thread.id, None)
+            for row in rows:
+                self._advance(thread.id, row[0])
+            if after_id is not None:
+                self._advance(thread.id, after_id)
+        self._notify("on_mirror_reset", thread.id)
+        elapsed = time.perf_counter() - started
+        self.syncs += 1
+        if after_id is not None:
+            self.incremental_syncs += 1
+        self.synced_messages += result["messages"]
+        self.sync_seconds += elapsed
+
+        logger.debug("Message Mirror Thread Synced", [
+            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ("Mode", "Full" if after_id is None else "After Watermark"),
+            ("Messages", str(result["messages"])),
+            ("Deleted", str(result["deleted"])),
+            ("Replayed Events", str(len(pending))),
+            ("Duration", f"{elapsed:.2f}s"),
+        ])
+        return result
+
+    async def catch_up(self, bot: "OthmanBot", days_back: int = MESSAGE_MIRROR_CATCHUP_DAYS) -> dict:
+        """
+        Replay recently active threads after downtime.
+
+        Threads with a message in the last days_back days are synced
+        (from their watermark when they have one); older threads are
+        synced lazily by the first job that needs them.
+
+        Returns:
+            Dict with threads synced plus scanner metrics
+        """
+        stats = {"threads_synced": 0, "threads_deferred": 0}
+        forum = bot.get_channel(DEBATES_FORUM_ID)
+        if not forum:
+            return stats
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        threads = []
+        for thread in await collect_forum_threads(forum):
+            if thread.id in self._live:
+                continue
+            last_activity = discord.utils.snowflake_time(thread.last_message_id or thread.id)
+            if last_activity > cutoff:
+                threads.append(thread)
+            else:
+                stats["threads_deferred"] += 1
+
+        async def _sync(thread: discord.Thread) -> dict:
+            await self.ensure(thread)
+            return {"threads_synced": 1}
+
+        scanner = ForumScanner("Message Mirror")
+        merge_counts(stats, await scanner.run(threads, _sync))
+        stats.update(scanner.get_stats())
+
+        logger.tree("Message Mirror Caught Up", [
+            ("Threads Synced", str(stats["threads_synced"])),
+            ("Deferred (Inactive)", str(stats["threads_deferred"])),
+            ("Messages", str(self.synced_messages)),
+            ("Duration", f"{stats['scan_duration_seconds']}s"),
+        ], emoji="🪞")
+        return stats
+
+    def get_stats(self) -> dict:
+        """Coverage and sync counters."""
+        return {
+            "live_threads": len(self._live),
+            "events": self.events,
+            "syncs": self.syncs,
+            "incremental_syncs": self.incremental_syncs,
+            "synced_messages": self.synced_messages,
+            "sync_seconds": round(self.sync_seconds, 1),
+            "local_reads": self.local_reads,
+        }
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["MessageMirror", "TRACKED_EMOJIS", "message_row"]
@@ -0,0 +1,272 @@
+"""
+OthmanBot - Moderation Job Runner
+=================================
+
+Background runner for persisted moderation jobs, currently removing a
+banned user's participation reactions from the threads they joined.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import (
+    MODERATION_JOB_CONCURRENCY,
+    MODERATION_JOB_RETENTION_DAYS,
+    REACTION_DELAY,
+)
+from src.core.emojis import PARTICIPATE_EMOJI
+from src.services.debates.forum_scanner import ForumScanner
+
+if TYPE_CHECKING:
+    from src.bot import OthmanBot
+
+
+# =============================================================================
+# Job Target
+# =============================================================================
+
+@dataclass
+class _JobTarget:
+    """One analytics embed a job acts on (thread-like for ForumScanner)."""
+    id: int
+    message_id: int
+    name: str
+    recorded: bool = True
+    attempts: int = 1
+
+
+# =============================================================================
+# Moderation Job Runner
+# =============================================================================
+
+class ModerationJobRunner:
+    """
+    Runs moderation jobs one after another, each across its threads in parallel.
+
+    DESIGN: /disallow used to clean up a global ban by fetching every debate
+    thread ever recorded, one by one, then fetching each analytics message
+    and paging through the participation reaction's users to find one
+    person. A job now targets only the embeds participation_gate records
+    the user as having reacted to, and removes the reaction straight from a
+    partial message: one API call per embed, no fetches. Discord accepts a
+    removal even when the user never reacted, so a removal only counts as
+    done for a recorded reaction; the rest are reported as unconfirmed.
+
+    Jobs run through a single ForumScanner, so every job shares one
+    concurrency limit and one 429 backoff. The scanner's metrics cover
+    only the job it last ran; the runner keeps its own totals across
+    jobs. Each embed's outcome is written
+    as soon as it finishes; jobs left unfinished by a restart are picked up
+    by start() with only their pending embeds.
+    """
+
+    def __init__(self, bot: "OthmanBot", concurrency: int = MODERATION_JOB_CONCURRENCY) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            bot: The OthmanBot instance
+            concurrency: Embeds a job works on in parallel
+        """
+        self.bot = bot
+        self._scanner = ForumScanner("Moderation Jobs", concurrency=concurrency, delay=REACTION_DELAY)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.jobs_submitted = 0
+        self.jobs_resumed = 0
+        self.jobs_finished = 0
+        self.reactions_removed = 0
+        self.reactions_unconfirmed = 0
+        self.targets_missing = 0
+        self.targets_failed = 0
+        self.rate_limits = 0
+        self.retries = 0
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Prune old jobs, re-queue unfinished ones and start the worker."""
+        db = self.bot.debates_service.db
+        await asyncio.to_thread(db.cleanup_moderation_jobs, MODERATION_JOB_RETENTION_DAYS)
+        jobs = await asyncio.to_thread(db.get_unfinished_moderation_jobs)
+        for job in jobs:
+            self._queue.put_nowait(job)
+        self.jobs_resumed += len(jobs)
+        self._ensure_started()
+
+        if jobs:
+            logger.tree("Moderation Jobs Resumed", [
+                ("Jobs", str(len(jobs))),
+                ("Pending Embeds", str(sum(len(job["items"]) for job in jobs))),
+            ], emoji="🧹")
+
+    async def submit_reaction_cleanup(self, user_id: int, thread_id: Optional[int] = None) -> dict:
+        """
+        Queue removal of a user's participation reactions.
+
+        Args:
+            user_id: Banned user
+            thread_id: Thread the ban covers, or None for a global ban
+
+        Returns:
+            The persisted job
+        """
+        job = await self.bot.debates_service.db.create_reaction_cleanup_job_async(user_id, thread_id)
+        self.jobs_submitted += 1
+        await self._queue.put(job)
+        self._ensure_started()
+        return job
+
+    def get_stats(self) -> dict:
+        """Get job counters and runner totals, plus the last job's scanner metrics."""
+        stats = {
+            "queued_jobs": self._queue.qsize(),
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_resumed": self.jobs_resumed,
+            "jobs_finished": self.jobs_finished,
+            "reactions_removed": self.reactions_removed,
+            "reactions_unconfirmed": self.reactions_unconfirmed,
+            "targets_missing": self.targets_missing,
+            "targets_failed": self.targets_failed,
+            "rate_limits": self.rate_limits,
+            "retries": self.retries,
+        }
+        stats.update(self._scanner.get_stats())
+        return stats
+
+    async def stop(self) -> None:
+        """Stop the worker; unfinished embeds stay pending for the next start."""
+        self._closed = True
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.tree("Moderation Job Runner Stopped", [
+            ("Jobs Finished", str(self.jobs_finished)),
+            ("Jobs Left Queued", str(self._queue.qsize())),
+        ], emoji="🛑")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _ensure_started(self) -> None:
+        """Start the worker on first use (needs a running loop)."""
+        if self._closed:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+            self._task.add_done_callback(self._handle_task_exception)
+
+    def _handle_task_exception(self, task: asyncio.Task) -> None:
+        """Handle exceptions from the worker task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.tree("Moderation Job Runner Task Exception", [
+                ("Error Type", type(exc).__name__),
+                ("Error", str(exc)[:100]),
+            ], emoji="❌")
+
+    async def _worker(self) -> None:
+        """Run queued jobs in order."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run_reaction_cleanup(job)
+            except Exception as e:
+                # Job stays unfinished in the database and is retried on restart
+                logger.error("Moderation Job Failed", [
+                    ("Job ID", str(job["id"])),
+                    ("User ID", str(job["user_id"])),
+                    ("Error Type", type(e).__name__),
+                    ("Error", str(e)[:100]),
+                ])
+
+    async def _run_reaction_cleanup(self, job: dict) -> None:
+        """Remove the user's participation reaction from every pending embed."""
+        db = self.bot.debates_service.db
+        job_id, user_id = job["id"], job["user_id"]
+        member = discord.Object(id=user_id)
+
+        targets = []
+        for item in job["items"]:
+            cached = self.bot.get_channel(item["thread_id"])
+            targets.append(_JobTarget(
+                id=item["thread_id"],
+                message_id=item["message_id"],
+                name=cached.name if cached else str(item["thread_id"]),
+                recorded=item["recorded"],
+                attempts=item["attempts"] + 1,
+            ))
+
+        async def _remove(target: _JobTarget) -> str:
+            message = self.bot.get_partial_messageable(target.id).get_partial_message(target.message_id)
+            try:
+                await message.remove_reaction(PARTICIPATE_EMOJI, member)
+                # Succeeds whether or not the user had reacted
+                status = "done" if target.recorded else "unconfirmed"
+            except discord.NotFound:
+                # Thread or analytics message deleted since the reaction was recorded
+                status = "missing"
+            except discord.Forbidden:
+                status = "failed"
+            await asyncio.to_thread(db.set_moderation_job_item_status, job_id, target.message_id, status, target.attempts)
+            return status
+
+        results = await self._scanner.run(targets, _remove) if targets else []
+        if targets:
+            self.rate_limits += self._scanner.rate_limits
+            self.retries += self._scanner.retries
+
+        # Targets the scanner gave up on (429s past retries, other HTTP errors)
+        for target, status in zip(targets, results):
+            if status is None:
+                await asyncio.to_thread(db.set_moderation_job_item_status, job_id, target.message_id, "failed", target.attempts)
+
+        counts = await asyncio.to_thread(db.finish_moderation_job, job_id)
+        removed = counts.get("done", 0)
+        unconfirmed = counts.get("unconfirmed", 0)
+        missing = counts.get("missing", 0)
+        failed = counts.get("failed", 0)
+        self.jobs_finished += 1
+        self.reactions_removed += removed
+        self.reactions_unconfirmed += unconfirmed
+        self.targets_missing += missing
+        self.targets_failed += failed
+
+        logger.tree("Ban Reactions Cleanup Complete", [
+            ("Job ID", str(job_id)),
+            ("User ID", str(user_id)),
+            ("Scope", str(job["thread_id"]) if job["thread_id"] else "Global"),
+            ("Threads Targeted", str(len({target.id for target in targets}))),
+            ("Embeds Targeted", str(len(targets))),
+            ("Reactions Removed", str(removed)),
+            ("Unconfirmed", str(unconfirmed)),
+            ("Missing", str(missing)),
+            ("Failed", str(failed)),
+            ("Rate Limits", str(self._scanner.rate_limits if targets else 0)),
+            ("Duration", f"{self._scanner.duration if targets else 0.0:.1f}s"),
+        ], emoji="🧹")
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["ModerationJobRunner"]
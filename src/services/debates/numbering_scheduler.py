@@ -7,7 +7,8 @@ Scans all non-deprecated debates and fixes any gaps in numbering.
 
 Also runs hourly checks for unnumbered threads (missed during bot downtime).
 
-Features rate limit awareness with automatic backoff.
+Renames run through the shared ForumScanner (bounded concurrency,
+429-driven backoff).
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
@@ -25,11 +26,11 @@ from src.core.config import DEBATES_FORUM_ID, SECONDS_PER_HOUR, NY_TZ, DISCORD_A
 from src.core.emojis import UPVOTE_EMOJI, PARTICIPATE_EMOJI
 from src.utils import edit_thread_with_retry, add_reactions_with_delay, send_message_with_retry
 from src.utils.discord_rate_limit import log_http_error
-from src.services.debates.analytics import calculate_debate_analytics, generate_analytics_embed
+from src.services.debates.analytics import generate_analytics_embed
+from src.services.debates.forum_scanner import ForumScanner, merge_counts, scan_report_items
 
 # Rate limit backoff settings
 RATE_LIMIT_BASE_DELAY = 5.0  # Base delay when rate limited (seconds)
-RATE_LIMIT_MAX_DELAY = 60.0  # Maximum backoff delay (seconds)
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -137,74 +138,56 @@ async def reconcile_debate_numbering(bot: "OthmanBot") -> dict:
             ])
             return stats
 
+        renames = {thread.id: (old_num, new_num) for thread, old_num, new_num in threads_to_rename}
+
         logger.info("🔧 Starting Gap Repair", [
             ("Gaps Found", str(len(threads_to_rename))),
             ("Threads To Renumber", str(len(threads_to_rename))),
         ])
 
-        # Fix the gaps by renumbering (with adaptive rate limit handling)
-        adaptive_delay = DISCORD_API_DELAY
-        consecutive_rate_limits = 0
+        async def _renumber(thread: "discord.Thread") -> Optional[dict]:
+            # Counts are returned, not applied, so a 429 retry can't double count
+            old_num, new_num = renames[thread.id]
+            # Extract title part after the number
+            title_match = re.match(r'^\d+\s*\|\s*(.+)$', thread.name)
+            if not title_match:
+                return None
+            title = title_match.group(1)
+            new_name = f"{new_num} | {title}"
 
-        for thread, old_num, new_num in threads_to_rename:
             try:
-                # Extract title part after the number
-                title_match = re.match(r'^\d+\s*\|\s*(.+)$', thread.name)
-                if title_match:
-                    title = title_match.group(1)
-                    new_name = f"{new_num} | {title}"
-
-                    success = await edit_thread_with_retry(thread, name=new_name)
-
-                    if success:
-                        stats["threads_renumbered"] += 1
-                        # Success - gradually reduce delay
-                        consecutive_rate_limits = max(0, consecutive_rate_limits - 1)
-                        adaptive_delay = max(DISCORD_API_DELAY, adaptive_delay * 0.9)
-
-                        logger.success("✅ Renumbered Debate Thread", [
-                            ("Old", f"#{old_num}"),
-                            ("New", f"#{new_num}"),
-                            ("Title", title[:THREAD_NAME_PREVIEW_LENGTH]),
-                        ])
-                    else:
-                        # edit_thread_with_retry returned False (exhausted retries)
-                        stats["errors"] += 1
-                        consecutive_rate_limits += 1
-                        adaptive_delay = min(adaptive_delay * 1.5, RATE_LIMIT_MAX_DELAY)
-                        logger.warning("Thread Renumber Failed After Retries", [
-                            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                            ("Adaptive Delay", f"{adaptive_delay:.1f}s"),
-                        ])
-
-                    # Use adaptive delay between operations
-                    await asyncio.sleep(adaptive_delay)
-
+                success = await edit_thread_with_retry(thread, name=new_name)
             except discord.HTTPException as e:
                 if e.status == 429:
-                    # Rate limited - back off significantly
-                    retry_after = getattr(e, 'retry_after', RATE_LIMIT_BASE_DELAY)
-                    consecutive_rate_limits += 1
-                    adaptive_delay = min(adaptive_delay * 2, RATE_LIMIT_MAX_DELAY)
-                    logger.warning("Renumbering Rate Limited", [
-                        ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                        ("Retry After", f"{retry_after:.1f}s"),
-                        ("Consecutive Limits", str(consecutive_rate_limits)),
-                    ])
-                    await asyncio.sleep(retry_after + 2.0)
-                else:
-                    log_http_error(e, "Renumber Thread", [
-                        ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                        ("Old Number", f"#{old_num}"),
-                        ("New Number", f"#{new_num}"),
-                    ])
-                stats["errors"] += 1
-            except Exception as e:
-                logger.error("Failed To Renumber Thread", [
+                    # Let the scanner back off and retry this thread
+                    raise
+                log_http_error(e, "Renumber Thread", [
                     ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                    ("Error", str(e)),
+                    ("Old Number", f"#{old_num}"),
+                    ("New Number", f"#{new_num}"),
                 ])
-                stats["errors"] += 1
+                return {"errors": 1}
+
+            if success:
+                logger.success("✅ Renumbered Debate Thread", [
+                    ("Old", f"#{old_num}"),
+                    ("New", f"#{new_num}"),
+                    ("Title", title[:THREAD_NAME_PREVIEW_LENGTH]),
+                ])
+                return {"threads_renumbered": 1}
+
+            # edit_thread_with_retry returned False (exhausted retries)
+            scanner.backoff(RATE_LIMIT_BASE_DELAY)
+            logger.warning("Thread Renumber Failed After Retries", [
+                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ])
+            return {"errors": 1}
+
+        # Fix the gaps by renumbering (scanner handles concurrency and 429 backoff)
+        scanner = ForumScanner("Numbering")
+        merge_counts(stats, await scanner.run([thread for thread, _, _ in threads_to_rename], _renumber))
+        stats["errors"] += scanner.failed
+        stats.update(scanner.get_stats())
 
         # Update the counter in database to match the highest number
         highest_num = 0
@@ -411,7 +394,7 @@ async def _number_single_thread(bot: "OthmanBot", thread: discord.Thread) -> boo
                     ("Thread ID", str(thread.id)),
                     ("Reason", "No analytics_message_id in database"),
                 ])
-                analytics = await calculate_debate_analytics(thread, db)
+                analytics = await bot.debates_service.analytics.calculate(thread)
                 embed = await generate_analytics_embed(bot, analytics)
                 analytics_message = await send_message_with_retry(thread, embed=embed)
 
@@ -655,9 +638,20 @@ class NumberingReconciliationScheduler:
             pass  # Don't fail on webhook error
 
     async def _send_reconciliation_webhook(self, trigger: str, stats: dict, success: bool) -> None:
-        """Send reconciliation results to webhook if bot is available."""
-        # Logging now handled by tree logger automatically
-        pass
+        """Report reconciliation results, with forum scan progress and throughput."""
+        # The tree logger forwards reports to the logging webhook
+        items = [("Trigger", trigger), ("Status", "Success" if success else "Failed")]
+        if success:
+            items += [
+                ("Threads", str(stats.get("threads_scanned", 0))),
+                ("Gaps Found", str(stats.get("gaps_found", 0))),
+                ("Threads Renumbered", str(stats.get("threads_renumbered", 0))),
+                ("Errors", str(stats.get("errors", 0))),
+            ]
+            items += scan_report_items(stats)
+        else:
+            items.append(("Error", str(stats.get("error", "Unknown"))[:100]))
+        logger.tree("Numbering Reconciliation Report", items, emoji="📊" if success else "❌")
 
 
 # =============================================================================
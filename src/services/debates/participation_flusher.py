@@ -0,0 +1,210 @@
+"""
+OthmanBot - Participation Flusher
+=================================
+
+Periodic batched writes of buffered participation counts and streaks.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Optional
+
+from src.core.logger import logger
+from src.core.config import (
+    PARTICIPATION_FLUSH_INTERVAL,
+    PARTICIPATION_FLUSH_MAX_PENDING,
+)
+
+if TYPE_CHECKING:
+    from src.services.debates.db import DebatesDatabase
+
+
+# =============================================================================
+# Participation Flusher
+# =============================================================================
+
+class ParticipationFlusher:
+    """
+    Records debate messages in the database's participation buffer and
+    flushes it on a timer.
+
+    DESIGN: The message handler calls record() without awaiting anything;
+    the buffer journals the event and queues the user's streak only on
+    their first message of the day. The worker flushes every
+    PARTICIPATION_FLUSH_INTERVAL seconds, or as soon as
+    PARTICIPATION_FLUSH_MAX_PENDING messages are buffered, so a chatty
+    thread costs one transaction per interval instead of two per message.
+    A failed flush leaves the events buffered for the next attempt.
+
+    start() replays journals left by a previous run in a worker thread, so
+    record() never touches SQLite on the event loop.
+    """
+
+    def __init__(
+        self,
+        db: "DebatesDatabase",
+        interval: float = PARTICIPATION_FLUSH_INTERVAL,
+        max_pending: int = PARTICIPATION_FLUSH_MAX_PENDING,
+    ) -> None:
+        """
+        Initialize the flusher.
+
+        Args:
+            db: Debates database holding the buffer
+            interval: Seconds between flushes
+            max_pending: Flush early once this many messages are buffered
+        """
+        self._db = db
+        self._interval = interval
+        self._max_pending = max_pending
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rows_written = 0
+        self.messages_written = 0
+        self.streaks_written = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def start(self) -> None:
+        """
+        Recover leftover journals off the event loop and start the worker.
+
+        Raises:
+            sqlite3.Error: If reading the last committed batch fails
+        """
+        buffer = await self._db.recover_participation_async()
+        if not self._closed:
+            self._ensure_started()
+        stats = buffer.get_stats()
+        logger.tree("Participation Flusher Started", [
+            ("Pending Messages", str(stats["pending_messages"])),
+            ("Sealed Journals", str(stats["sealed_journals"])),
+            ("Replayed Events", str(stats["replayed"])),
+        ], emoji="📊")
+
+    def record(self, thread_id: int, user_id: int) -> bool:
+        """Count a debate message. Returns True if the user's streak was queued."""
+        queued = self._db.record_participation(thread_id, user_id)
+        if self._closed:
+            return queued
+
+        self._ensure_started()
+        if self._db.get_pending_participation() >= self._max_pending:
+            self._wake.set()
+        return queued
+
+    async def flush(self) -> dict:
+        """Write everything buffered now. Returns the flush result."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(self._db.flush_participation)
+        except sqlite3.Error as e:
+            self.failed_flushes += 1
+            logger.warning("Participation Flush Failed", [
+                ("Pending", str(self._db.get_pending_participation())),
+                ("Error Type", type(e).__name__),
+                ("Error", str(e)[:100]),
+            ])
+            return {"rows": 0, "messages": 0, "streaks": 0}
+
+        if result["rows"] or result["streaks"]:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.flushes += 1
+            self.rows_written += result["rows"]
+            self.messages_written += result["messages"]
+            self.streaks_written += result["streaks"]
+            self.last_latency_ms = latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            logger.debug("Participation Flushed", [
+                ("Messages", str(result["messages"])),
+                ("Rows", str(result["rows"])),
+                ("Streaks", str(result["streaks"])),
+                ("Latency", f"{latency_ms:.1f}ms"),
+            ])
+        return result
+
+    def get_stats(self) -> dict:
+        """Get flush metrics plus the buffer's counters."""
+        stats = self._db.get_participation_buffer_stats()
+        stats.update({
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "rows_written": self.rows_written,
+            "messages_written": self.messages_written,
+            "streaks_written": self.streaks_written,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        })
+        return stats
+
+    async def stop(self) -> None:
+        """Stop the worker and flush whatever is still buffered."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        await self.flush()
+        logger.tree("Participation Buffer Flushed", [
+            ("Flushes", str(self.flushes)),
+            ("Messages", str(self.messages_written)),
+            ("Rows", str(self.rows_written)),
+            ("Streaks", str(self.streaks_written)),
+        ], emoji="📊")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _ensure_started(self) -> None:
+        """Start the worker on first use (needs a running loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+            self._task.add_done_callback(self._handle_task_exception)
+
+    def _handle_task_exception(self, task: asyncio.Task) -> None:
+        """Handle exceptions from the worker task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.tree("Participation Flusher Task Exception", [
+                ("Error Type", type(exc).__name__),
+                ("Error", str(exc)[:100]),
+            ], emoji="❌")
+
+    async def _worker(self) -> None:
+        """Flush on every interval, or early when the buffer fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["ParticipationFlusher"]
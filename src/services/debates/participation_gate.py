@@ -0,0 +1,247 @@
+"""
+OthmanBot - Participation Gate
+==============================
+
+In-memory index of who has reacted to each thread's analytics embed,
+so the access check on every debate message needs no REST calls.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import discord
+
+from src.core.logger import logger
+from src.core.config import PARTICIPATION_GATE_MAX_THREADS
+from src.core.emojis import PARTICIPATE_EMOJI
+
+if TYPE_CHECKING:
+    from src.services.debates.db import DebatesDatabase
+
+
+# =============================================================================
+# Gate Entry
+# =============================================================================
+
+@dataclass
+class _GateEntry:
+    """Participant set for one thread's analytics message."""
+    message_id: int
+    users: set[int]
+    live: bool = False
+    hydrating: bool = False
+    pending: dict[int, bool] = field(default_factory=dict)
+
+
+# =============================================================================
+# Participation Gate
+# =============================================================================
+
+class ParticipationGate:
+    """
+    Per-thread participant sets kept current from reaction events.
+
+    DESIGN: check_user_participation used to fetch the analytics message
+    and page through every user on the participation reaction for each
+    chat message, which is several API calls per message on busy threads.
+    The gate keeps one set per thread, keyed by the analytics message it
+    belongs to, and updates it (and the participation_gate table) from
+    raw reaction events.
+
+    Sets loaded from the database may be missing reactions made while
+    the bot was offline, so a miss on a set not yet read from Discord in
+    this process hydrates it once (one fetch_message plus the reaction
+    pages) before blocking. After that, membership is a set lookup.
+    Reaction events that arrive mid-hydration are replayed on top of the
+    fetched set so none are lost.
+    """
+
+    def __init__(self, db: "DebatesDatabase", max_threads: int = PARTICIPATION_GATE_MAX_THREADS) -> None:
+        """
+        Initialize the gate.
+
+        Args:
+            db: Debates database for persisted participant sets
+            max_threads: Threads kept in memory (least recently used evicted)
+        """
+        self._db = db
+        self._max_threads = max(1, max_threads)
+        self._entries: OrderedDict[int, _GateEntry] = OrderedDict()
+        self._locks: dict[int, asyncio.Lock] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.hydrations = 0
+        self.events = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    async def is_participant(self, thread: discord.Thread, message_id: int, user_id: int) -> bool:
+        """
+        Check whether a user has reacted to the thread's analytics embed.
+
+        Args:
+            thread: Debate thread
+            message_id: Analytics message ID for the thread
+            user_id: User attempting to post
+
+        Returns:
+            True if the user has the participation reaction
+
+        Raises:
+            discord.HTTPException: If a needed hydration fails
+        """
+        entry = await self._get_entry(thread.id, message_id)
+        if user_id in entry.users:
+            self.hits += 1
+            return True
+        if entry.live:
+            self.misses += 1
+            return False
+
+        async with self._lock_for(thread.id):
+            entry = await self._get_entry(thread.id, message_id)
+            if not entry.live:
+                await self._hydrate(thread, entry)
+
+        is_member = user_id in entry.users
+        if is_member:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return is_member
+
+    async def record(self, thread_id: int, message_id: int, user_id: int, joined: bool) -> None:
+        """
+        Apply a participation reaction being added or removed.
+
+        Args:
+            thread_id: Debate thread
+            message_id: Analytics message the reaction is on
+            user_id: Reacting user
+            joined: True for an added reaction, False for a removed one
+        """
+        self.events += 1
+        entry = self._entries.get(thread_id)
+        if entry is not None and entry.message_id == message_id:
+            if joined:
+                entry.users.add(user_id)
+            else:
+                entry.users.discard(user_id)
+            if entry.hydrating:
+                entry.pending[user_id] = joined
+        await asyncio.to_thread(self._db.set_participant, thread_id, message_id, user_id, joined)
+
+    def forget(self, thread_id: int) -> None:
+        """Drop a thread's in-memory set (e.g. after the thread is deleted)."""
+        self._entries.pop(thread_id, None)
+        self._locks.pop(thread_id, None)
+
+    def get_stats(self) -> dict:
+        """Index size and hit/miss counters."""
+        return {
+            "threads": len(self._entries),
+            "live_threads": sum(1 for entry in self._entries.values() if entry.live),
+            "participants": sum(len(entry.users) for entry in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "hydrations": self.hydrations,
+            "events": self.events,
+        }
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def _lock_for(self, thread_id: int) -> asyncio.Lock:
+        """Per-thread lock so concurrent misses hydrate once."""
+        lock = self._locks.get(thread_id)
+        if lock is None:
+            lock = self._locks[thread_id] = asyncio.Lock()
+        return lock
+
+    async def _get_entry(self, thread_id: int, message_id: int) -> _GateEntry:
+        """Return the thread's set, loading the persisted one if needed."""
+        entry = self._entries.get(thread_id)
+        if entry is not None and entry.message_id == message_id:
+            self._entries.move_to_end(thread_id)
+            return entry
+
+        users = await asyncio.to_thread(self._db.get_participants, message_id)
+        self.loads += 1
+
+        # Another task may have loaded it while we were in the worker thread
+        entry = self._entries.get(thread_id)
+        if entry is not None and entry.message_id == message_id:
+            return entry
+
+        entry = _GateEntry(message_id=message_id, users=users)
+        self._entries[thread_id] = entry
+        self._entries.move_to_end(thread_id)
+        while len(self._entries) > self._max_threads:
+            evicted, _ = self._entries.popitem(last=False)
+            self._locks.pop(evicted, None)
+        return entry
+
+    async def _hydrate(self, thread: discord.Thread, entry: _GateEntry) -> None:
+        """Read the participation reaction from Discord and persist it."""
+        entry.hydrating = True
+        entry.pending.clear()
+        try:
+            message = await thread.fetch_message(entry.message_id)
+            users: set[int] = set()
+            for reaction in message.reactions:
+                if str(reaction.emoji) == PARTICIPATE_EMOJI:
+                    async for user in reaction.users(limit=None):
+                        if not user.bot:
+                            users.add(user.id)
+                    break
+
+            applied = dict(entry.pending)
+            self._apply_pending(users, applied)
+            await asyncio.to_thread(self._db.replace_participants, thread.id, entry.message_id, users)
+
+            # Events that landed while the replace ran may have been wiped by it
+            late = {user_id: joined for user_id, joined in entry.pending.items() if applied.get(user_id) != joined}
+            self._apply_pending(users, late)
+            for user_id, joined in late.items():
+                await asyncio.to_thread(self._db.set_participant, thread.id, entry.message_id, user_id, joined)
+
+            entry.users = users
+            entry.live = True
+            self.hydrations += 1
+        finally:
+            entry.hydrating = False
+            entry.pending.clear()
+
+        logger.debug("Participation Gate Hydrated", [
+            ("Thread", str(thread.id)),
+            ("Message ID", str(entry.message_id)),
+            ("Participants", str(len(entry.users))),
+        ])
+
+    @staticmethod
+    def _apply_pending(users: set[int], pending: dict[int, bool]) -> None:
+        """Apply buffered reaction events to a participant set."""
+        for user_id, joined in pending.items():
+            if joined:
+                users.add(user_id)
+            else:
+                users.discard(user_id)
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["ParticipationGate"]
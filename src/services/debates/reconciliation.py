@@ -7,21 +7,31 @@ Runs on startup and nightly to catch any missed votes.
 Also ensures starter messages have vote reactions.
 Cleans up orphaned votes from deleted messages.
 
-Features rate limit awareness with automatic backoff.
+Threads are processed by the shared ForumScanner (bounded concurrency,
+429-driven backoff) and read from the local message mirror, which only
+goes to Discord the first time a thread is used after a restart.
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
 import asyncio
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import discord
 
 from src.core.logger import logger
-from src.core.config import DEBATES_FORUM_ID, DISCORD_ARCHIVED_THREADS_LIMIT, DISCORD_API_DELAY, REACTION_DELAY, LOG_TITLE_PREVIEW_LENGTH
+from src.core.config import (
+    DEBATES_FORUM_ID,
+    REACTION_DELAY,
+    LOG_TITLE_PREVIEW_LENGTH,
+    RECONCILE_CHECKPOINT_MAX_AGE_HOURS,
+)
 from src.core.emojis import UPVOTE_EMOJI, DOWNVOTE_EMOJI
+from src.services.debates.forum_scanner import ForumScanner, collect_forum_threads, merge_counts
 
 # Constants for orphan cleanup
 ORPHAN_CLEANUP_BATCH_SIZE = 50  # Process orphans in batches to avoid memory issues
@@ -29,39 +39,57 @@ ORPHAN_CLEANUP_API_DELAY = 0.1  # Small delay between message existence checks
 
 # Rate limit backoff settings
 RATE_LIMIT_BASE_DELAY = 5.0  # Base delay when rate limited (seconds)
-RATE_LIMIT_MAX_DELAY = 60.0  # Maximum backoff delay (seconds)
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
+    from src.services.debates.db import MirrorMessage
+    from src.services.debates.message_mirror import MessageMirror
 
 
 # =============================================================================
 # Karma Reconciliation
 # =============================================================================
 
-async def reconcile_karma(bot: "OthmanBot", days_back: int | None = 7) -> dict:
+async def reconcile_karma(
+    bot: "OthmanBot",
+    days_back: int | None = 7,
+    incremental: bool = False
+) -> dict:
     """
     Reconcile karma by scanning debate threads and comparing actual reactions
     with stored votes in the database.
 
     This catches any votes that were missed while the bot was offline.
 
+    Every reconciled thread gets a watermark (newest message ID and the
+    thread's message_count). In incremental mode, threads whose newest
+    message and message count still match a recent watermark are skipped,
+    and changed threads only fetch messages after it. Reactions added to
+    older messages while offline are caught by the next full run.
+
     Args:
         bot: The OthmanBot instance
         days_back: How many days back to scan threads (default 7), or None for ALL threads
+        incremental: Use stored watermarks to skip unchanged history
 
     Returns:
         Dict with reconciliation stats
     """
     stats = {
         "threads_scanned": 0,
+        "threads_skipped": 0,
         "messages_scanned": 0,
         "votes_added": 0,
         "votes_removed": 0,
         "reactions_fixed": 0,
         "self_reactions_removed": 0,
         "errors": 0,
+        "db_seconds": 0.0,
+        "duration_seconds": 0.0,
+        "messages_per_second": 0.0,
+        "votes_per_second": 0.0,
     }
+    started = time.perf_counter()
 
     try:
         debates_forum = bot.get_channel(DEBATES_FORUM_ID)
@@ -77,115 +105,82 @@ async def reconcile_karma(bot: "OthmanBot", days_back: int | None = 7) -> dict:
         if days_back is not None:
             cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-        # Collect all active threads
-        threads_to_scan = []
-
         # Get Open Discussion thread ID to skip it (no karma tracking)
         open_discussion_thread_id = None
         if hasattr(bot, 'open_discussion') and bot.open_discussion:
             open_discussion_thread_id = bot.open_discussion.get_thread_id()
 
-        # Active threads (skip deprecated and open discussion)
-        for thread in debates_forum.threads:
-            if thread.name.startswith("[DEPRECATED]"):
-                continue
-            # Skip Open Discussion thread (no karma tracking)
-            if open_discussion_thread_id and thread.id == open_discussion_thread_id:
-                continue
+        # Active and recently archived threads (skip deprecated and open discussion)
+        threads_to_scan = [
+            thread for thread in await collect_forum_threads(
+                debates_forum, skip_ids=(open_discussion_thread_id,)
+            )
             # If no cutoff, include all; otherwise check date
-            if cutoff_time is None or (thread.created_at and thread.created_at > cutoff_time):
-                threads_to_scan.append(thread)
-
-        # Recently archived threads (skip deprecated and open discussion)
-        async for thread in debates_forum.archived_threads(limit=DISCORD_ARCHIVED_THREADS_LIMIT):
-            if thread.name.startswith("[DEPRECATED]"):
-                continue
-            # Skip Open Discussion thread (no karma tracking)
-            if open_discussion_thread_id and thread.id == open_discussion_thread_id:
-                continue
-            # If no cutoff, include all; otherwise check date
-            if cutoff_time is None or (thread.created_at and thread.created_at > cutoff_time):
-                threads_to_scan.append(thread)
+            if cutoff_time is None or (thread.created_at and thread.created_at > cutoff_time)
+        ]
 
         logger.info("🔄 Reconciling Karma", [
             ("Threads", str(len(threads_to_scan))),
         ])
 
-        # Track consecutive rate limits for adaptive backoff
-        consecutive_rate_limits = 0
-        adaptive_delay = DISCORD_API_DELAY
+        db = bot.debates_service.db if getattr(bot, "debates_service", None) else None
+        checkpoints: dict[int, dict] = {}
+        if incremental and db:
+            checkpoints = await db.get_reconcile_checkpoints_async(RECONCILE_CHECKPOINT_MAX_AGE_HOURS)
+        new_checkpoints: list[tuple[int, int, int | None]] = []
 
+        changed_threads = []
         for thread in threads_to_scan:
-            try:
+            checkpoint = checkpoints.get(thread.id)
+            if checkpoint and _is_unchanged(thread, checkpoint):
+                stats["threads_skipped"] += 1
+            else:
+                changed_threads.append(thread)
+
+        scanner = ForumScanner("Karma Reconciliation")
+
+        async def _reconcile(thread: discord.Thread) -> dict:
+            # Counted per attempt; a 429 retry starts over with fresh counts
+            counts: Counter = Counter(threads_scanned=1)
+            checkpoint = checkpoints.get(thread.id)
+            if checkpoint:
+                # Starter reactions were fixed when the watermark was set
+                last_message_id = await _reconcile_thread(
+                    bot, thread, counts, after_id=checkpoint["last_message_id"]
+                )
+            else:
                 # Ensure starter message has vote reactions (in correct order)
-                rate_limit_delay = await _ensure_starter_reactions(thread, stats, bot)
-
-                # If rate limited, back off before continuing
+                rate_limit_delay = await _ensure_starter_reactions(thread, counts, bot)
                 if rate_limit_delay > 0:
-                    consecutive_rate_limits += 1
-                    # Exponential backoff: increase base delay
-                    adaptive_delay = min(
-                        adaptive_delay * (1.5 ** consecutive_rate_limits),
-                        RATE_LIMIT_MAX_DELAY
-                    )
-                    logger.info("Rate Limit Backoff", [
-                        ("Waiting", f"{rate_limit_delay:.1f}s"),
-                        ("Adaptive Delay", f"{adaptive_delay:.1f}s"),
-                        ("Consecutive Limits", str(consecutive_rate_limits)),
-                    ])
-                    await asyncio.sleep(rate_limit_delay + 1.0)  # Add buffer
-                else:
-                    # Reset consecutive count on success
-                    consecutive_rate_limits = max(0, consecutive_rate_limits - 1)
-                    # Gradually reduce adaptive delay back to normal
-                    adaptive_delay = max(DISCORD_API_DELAY, adaptive_delay * 0.9)
+                    scanner.backoff(rate_limit_delay)
+                last_message_id = await _reconcile_thread(bot, thread, counts, resync=not incremental)
 
-                # Reconcile karma votes
-                await _reconcile_thread(bot, thread, stats)
-                stats["threads_scanned"] += 1
+            if last_message_id:
+                new_checkpoints.append((thread.id, last_message_id, thread.message_count))
+            return counts
 
-                # Use adaptive delay between threads
-                await asyncio.sleep(adaptive_delay)
+        merge_counts(stats, await scanner.run(changed_threads, _reconcile))
+        stats["errors"] += scanner.failed
+        stats.update(scanner.get_stats())
 
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    # Rate limited at thread level - back off significantly
-                    retry_after = getattr(e, 'retry_after', RATE_LIMIT_BASE_DELAY)
-                    consecutive_rate_limits += 1
-                    adaptive_delay = min(
-                        adaptive_delay * 2,
-                        RATE_LIMIT_MAX_DELAY
-                    )
-                    logger.warning("Thread Reconciliation Rate Limited", [
-                        ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                        ("Retry After", f"{retry_after:.1f}s"),
-                        ("Consecutive Limits", str(consecutive_rate_limits)),
-                    ])
-                    await asyncio.sleep(retry_after + 2.0)
-                    stats["errors"] += 1
-                else:
-                    logger.error("Error Reconciling Thread", [
-                        ("Thread ID", str(thread.id)),
-                        ("Error", str(e)),
-                    ])
-                    stats["errors"] += 1
-            except Exception as e:
-                logger.error("Error Reconciling Thread", [
-                    ("Thread ID", str(thread.id)),
-                    ("Error", str(e)),
-                ])
-                stats["errors"] += 1
+        if db and new_checkpoints:
+            await db.save_reconcile_checkpoints_async(new_checkpoints)
 
+        _record_throughput(stats, started)
         logger.success("✅ Karma Reconciliation Complete", [
             ("Threads", str(stats['threads_scanned'])),
+            ("Unchanged (Skipped)", str(stats['threads_skipped'])),
             ("Messages", str(stats['messages_scanned'])),
             ("Added", f"+{stats['votes_added']}"),
             ("Removed", f"-{stats['votes_removed']}"),
             ("Reactions Fixed", str(stats['reactions_fixed'])),
             ("Self-Reactions Removed", str(stats['self_reactions_removed'])),
+            ("Duration", f"{stats['duration_seconds']:.1f}s (DB {stats['db_seconds']:.2f}s)"),
+            ("Throughput", f"{stats['messages_per_second']} msg/s, {stats['votes_per_second']} votes/s"),
         ])
 
     except Exception as e:
+        _record_throughput(stats, started)
         logger.error("Failed To Reconcile Karma", [
             ("Error", str(e)),
         ])
@@ -204,7 +199,7 @@ async def _ensure_starter_reactions(thread: discord.Thread, stats: dict, bot: "O
 
     Args:
         thread: Discord thread to check
-        stats: Stats dict to update
+        stats: Per-thread counts to update
         bot: Bot instance (needed to remove bot's own reactions)
 
     Returns:
@@ -270,7 +265,22 @@ async def _ensure_starter_reactions(thread: discord.Thread, stats: dict, bot: "O
     return rate_limit_delay
 
 
-async def _reconcile_thread(bot: "OthmanBot", thread: discord.Thread, stats: dict) -> None:
+def _is_unchanged(thread: discord.Thread, checkpoint: dict) -> bool:
+    """True if the thread has no messages newer than its watermark."""
+    return (
+        thread.last_message_id is not None
+        and thread.last_message_id == checkpoint["last_message_id"]
+        and thread.message_count == checkpoint["message_count"]
+    )
+
+
+async def _reconcile_thread(
+    bot: "OthmanBot",
+    thread: discord.Thread,
+    stats: dict,
+    after_id: int | None = None,
+    resync: bool = False
+) -> int | None:
     """
     Reconcile karma for a single thread.
 
@@ -279,116 +289,127 @@ async def _reconcile_thread(bot: "OthmanBot", thread: discord.Thread, stats: dic
     Args:
         bot: The OthmanBot instance
         thread: Discord thread to reconcile
-        stats: Stats dict to update
+        stats: Per-thread counts to update
+        after_id: Only scan messages newer than this ID (watermark)
+        resync: Re-read the thread's full history into the mirror if it
+            isn't live yet, instead of replaying from its watermark
+
+    Returns:
+        Newest message ID seen (the new watermark), or None if skipped
     """
     if not hasattr(bot, 'debates_service') or bot.debates_service is None:
         logger.warning("Skipping Thread Reconciliation - Debates Service Not Available", [
             ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
         ])
-        return
+        return None
 
     db = bot.debates_service.db
+    mirror = bot.debates_service.mirror
+
+    # Read the thread from the local mirror. Incremental runs replay only
+    # history after the mirror's watermark, or after the reconcile watermark
+    # when the mirror has none (it was read from the mirror, so older rows
+    # are already stored); a full run re-reads threads not yet live
+    await mirror.ensure(thread, after_id=after_id, resync=resync)
+    messages = await asyncio.to_thread(db.get_mirror_messages, thread.id, True, after_id)
+    reactions = await asyncio.to_thread(
+        db.get_mirror_reactions, thread.id, (UPVOTE_EMOJI, DOWNVOTE_EMOJI)
+    )
+
+    # Observed reaction state: message_id -> (author_id, upvoters, downvoters)
+    observed: dict[int, tuple[int, set[int], set[int]]] = {}
+    last_message_id = after_id or thread.id
+
+    for message in messages:
+        last_message_id = max(last_message_id, message.message_id)
 
-    async for message in thread.history(limit=1000):
         # Skip bot messages
-        if message.author.bot:
+        if message.is_bot:
             continue
 
         stats["messages_scanned"] += 1
-        author_id = message.author.id
-
-        # Get actual reactions from Discord
-        actual_upvoters = set()
-        actual_downvoters = set()
-
-        for reaction in message.reactions:
-            emoji_str = str(reaction.emoji)
-            # Skip reactions with 0 count (shouldn't happen but safety check)
-            if reaction.count == 0:
-                continue
-            if emoji_str == UPVOTE_EMOJI:
-                async for user in reaction.users():
-                    if user.bot:
-                        continue
-                    # Check for self-reaction and remove it
-                    if user.id == author_id:
-                        try:
-                            await reaction.remove(user)
-                            stats["self_reactions_removed"] += 1
-                            logger.info("Removed Self-Reaction (Reconciliation)", [
-                                ("User", f"{user.name} ({user.display_name})"),
-                                ("ID", str(user.id)),
-                                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                                ("Message ID", str(message.id)),
-                                ("Emoji", "⬆️"),
-                            ])
-                            await asyncio.sleep(REACTION_DELAY)
-                        except discord.HTTPException as e:
-                            logger.warning("Failed To Remove Self-Reaction", [
-                                ("Error", str(e)),
-                            ])
-                    else:
-                        actual_upvoters.add(user.id)
-            elif emoji_str == DOWNVOTE_EMOJI:
-                async for user in reaction.users():
-                    if user.bot:
-                        continue
-                    # Check for self-reaction and remove it
-                    if user.id == author_id:
-                        try:
-                            await reaction.remove(user)
-                            stats["self_reactions_removed"] += 1
-                            logger.info("Removed Self-Reaction (Reconciliation)", [
-                                ("User", f"{user.name} ({user.display_name})"),
-                                ("ID", str(user.id)),
-                                ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                                ("Message ID", str(message.id)),
-                                ("Emoji", "⬇️"),
-                            ])
-                            await asyncio.sleep(REACTION_DELAY)
-                        except discord.HTTPException as e:
-                            logger.warning("Failed To Remove Self-Reaction", [
-                                ("Error", str(e)),
-                            ])
-                    else:
-                        actual_downvoters.add(user.id)
-
-        # Get stored votes from database
-        stored_votes = db.get_message_votes(message.id)
-
-        # Find missing upvotes (in Discord but not in DB)
-        for voter_id in actual_upvoters:
-            if voter_id not in stored_votes or stored_votes[voter_id] != 1:
-                # Add missing upvote
-                if db.add_vote(voter_id, message.id, author_id, 1):
-                    stats["votes_added"] += 1
-                    logger.debug("Added Missing Upvote", [
-                        ("ID", str(voter_id)),
-                        ("Message", str(message.id)),
-                    ])
+        by_emoji = reactions.get(message.message_id, {})
+        actual_upvoters = set(by_emoji.get(UPVOTE_EMOJI, ()))
+        actual_downvoters = set(by_emoji.get(DOWNVOTE_EMOJI, ()))
+
+        for emoji, voters, label in (
+            (UPVOTE_EMOJI, actual_upvoters, "⬆️"),
+            (DOWNVOTE_EMOJI, actual_downvoters, "⬇️"),
+        ):
+            if message.author_id in voters:
+                voters.discard(message.author_id)
+                await _remove_self_reaction(mirror, thread, message, emoji, label, stats)
+
+        observed[message.message_id] = (message.author_id, actual_upvoters, actual_downvoters)
+
+    if not observed:
+        return last_message_id
+
+    # Diff against stored votes and apply the delta set in one transaction
+    db_started = time.perf_counter()
+    result = await db.reconcile_message_votes_async(observed)
+    stats["db_seconds"] += time.perf_counter() - db_started
+    stats["votes_added"] += result["votes_added"]
+    stats["votes_removed"] += result["votes_removed"]
+
+    if result["votes_added"] or result["votes_removed"]:
+        logger.debug("Thread Votes Reconciled", [
+            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ("Messages", str(len(observed))),
+            ("Added", f"+{result['votes_added']}"),
+            ("Removed", f"-{result['votes_removed']}"),
+        ])
 
-        # Find missing downvotes (in Discord but not in DB)
-        for voter_id in actual_downvoters:
-            if voter_id not in stored_votes or stored_votes[voter_id] != -1:
-                # Add missing downvote
-                if db.add_vote(voter_id, message.id, author_id, -1):
-                    stats["votes_added"] += 1
-                    logger.debug("Added Missing Downvote", [
-                        ("ID", str(voter_id)),
-                        ("Message", str(message.id)),
-                    ])
+    return last_message_id
+
+
+async def _remove_self_reaction(
+    mirror: "MessageMirror",
+    thread: discord.Thread,
+    message: "MirrorMessage",
+    emoji: str,
+    emoji_label: str,
+    stats: dict
+) -> None:
+    """
+    Remove a user's vote reaction on their own message.
+
+    Args:
+        mirror: Message mirror to update
+        thread: Thread the message is in
+        message: Mirrored message carrying the self-reaction
+        emoji: Vote emoji to remove
+        emoji_label: Emoji shown in logs
+        stats: Per-thread counts to update
+    """
+    try:
+        await thread.get_partial_message(message.message_id).remove_reaction(
+            emoji, discord.Object(id=message.author_id)
+        )
+        await mirror.record_reaction(thread.id, message.message_id, emoji, message.author_id, False)
+        stats["self_reactions_removed"] += 1
+        logger.info("Removed Self-Reaction (Reconciliation)", [
+            ("User", message.author_name),
+            ("ID", str(message.author_id)),
+            ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
+            ("Message ID", str(message.message_id)),
+            ("Emoji", emoji_label),
+        ])
+        await asyncio.sleep(REACTION_DELAY)
+    except discord.HTTPException as e:
+        logger.warning("Failed To Remove Self-Reaction", [
+            ("Error", str(e)),
+        ])
 
-        # Find stale votes (in DB but not in Discord)
-        all_actual_voters = actual_upvoters | actual_downvoters
-        for voter_id, vote_type in stored_votes.items():
-            if voter_id not in all_actual_voters:
-                # Remove stale vote
-                if db.remove_vote(voter_id, message.id):
-                    stats["votes_removed"] += 1
-                    logger.debug("Removed Stale Vote", [
-                        ("ID", str(voter_id)),
-                        ("Message", str(message.id)),
-                    ])
+
+def _record_throughput(stats: dict, started: float) -> None:
+    """Add elapsed time and messages/s, votes/s rates to the stats dict."""
+    elapsed = time.perf_counter() - started
+    stats["duration_seconds"] = round(elapsed, 2)
+    stats["db_seconds"] = round(stats["db_seconds"], 3)
+    votes_changed = stats["votes_added"] + stats["votes_removed"]
+    stats["messages_per_second"] = round(stats["messages_scanned"] / elapsed, 1) if elapsed > 0 else 0.0
+    stats["votes_per_second"] = round(votes_changed / elapsed, 1) if elapsed > 0 else 0.0
 
 
 # =============================================================================
@@ -445,61 +466,34 @@ async def cleanup_orphan_votes(bot: "OthmanBot") -> dict:
 
         # Build a set of all valid message IDs from debate threads
         valid_message_ids: set[int] = set()
-        orphan_message_ids: set[int] = set()
 
         # Collect all threads (active and archived)
-        all_threads = list(debates_forum.threads)
-        async for thread in debates_forum.archived_threads(limit=DISCORD_ARCHIVED_THREADS_LIMIT):
-            all_threads.append(thread)
+        all_threads = await collect_forum_threads(debates_forum)
 
         logger.info("📂 Scanning Threads For Valid Messages", [
             ("Thread Count", str(len(all_threads))),
         ])
 
-        # Scan each thread to collect valid message IDs (with rate limit awareness)
-        adaptive_delay = DISCORD_API_DELAY
-        consecutive_rate_limits = 0
-
-        for thread in all_threads:
-            if thread.name.startswith("[DEPRECATED]"):
-                continue
+        mirror = bot.debates_service.mirror
 
+        async def _collect_message_ids(thread: discord.Thread) -> Optional[dict]:
             try:
-                async for message in thread.history(limit=1000):
-                    if not message.author.bot:
-                        valid_message_ids.add(message.id)
-                        stats["messages_checked"] += 1
-
-                # Success - gradually reduce delay
-                consecutive_rate_limits = max(0, consecutive_rate_limits - 1)
-                adaptive_delay = max(DISCORD_API_DELAY, adaptive_delay * 0.9)
-                await asyncio.sleep(adaptive_delay)
-
+                await mirror.ensure(thread)
+                message_ids = await asyncio.to_thread(db.get_mirror_message_ids, thread.id)
+                valid_message_ids.update(message_ids)
+                return {"messages_checked": len(message_ids)}
             except discord.NotFound:
                 # Thread deleted during scan - log and track
-                stats["threads_deleted_during_scan"] = stats.get("threads_deleted_during_scan", 0) + 1
                 logger.debug("Thread Deleted During Orphan Scan", [
                     ("Thread ID", str(thread.id)),
                 ])
-                continue
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    # Rate limited - back off
-                    retry_after = getattr(e, 'retry_after', RATE_LIMIT_BASE_DELAY)
-                    consecutive_rate_limits += 1
-                    adaptive_delay = min(adaptive_delay * 2, RATE_LIMIT_MAX_DELAY)
-                    logger.warning("Orphan Scan Rate Limited", [
-                        ("Thread", thread.name[:LOG_TITLE_PREVIEW_LENGTH]),
-                        ("Retry After", f"{retry_after:.1f}s"),
-                        ("Adaptive Delay", f"{adaptive_delay:.1f}s"),
-                    ])
-                    await asyncio.sleep(retry_after + 1.0)
-                else:
-                    logger.warning("Error Scanning Thread For Messages", [
-                        ("Thread ID", str(thread.id)),
-                        ("Error", str(e)),
-                    ])
-                stats["errors"] += 1
+                return {"threads_deleted_during_scan": 1}
+
+        # Scan each thread to collect valid message IDs (rate limits handled by the scanner)
+        scanner = ForumScanner("Orphan Vote")
+        merge_counts(stats, await scanner.run(all_threads, _collect_message_ids))
+        stats["errors"] += scanner.failed
+        stats.update(scanner.get_stats())
 
         # Find orphaned message IDs (votes exist but message doesn't)
         orphan_message_ids = voted_message_ids - valid_message_ids
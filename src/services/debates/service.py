@@ -17,6 +17,11 @@ import discord
 from src.core.logger import logger
 from src.core.config import NY_TZ
 from src.services.debates.database import DebatesDatabase, UserKarma
+from src.services.debates.vote_queue import VoteIngestionQueue
+from src.services.debates.participation_flusher import ParticipationFlusher
+from src.services.debates.participation_gate import ParticipationGate
+from src.services.debates.message_mirror import MessageMirror
+from src.services.debates.analytics_engine import DebateAnalyticsEngine
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -47,8 +52,18 @@ class DebatesService:
     def __init__(self) -> None:
         """Initialize the debates service."""
         self.db = DebatesDatabase()
+        self.vote_queue = VoteIngestionQueue(self.db)
+        self.participation = ParticipationFlusher(self.db)
+        self.participation_gate = ParticipationGate(self.db)
+        self.mirror = MessageMirror(self.db)
+        self.analytics = DebateAnalyticsEngine(self.db, self.mirror)
         logger.info("Debates Service Initialized", [
             ("Database", "Connected"),
+            ("Vote Queue", "Batched"),
+            ("Participation", "Buffered"),
+            ("Participation Gate", "Indexed"),
+            ("Message Mirror", "Event-fed"),
+            ("Analytics", "Incremental"),
         ])
 
     def record_upvote(
@@ -114,12 +129,12 @@ class DebatesService:
         author_id: int
     ) -> bool:
         """
-        Async version of record_upvote with retry logic.
+        Async version of record_upvote, batched through the vote queue.
         """
         if voter_id == author_id:
             return False  # No self-voting
 
-        result = await self.db.add_vote_async(voter_id, message_id, author_id, 1)
+        result = await self.vote_queue.add_vote(voter_id, message_id, author_id, 1)
         if result:
             logger.debug("⬆️ Upvote Recorded (Async)", [
                 ("ID", str(voter_id)),
@@ -134,12 +149,12 @@ class DebatesService:
         author_id: int
     ) -> bool:
         """
-        Async version of record_downvote with retry logic.
+        Async version of record_downvote, batched through the vote queue.
         """
         if voter_id == author_id:
             return False  # No self-voting
 
-        result = await self.db.add_vote_async(voter_id, message_id, author_id, -1)
+        result = await self.vote_queue.add_vote(voter_id, message_id, author_id, -1)
         if result:
             logger.debug("⬇️ Downvote Recorded (Async)", [
                 ("ID", str(voter_id)),
@@ -171,6 +186,23 @@ class DebatesService:
             return True
         return False
 
+    async def remove_vote_async(
+        self,
+        voter_id: int,
+        message_id: int
+    ) -> bool:
+        """
+        Async version of remove_vote, batched through the vote queue.
+        """
+        author_id = await self.vote_queue.remove_vote(voter_id, message_id)
+        if author_id:
+            logger.debug("🗑️ Vote Removed (Async)", [
+                ("ID", str(voter_id)),
+                ("Message", str(message_id)),
+            ])
+            return True
+        return False
+
     def get_karma(self, user_id: int) -> UserKarma:
         """
         Get karma stats for a user.
@@ -9,14 +9,14 @@ Author: Claude Code
 Server: discord.gg/syria
 """
 
-import asyncio
 import discord
 from datetime import datetime, timezone
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from src.core.logger import logger
 from src.core.config import DEBATES_FORUM_ID, NY_TZ, LOG_TITLE_PREVIEW_LENGTH
 from src.utils import edit_thread_with_retry
+from src.services.debates.forum_scanner import ForumScanner, merge_counts
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -30,7 +30,7 @@ STALE_DAYS_THRESHOLD: int = 14
 """Days of inactivity before a thread is considered stale."""
 
 RATE_LIMIT_DELAY: float = 1.0
-"""Delay between thread operations to avoid rate limits (seconds)."""
+"""Delay each scanner slot takes between thread operations (seconds)."""
 
 
 # =============================================================================
@@ -94,9 +94,8 @@ class StaleArchiveManager:
                 "errors": 0,
             }
 
-            archived_threads: List[str] = []
-
-            # Process only active (non-archived) threads
+            # Filter active (non-archived) threads up front
+            candidates: List[discord.Thread] = []
             for thread in debates_forum.threads:
                 if thread is None:
                     continue
@@ -120,44 +119,40 @@ class StaleArchiveManager:
                     stats["threads_skipped_closed"] += 1
                     continue
 
-                try:
-                    # Check days since last activity
-                    days_inactive = await self._get_days_since_last_message(thread)
-
-                    if days_inactive >= STALE_DAYS_THRESHOLD:
-                        # Archive the thread
-                        await self._archive_stale_thread(thread, days_inactive)
-                        stats["threads_archived"] += 1
-                        archived_threads.append(f"{thread_preview} ({days_inactive:.0f}d)")
-
-                        logger.tree("Stale Thread Archived", [
-                            ("Thread", thread_preview),
-                            ("Thread ID", str(thread.id)),
-                            ("Days Inactive", f"{days_inactive:.0f}"),
-                        ], emoji="🗄️")
-                    else:
-                        stats["threads_skipped_active"] += 1
-                        logger.debug("Thread Still Active", [
-                            ("Thread", thread_preview),
-                            ("Days Inactive", f"{days_inactive:.1f}"),
-                            ("Threshold", f"{STALE_DAYS_THRESHOLD}"),
-                        ])
-
-                    await asyncio.sleep(RATE_LIMIT_DELAY)
-
-                except discord.HTTPException as e:
-                    stats["errors"] += 1
-                    logger.warning("Error Processing Thread", [
-                        ("Thread", thread_preview),
-                        ("Error", str(e)[:50]),
-                    ])
-                except Exception as e:
-                    stats["errors"] += 1
-                    logger.tree("Unexpected Error Processing Thread", [
+                candidates.append(thread)
+
+            async def _check_thread(thread: discord.Thread) -> tuple[dict, Optional[str]]:
+                # Returns (counts, archived preview); merged once the scan finishes
+                thread_preview = thread.name[:LOG_TITLE_PREVIEW_LENGTH]
+
+                # Check days since last activity
+                days_inactive = await self._get_days_since_last_message(thread)
+
+                if days_inactive >= STALE_DAYS_THRESHOLD:
+                    # Archive the thread
+                    await self._archive_stale_thread(thread, days_inactive)
+
+                    logger.tree("Stale Thread Archived", [
                         ("Thread", thread_preview),
-                        ("Error", str(e)[:50]),
-                        ("Type", type(e).__name__),
-                    ], emoji="❌")
+                        ("Thread ID", str(thread.id)),
+                        ("Days Inactive", f"{days_inactive:.0f}"),
+                    ], emoji="🗄️")
+                    return {"threads_archived": 1}, f"{thread_preview} ({days_inactive:.0f}d)"
+
+                logger.debug("Thread Still Active", [
+                    ("Thread", thread_preview),
+                    ("Days Inactive", f"{days_inactive:.1f}"),
+                    ("Threshold", f"{STALE_DAYS_THRESHOLD}"),
+                ])
+                return {"threads_skipped_active": 1}, None
+
+            # Check and archive concurrently (scanner handles 429 backoff)
+            scanner = ForumScanner("Stale Archive", delay=RATE_LIMIT_DELAY)
+            checked = [entry for entry in await scanner.run(candidates, _check_thread) if entry]
+            merge_counts(stats, (counts for counts, _ in checked))
+            archived_threads: List[str] = [preview for _, preview in checked if preview]
+            stats["errors"] += scanner.failed
+            stats.update(scanner.get_stats())
 
             # Log archived threads summary
             if archived_threads:
@@ -8,15 +8,12 @@ Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
-import asyncio
 import json
-import os
 from typing import List
 
-from openai import OpenAI
-
 from src.core.logger import logger
 from src.core.config import DEBATE_TAGS
+from src.services.llm_gateway import llm_gateway
 
 # Tag descriptions for AI classification
 TAG_DESCRIPTIONS = {
@@ -45,21 +42,18 @@ async def detect_debate_tags(title: str, description: str = "") -> List[int]:
         List of Discord tag IDs (1-2 tags maximum)
 
     DESIGN:
-    - Uses OpenAI to analyze the debate content
+    - Uses OpenAI (via the shared LLM gateway) to analyze the debate content
     - Returns 1-2 most relevant tags
     - Never includes "hot" tag (that's added dynamically based on activity)
     """
     try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not llm_gateway.available:
             logger.error("OPENAI_API_KEY Not Found", [
                 ("Feature", "Tag detection"),
                 ("Action", "Returning empty tags"),
             ])
             return []
 
-        client = OpenAI(api_key=api_key, timeout=30.0)
-
         # Build the tag options for the AI
         tag_options = "\n".join([
             f"- {name}: {desc}"
@@ -87,26 +81,18 @@ Instructions:
 
 Tags:"""
 
-        # Run OpenAI call in thread pool to avoid blocking the event loop
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a debate topic classifier. Return only tag names, comma-separated, no explanation."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+        response = await llm_gateway.complete(
+            system_prompt="You are a debate topic classifier. Return only tag names, comma-separated, no explanation.",
+            user_prompt=prompt,
             max_tokens=50,
-            temperature=0.3
+            temperature=0.3,
+            feature="debates",
         )
+        if not response:
+            return []
 
         # Parse the response
-        tag_names_str = response.choices[0].message.content.strip().lower()
+        tag_names_str = response.strip().lower()
         tag_names = [name.strip() for name in tag_names_str.split(",")]
 
         # Convert tag names to Discord tag IDs
@@ -175,32 +161,28 @@ async def is_religion_debate(title: str, description: str = "") -> bool:
     - Returns False on errors (fail-open)
     """
     try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not llm_gateway.available:
             logger.error("OPENAI_API_KEY Not Found", [
                 ("Feature", "Religion detection"),
                 ("Action", "Allowing debate (fail-open)"),
             ])
             return False
 
-        client = OpenAI(api_key=api_key, timeout=30.0)
-
         content = f"Title: {title}"
         if description:
             content += f"\nDescription: {description[:500]}"
 
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": RELIGION_DETECTION_PROMPT},
-                {"role": "user", "content": f"Debate topic:\n{content}"}
-            ],
+        response = await llm_gateway.complete(
+            system_prompt=RELIGION_DETECTION_PROMPT,
+            user_prompt=f"Debate topic:\n{content}",
             max_tokens=100,
-            temperature=0.1
+            temperature=0.1,
+            feature="debates",
         )
+        if not response:
+            return False
 
-        response_text = response.choices[0].message.content.strip()
+        response_text = response.strip()
 
         # Parse JSON response
         try:
@@ -0,0 +1,293 @@
+"""
+OthmanBot - Vote Ingestion Queue
+================================
+
+Batched, write-coalescing vote pipeline for reaction events.
+Collects vote adds/removes over a short window and applies them
+in one database transaction.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from src.core.logger import logger
+from src.core.config import (
+    VOTE_BATCH_WINDOW,
+    VOTE_BATCH_MAX_SIZE,
+    VOTE_BATCH_MAX_RETRIES,
+)
+
+if TYPE_CHECKING:
+    from src.services.debates.db import DebatesDatabase
+
+
+# =============================================================================
+# Batch Metrics
+# =============================================================================
+
+@dataclass
+class VoteBatchMetrics:
+    """Running counters for applied vote batches."""
+    batches: int = 0
+    events: int = 0
+    coalesced: int = 0
+    failed_batches: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+    last_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def record(self, size: int, keys: int, latency_ms: float, wait_ms: float) -> None:
+        """Record one applied batch."""
+        self.batches += 1
+        self.events += size
+        self.coalesced += size - keys
+        self.last_batch_size = size
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.total_latency_ms += latency_ms
+        self.last_wait_ms = wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def to_dict(self) -> dict:
+        """Return metrics as a plain dict (for logging and the stats API)."""
+        avg_latency = self.total_latency_ms / self.batches if self.batches else 0.0
+        avg_size = self.events / self.batches if self.batches else 0.0
+        return {
+            "batches": self.batches,
+            "events": self.events,
+            "coalesced": self.coalesced,
+            "failed_batches": self.failed_batches,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "avg_batch_size": round(avg_size, 1),
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "avg_latency_ms": round(avg_latency, 1),
+            "last_wait_ms": round(self.last_wait_ms, 1),
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
+
+
+# =============================================================================
+# Vote Ingestion Queue
+# =============================================================================
+
+class VoteIngestionQueue:
+    """
+    Async queue that batches vote writes.
+
+    DESIGN: Reaction handlers await a future per event instead of a thread
+    hop + lock + transaction each. The worker drains the queue for up to
+    VOTE_BATCH_WINDOW seconds (or VOTE_BATCH_MAX_SIZE events) and hands the
+    whole batch to DebatesDatabase.apply_vote_batch, which writes only the
+    net change per (voter, message) in one BEGIN IMMEDIATE transaction.
+    A reaction burst therefore costs one commit instead of hundreds.
+    """
+
+    def __init__(
+        self,
+        db: "DebatesDatabase",
+        window: float = VOTE_BATCH_WINDOW,
+        max_batch_size: int = VOTE_BATCH_MAX_SIZE,
+        max_retries: int = VOTE_BATCH_MAX_RETRIES,
+    ) -> None:
+        """
+        Initialize the vote queue.
+
+        Args:
+            db: Debates database to write to
+            window: Seconds to collect events after the first one arrives
+            max_batch_size: Flush early once this many events are queued
+            max_retries: Attempts per batch on database lock errors
+        """
+        self._db = db
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._max_retries = max_retries
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.metrics = VoteBatchMetrics()
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def add_vote(
+        self,
+        voter_id: int,
+        message_id: int,
+        author_id: int,
+        vote_type: int
+    ) -> bool:
+        """Queue a vote and wait for its batch to commit. Returns add_vote's result."""
+        return await self._submit((voter_id, message_id, author_id, vote_type))
+
+    async def remove_vote(self, voter_id: int, message_id: int) -> Optional[int]:
+        """Queue a vote removal and wait for its batch to commit. Returns author_id if removed."""
+        return await self._submit((voter_id, message_id, None, 0))
+
+    def get_stats(self) -> dict:
+        """Get batch metrics plus current queue depth."""
+        stats = self.metrics.to_dict()
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    async def stop(self) -> None:
+        """Flush every queued vote and stop the worker."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._task and not self._task.done():
+            # Sentinel lets the worker finish its in-flight batch cleanly
+            await self._queue.put(None)
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        # Anything still queued (worker never started, or raced the sentinel)
+        remaining = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                remaining.append(item)
+        for start in range(0, len(remaining), self._max_batch_size):
+            await self._apply(remaining[start:start + self._max_batch_size])
+
+        logger.tree("Vote Queue Flushed", [
+            ("Batches", str(self.metrics.batches)),
+            ("Events", str(self.metrics.events)),
+            ("Coalesced", str(self.metrics.coalesced)),
+            ("Avg Latency", f"{self.metrics.to_dict()['avg_latency_ms']}ms"),
+        ], emoji="🗳️")
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _submit(self, event: tuple) -> object:
+        """Enqueue an event and wait for its result."""
+        if self._closed:
+            # Late events during shutdown go straight to the database
+            results = await asyncio.to_thread(self._db.apply_vote_batch, [event])
+            return results[0]
+
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, future, time.perf_counter()))
+        return await future
+
+    def _ensure_started(self) -> None:
+        """Start the worker on first use (needs a running loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+            self._task.add_done_callback(self._handle_task_exception)
+
+    def _handle_task_exception(self, task: asyncio.Task) -> None:
+        """Handle exceptions from the worker task."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.tree("Vote Queue Task Exception", [
+                ("Error Type", type(exc).__name__),
+                ("Error", str(exc)[:100]),
+            ], emoji="❌")
+
+    async def _worker(self) -> None:
+        """Collect events into windows and apply each window as one batch."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            stop_after = False
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop_after = True
+                    break
+                batch.append(item)
+
+            await self._apply(batch)
+            if stop_after:
+                return
+
+    async def _apply(self, batch: list) -> None:
+        """Write a batch with retry and resolve every waiting future."""
+        events = [event for event, _, _ in batch]
+        oldest = min(enqueued_at for _, _, enqueued_at in batch)
+        started = time.perf_counter()
+
+        results = None
+        for attempt in range(self._max_retries):
+            try:
+                results = await asyncio.to_thread(self._db.apply_vote_batch, events)
+                break
+            except sqlite3.OperationalError:
+                if attempt < self._max_retries - 1:
+                    delay = 0.1 * (2 ** attempt)
+                    logger.debug("Vote Batch Retry (DB Locked)", [
+                        ("Events", str(len(events))),
+                        ("Attempt", f"{attempt + 1}/{self._max_retries}"),
+                        ("Delay", f"{delay:.1f}s"),
+                    ])
+                    await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("Vote Batch Failed", [
+                    ("Events", str(len(events))),
+                    ("Error Type", type(e).__name__),
+                    ("Error", str(e)[:100]),
+                ])
+                break
+
+        finished = time.perf_counter()
+        if results is None:
+            self.metrics.failed_batches += 1
+            logger.warning("Vote Batch Failed After Retries", [
+                ("Events", str(len(events))),
+                ("Attempts", str(self._max_retries)),
+            ])
+            # Same fallbacks add_vote_async / remove_vote would surface
+            results = [None if vote_type == 0 else False for _, _, _, vote_type in events]
+        else:
+            keys = len({(voter_id, message_id) for voter_id, message_id, _, _ in events})
+            self.metrics.record(
+                size=len(events),
+                keys=keys,
+                latency_ms=(finished - started) * 1000,
+                wait_ms=(finished - oldest) * 1000,
+            )
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["VoteIngestionQueue", "VoteBatchMetrics"]
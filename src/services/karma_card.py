@@ -2,18 +2,33 @@
 OthmanBot - Karma Card Generator
 ================================
 
-HTML/CSS based karma card rendered with Playwright for professional quality.
-Optimized with page pooling and caching for fast generation.
+HTML/CSS based karma card rendered with Playwright for professional quality,
+or drawn in-process by the Pillow renderer in karma_card_image.py
+(KARMA_CARD_RENDERER). Optimized with page pooling, a persistent
+content-addressed image cache and prefetched avatar/banner assets.
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
+import asyncio
+import base64
 import time
+from collections import OrderedDict, deque
 from typing import Optional
 
+import aiohttp
+
 from src.core.logger import logger
-from src.services.playwright_pool import get_page, return_page, get_render_semaphore
+from src.core.config import (
+    KARMA_CARD_ASSET_CACHE_ENTRIES,
+    KARMA_CARD_ASSET_TIMEOUT,
+    KARMA_CARD_LATENCY_SAMPLES,
+    KARMA_CARD_RENDERER,
+)
+from src.caches import card_image_cache
+from src.services import playwright_pool
+from src.services.playwright_pool import get_page, return_page, discard_page, get_render_semaphore
 
 
 # =============================================================================
@@ -33,9 +48,14 @@ STATUS_COLORS = {
     "streaming": "#9146ff",
 }
 
-# Card cache: {cache_key: (bytes, timestamp)}
-_card_cache: dict = {}
-_CACHE_TTL = 30  # Cache cards for 30 seconds
+# Avatar/banner bytes: {url: (content_type, bytes)} (Discord asset URLs are content-hashed)
+_asset_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+
+# Recent latencies in ms, for p50/p99
+_render_latencies: deque = deque(maxlen=KARMA_CARD_LATENCY_SAMPLES)
+_request_latencies: deque = deque(maxlen=KARMA_CARD_LATENCY_SAMPLES)
+_render_count: int = 0
+_asset_fetch_failures: int = 0
 
 
 # =============================================================================
@@ -439,6 +459,106 @@ def _generate_html(
     return html
 
 
+# =============================================================================
+# Asset Prefetch
+# =============================================================================
+
+async def _fetch_asset(session: aiohttp.ClientSession, url: str) -> None:
+    """Download an image into the asset cache (failures are logged and skipped)."""
+    global _asset_fetch_failures
+
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history, status=response.status
+                )
+            content_type = response.headers.get("Content-Type", "image/png").split(";")[0]
+            data = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _asset_fetch_failures += 1
+        logger.debug("Karma Card Asset Fetch Failed", [
+            ("URL", url[:50]),
+            ("Error", str(e)[:100]),
+        ])
+        return
+
+    _asset_cache[url] = (content_type, data)
+    while len(_asset_cache) > KARMA_CARD_ASSET_CACHE_ENTRIES:
+        _asset_cache.popitem(last=False)
+
+
+async def _prefetch_assets(*urls: Optional[str]) -> dict[str, tuple[str, bytes]]:
+    """
+    Fetch avatar/banner bytes once so rendering never waits on the network.
+
+    Returns:
+        url -> (content type, bytes) for every URL that could be fetched
+    """
+    missing = [url for url in urls if url and url not in _asset_cache]
+    if missing:
+        timeout = aiohttp.ClientTimeout(total=KARMA_CARD_ASSET_TIMEOUT)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            await asyncio.gather(*(_fetch_asset(session, url) for url in missing))
+
+    assets = {}
+    for url in urls:
+        if url and url in _asset_cache:
+            _asset_cache.move_to_end(url)
+            assets[url] = _asset_cache[url]
+    return assets
+
+
+def _data_uri(url: Optional[str], assets: dict[str, tuple[str, bytes]]) -> Optional[str]:
+    """Inline a fetched asset, or keep the URL if the fetch failed."""
+    if not url or url not in assets:
+        return url
+    content_type, data = assets[url]
+    return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+# =============================================================================
+# Render Metrics
+# =============================================================================
+
+def _percentile(samples: deque, fraction: float) -> float:
+    """Nearest-rank percentile of recent samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return round(ordered[index], 1)
+
+
+def get_render_stats() -> dict:
+    """Render/request latency percentiles plus cache and pool state."""
+    return {
+        "renders": _render_count,
+        "render_p50_ms": _percentile(_render_latencies, 0.50),
+        "render_p99_ms": _percentile(_render_latencies, 0.99),
+        "request_p50_ms": _percentile(_request_latencies, 0.50),
+        "request_p99_ms": _percentile(_request_latencies, 0.99),
+        "asset_cache_entries": len(_asset_cache),
+        "asset_fetch_failures": _asset_fetch_failures,
+        "cache": card_image_cache.get_stats(),
+        "pool": playwright_pool.get_pool_stats(),
+    }
+
+
+async def prewarm_karma_renderer() -> None:
+    """Get the configured renderer ready before a render needs it."""
+    try:
+        if KARMA_CARD_RENDERER == "pillow":
+            from src.services.karma_card_image import warm_up
+            await asyncio.to_thread(warm_up)
+        else:
+            await playwright_pool.prewarm()
+    except Exception as e:
+        logger.debug("Karma Card Prewarm Failed", [
+            ("Error", str(e)[:100]),
+        ])
+
+
 # =============================================================================
 # Card Generation
 # =============================================================================
@@ -455,7 +575,8 @@ async def generate_karma_card(
     banner_url: Optional[str] = None,
 ) -> bytes:
     """
-    Generate karma card using Playwright with caching and page pooling.
+    Generate karma card with caching, using the configured renderer
+    (Playwright with page pooling, or the in-process Pillow renderer).
 
     Args:
         username: Discord username
@@ -471,54 +592,116 @@ async def generate_karma_card(
     Returns:
         PNG image bytes
     """
-    global _card_cache
-
-    # Create cache key from data that affects appearance
-    cache_key = (
-        username, display_name, karma, rank, upvotes, downvotes,
-        status, avatar_url[:50] if avatar_url else ""
+    global _render_count
+
+    started = time.perf_counter()
+    if KARMA_CARD_RENDERER != "pillow":
+        playwright_pool.note_demand()
+
+    card_name = display_name[:16] + "..." if len(display_name) > 16 else display_name
+    fields = dict(
+        display_name=card_name,
+        username=username,
+        karma=karma,
+        rank=rank,
+        upvotes=upvotes,
+        downvotes=downvotes,
+        status=status,
     )
 
-    # Check cache
-    now = time.time()
-    if cache_key in _card_cache:
-        cached_bytes, cached_time = _card_cache[cache_key]
-        if now - cached_time < _CACHE_TTL:
-            logger.tree("Karma Card Cache Hit", [
-                ("User", display_name),
-            ], emoji="⚡")
-            return cached_bytes
+    # Content-addressed key: the template rendered with the asset URLs
+    # (Discord asset URLs change whenever the image does)
+    cache_key = card_image_cache.make_key(
+        KARMA_CARD_RENDERER,
+        _generate_html(avatar_url=avatar_url, banner_url=banner_url, **fields),
+    )
+    cached = await card_image_cache.get(cache_key)
+    if cached is not None:
+        _request_latencies.append((time.perf_counter() - started) * 1000)
+        logger.tree("Karma Card Cache Hit", [
+            ("User", display_name),
+        ], emoji="⚡")
+        return cached
+
+    # Fetch avatar/banner before taking a render slot
+    assets = await _prefetch_assets(avatar_url, banner_url)
+
+    render_started = time.perf_counter()
+    try:
+        if KARMA_CARD_RENDERER == "pillow":
+            screenshot = await _render_with_pillow(fields, avatar_url, banner_url, assets)
+        else:
+            html = _generate_html(
+                avatar_url=_data_uri(avatar_url, assets),
+                banner_url=_data_uri(banner_url, assets),
+                **fields,
+            )
+            screenshot = await _render_with_playwright(html, display_name)
+    except Exception as e:
+        logger.error("Karma Card Failed", [
+            ("User", display_name),
+            ("Renderer", KARMA_CARD_RENDERER),
+            ("Error", str(e)[:100]),
+        ])
+        raise
+
+    render_ms = (time.perf_counter() - render_started) * 1000
+    _render_latencies.append(render_ms)
+    _render_count += 1
+
+    # Cache the result
+    await card_image_cache.put(cache_key, screenshot)
+    _request_latencies.append((time.perf_counter() - started) * 1000)
+
+    logger.tree("Karma Card Generated", [
+        ("User", display_name),
+        ("Karma", str(karma)),
+        ("Rank", f"#{rank}"),
+        ("Render", f"{render_ms:.0f}ms"),
+    ], emoji="🎨")
+
+    return screenshot
+
+
+async def _render_with_pillow(
+    fields: dict,
+    avatar_url: Optional[str],
+    banner_url: Optional[str],
+    assets: dict[str, tuple[str, bytes]],
+) -> bytes:
+    """
+    Draw the card in-process with the Pillow renderer (in a worker thread).
 
-    # Clean old cache entries periodically
-    if len(_card_cache) > 100:
-        _card_cache.clear()
+    Shares the render semaphore, which bounds CPU use and keeps the
+    renderer's image caches to one thread at a time.
+    """
+    from src.services.karma_card_image import render_karma_card_image
 
+    avatar = assets.get(avatar_url) if avatar_url else None
+    banner = assets.get(banner_url) if banner_url else None
+    async with get_render_semaphore():
+        return await asyncio.to_thread(
+            render_karma_card_image,
+            avatar_url=avatar_url,
+            avatar_data=avatar[1] if avatar else None,
+            banner_url=banner_url,
+            banner_data=banner[1] if banner else None,
+            **fields,
+        )
+
+
+async def _render_with_playwright(html: str, display_name: str) -> bytes:
+    """Rasterize the HTML card in a pooled Chromium page."""
     # Use semaphore to limit concurrent renders
     async with get_render_semaphore():
-        page = None
+        page = await get_page()
         try:
-            page = await get_page()
-
-            # Clear page before each render
-            await page.goto('about:blank')
-
             # Set viewport size for karma card (matching SyriaBot/JawdatBot)
             await page.set_viewport_size({'width': 960, 'height': 300})
 
-            # Generate HTML
-            html = _generate_html(
-                display_name=display_name[:16] + "..." if len(display_name) > 16 else display_name,
-                username=username,
-                avatar_url=avatar_url,
-                karma=karma,
-                rank=rank,
-                upvotes=upvotes,
-                downvotes=downvotes,
-                status=status,
-                banner_url=banner_url,
-            )
-
-            await page.set_content(html, wait_until='networkidle')
+            # Assets are inline; only the web font may hit the network (cached per context)
+            await page.set_content(html, wait_until='load')
+            await page.evaluate('() => document.fonts.ready.then(() => true)')
 
             # Wait for avatar with short timeout
             try:
@@ -547,37 +730,22 @@ async def generate_karma_card(
 
             # Screenshot
             screenshot = await page.screenshot(type='png', omit_background=True)
-
-            # Return page to pool
-            await return_page(page)
-            page = None
-
-            # Cache the result
-            _card_cache[cache_key] = (screenshot, now)
-
-            logger.tree("Karma Card Generated", [
-                ("User", display_name),
-                ("Karma", str(karma)),
-                ("Rank", f"#{rank}"),
-            ], emoji="🎨")
-
-            return screenshot
-
-        except Exception as e:
-            logger.error("Karma Card Failed", [
-                ("User", display_name),
-                ("Error", str(e)[:100]),
-            ])
-            if page:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
+        except Exception:
+            await discard_page(page)
             raise
 
+    # Return page to pool
+    await return_page(page)
+    return screenshot
+
 
 # =============================================================================
 # Module Export
 # =============================================================================
 
-__all__ = ["generate_karma_card", "get_tier"]
+__all__ = [
+    "generate_karma_card",
+    "get_tier",
+    "get_render_stats",
+    "prewarm_karma_renderer",
+]
@@ -0,0 +1,763 @@
+"""
+OthmanBot - Karma Card Image Renderer
+=====================================
+
+Pure-Python (Pillow) renderer for the karma card. Draws the same layout
+as the HTML template in karma_card.py without a headless browser.
+Arabic is shaped and laid out right to left, and characters the main
+font lacks fall back per glyph to the Arabic/emoji fonts.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import io
+import math
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageOps, features
+
+try:
+    from arabic_reshaper import ArabicReshaper
+    from bidi.algorithm import get_display
+    # Keep harakat (the browser draws them too)
+    reshape_arabic = ArabicReshaper(configuration={"delete_harakat": False}).reshape
+except ImportError:
+    reshape_arabic = get_display = None
+
+from src.core.config import KARMA_CARD_FONT_DIR, KARMA_CARD_ASSET_CACHE_ENTRIES
+from src.services.karma_card import COLOR_GREEN, COLOR_GOLD, STATUS_COLORS, get_tier
+
+
+# =============================================================================
+# Layout (pixel values from the HTML template's CSS)
+# =============================================================================
+
+# Canvas matches the Playwright viewport/screenshot
+CANVAS_SIZE = (960, 300)
+
+# .card-wrapper (3px gradient border) centered in the viewport
+WRAPPER_SIZE = (940, 286)
+WRAPPER_POS = ((960 - 940) // 2, (300 - 286) // 2)
+WRAPPER_RADIUS = 20
+
+# .card inside the wrapper
+CARD_SIZE = (934, 280)
+CARD_POS = (WRAPPER_POS[0] + 3, WRAPPER_POS[1] + 3)
+CARD_RADIUS = 21
+
+# .card-content padding and gap
+PAD_X, PAD_Y, CONTENT_GAP = 40, 32, 36
+CONTENT_HEIGHT = CARD_SIZE[1] - 2 * PAD_Y
+
+# .avatar-wrapper
+AVATAR_SIZE = 180
+AVATAR_POS = (CARD_POS[0] + PAD_X, CARD_POS[1] + PAD_Y + (CONTENT_HEIGHT - AVATAR_SIZE) // 2)
+RING_WIDTH = 6
+STATUS_DOT_SIZE = 44
+STATUS_DOT_BORDER = 8
+
+# .info-section
+INFO_LEFT = CARD_POS[0] + PAD_X + AVATAR_SIZE + CONTENT_GAP
+INFO_RIGHT = CARD_POS[0] + CARD_SIZE[0] - PAD_X
+INFO_WIDTH = INFO_RIGHT - INFO_LEFT
+NAME_LINE, USERNAME_LINE, NAMES_GAP = 44, 19, 2
+BADGE_HEIGHT, BADGE_MIN_WIDTH, BADGE_PAD_X, BADGE_GAP, BADGE_RADIUS = 56, 72, 16, 8, 12
+TOP_ROW_HEIGHT = max(NAME_LINE + NAMES_GAP + USERNAME_LINE, BADGE_HEIGHT)
+STATS_HEIGHT, STATS_PAD_X, STATS_PAD_Y, STATS_GAP, STATS_RADIUS = 84, 24, 16, 24, 14
+STAT_VALUE_LINE, STAT_LABEL_LINE, STAT_LABEL_GAP = 31, 15, 4
+INFO_TOP = CARD_POS[1] + PAD_Y + (CONTENT_HEIGHT - (TOP_ROW_HEIGHT + 16 + STATS_HEIGHT)) // 2
+STATS_TOP = INFO_TOP + TOP_ROW_HEIGHT + 16
+
+# Supersampling factor for anti-aliased shapes
+AA = 4
+
+WHITE = (255, 255, 255, 255)
+
+
+# =============================================================================
+# Colors & Gradients
+# =============================================================================
+
+def _rgba(color: str, alpha: float = 1.0) -> tuple[int, int, int, int]:
+    """Parse #rrggbb (or #rrggbbaa) into an RGBA tuple."""
+    color = color.lstrip("#")
+    r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    a = int(color[6:8], 16) / 255 if len(color) == 8 else 1.0
+    return (r, g, b, round(255 * a * alpha))
+
+
+def _lut(stops: list[tuple[float, tuple[int, int, int, int]]]) -> list[int]:
+    """Build a 4-channel point() table for a multi-stop gradient."""
+    channels: list[list[int]] = [[], [], [], []]
+    for i in range(256):
+        t = i / 255
+        for (t0, c0), (t1, c1) in zip(stops, stops[1:]):
+            if t <= t1 or (t1, c1) == stops[-1]:
+                f = 0.0 if t1 == t0 else min(1.0, max(0.0, (t - t0) / (t1 - t0)))
+                for ch in range(4):
+                    channels[ch].append(round(c0[ch] + (c1[ch] - c0[ch]) * f))
+                break
+    return channels[0] + channels[1] + channels[2] + channels[3]
+
+
+def _linear_gradient(
+    size: tuple[int, int],
+    angle: float,
+    colors: list[tuple[int, int, int, int]],
+) -> Image.Image:
+    """
+    Render a CSS linear-gradient(angle, colors...) with evenly spaced stops.
+
+    Uses the CSS gradient-line length so corners hit the first and last stop.
+    """
+    w, h = size
+    rad = math.radians(angle)
+    dx, dy = math.sin(rad), -math.cos(rad)
+    length = abs(w * dx) + abs(h * dy) or 1.0
+    t_map = Image.new("L", size)
+    t_map.putdata([
+        max(0, min(255, round((((x + 0.5 - w / 2) * dx + (y + 0.5 - h / 2) * dy) / length + 0.5) * 255)))
+        for y in range(h) for x in range(w)
+    ])
+    stops = [(i / (len(colors) - 1), color) for i, color in enumerate(colors)]
+    table = _lut(stops)
+    bands = [t_map.point(table[i * 256:(i + 1) * 256]) for i in range(4)]
+    return Image.merge("RGBA", bands)
+
+
+# =============================================================================
+# Shapes
+# =============================================================================
+
+@lru_cache(maxsize=64)
+def _rounded_mask(size: tuple[int, int], radius: int) -> Image.Image:
+    """Anti-aliased rounded-rectangle mask."""
+    w, h = size
+    big = Image.new("L", (w * AA, h * AA), 0)
+    ImageDraw.Draw(big).rounded_rectangle((0, 0, w * AA - 1, h * AA - 1), radius * AA, fill=255)
+    return big.resize(size, Image.LANCZOS)
+
+
+@lru_cache(maxsize=16)
+def _circle_mask(diameter: int) -> Image.Image:
+    """Anti-aliased circle mask."""
+    big = Image.new("L", (diameter * AA, diameter * AA), 0)
+    ImageDraw.Draw(big).ellipse((0, 0, diameter * AA - 1, diameter * AA - 1), fill=255)
+    return big.resize((diameter, diameter), Image.LANCZOS)
+
+
+@lru_cache(maxsize=16)
+def _ring_mask(diameter: int, width: int) -> Image.Image:
+    """Anti-aliased ring (circle border) mask."""
+    big = Image.new("L", (diameter * AA, diameter * AA), 0)
+    ImageDraw.Draw(big).ellipse(
+        (0, 0, diameter * AA - 1, diameter * AA - 1), outline=255, width=width * AA
+    )
+    return big.resize((diameter, diameter), Image.LANCZOS)
+
+
+def _shadow(
+    size: tuple[int, int],
+    shape: Image.Image,
+    pos: tuple[int, int],
+    color: tuple[int, int, int, int],
+    sigma: float,
+) -> Image.Image:
+    """
+    A blurred, colored copy of a mask placed on a transparent layer.
+
+    CSS box-shadow blur B is a Gaussian with sigma B/2; filter: blur(R) has sigma R.
+    """
+    alpha = Image.new("L", size, 0)
+    alpha.paste(shape, pos)
+    if sigma:
+        alpha = alpha.filter(ImageFilter.GaussianBlur(sigma))
+    layer = Image.new("RGBA", size, color[:3] + (0,))
+    layer.putalpha(alpha.point(lambda v: v * color[3] // 255))
+    return layer
+
+
+def _fill(size: tuple[int, int], color: tuple[int, int, int, int]) -> Image.Image:
+    """Solid color layer."""
+    return Image.new("RGBA", size, color)
+
+
+def _masked(layer: Image.Image, mask: Image.Image) -> Image.Image:
+    """Clip a layer to a mask (multiplying existing alpha)."""
+    alpha = Image.composite(layer.getchannel("A"), Image.new("L", layer.size, 0), mask)
+    clipped = layer.copy()
+    clipped.putalpha(alpha)
+    return clipped
+
+
+# =============================================================================
+# Fonts
+# =============================================================================
+
+# CSS font-weight -> Inter static font file suffix
+_WEIGHT_NAMES = {500: "Medium", 600: "SemiBold", 700: "Bold", 800: "ExtraBold", 900: "Black"}
+
+# Per-glyph fallbacks in KARMA_CARD_FONT_DIR, tried in order for characters
+# the primary font lacks. DejaVu is shipped and covers Arabic, most symbols
+# and some emoji; the others are used when dropped into the directory
+# (Twemoji.Mozilla is COLRv0, so its emoji draw in color).
+_FALLBACK_CHAIN = (
+    "NotoSansArabic-Bold.ttf",
+    "Twemoji.Mozilla.ttf",
+    "NotoEmoji-Bold.ttf",
+    "DejaVuSans-Bold.ttf",
+)
+
+# System fallbacks when neither Inter nor the shipped font can be loaded
+_SYSTEM_FONTS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf",
+    "/Library/Fonts/Arial Bold.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+)
+
+# Characters that stay in the current run's font (marks, joiners, variation selectors)
+_JOINING_CATEGORIES = frozenset(("Mn", "Me", "Cf"))
+
+# Raqm shapes and reorders each run itself; without it Arabic is reshaped
+# to presentation forms and put in visual order before layout
+_RAQM = features.check("raqm")
+
+
+@lru_cache(maxsize=32)
+def _font(weight: int, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load (once) the font for a CSS weight and pixel size.
+
+    FreeType keeps rendered glyphs per font object, so caching the object
+    also caches the glyphs across renders.
+    """
+    candidates = [KARMA_CARD_FONT_DIR / f"Inter-{_WEIGHT_NAMES.get(weight, 'Bold')}.ttf"]
+    candidates += [KARMA_CARD_FONT_DIR / "Inter-Bold.ttf", KARMA_CARD_FONT_DIR / "DejaVuSans-Bold.ttf"]
+    for path in [*candidates, *_SYSTEM_FONTS]:
+        try:
+            return ImageFont.truetype(str(path), size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=32)
+def _font_chain(font: ImageFont.FreeTypeFont) -> tuple[ImageFont.FreeTypeFont, ...]:
+    """The font followed by the fallback fonts (that exist) at the same size."""
+    chain = [font]
+    for name in _FALLBACK_CHAIN:
+        path = KARMA_CARD_FONT_DIR / name
+        if str(path) == getattr(font, "path", None):
+            continue
+        try:
+            chain.append(ImageFont.truetype(str(path), font.size))
+        except OSError:
+            continue
+    return tuple(chain)
+
+
+def _glyph_mask(font: ImageFont.FreeTypeFont, ch: str) -> bytes:
+    """Rasterized glyph, for comparing against the font's missing-glyph box."""
+    size = font.size * 2
+    image = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(image).text((size // 4, size // 4), ch, font=font, fill=255)
+    return image.tobytes()
+
+
+@lru_cache(maxsize=64)
+def _notdef_mask(font: ImageFont.FreeTypeFont) -> bytes:
+    """The font's .notdef glyph (U+FFFF is never mapped)."""
+    return _glyph_mask(font, "\uffff")
+
+
+@lru_cache(maxsize=4096)
+def _has_glyph(font: ImageFont.FreeTypeFont, ch: str) -> bool:
+    """Whether the font maps the character to a real glyph."""
+    return _glyph_mask(font, ch) != _notdef_mask(font)
+
+
+def _direction(text: str) -> Optional[str]:
+    """Direction of the first strong character ("R" or "L"), None if there is none."""
+    for ch in text:
+        kind = unicodedata.bidirectional(ch)
+        if kind in ("R", "AL"):
+            return "R"
+        if kind == "L":
+            return "L"
+    return None
+
+
+def _visual_order(runs: list[tuple[ImageFont.FreeTypeFont, str]]) -> list[tuple[ImageFont.FreeTypeFont, str]]:
+    """
+    Put logical-order runs in left-to-right order for a left-to-right line.
+
+    Raqm orders the text inside a run; here neutral runs (spaces, emoji)
+    between right-to-left runs join them, and each right-to-left stretch
+    is reversed, as the browser does for an Arabic name with an emoji in it.
+    """
+    directions = [_direction(text) for _, text in runs]
+    for index, direction in enumerate(directions):
+        if direction is None:
+            before = next((d for d in reversed(directions[:index]) if d), "L")
+            after = next((d for d in directions[index + 1:] if d), "L")
+            directions[index] = "R" if before == after == "R" else "L"
+    ordered: list[tuple[ImageFont.FreeTypeFont, str]] = []
+    stretch: list[tuple[ImageFont.FreeTypeFont, str]] = []
+    for run, direction in zip(runs, directions):
+        if direction == "R":
+            stretch.append(run)
+            continue
+        ordered += reversed(stretch)
+        stretch = []
+        ordered.append(run)
+    return ordered + stretch[::-1]
+
+
+def _runs(text: str, font: ImageFont.FreeTypeFont) -> list[tuple[ImageFont.FreeTypeFont, str]]:
+    """
+    Split a line into same-font runs, in left-to-right drawing order.
+
+    Each character takes the first font in the chain that has it; spaces,
+    combining marks and joiners stay with the run they follow so shaping
+    and emoji sequences aren't cut.
+    """
+    if not _RAQM and reshape_arabic and get_display:
+        # The card is a left-to-right page, so the paragraph is too
+        text = get_display(reshape_arabic(text), base_dir="L")
+    chain = _font_chain(font)
+    pieces: list[list] = []
+    for ch in text:
+        if pieces and (ch.isspace() or unicodedata.category(ch) in _JOINING_CATEGORIES):
+            current = pieces[-1][0]
+        else:
+            current = next((candidate for candidate in chain if _has_glyph(candidate, ch)), font)
+        if pieces and pieces[-1][0] is current:
+            pieces[-1][1] += ch
+        else:
+            pieces.append([current, ch])
+    runs = [(run_font, run_text) for run_font, run_text in pieces]
+    return _visual_order(runs) if _RAQM else runs
+
+
+def _text_width(text: str, font: ImageFont.FreeTypeFont, spacing: float = 0.0) -> int:
+    """Advance width of a string, including CSS letter-spacing."""
+    if not spacing:
+        return round(sum(run_font.getlength(run) for run_font, run in _runs(text, font)))
+    return round(sum(_runs(ch, font)[0][0].getlength(ch) for ch in text) + spacing * len(text))
+
+
+def _baseline(top: float, line_height: int, font: ImageFont.FreeTypeFont) -> int:
+    """Baseline y for text vertically centered in a CSS line box."""
+    ascent, descent = font.getmetrics()
+    return round(top + (line_height - (ascent + descent)) / 2 + ascent)
+
+
+def _draw_text(
+    draw: ImageDraw.ImageDraw,
+    x: float,
+    top: float,
+    line_height: int,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fill: tuple[int, int, int, int],
+    align: str = "left",
+    spacing: float = 0.0,
+) -> None:
+    """
+    Draw one line of text in a CSS line box (align: left, center or right of x).
+
+    Runs in fallback fonts share the primary font's baseline.
+    """
+    width = _text_width(text, font, spacing)
+    if align == "center":
+        x -= width / 2
+    elif align == "right":
+        x -= width
+    y = _baseline(top, line_height, font)
+    if not spacing:
+        for run_font, run in _runs(text, font):
+            draw.text((round(x), y), run, font=run_font, fill=fill, anchor="ls", embedded_color=True)
+            x += run_font.getlength(run)
+        return
+    for ch in text:
+        char_font = _runs(ch, font)[0][0]
+        draw.text((round(x), y), ch, font=char_font, fill=fill, anchor="ls", embedded_color=True)
+        x += char_font.getlength(ch) + spacing
+
+
+# =============================================================================
+# Static Layers (built once)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _frame_layer() -> Image.Image:
+    """Wrapper glow, drop shadows and the green/gold gradient border."""
+    canvas = Image.new("RGBA", CANVAS_SIZE, (0, 0, 0, 0))
+    wrapper_mask = _rounded_mask(WRAPPER_SIZE, WRAPPER_RADIUS)
+
+    # box-shadow: 0 8px 32px rgba(0,0,0,.5), 0 0 40px green/.3, 0 0 40px gold/.2
+    for color, offset, blur in (
+        ((0, 0, 0, 128), 8, 32),
+        (_rgba(COLOR_GREEN, 0.3), 0, 40),
+        (_rgba(COLOR_GOLD, 0.2), 0, 40),
+    ):
+        pos = (WRAPPER_POS[0], WRAPPER_POS[1] + offset)
+        canvas.alpha_composite(_shadow(CANVAS_SIZE, wrapper_mask, pos, color, blur / 2))
+
+    # ::before: inset -6px gradient blurred 16px at 80% opacity
+    glow_size = (WRAPPER_SIZE[0] + 12, WRAPPER_SIZE[1] + 12)
+    glow = _linear_gradient(glow_size, 135, [
+        _rgba(COLOR_GREEN + "44"), _rgba(COLOR_GOLD + "33"), _rgba(COLOR_GREEN + "44"),
+    ])
+    glow = _masked(glow, _rounded_mask(glow_size, WRAPPER_RADIUS + 6))
+    glow_layer = Image.new("RGBA", CANVAS_SIZE, (0, 0, 0, 0))
+    glow_layer.alpha_composite(glow, (WRAPPER_POS[0] - 6, WRAPPER_POS[1] - 6))
+    glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(16))
+    glow_layer.putalpha(glow_layer.getchannel("A").point(lambda v: v * 4 // 5))
+    canvas.alpha_composite(glow_layer)
+
+    border = _linear_gradient(WRAPPER_SIZE, 135, [
+        _rgba(COLOR_GREEN), _rgba(COLOR_GOLD), _rgba(COLOR_GREEN),
+    ])
+    canvas.alpha_composite(_masked(border, wrapper_mask), WRAPPER_POS)
+    return canvas
+
+
+@lru_cache(maxsize=1)
+def _card_overlay() -> Image.Image:
+    """The card's dark translucent overlay (.card::before)."""
+    return _linear_gradient(CARD_SIZE, 135, [(12, 12, 18, 235), (18, 18, 28, 224)])
+
+
+@lru_cache(maxsize=1)
+def _default_card_background() -> Image.Image:
+    """Card background when the guild has no banner, clipped to the card."""
+    background = _linear_gradient(CARD_SIZE, 135, [_rgba("#0f0f17"), _rgba("#1a1a28")])
+    background.alpha_composite(_card_overlay())
+    return _masked(background, _rounded_mask(CARD_SIZE, CARD_RADIUS))
+
+
+@lru_cache(maxsize=1)
+def _stats_panel() -> tuple[Image.Image, list[float]]:
+    """
+    Stats box with its labels and dividers, plus the three column centers.
+
+    Returns:
+        (panel layer sized INFO_WIDTH x STATS_HEIGHT, column center x offsets)
+    """
+    size = (INFO_WIDTH, STATS_HEIGHT)
+    panel = Image.new("RGBA", size, (0, 0, 0, 0))
+    mask = _rounded_mask(size, STATS_RADIUS)
+    panel.alpha_composite(_masked(_fill(size, (255, 255, 255, 20)), mask))
+    inner = _rounded_mask((size[0] - 2, size[1] - 2), STATS_RADIUS - 1)
+    ring = Image.new("L", size, 0)
+    ring.paste(mask)
+    ring.paste(0, (1, 1), inner)
+    panel.alpha_composite(_masked(_fill(size, (255, 255, 255, 20)), ring))
+
+    inner_width = INFO_WIDTH - 2 - 2 * STATS_PAD_X
+    column = (inner_width - 2 - 4 * STATS_GAP) / 3
+    draw = ImageDraw.Draw(panel)
+    label_font = _font(600, 12)
+    label_top = 1 + STATS_PAD_Y + STAT_VALUE_LINE + STAT_LABEL_GAP
+    centers = []
+    x = 1 + STATS_PAD_X
+    for index, label in enumerate(("UPVOTES", "DOWNVOTES", "APPROVAL")):
+        center = x + column / 2
+        centers.append(center)
+        _draw_text(draw, center, label_top, STAT_LABEL_LINE, label, label_font, _rgba("#8a8a9a"), "center", 1.0)
+        x += column + STATS_GAP
+        if index < 2:
+            divider_top = 1 + STATS_PAD_Y
+            draw.rectangle(
+                (round(x), divider_top, round(x), divider_top + STAT_VALUE_LINE + STAT_LABEL_GAP + STAT_LABEL_LINE - 1),
+                fill=(255, 255, 255, 26),
+            )
+            x += 1 + STATS_GAP
+    return panel, centers
+
+
+@lru_cache(maxsize=1)
+def _card_clip() -> Image.Image:
+    """Canvas-sized mask of the card (its overflow: hidden clip)."""
+    clip = Image.new("L", CANVAS_SIZE, 0)
+    clip.paste(_rounded_mask(CARD_SIZE, CARD_RADIUS), CARD_POS)
+    return clip
+
+
+def _cropped(layer: Image.Image) -> tuple[Image.Image, tuple[int, int]]:
+    """Clip a canvas-sized layer to the card and crop it to its visible box."""
+    layer = _masked(layer, _card_clip())
+    box = layer.getbbox() or (0, 0, 1, 1)
+    return layer.crop(box), box[:2]
+
+
+@lru_cache(maxsize=len(STATUS_COLORS))
+def _status_layers(status_color: str) -> tuple[tuple[Image.Image, tuple[int, int]], tuple[Image.Image, tuple[int, int]]]:
+    """
+    Ring glow and status ring (drawn under the avatar) and the status dot
+    (drawn over it) for one presence color.
+
+    Returns:
+        ((ring layer, canvas position), (dot layer, canvas position))
+    """
+    color = _rgba(status_color)
+    x, y = AVATAR_POS
+
+    # .avatar-ring::before: inset -12px of the ring, blur 20px, 40% opacity
+    glow_diameter = AVATAR_SIZE + 2 * (RING_WIDTH + 12)
+    glow_pos = (x - RING_WIDTH - 12, y - RING_WIDTH - 12)
+    ring_layer = _shadow(CANVAS_SIZE, _circle_mask(glow_diameter), glow_pos, color[:3] + (102,), 20)
+
+    ring_diameter = AVATAR_SIZE + 2 * RING_WIDTH
+    ring = Image.new("RGBA", (ring_diameter, ring_diameter), color)
+    ring.putalpha(_ring_mask(ring_diameter, RING_WIDTH))
+    ring_layer.alpha_composite(ring, (x - RING_WIDTH, y - RING_WIDTH))
+
+    # .status-dot: bottom/right 5px, 8px #14141f border, 12px glow at 40%
+    dot_pos = (x + AVATAR_SIZE - 5 - STATUS_DOT_SIZE, y + AVATAR_SIZE - 5 - STATUS_DOT_SIZE)
+    dot_mask = _circle_mask(STATUS_DOT_SIZE)
+    dot = Image.new("RGBA", (STATUS_DOT_SIZE, STATUS_DOT_SIZE), _rgba("#14141f"))
+    inner_diameter = STATUS_DOT_SIZE - 2 * STATUS_DOT_BORDER
+    inner = Image.new("RGBA", (inner_diameter, inner_diameter), color)
+    inner.putalpha(_circle_mask(inner_diameter))
+    dot.alpha_composite(inner, (STATUS_DOT_BORDER, STATUS_DOT_BORDER))
+    dot.putalpha(dot_mask)
+    dot_layer = _shadow(CANVAS_SIZE, dot_mask, dot_pos, color[:3] + (102,), 6)
+    dot_layer.alpha_composite(dot, dot_pos)
+    return _cropped(ring_layer), _cropped(dot_layer)
+
+
+@lru_cache(maxsize=32)
+def _badge_background(kind: str, width: int) -> Image.Image:
+    """
+    Badge pill with shadow, border and shine, padded for its shadow.
+
+    kind is "rank", "karma" or a tier name.
+    """
+    size = (width, BADGE_HEIGHT)
+    margin = 20
+    layer = Image.new("RGBA", (width + 2 * margin, BADGE_HEIGHT + 2 * margin), (0, 0, 0, 0))
+    mask = _rounded_mask(size, BADGE_RADIUS)
+
+    if kind == "rank":
+        fill = _linear_gradient(size, 145, [_rgba("#3a3a4a"), _rgba("#2a2a3a")])
+        border, shadow, blur = (255, 255, 255, 26), (0, 0, 0, 102), 6
+    elif kind == "karma":
+        fill = _linear_gradient(size, 145, [_rgba(COLOR_GREEN), _rgba("#165c26"), _rgba("#0f4d1c")])
+        border, shadow, blur = (255, 255, 255, 51), _rgba(COLOR_GREEN, 0.5), 8
+    else:
+        fill = _linear_gradient(size, 145, [_rgba(c) for c in _TIER_STOPS[kind]])
+        border, shadow, blur = (255, 255, 255, 64), (0, 0, 0, 102), 8
+
+    layer.alpha_composite(_shadow(layer.size, mask, (margin, margin + 4), shadow, blur))
+    pill = _masked(fill, mask)
+
+    # ::after shine: skewed white band at left 15%, width 35%
+    shine = Image.new("L", size, 0)
+    shine_draw = ImageDraw.Draw(shine)
+    left, band = 0.15 * width, 0.35 * width
+    skew = math.tan(math.radians(20)) * BADGE_HEIGHT / 2
+    for step in range(max(1, round(band))):
+        t = step / max(1.0, band - 1)
+        alpha = round(38 * (1 - abs(2 * t - 1)))
+        x = left + step
+        shine_draw.line((x + skew, 0, x - skew, BADGE_HEIGHT), fill=alpha, width=1)
+    shine = Image.composite(shine, Image.new("L", size, 0), mask)
+    pill.alpha_composite(Image.merge("RGBA", (*Image.new("RGB", size, (255, 255, 255)).split(), shine)))
+
+    inner = _rounded_mask((width - 2, BADGE_HEIGHT - 2), BADGE_RADIUS - 1)
+    ring = Image.new("L", size, 0)
+    ring.paste(mask)
+    ring.paste(0, (1, 1), inner)
+    pill.alpha_composite(_masked(_fill(size, border), ring))
+
+    layer.alpha_composite(pill, (margin, margin))
+    return layer
+
+
+# Tier gradient stops (same colors as get_tier's CSS gradients)
+_TIER_STOPS = {
+    "Diamond": ("#b9f2ff", "#7dd3fc", "#38bdf8"),
+    "Gold": ("#f5d55a", COLOR_GOLD, "#cc9900"),
+    "Silver": ("#e8e8e8", "#c0c0c0", "#a8a8a8"),
+    "Bronze": ("#daa06d", "#cd7f32", "#a0522d"),
+}
+
+
+# =============================================================================
+# Avatar & Banner Compositing
+# =============================================================================
+
+_avatar_cache: OrderedDict[str, Image.Image] = OrderedDict()
+_banner_cache: OrderedDict[str, Image.Image] = OrderedDict()
+
+
+def _remember(cache: OrderedDict, key: str, image: Image.Image) -> Image.Image:
+    """Store a processed image in a small LRU."""
+    cache[key] = image
+    cache.move_to_end(key)
+    while len(cache) > KARMA_CARD_ASSET_CACHE_ENTRIES:
+        cache.popitem(last=False)
+    return image
+
+
+def _avatar_image(url: Optional[str], data: Optional[bytes], initial: str) -> Image.Image:
+    """Round 180px avatar (object-fit: cover), or the initial-letter fallback."""
+    if url and url in _avatar_cache:
+        _avatar_cache.move_to_end(url)
+        return _avatar_cache[url]
+
+    if data:
+        try:
+            with Image.open(io.BytesIO(data)) as source:
+                source.seek(0)
+                avatar = ImageOps.fit(source.convert("RGBA"), (AVATAR_SIZE, AVATAR_SIZE), Image.LANCZOS)
+            avatar.putalpha(Image.composite(
+                avatar.getchannel("A"), Image.new("L", avatar.size, 0), _circle_mask(AVATAR_SIZE)
+            ))
+            return _remember(_avatar_cache, url, avatar) if url else avatar
+        except (OSError, ValueError):
+            pass
+
+    return _initial_avatar(initial)
+
+
+@lru_cache(maxsize=64)
+def _initial_avatar(initial: str) -> Image.Image:
+    """Fallback avatar: gradient circle with the display name's first letter."""
+    avatar = _linear_gradient((AVATAR_SIZE, AVATAR_SIZE), 135, [_rgba("#3a3a4a"), _rgba("#2a2a3a")])
+    avatar.putalpha(_circle_mask(AVATAR_SIZE))
+    draw = ImageDraw.Draw(avatar)
+    _draw_text(draw, AVATAR_SIZE / 2, 0, AVATAR_SIZE, initial, _font(700, 64), WHITE, "center")
+    return avatar
+
+
+def _banner_background(url: str, data: bytes) -> Optional[Image.Image]:
+    """Banner cover-fitted to the card, blurred 12px, under the overlay, clipped to the card."""
+    if url in _banner_cache:
+        _banner_cache.move_to_end(url)
+        return _banner_cache[url]
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            source.seek(0)
+            banner = ImageOps.fit(source.convert("RGBA"), CARD_SIZE, Image.LANCZOS)
+    except (OSError, ValueError):
+        return None
+    banner = banner.filter(ImageFilter.GaussianBlur(12))
+    banner.alpha_composite(_card_overlay())
+    return _remember(_banner_cache, url, _masked(banner, _rounded_mask(CARD_SIZE, CARD_RADIUS)))
+
+
+# =============================================================================
+# Card Rendering
+# =============================================================================
+
+def render_karma_card_image(
+    display_name: str,
+    username: str,
+    karma: int,
+    rank: int,
+    upvotes: int,
+    downvotes: int,
+    status: str,
+    avatar_url: Optional[str] = None,
+    avatar_data: Optional[bytes] = None,
+    banner_url: Optional[str] = None,
+    banner_data: Optional[bytes] = None,
+) -> bytes:
+    """
+    Render the karma card as PNG bytes (960x300, transparent outside the card).
+
+    Blocking; run it in a worker thread. Avatar and banner come in as
+    already-fetched bytes, keyed by URL for the processed-image caches.
+    """
+    status_color = STATUS_COLORS.get(status, STATUS_COLORS["online"])
+    tier_name, _, _ = get_tier(karma)
+    total_votes = upvotes + downvotes
+    approval_rate = round((upvotes / total_votes * 100), 1) if total_votes > 0 else 0.0
+
+    canvas = _frame_layer().copy()
+
+    # Card background (banner or default gradient), clipped to the card radius
+    background = None
+    if banner_url and banner_data:
+        background = _banner_background(banner_url, banner_data)
+    if background is None:
+        background = _default_card_background()
+    canvas.alpha_composite(background, CARD_POS)
+
+    # Avatar with status ring, glow and dot
+    (ring_layer, ring_pos), (dot_layer, dot_pos) = _status_layers(status_color)
+    canvas.alpha_composite(ring_layer, ring_pos)
+    initial = display_name[0].upper() if display_name else "?"
+    canvas.alpha_composite(_avatar_image(avatar_url, avatar_data, initial), AVATAR_POS)
+    canvas.alpha_composite(dot_layer, dot_pos)
+
+    draw = ImageDraw.Draw(canvas)
+
+    # Names (display name has a soft drop shadow)
+    name_font = _font(800, 40)
+    shadow_origin = (INFO_LEFT - 12, INFO_TOP - 10)
+    shadow = Image.new("RGBA", (INFO_WIDTH + 24, NAME_LINE + 24), (0, 0, 0, 0))
+    _draw_text(ImageDraw.Draw(shadow), 12, 12, NAME_LINE, display_name, name_font, (0, 0, 0, 128))
+    canvas.alpha_composite(shadow.filter(ImageFilter.GaussianBlur(4)), shadow_origin)
+    _draw_text(draw, INFO_LEFT, INFO_TOP, NAME_LINE, display_name, name_font, WHITE)
+    _draw_text(
+        draw, INFO_LEFT, INFO_TOP + NAME_LINE + NAMES_GAP, USERNAME_LINE,
+        f"@{username}", _font(500, 16), _rgba("#6b7280"),
+    )
+
+    # Badges, laid out right to left from the info section's edge
+    label_font, value_font = _font(700, 9), _font(900, 22)
+    badges = [("rank", "RANK", f"#{rank}"), ("karma", "KARMA", f"{karma:,}")]
+    if tier_name:
+        badges.append((tier_name, "TIER", tier_name))
+    x = INFO_RIGHT
+    for kind, label, value in reversed(badges):
+        width = max(
+            BADGE_MIN_WIDTH,
+            max(_text_width(label, label_font, 1.2), _text_width(value, value_font)) + 2 * BADGE_PAD_X,
+        )
+        x -= width
+        canvas.alpha_composite(_badge_background(kind, width), (x - 20, INFO_TOP - 20))
+        center = x + width / 2
+        label_color = _rgba("#9ca3af", 0.7) if kind == "rank" else (255, 255, 255, 143)
+        _draw_text(draw, center, INFO_TOP + 8, 11, label, label_font, label_color, "center", 1.2)
+        _draw_text(draw, center, INFO_TOP + 8 + 11 + 2, 27, value, value_font, WHITE, "center")
+        x -= BADGE_GAP
+
+    # Stats
+    panel, centers = _stats_panel()
+    canvas.alpha_composite(panel, (INFO_LEFT, STATS_TOP))
+    stat_font = _font(800, 26)
+    value_top = STATS_TOP + 1 + STATS_PAD_Y
+    for center, text, color in zip(centers, (
+        f"+{upvotes:,}", f"-{downvotes:,}", f"{approval_rate}%",
+    ), ("#57f287", "#ed4245", "#e6b84a")):
+        _draw_text(draw, INFO_LEFT + center, value_top, STAT_VALUE_LINE, text, stat_font, _rgba(color), "center")
+
+    output = io.BytesIO()
+    canvas.save(output, format="PNG", compress_level=1)
+    return output.getvalue()
+
+
+def warm_up() -> None:
+    """Build the static layers now so the first render doesn't pay for them."""
+    _frame_layer()
+    _default_card_background()
+    _stats_panel()
+    for color in STATUS_COLORS.values():
+        _status_layers(color)
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["render_karma_card_image", "warm_up", "CANVAS_SIZE"]
@@ -0,0 +1,493 @@
+"""
+OthmanBot - LLM Gateway
+=======================
+
+Single async entry point for every OpenAI call the bot makes (scraper
+titles/summaries/quotes, debate tagging, religion detection, translation).
+
+Features:
+- One shared AsyncOpenAI client (HTTP connection reuse)
+- Adaptive rate limiting shared by all callers
+- Concurrency limit and circuit breaker
+- Retry with exponential backoff and jitter
+- Per-call latency and token metrics in scraper_metrics
+- Structured (JSON) requests for merged prompts
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from openai import AsyncOpenAI, APIError, RateLimitError, APIConnectionError, AuthenticationError
+
+from src.core.logger import logger
+from src.core.config import (
+    OPENAI_TIMEOUT,
+    LLM_MODEL,
+    LLM_MAX_CONCURRENCY,
+    LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_RECOVERY_SECONDS,
+)
+
+
+# Token counters of the usage scopes active in the current task (see track_usage)
+_usage_scopes: ContextVar[tuple[list[int], ...]] = ContextVar("llm_usage_scopes", default=())
+
+
+# =============================================================================
+# Retry Configuration
+# =============================================================================
+
+class OpenAIRetryConfig:
+    """Configuration for OpenAI API retry behavior."""
+    MAX_RETRIES: int = 3
+    BASE_DELAY: float = 1.0  # seconds
+    MAX_DELAY: float = 60.0  # seconds
+    EXPONENTIAL_BASE: float = 2.0
+    JITTER_RANGE: float = 0.1  # 10% jitter
+
+
+# =============================================================================
+# Adaptive Rate Limiter
+# =============================================================================
+
+class AdaptiveRateLimiter:
+    """
+    Adaptive rate limiter that adjusts based on API response times and errors.
+
+    Tracks latency and automatically throttles when API is slow or returns errors.
+    """
+
+    def __init__(self) -> None:
+        self._retry_after: float = 0.0  # Timestamp when retry is allowed
+        self._latency_samples: list[float] = []
+        self._max_samples: int = 10
+        self._throttle_threshold_ms: float = 2000.0  # Throttle if latency > 2s
+        self._throttle_multiplier: float = 1.0  # Current throttle level (1.0 = normal)
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Record API call latency and adjust throttle."""
+        self._latency_samples.append(latency_ms)
+        if len(self._latency_samples) > self._max_samples:
+            self._latency_samples.pop(0)
+
+        # Calculate average latency
+        avg_latency = sum(self._latency_samples) / len(self._latency_samples)
+
+        # Adjust throttle based on latency
+        if avg_latency > self._throttle_threshold_ms:
+            self._throttle_multiplier = min(3.0, self._throttle_multiplier * 1.2)
+        elif avg_latency < self._throttle_threshold_ms / 2:
+            self._throttle_multiplier = max(1.0, self._throttle_multiplier * 0.9)
+
+    def set_retry_after(self, seconds: float) -> None:
+        """Set retry-after from API header."""
+        self._retry_after = time.time() + seconds
+        logger.tree("Rate Limiter - Retry After Set", [
+            ("Wait Seconds", f"{seconds:.1f}"),
+            ("Current Throttle", f"{self._throttle_multiplier:.1f}x"),
+            ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
+        ], emoji="⏳")
+
+    async def wait_if_needed(self) -> None:
+        """Wait if rate limited or throttled."""
+        # Check retry-after
+        now = time.time()
+        if self._retry_after > now:
+            wait_time = self._retry_after - now
+            logger.tree("Rate Limiter - Waiting (Retry-After)", [
+                ("Wait Time", f"{wait_time:.1f}s"),
+                ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
+            ], emoji="⏸️")
+            await asyncio.sleep(wait_time)
+
+        # Apply throttle multiplier
+        if self._throttle_multiplier > 1.0:
+            throttle_wait = (self._throttle_multiplier - 1.0) * 0.5
+            if throttle_wait > 0.1:  # Only log if significant wait
+                logger.tree("Rate Limiter - Throttling Active", [
+                    ("Throttle Level", f"{self._throttle_multiplier:.1f}x"),
+                    ("Extra Wait", f"{throttle_wait:.2f}s"),
+                    ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
+                ], emoji="🐌")
+            await asyncio.sleep(throttle_wait)
+
+    def get_delay_with_jitter(self, base_delay: float) -> float:
+        """Get delay with random jitter."""
+        jitter = base_delay * OpenAIRetryConfig.JITTER_RANGE * random.random()
+        return base_delay + jitter
+
+    @property
+    def throttle_level(self) -> float:
+        """Current throttle multiplier."""
+        return self._throttle_multiplier
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Average latency in milliseconds."""
+        if not self._latency_samples:
+            return 0.0
+        return sum(self._latency_samples) / len(self._latency_samples)
+
+
+# =============================================================================
+# LLM Gateway
+# =============================================================================
+
+class LLMGateway:
+    """
+    Shared async gateway for chat completions.
+
+    DESIGN: The scrapers wrapped the sync OpenAI client in to_thread, the
+    debate tagger and religion check built a new OpenAI client (and HTTP
+    connection pool) per call, and translation had its own AsyncOpenAI
+    and circuit breaker. Rate limits hit by one were invisible to the
+    others. All of them now go through this gateway:
+
+    - one lazily created AsyncOpenAI client, so connections are reused
+    - one AdaptiveRateLimiter, so a 429 or slow responses slow everyone
+    - a semaphore capping requests in flight (LLM_MAX_CONCURRENCY)
+    - one circuit breaker: after LLM_CIRCUIT_FAILURE_THRESHOLD calls in a
+      row fail all retries, calls return "" immediately for
+      LLM_CIRCUIT_RECOVERY_SECONDS
+    - latency and token counts recorded per call under the caller's
+      feature name in scraper_metrics
+
+    Failures after retries return "" (the old _call_openai contract);
+    AuthenticationError is raised since retrying cannot fix it.
+    """
+
+    def __init__(self, max_concurrency: int = LLM_MAX_CONCURRENCY) -> None:
+        """
+        Initialize the gateway (the client is created on first use).
+
+        Args:
+            max_concurrency: Requests allowed in flight at once
+        """
+        self._client: Optional[AsyncOpenAI] = None
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.rate_limiter = AdaptiveRateLimiter()
+
+        # Circuit breaker
+        self._consecutive_failures: int = 0
+        self._circuit_opened_at: float = 0.0
+
+        # Metrics
+        self.calls: int = 0
+        self.failures: int = 0
+        self.short_circuited: int = 0
+        self.prompt_tokens: int = 0
+        self.completion_tokens: int = 0
+        self.in_flight: int = 0
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    @property
+    def available(self) -> bool:
+        """True if an API key is configured."""
+        return bool(os.getenv("OPENAI_API_KEY"))
+
+    @property
+    def circuit_open(self) -> bool:
+        """True while calls are being short-circuited after repeated failures."""
+        if self._consecutive_failures < LLM_CIRCUIT_FAILURE_THRESHOLD:
+            return False
+        return time.time() - self._circuit_opened_at < LLM_CIRCUIT_RECOVERY_SECONDS
+
+    @contextmanager
+    def track_usage(self) -> Iterator[list[int]]:
+        """
+        Count the tokens spent by calls made inside the block.
+
+        Yields a one-element list holding the running total. Tasks started
+        inside the block (e.g. by asyncio.gather) are counted too, and nested
+        scopes all see the calls made in the innermost one.
+        """
+        counter = [0]
+        token = _usage_scopes.set(_usage_scopes.get() + (counter,))
+        try:
+            yield counter
+        finally:
+            _usage_scopes.reset(token)
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        feature: str = "general",
+        model: str = LLM_MODEL,
+        json_mode: bool = False,
+    ) -> str:
+        """
+        Run one chat completion with retries, rate limiting and metrics.
+
+        Args:
+            system_prompt: System message for context
+            user_prompt: User message with content
+            max_tokens: Maximum tokens in response
+            temperature: Creativity level (0-1)
+            feature: Metrics bucket (e.g. "news", "soccer", "debates")
+            model: Model name
+            json_mode: Ask the model for a JSON object response
+
+        Returns:
+            AI response text, or "" if unavailable or all retries failed
+
+        Raises:
+            AuthenticationError: Invalid API key (no retry)
+        """
+        if not self.available:
+            return ""
+
+        if self.circuit_open:
+            self.short_circuited += 1
+            logger.debug("LLM Call Skipped (Circuit Open)", [
+                ("Feature", feature),
+            ])
+            return ""
+
+        extra: dict = {"response_format": {"type": "json_object"}} if json_mode else {}
+        last_exception: Optional[Exception] = None
+
+        async with self._semaphore:
+            # Wait if rate limited
+            await self.rate_limiter.wait_if_needed()
+            self.in_flight += 1
+            try:
+                for attempt in range(OpenAIRetryConfig.MAX_RETRIES):
+                    try:
+                        # Track latency
+                        start_time = time.time()
+                        self.calls += 1
+
+                        response = await self._get_client().chat.completions.create(
+                            model=model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {"role": "user", "content": user_prompt},
+                            ],
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            **extra,
+                        )
+
+                        # Record latency and usage
+                        latency_ms = (time.time() - start_time) * 1000
+                        self.rate_limiter.record_latency(latency_ms)
+                        self._record_usage(feature, latency_ms, getattr(response, "usage", None))
+                        self._consecutive_failures = 0
+
+                        return (response.choices[0].message.content or "").strip()
+
+                    except AuthenticationError:
+                        # Invalid API key - don't retry
+                        logger.error("OpenAI Authentication Failed", [
+                            ("Error", "Invalid API key"),
+                            ("Action", "Check OPENAI_API_KEY environment variable"),
+                        ])
+                        raise
+
+                    except RateLimitError as e:
+                        # Parse Retry-After header if available
+                        retry_after = getattr(e, 'retry_after', None)
+                        if retry_after:
+                            self.rate_limiter.set_retry_after(float(retry_after))
+                            delay = float(retry_after)
+                        else:
+                            delay = self._backoff(attempt)
+
+                        logger.warning("OpenAI Rate Limited", [
+                            ("Feature", feature),
+                            ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
+                            ("Retry In", f"{delay:.1f}s"),
+                            ("Throttle Level", f"{self.rate_limiter.throttle_level:.1f}x"),
+                        ])
+                        self._record_metric(feature, "ai_rate_limit", 1)
+                        last_exception = e
+                        await asyncio.sleep(delay)
+
+                    except APIConnectionError as e:
+                        # Network error - retry with backoff + jitter
+                        delay = self._backoff(attempt)
+                        logger.warning("OpenAI Connection Error", [
+                            ("Feature", feature),
+                            ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
+                            ("Error", str(e)[:100]),
+                            ("Retry In", f"{delay:.1f}s"),
+                        ])
+                        self._record_metric(feature, "ai_connection_error", 1)
+                        last_exception = e
+                        await asyncio.sleep(delay)
+
+                    except APIError as e:
+                        # Other API error - retry with backoff + jitter
+                        delay = self._backoff(attempt)
+                        logger.warning("OpenAI API Error", [
+                            ("Feature", feature),
+                            ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
+                            ("Error", str(e)[:100]),
+                            ("Retry In", f"{delay:.1f}s"),
+                        ])
+                        self._record_metric(feature, "ai_api_error", 1)
+                        last_exception = e
+                        await asyncio.sleep(delay)
+
+                    except (TimeoutError, asyncio.TimeoutError) as e:
+                        # Timeout - retry with backoff + jitter
+                        delay = self._backoff(attempt)
+                        logger.warning("OpenAI Timeout", [
+                            ("Feature", feature),
+                            ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
+                            ("Retry In", f"{delay:.1f}s"),
+                        ])
+                        self._record_metric(feature, "ai_timeout", 1)
+                        last_exception = e
+                        await asyncio.sleep(delay)
+            finally:
+                self.in_flight -= 1
+
+        # All retries exhausted
+        self.failures += 1
+        self._consecutive_failures += 1
+        if self._consecutive_failures == LLM_CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_opened_at = time.time()
+            logger.warning("LLM Circuit Opened", [
+                ("Failures", str(self._consecutive_failures)),
+                ("Timeout", f"{LLM_CIRCUIT_RECOVERY_SECONDS}s"),
+            ])
+        elif self._consecutive_failures > LLM_CIRCUIT_FAILURE_THRESHOLD:
+            # Half-open probe failed; stay open for another window
+            self._circuit_opened_at = time.time()
+
+        logger.error("OpenAI API Failed After Retries", [
+            ("Feature", feature),
+            ("Retries", str(OpenAIRetryConfig.MAX_RETRIES)),
+            ("Last Error", str(last_exception)[:100] if last_exception else "Unknown"),
+        ])
+        self._record_metric(feature, "ai_total_failure", 1)
+        return ""
+
+    async def complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.3,
+        feature: str = "general",
+        model: str = LLM_MODEL,
+    ) -> Optional[dict]:
+        """
+        Run a structured request and parse its JSON object response.
+
+        Returns:
+            Parsed object, or None if the call failed or returned invalid JSON
+        """
+        response = await self.complete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            feature=feature,
+            model=model,
+            json_mode=True,
+        )
+        if not response:
+            return None
+
+        text = response
+        # Handle potential markdown wrapping
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        try:
+            result = json.loads(text.strip())
+        except json.JSONDecodeError:
+            logger.warning("LLM Returned Invalid JSON", [
+                ("Feature", feature),
+                ("Preview", response[:100].replace('\n', ' ')),
+            ])
+            return None
+        return result if isinstance(result, dict) else None
+
+    def get_stats(self) -> dict:
+        """Call, failure and token counters plus limiter state."""
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "short_circuited": self.short_circuited,
+            "in_flight": self.in_flight,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "avg_latency_ms": round(self.rate_limiter.avg_latency_ms),
+            "throttle_level": round(self.rate_limiter.throttle_level, 2),
+            "circuit_open": self.circuit_open,
+        }
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _get_client(self) -> AsyncOpenAI:
+        """Create the shared client on first use."""
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=float(OPENAI_TIMEOUT))
+        return self._client
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay with jitter for a retry attempt."""
+        base_delay = OpenAIRetryConfig.BASE_DELAY * (OpenAIRetryConfig.EXPONENTIAL_BASE ** attempt)
+        return self.rate_limiter.get_delay_with_jitter(min(base_delay, OpenAIRetryConfig.MAX_DELAY))
+
+    def _record_usage(self, feature: str, latency_ms: float, usage) -> None:
+        """Record latency and token counts of a successful call."""
+        self._record_metric(feature, "ai_latency_ms", latency_ms)
+        if usage is None:
+            return
+        prompt = getattr(usage, "prompt_tokens", 0) or 0
+        completion = getattr(usage, "completion_tokens", 0) or 0
+        self.prompt_tokens += prompt
+        self.completion_tokens += completion
+        self._record_metric(feature, "ai_prompt_tokens", prompt)
+        self._record_metric(feature, "ai_completion_tokens", completion)
+        for counter in _usage_scopes.get():
+            counter[0] += prompt + completion
+
+    @staticmethod
+    def _record_metric(feature: str, metric_name: str, value: float) -> None:
+        """Write one metric row; metrics must never break a call."""
+        try:
+            from src.services.database import get_db
+            get_db().record_metric(feature, metric_name, value)
+        except Exception as e:
+            logger.debug("LLM Metric Not Recorded", [
+                ("Metric", metric_name),
+                ("Error", str(e)[:100]),
+            ])
+
+
+# =============================================================================
+# Module-level Instance
+# =============================================================================
+
+# Singleton instance shared by scrapers, debate tagging and translation
+llm_gateway = LLMGateway()
+
+
+# =============================================================================
+# Module Export
+# =============================================================================
+
+__all__ = ["LLMGateway", "AdaptiveRateLimiter", "OpenAIRetryConfig", "llm_gateway"]
@@ -7,10 +7,10 @@ HTML-to-image rendering. Optimized for low memory usage and stability.
 
 Features:
 - Singleton browser/context pattern
-- Page pooling to avoid creation overhead
-- Idle timeout (closes browser after inactivity)
-- Periodic restart to clear memory leaks
-- Semaphore to limit concurrent renders
+- Configurable page pool and render concurrency
+- Keep-warm policy driven by recent demand
+- Background idle reaper (closes browser after inactivity)
+- Periodic restart to clear memory leaks (only when no page is in use)
 - Graceful cleanup on shutdown
 
 Author: حَـــــنَّـــــا
@@ -20,10 +20,19 @@ Server: discord.gg/syria
 import asyncio
 import atexit
 import time
+from collections import deque
 from typing import Optional
 from playwright.async_api import async_playwright, Page, BrowserContext
 
 from src.core.logger import logger
+from src.core.config import (
+    KARMA_CARD_RENDER_CONCURRENCY,
+    KARMA_CARD_PAGE_POOL_SIZE,
+    KARMA_CARD_IDLE_TIMEOUT,
+    KARMA_CARD_WARM_WINDOW,
+    KARMA_CARD_WARM_MIN_REQUESTS,
+    KARMA_CARD_RESTART_AFTER_RENDERS,
+)
 
 
 # =============================================================================
@@ -34,18 +43,34 @@ _browser = None
 _context = None
 _playwright = None
 
+# Serializes browser launch and teardown
+_lifecycle_lock = asyncio.Lock()
+
 # Page pool for reuse (avoid creating/destroying pages)
 _page_pool: list = []
 _page_pool_lock = asyncio.Lock()
-_MAX_POOL_SIZE = 2  # Reduced to save memory
+_MAX_POOL_SIZE = max(1, KARMA_CARD_PAGE_POOL_SIZE)
+
+# Pages currently checked out by a render (restart/idle close waits for 0)
+_pages_in_use: int = 0
 
 # Track last activity for idle timeout
 _last_activity: float = 0
-_IDLE_TIMEOUT = 120  # Close browser after 2 minutes of inactivity
+_IDLE_TIMEOUT = KARMA_CARD_IDLE_TIMEOUT
+_REAPER_INTERVAL = 30
+_reaper_task: Optional[asyncio.Task] = None
+
+# Recent demand timestamps for the keep-warm policy
+_demand: deque = deque()
 
 # Track renders for periodic browser restart (clears memory leaks)
 _render_count: int = 0
-_RESTART_AFTER_RENDERS = 50  # Restart browser every 50 renders
+_RESTART_AFTER_RENDERS = KARMA_CARD_RESTART_AFTER_RENDERS
+
+# Lifetime counters
+_launches: int = 0
+_restarts: int = 0
+_idle_closes: int = 0
 
 # Semaphore to limit concurrent card generations
 _render_semaphore: Optional[asyncio.Semaphore] = None
@@ -59,7 +84,7 @@ def get_render_semaphore() -> asyncio.Semaphore:
     """Get or create the shared render semaphore."""
     global _render_semaphore
     if _render_semaphore is None:
-        _render_semaphore = asyncio.Semaphore(1)  # Only 1 concurrent render
+        _render_semaphore = asyncio.Semaphore(max(1, KARMA_CARD_RENDER_CONCURRENCY))
     return _render_semaphore
 
 
@@ -85,33 +110,107 @@ def _sync_cleanup():
 atexit.register(_sync_cleanup)
 
 
+# =============================================================================
+# Demand & Keep-Warm
+# =============================================================================
+
+def note_demand() -> None:
+    """Record one render request for the keep-warm policy."""
+    now = time.time()
+    _demand.append(now)
+    _trim_demand(now)
+
+
+def _trim_demand(now: float) -> None:
+    """Drop demand older than the warm window."""
+    cutoff = now - KARMA_CARD_WARM_WINDOW
+    while _demand and _demand[0] < cutoff:
+        _demand.popleft()
+
+
+def is_warm_demand() -> bool:
+    """True if recent demand is high enough to keep the browser open."""
+    _trim_demand(time.time())
+    return len(_demand) >= KARMA_CARD_WARM_MIN_REQUESTS
+
+
+def _idle_timeout() -> float:
+    """Idle timeout under the current demand (longer while demand is warm)."""
+    return KARMA_CARD_WARM_WINDOW if is_warm_demand() else _IDLE_TIMEOUT
+
+
 # =============================================================================
 # Idle & Memory Management
 # =============================================================================
 
+def _ensure_reaper() -> None:
+    """Start the idle/restart reaper while a browser is open."""
+    global _reaper_task
+    if _reaper_task is None or _reaper_task.done():
+        _reaper_task = asyncio.create_task(_reaper_loop())
+        _reaper_task.add_done_callback(_handle_reaper_exception)
+
+
+def _handle_reaper_exception(task: asyncio.Task) -> None:
+    """Handle exceptions from the reaper task."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.tree("Playwright Reaper Exception", [
+            ("Error Type", type(exc).__name__),
+            ("Error", str(exc)[:100]),
+        ], emoji="❌")
+
+
+async def _reaper_loop() -> None:
+    """
+    Close the browser when idle and recycle it after many renders.
+
+    DESIGN: The idle check used to run only when the next render asked for
+    a context, so an idle browser stayed open until the next /karma. The
+    reaper runs while a browser is open and only acts when no page is
+    checked out, so a restart never pulls a page from under a render.
+    """
+    while _browser is not None:
+        await asyncio.sleep(_REAPER_INTERVAL)
+        if _pages_in_use:
+            continue
+        await _check_render_restart()
+        await _check_idle_timeout()
+
+
 async def _check_idle_timeout():
     """Check if browser should be closed due to inactivity."""
-    global _last_activity
-    if _browser is not None and _last_activity > 0:
+    global _idle_closes
+    if _browser is not None and _last_activity > 0 and not _pages_in_use:
         idle_time = time.time() - _last_activity
-        if idle_time > _IDLE_TIMEOUT:
+        timeout = _idle_timeout()
+        if idle_time > timeout:
             logger.tree("Playwright Idle Timeout", [
                 ("Idle Time", f"{int(idle_time)}s"),
+                ("Timeout", f"{int(timeout)}s"),
                 ("Action", "Closing browser"),
             ], emoji="💤")
-            await cleanup()
+            if await cleanup(only_if_idle=True):
+                _idle_closes += 1
 
 
 async def _check_render_restart():
     """Check if browser should be restarted due to render count (memory cleanup)."""
-    global _render_count
-    if _browser is not None and _render_count >= _RESTART_AFTER_RENDERS:
+    global _restarts
+    if _browser is not None and _render_count >= _RESTART_AFTER_RENDERS and not _pages_in_use:
         logger.tree("Playwright Restart", [
             ("Render Count", str(_render_count)),
             ("Action", "Restarting for memory cleanup"),
         ], emoji="🔄")
-        await cleanup()
-        _render_count = 0
+        if not await cleanup(only_if_idle=True):
+            return
+        _restarts += 1
+
+        # Come straight back up if /karma is busy
+        if is_warm_demand():
+            await prewarm()
 
 
 # =============================================================================
@@ -135,7 +234,7 @@ async def _force_reset_state():
 
 async def _launch_browser(width: int, height: int) -> BrowserContext:
     """Launch browser and create context."""
-    global _browser, _context, _playwright
+    global _browser, _context, _playwright, _launches
 
     logger.tree("Playwright Starting", [
         ("Action", "Launching Chromium"),
@@ -174,8 +273,12 @@ async def _launch_browser(width: int, height: int) -> BrowserContext:
         viewport={'width': width, 'height': height},
         device_scale_factor=1,
     )
+    _launches += 1
+    _ensure_reaper()
     logger.tree("Playwright Ready", [
         ("Viewport", f"{width}x{height}"),
+        ("Page Pool", str(_MAX_POOL_SIZE)),
+        ("Concurrency", str(max(1, KARMA_CARD_RENDER_CONCURRENCY))),
     ], emoji="✅")
 
     return _context
@@ -185,134 +288,200 @@ async def get_context(width: int = 940, height: int = 300) -> BrowserContext:
     """Get or create browser context (reusable) with crash recovery."""
     global _browser, _context, _playwright, _last_activity
 
-    # Check if we should close idle browser first
-    await _check_idle_timeout()
-
-    # Check if we should restart browser for memory cleanup
-    await _check_render_restart()
-
-    if _context is None:
-        try:
-            await _launch_browser(width, height)
-        except Exception as e:
-            logger.tree("Playwright Launch Failed", [
-                ("Error", str(e)[:100]),
-                ("Action", "Resetting state and retrying"),
-            ], emoji="❌")
-            # Reset all state and try again
-            await _force_reset_state()
+    async with _lifecycle_lock:
+        if _context is None:
+            try:
+                await _launch_browser(width, height)
+            except Exception as e:
+                logger.tree("Playwright Launch Failed", [
+                    ("Error", str(e)[:100]),
+                    ("Action", "Resetting state and retrying"),
+                ], emoji="❌")
+                # Reset all state and try again
+                await _force_reset_state()
+                try:
+                    await _launch_browser(width, height)
+                except Exception as retry_error:
+                    logger.tree("Playwright Retry Failed", [
+                        ("Error", str(retry_error)[:100]),
+                    ], emoji="💀")
+                    raise
+        else:
+            # Verify existing context is still valid
             try:
+                # Simple health check - try to get pages
+                _ = _context.pages
+            except Exception as e:
+                logger.tree("Playwright Context Invalid", [
+                    ("Error", str(e)[:50]),
+                    ("Action", "Recovering"),
+                ], emoji="⚠️")
+                await _force_reset_state()
                 await _launch_browser(width, height)
-            except Exception as retry_error:
-                logger.tree("Playwright Retry Failed", [
-                    ("Error", str(retry_error)[:100]),
-                ], emoji="💀")
-                raise
-    else:
-        # Verify existing context is still valid
-        try:
-            # Simple health check - try to get pages
-            _ = _context.pages
-        except Exception as e:
-            logger.tree("Playwright Context Invalid", [
-                ("Error", str(e)[:50]),
-                ("Action", "Recovering"),
-            ], emoji="⚠️")
-            await _force_reset_state()
-            await _launch_browser(width, height)
 
     _last_activity = time.time()
     return _context
 
 
+async def prewarm() -> None:
+    """
+    Launch the browser and fill the page pool ahead of demand.
+
+    Cheap when already warm; safe to call on every /karma request.
+    """
+    context = await get_context()
+    async with _page_pool_lock:
+        missing = _MAX_POOL_SIZE - len(_page_pool) - _pages_in_use
+    for _ in range(max(0, missing)):
+        page = await context.new_page()
+        async with _page_pool_lock:
+            if len(_page_pool) < _MAX_POOL_SIZE:
+                _page_pool.append(page)
+                continue
+        await page.close()
+
+
 # =============================================================================
 # Page Pool Management
 # =============================================================================
 
 async def get_page() -> Page:
     """Get a page from pool or create new one."""
-    global _render_count, _last_activity
-
-    async with _page_pool_lock:
-        if _page_pool:
-            _last_activity = time.time()
-            return _page_pool.pop()
+    global _pages_in_use, _last_activity
 
-    context = await get_context()
-    page = await context.new_page()
+    _pages_in_use += 1
+    try:
+        async with _page_pool_lock:
+            if _page_pool:
+                _last_activity = time.time()
+                return _page_pool.pop()
+
+        context = await get_context()
+        page = await context.new_page()
+    except BaseException:
+        _pages_in_use -= 1
+        raise
     _last_activity = time.time()
     return page
 
 
 async def return_page(page: Page) -> None:
     """Return page to pool for reuse."""
-    global _render_count, _last_activity
+    global _render_count, _last_activity, _pages_in_use
 
+    _pages_in_use = max(0, _pages_in_use - 1)
     _render_count += 1
     _last_activity = time.time()
 
     async with _page_pool_lock:
-        if len(_page_pool) < _MAX_POOL_SIZE:
+        if len(_page_pool) < _MAX_POOL_SIZE and _context is not None:
             _page_pool.append(page)
-        else:
-            try:
-                await page.close()
-            except Exception as e:
-                logger.tree("Playwright Page Close Failed", [
-                    ("Error", str(e)[:50]),
-                ], emoji="⚠️")
+            return
+
+    try:
+        await page.close()
+    except Exception as e:
+        logger.tree("Playwright Page Close Failed", [
+            ("Error", str(e)[:50]),
+        ], emoji="⚠️")
+
+
+async def discard_page(page: Page) -> None:
+    """Close a page that failed mid-render instead of pooling it."""
+    global _pages_in_use
+
+    _pages_in_use = max(0, _pages_in_use - 1)
+    try:
+        await page.close()
+    except Exception:
+        pass
+
+
+def get_pool_stats() -> dict:
+    """Browser, pool and keep-warm state for the stats API."""
+    _trim_demand(time.time())
+    return {
+        "browser_open": _browser is not None,
+        "pooled_pages": len(_page_pool),
+        "pages_in_use": _pages_in_use,
+        "pool_size": _MAX_POOL_SIZE,
+        "concurrency": max(1, KARMA_CARD_RENDER_CONCURRENCY),
+        "recent_requests": len(_demand),
+        "warm": len(_demand) >= KARMA_CARD_WARM_MIN_REQUESTS,
+        "renders_since_launch": _render_count,
+        "launches": _launches,
+        "restarts": _restarts,
+        "idle_closes": _idle_closes,
+    }
 
 
 # =============================================================================
 # Cleanup
 # =============================================================================
 
-async def cleanup() -> None:
-    """Clean up browser resources. Call on bot shutdown."""
-    global _browser, _context, _playwright, _page_pool, _render_count, _last_activity
+async def cleanup(only_if_idle: bool = False) -> bool:
+    """
+    Clean up browser resources. Call on bot shutdown.
+
+    Args:
+        only_if_idle: Skip (and return False) if a render checked out a page
+
+    Returns:
+        True if the browser was torn down
+    """
+    global _browser, _context, _playwright, _page_pool, _render_count, _last_activity, _reaper_task
+
+    async with _lifecycle_lock:
+        if only_if_idle and _pages_in_use:
+            return False
+        _last_activity = 0
+
+        # Close all pooled pages
+        async with _page_pool_lock:
+            for page in _page_pool:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            _page_pool.clear()
+
+        # Close context
+        if _context:
+            try:
+                await _context.close()
+            except Exception:
+                pass
+            _context = None
 
-    _last_activity = 0
+        # Close browser
+        if _browser:
+            try:
+                await _browser.close()
+            except Exception:
+                pass
+            _browser = None
 
-    # Close all pooled pages
-    async with _page_pool_lock:
-        for page in _page_pool:
+        # Stop playwright
+        if _playwright:
             try:
-                await page.close()
+                await _playwright.stop()
             except Exception:
                 pass
-        _page_pool.clear()
-
-    # Close context
-    if _context:
-        try:
-            await _context.close()
-        except Exception:
-            pass
-        _context = None
-
-    # Close browser
-    if _browser:
-        try:
-            await _browser.close()
-        except Exception:
-            pass
-        _browser = None
-
-    # Stop playwright
-    if _playwright:
-        try:
-            await _playwright.stop()
-        except Exception:
-            pass
-        _playwright = None
-
-    # Force kill any remaining chrome processes
-    _sync_cleanup()
+            _playwright = None
 
-    _render_count = 0
+        # Stop the reaper (unless it is the caller; it exits on its own)
+        if _reaper_task is not None and _reaper_task is not asyncio.current_task():
+            _reaper_task.cancel()
+            _reaper_task = None
+
+        # Force kill any remaining chrome processes
+        _sync_cleanup()
+
+        _render_count = 0
     logger.tree("Playwright Cleanup", [
         ("Status", "Complete"),
     ], emoji="🧹")
+    return True
 
 
 # =============================================================================
@@ -323,6 +492,11 @@ __all__ = [
     "get_context",
     "get_page",
     "return_page",
+    "discard_page",
+    "prewarm",
+    "note_demand",
+    "is_warm_demand",
+    "get_pool_stats",
     "cleanup",
     "get_render_semaphore",
 ]
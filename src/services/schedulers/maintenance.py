@@ -272,9 +272,9 @@ class MaintenanceScheduler:
         # This method ensures content hashes are also available
 
         for content_type in ["news", "soccer"]:
-            # Get recent content for similarity checking
-            recent = self._db.get_recent_content(content_type, limit=50)
-            count = len(recent)
+            # Load the near-duplicate index for similarity checking
+            index = await asyncio.to_thread(self._db.get_similarity_index, content_type)
+            count = len(index)
 
             logger.tree("Cache Warmed", [
                 ("Content Type", content_type),
@@ -336,6 +336,13 @@ class ContentRotationScheduler:
         """
         Check if a content type has new unposted articles.
 
+        DESIGN: The check used to run the full scrape (page extraction and
+        AI title/summary/quote calls) and throw the article away, and the
+        post callback then did all of it again. Now a feed-only probe
+        rules out empty types first. When it finds entries, the article
+        is prepared once here and handed to the scraper, and the post
+        callback takes it instead of scraping again.
+
         Args:
             content_type: The content type to check
             scraper: The scraper instance for this content type
@@ -344,14 +351,18 @@ class ContentRotationScheduler:
             True if there are new unposted articles, False otherwise
         """
         try:
-            # Fetch articles using the appropriate method for each scraper type
+            # Cheap probe: feed entries vs posted/quarantine/cutoff only
+            if not await scraper.has_new_entries(hours_back=24):
+                return False
+
+            # Prepare the article for the post callback
             if content_type == ContentType.NEWS:
                 articles = await scraper.fetch_latest_news(max_articles=1, hours_back=24)
             else:  # SOCCER
                 articles = await scraper.fetch_latest_soccer_news(max_articles=1, hours_back=24)
 
-            # If we got articles, there's new content
-            # The scrapers already filter out posted content
+            # Entries can still fail screening (no media, bad content)
+            scraper.hand_off(articles)
             return bool(articles)
 
         except Exception as e:
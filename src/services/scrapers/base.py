@@ -14,119 +14,44 @@ Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
-import os
 import re
 import asyncio
 import time
-import random
 import aiohttp
+import feedparser
+from bs4 import BeautifulSoup
+from abc import ABC, abstractmethod
+from collections import deque
 from types import TracebackType
 from typing import Optional, Type
-from dataclasses import dataclass
-from datetime import datetime
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError, AuthenticationError
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from src.core.logger import logger
+from src.core.config import (
+    NY_TZ,
+    SCRAPER_EXTRACT_CONCURRENCY,
+    SCRAPER_EXTRACT_LOOKAHEAD,
+    SCRAPER_AI_CONCURRENCY,
+    SCRAPER_HANDOFF_TTL,
+)
+from src.caches.feed import feed_cache
+from src.services.llm_gateway import llm_gateway
 from src.services.database import get_db
 from src.utils import AICache
 from src.utils.language import is_english_only
-from src.utils.similarity import cosine_similarity, SIMILARITY_THRESHOLD
+from src.utils.similarity import SIMILARITY_THRESHOLD
 
 
 # =============================================================================
-# OpenAI Error Handling
+# Prompt Versions
 # =============================================================================
 
-class OpenAIRetryConfig:
-    """Configuration for OpenAI API retry behavior."""
-    MAX_RETRIES: int = 3
-    BASE_DELAY: float = 1.0  # seconds
-    MAX_DELAY: float = 60.0  # seconds
-    EXPONENTIAL_BASE: float = 2.0
-    JITTER_RANGE: float = 0.1  # 10% jitter
-
-
-class AdaptiveRateLimiter:
-    """
-    Adaptive rate limiter that adjusts based on API response times and errors.
-
-    Tracks latency and automatically throttles when API is slow or returns errors.
-    """
-
-    def __init__(self) -> None:
-        self._retry_after: float = 0.0  # Timestamp when retry is allowed
-        self._latency_samples: list[float] = []
-        self._max_samples: int = 10
-        self._throttle_threshold_ms: float = 2000.0  # Throttle if latency > 2s
-        self._throttle_multiplier: float = 1.0  # Current throttle level (1.0 = normal)
-
-    def record_latency(self, latency_ms: float) -> None:
-        """Record API call latency and adjust throttle."""
-        self._latency_samples.append(latency_ms)
-        if len(self._latency_samples) > self._max_samples:
-            self._latency_samples.pop(0)
-
-        # Calculate average latency
-        avg_latency = sum(self._latency_samples) / len(self._latency_samples)
-
-        # Adjust throttle based on latency
-        if avg_latency > self._throttle_threshold_ms:
-            self._throttle_multiplier = min(3.0, self._throttle_multiplier * 1.2)
-        elif avg_latency < self._throttle_threshold_ms / 2:
-            self._throttle_multiplier = max(1.0, self._throttle_multiplier * 0.9)
-
-    def set_retry_after(self, seconds: float) -> None:
-        """Set retry-after from API header."""
-        self._retry_after = time.time() + seconds
-        logger.tree("Rate Limiter - Retry After Set", [
-            ("Wait Seconds", f"{seconds:.1f}"),
-            ("Current Throttle", f"{self._throttle_multiplier:.1f}x"),
-            ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
-        ], emoji="⏳")
-
-    async def wait_if_needed(self) -> None:
-        """Wait if rate limited or throttled."""
-        # Check retry-after
-        now = time.time()
-        if self._retry_after > now:
-            wait_time = self._retry_after - now
-            logger.tree("Rate Limiter - Waiting (Retry-After)", [
-                ("Wait Time", f"{wait_time:.1f}s"),
-                ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
-            ], emoji="⏸️")
-            await asyncio.sleep(wait_time)
-
-        # Apply throttle multiplier
-        if self._throttle_multiplier > 1.0:
-            throttle_wait = (self._throttle_multiplier - 1.0) * 0.5
-            if throttle_wait > 0.1:  # Only log if significant wait
-                logger.tree("Rate Limiter - Throttling Active", [
-                    ("Throttle Level", f"{self._throttle_multiplier:.1f}x"),
-                    ("Extra Wait", f"{throttle_wait:.2f}s"),
-                    ("Avg Latency", f"{self.avg_latency_ms:.0f}ms"),
-                ], emoji="🐌")
-            await asyncio.sleep(throttle_wait)
-
-    def get_delay_with_jitter(self, base_delay: float) -> float:
-        """Get delay with random jitter."""
-        jitter = base_delay * OpenAIRetryConfig.JITTER_RANGE * random.random()
-        return base_delay + jitter
-
-    @property
-    def throttle_level(self) -> float:
-        """Current throttle multiplier."""
-        return self._throttle_multiplier
-
-    @property
-    def avg_latency_ms(self) -> float:
-        """Average latency in milliseconds."""
-        if not self._latency_samples:
-            return 0.0
-        return sum(self._latency_samples) / len(self._latency_samples)
-
-
-# Global rate limiter instance
-_rate_limiter = AdaptiveRateLimiter()
+# Part of every AI cache key; bump one when its prompt changes so cached
+# answers produced by the old prompt are no longer served
+TITLE_PROMPT_VERSION: str = "v1"
+SUMMARY_PROMPT_VERSION: str = "v1"
+QUOTE_PROMPT_VERSION: str = "v3"  # v2 added English-only validation
 
 
 # =============================================================================
@@ -158,18 +83,74 @@ class Article:
     key_quote: Optional[str] = None  # Extracted quote from article
 
 
+# =============================================================================
+# Feed Pipeline Types
+# =============================================================================
+
+# Placeholder texts _extract_full_content returns instead of raising
+EXTRACTION_ERRORS: tuple[str, ...] = (
+    "Content unavailable",
+    "Could not fetch article content",
+    "Could not extract article text",
+    "Content extraction failed",
+    "Article fetch timed out",
+)
+
+
+@dataclass
+class FeedCandidate:
+    """A feed entry moving through the scraper pipeline."""
+    entry: feedparser.FeedParserDict
+    url: str
+    article_id: str
+    published_date: datetime
+    source_key: str
+    source_info: dict[str, str]
+    image_url: Optional[str] = None
+    summary: str = ""
+    full_content: str = ""
+    scraped_image: Optional[str] = None
+    video_url: Optional[str] = None
+
+
+@dataclass
+class PipelineStats:
+    """Counts and per-stage timings of one pipeline run."""
+    source: str
+    entries: int = 0
+    candidates: int = 0
+    extracted: int = 0
+    skipped: int = 0
+    enriched: int = 0
+    failed: int = 0
+    feed_cached: bool = False
+    stage_ms: dict[str, float] = field(default_factory=dict)
+
+    def add_time(self, stage: str, started: float) -> None:
+        """Add the time since started (perf_counter) to a stage."""
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stage_ms[stage] = self.stage_ms.get(stage, 0.0) + elapsed
+
+
 # =============================================================================
 # Base Scraper Class
 # =============================================================================
 
-class BaseScraper:
+class BaseScraper(ABC):
     """
     Base scraper class with shared functionality.
 
     All scrapers (news, soccer) inherit from this class
-    to avoid code duplication.
+    to avoid code duplication. The feed source list and the pipeline
+    hooks are abstract, so a scraper missing one fails at construction.
     """
 
+    # Title instruction for the merged article request (subclasses override)
+    TITLE_RULES: str = (
+        "Concise, engaging English headline (3-7 words). Translate Arabic titles. "
+        "Take location and people names directly from the article; never guess them."
+    )
+
     def __init__(
         self,
         content_type: str,
@@ -200,13 +181,15 @@ class BaseScraper:
             ("Backend", "SQLite"),
         ], emoji=log_emoji)
 
-        # DESIGN: Initialize OpenAI client for title/summary generation
-        api_key: Optional[str] = os.getenv("OPENAI_API_KEY")
-        self.openai_client: Optional[OpenAI] = OpenAI(api_key=api_key, timeout=30.0) if api_key else None
-
         # DESIGN: Initialize AI response cache (now SQLite-backed)
         self.ai_cache: AICache = AICache(content_type)
 
+        self.last_pipeline_stats: Optional[PipelineStats] = None
+
+        # Articles prepared by the rotation check, waiting for the poster
+        self._handed_off: list[Article] = []
+        self._handed_off_at: float = 0.0
+
     async def __aenter__(self) -> "BaseScraper":
         """Async context manager entry."""
         if self.session_headers:
@@ -305,25 +288,12 @@ class BaseScraper:
         """
         article_id = self._extract_article_id(url)
 
-        # Get recent content from database
-        recent_content = self._db.get_recent_content(self.content_type, limit=50)
-
-        if not recent_content:
+        # Score against every indexed recent article in one pass
+        index = self._db.get_similarity_index(self.content_type)
+        if not len(index):
             return (False, 0.0)
 
-        # Check similarity against each recent article
-        highest_similarity = 0.0
-        matching_id = None
-
-        for existing_id, existing_content in recent_content:
-            # Skip self
-            if existing_id == article_id:
-                continue
-
-            similarity = cosine_similarity(content, existing_content)
-            if similarity > highest_similarity:
-                highest_similarity = similarity
-                matching_id = existing_id
+        highest_similarity, matching_id, compared = index.query(content, exclude_id=article_id)
 
         is_duplicate = highest_similarity >= SIMILARITY_THRESHOLD
 
@@ -333,7 +303,7 @@ class BaseScraper:
                 ("Similarity", f"{highest_similarity:.2%}"),
                 ("Matches Article", matching_id or "Unknown"),
                 ("Threshold", f"{SIMILARITY_THRESHOLD:.0%}"),
-                ("Compared Against", f"{len(recent_content)} articles"),
+                ("Compared Against", f"{compared} articles"),
             ], emoji="🔍")
 
         return (is_duplicate, highest_similarity)
@@ -420,10 +390,581 @@ class BaseScraper:
         """
         return self._db.get_metrics_summary(self.content_type, hours_back)
 
+    # -------------------------------------------------------------------------
+    # New Content Probe & Hand-off
+    # -------------------------------------------------------------------------
+
+    async def has_new_entries(self, hours_back: int = 24) -> bool:
+        """
+        Cheaply check whether any source has an unposted entry.
+
+        Only reads the feeds (through the feed cache) and applies the
+        posted, quarantine and cutoff filters; no article pages are
+        fetched and no AI calls are made. An entry can still be skipped
+        later for missing media or bad content.
+
+        Args:
+            hours_back: How far back an entry may be published
+
+        Returns:
+            True if at least one entry passes the filters
+        """
+        cutoff_time: datetime = datetime.now(NY_TZ) - timedelta(hours=hours_back)
+
+        for source_key, source_info in self._feed_sources().items():
+            try:
+                stats = PipelineStats(source=source_info["name"])
+                feed = await self._fetch_feed(source_info["rss_url"], stats)
+            except Exception as e:
+                logger.warning(f"{self.log_emoji} Feed Probe Failed", [
+                    ("Source", source_info["name"]),
+                    ("Error", str(e)[:100]),
+                ])
+                continue
+
+            candidates = self._select_candidates(feed.entries, source_key, source_info, cutoff_time)
+            if candidates:
+                logger.debug(f"{self.log_emoji} Feed Probe Found Entries", [
+                    ("Source", source_info["name"]),
+                    ("Candidates", str(len(candidates))),
+                    ("Feed", "cached" if stats.feed_cached else "downloaded"),
+                ])
+                return True
+
+        return False
+
+    def hand_off(self, articles: list[Article]) -> None:
+        """Keep articles prepared ahead of posting so the poster can reuse them."""
+        self._handed_off = list(articles)
+        self._handed_off_at = time.monotonic()
+
+    def take_handed_off(self) -> list[Article]:
+        """
+        Take the articles left by hand_off(), if still fresh and unposted.
+
+        The hand-off is consumed either way, so a stale or already posted
+        article is never offered twice.
+        """
+        articles, self._handed_off = self._handed_off, []
+        if not articles or time.monotonic() - self._handed_off_at > SCRAPER_HANDOFF_TTL:
+            return []
+        return [article for article in articles if not self.is_already_posted(article.url)]
+
+    @abstractmethod
+    def _feed_sources(self) -> dict[str, dict[str, str]]:
+        """RSS sources of this scraper (key -> name/emoji/rss_url)."""
+
+    # -------------------------------------------------------------------------
+    # Feed Pipeline
+    # -------------------------------------------------------------------------
+
+    async def _run_pipeline(
+        self,
+        source_key: str,
+        source_info: dict[str, str],
+        cutoff_time: datetime,
+        max_articles: int,
+    ) -> list[Article]:
+        """
+        Turn one RSS source into up to max_articles finished articles.
+
+        DESIGN: The scrapers used to parse the feed on the event loop,
+        extract pages in fixed batches of five, then run the AI calls for
+        every extracted article one by one, and only afterwards drop the
+        articles that were already posted. Posting one article cost a full
+        sequential sweep of the feed.
+
+        Now each source streams through bounded stages:
+        1. feed: conditional GET through the shared feed cache (parsed in a
+           thread, reused as-is on a 304)
+        2. filter: posted, duplicate-in-feed, quarantined and stale entries
+           are dropped before any page is fetched
+        3. extract: article pages fetched SCRAPER_EXTRACT_CONCURRENCY at a
+           time, at most SCRAPER_EXTRACT_LOOKAHEAD entries ahead
+        4. screen: media, extraction errors and duplicate content, in feed
+           order (newest first)
+        5. enrich: AI title/summary/quote/tag, started only while more
+           survivors are still needed, SCRAPER_AI_CONCURRENCY at a time
+        The run stops and cancels outstanding work once max_articles
+        survivors exist.
+        """
+        stats = PipelineStats(source=source_info["name"])
+        self.last_pipeline_stats = stats
+        articles: list[Article] = []
+        run_started = time.perf_counter()
+
+        # Stage 1: Feed
+        started = time.perf_counter()
+        feed = await self._fetch_feed(source_info["rss_url"], stats)
+        stats.add_time("feed", started)
+        stats.entries = len(feed.entries)
+
+        if not feed.entries:
+            logger.warning(f"{self.log_emoji} No Entries in Feed", [
+                ("Source", source_info["name"]),
+            ])
+            return articles
+
+        # Stage 2: Filter
+        started = time.perf_counter()
+        candidates = self._select_candidates(feed.entries, source_key, source_info, cutoff_time)
+        if candidates:
+            await asyncio.to_thread(self._prepare_candidates, candidates)
+        stats.add_time("filter", started)
+        stats.candidates = len(candidates)
+
+        # Stages 3-5: Extract -> Screen -> Enrich
+        extract_semaphore = asyncio.Semaphore(max(1, SCRAPER_EXTRACT_CONCURRENCY))
+        ai_semaphore = asyncio.Semaphore(max(1, SCRAPER_AI_CONCURRENCY))
+        remaining = iter(candidates)
+        extracting: deque[asyncio.Task] = deque()
+        enriching: set[asyncio.Task] = set()
+
+        def fill_extract_window() -> None:
+            while len(extracting) < max(1, SCRAPER_EXTRACT_LOOKAHEAD):
+                candidate = next(remaining, None)
+                if candidate is None:
+                    return
+                extracting.append(asyncio.create_task(
+                    self._pipeline_extract(candidate, extract_semaphore, stats)
+                ))
+
+        try:
+            fill_extract_window()
+            while len(articles) < max_articles and (extracting or enriching):
+                if extracting and len(articles) + len(enriching) < max_articles:
+                    candidate = await extracting.popleft()
+                    fill_extract_window()
+                    if candidate is None:
+                        continue
+
+                    started = time.perf_counter()
+                    reason = self._screen_candidate(candidate)
+                    stats.add_time("screen", started)
+                    if reason:
+                        stats.skipped += 1
+                        logger.info(f"{self.log_emoji} Skipping Article", [
+                            ("Title", candidate.entry.get("title", "Untitled")[:50]),
+                            ("Reason", reason[:80]),
+                        ])
+                        continue
+
+                    enriching.add(asyncio.create_task(
+                        self._pipeline_enrich(candidate, ai_semaphore, stats)
+                    ))
+                    continue
+
+                done, enriching = await asyncio.wait(enriching, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    article = task.result()
+                    if article is not None:
+                        articles.append(article)
+        finally:
+            leftovers = [*extracting, *enriching]
+            for task in leftovers:
+                task.cancel()
+            if leftovers:
+                await asyncio.gather(*leftovers, return_exceptions=True)
+
+        stats.add_time("total", run_started)
+        self._log_pipeline_stats(stats, len(articles))
+        return articles[:max_articles]
+
+    async def _fetch_feed(self, url: str, stats: PipelineStats) -> feedparser.FeedParserDict:
+        """
+        Get an RSS feed through the shared conditional-GET feed cache.
+
+        Without a session (scraper not entered) feedparser downloads the
+        feed itself, off the event loop.
+        """
+        if not self.session:
+            return await asyncio.to_thread(feedparser.parse, url)
+
+        feed, stats.feed_cached = await feed_cache.fetch(self.session, url)
+        return feed
+
+    def _select_candidates(
+        self,
+        entries: list,
+        source_key: str,
+        source_info: dict[str, str],
+        cutoff_time: datetime,
+    ) -> list[FeedCandidate]:
+        """Drop entries that are posted, repeated, quarantined or too old."""
+        candidates: list[FeedCandidate] = []
+        seen_ids: set[str] = set()
+
+        for entry in entries:
+            url = entry.get("link", "")
+            article_id = self._extract_article_id(url)
+            if not url or article_id in seen_ids or article_id in self.fetched_urls:
+                continue
+            seen_ids.add(article_id)
+
+            published_date = self._parse_date(entry)
+            if not published_date or published_date < cutoff_time:
+                continue
+
+            # Check if article is quarantined (too many failures)
+            if self.is_quarantined(url):
+                logger.tree("Skipping Quarantined Article", [
+                    ("URL", url[:60]),
+                ], emoji="⏭️")
+                continue
+
+            candidates.append(FeedCandidate(
+                entry=entry,
+                url=url,
+                article_id=article_id,
+                published_date=published_date,
+                source_key=source_key,
+                source_info=source_info,
+            ))
+
+        # Newest first, so early stopping keeps the freshest articles
+        candidates.sort(key=lambda c: c.published_date, reverse=True)
+        return candidates
+
+    def _prepare_candidates(self, candidates: list[FeedCandidate]) -> None:
+        """Pull the RSS image and plain-text summary (runs in a worker thread)."""
+        for candidate in candidates:
+            candidate.image_url = self._extract_image(candidate.entry)
+            summary = BeautifulSoup(self._entry_html(candidate.entry), "html.parser").get_text()
+            candidate.summary = summary[:500] + "..." if len(summary) > 500 else summary
+
+    async def _pipeline_extract(
+        self,
+        candidate: FeedCandidate,
+        semaphore: asyncio.Semaphore,
+        stats: PipelineStats,
+    ) -> Optional[FeedCandidate]:
+        """Extraction stage: fetch the article page, None if it failed."""
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await self._extract_candidate(candidate)
+            except Exception as e:
+                logger.tree("Content Extraction Failed", [
+                    ("URL", candidate.url[:50]),
+                    ("Error", str(e)[:50]),
+                ], emoji="❌")
+                return None
+            finally:
+                stats.add_time("extract", started)
+        stats.extracted += 1
+        return candidate
+
+    async def _pipeline_enrich(
+        self,
+        candidate: FeedCandidate,
+        semaphore: asyncio.Semaphore,
+        stats: PipelineStats,
+    ) -> Optional[Article]:
+        """Enrichment stage: AI calls for one screened article."""
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                article = await self._enrich_candidate(candidate)
+            except Exception as e:
+                # Record failure to dead letter queue
+                error_msg = str(e)[:200]
+                self.record_failure(candidate.url, error_msg)
+                self.record_metric("article_failures", 1)
+                stats.failed += 1
+                logger.warning(f"{self.log_emoji} Failed To Process Article", [
+                    ("Source", candidate.source_info["name"]),
+                    ("URL", candidate.url[:60]),
+                    ("Error", error_msg[:100]),
+                ])
+                return None
+            finally:
+                stats.add_time("enrich", started)
+
+        if article is None:
+            stats.skipped += 1
+            return None
+
+        self.record_metric("articles_processed", 1)
+        self.clear_failure(candidate.url)
+        stats.enriched += 1
+        return article
+
+    def _log_pipeline_stats(self, stats: PipelineStats, survivors: int) -> None:
+        """Log and record the stage timings of a pipeline run."""
+        for stage, elapsed in stats.stage_ms.items():
+            self.record_metric(f"pipeline_{stage}_ms", elapsed)
+
+        logger.tree(f"{self.content_type.capitalize()} Pipeline Complete", [
+            ("Source", stats.source),
+            ("Entries", str(stats.entries)),
+            ("Candidates", str(stats.candidates)),
+            ("Extracted", str(stats.extracted)),
+            ("Skipped", str(stats.skipped)),
+            ("Failed", str(stats.failed)),
+            ("Survivors", str(survivors)),
+            ("Feed", "cached" if stats.feed_cached else "downloaded"),
+            ("Stages", ", ".join(
+                f"{stage} {elapsed:.0f}ms" for stage, elapsed in stats.stage_ms.items()
+            )),
+        ], emoji=self.log_emoji)
+
+    # -------------------------------------------------------------------------
+    # Pipeline Hooks (implemented by each scraper)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    async def _extract_candidate(self, candidate: FeedCandidate) -> None:
+        """Fetch the article page and fill in full_content and media."""
+
+    @abstractmethod
+    def _screen_candidate(self, candidate: FeedCandidate) -> Optional[str]:
+        """Return why an extracted article should be skipped, or None to keep it."""
+
+    @abstractmethod
+    async def _enrich_candidate(self, candidate: FeedCandidate) -> Optional[Article]:
+        """Run the AI calls and build the Article, or None to skip it."""
+
+    # -------------------------------------------------------------------------
+    # RSS Entry Helpers
+    # -------------------------------------------------------------------------
+
+    def _parse_date(self, entry: feedparser.FeedParserDict) -> Optional[datetime]:
+        """Parse publication date from RSS entry."""
+        date_tuple = entry.get("published_parsed") or entry.get("updated_parsed")
+
+        if date_tuple:
+            try:
+                # Create datetime and make it timezone-aware (assume NY timezone for RSS feeds)
+                naive_dt = datetime(*date_tuple[:6])
+                return naive_dt.replace(tzinfo=NY_TZ)
+            except (TypeError, ValueError):
+                pass
+
+        return datetime.now(NY_TZ)
+
+    @staticmethod
+    def _entry_html(entry: feedparser.FeedParserDict) -> str:
+        """Summary HTML of an RSS entry (content field can be list or dict)."""
+        content_field = entry.get("content", [{}])
+        content_value = ""
+        if isinstance(content_field, list) and content_field:
+            content_value = content_field[0].get("value", "")
+        elif isinstance(content_field, dict):
+            content_value = content_field.get("value", "")
+
+        return (
+            entry.get("summary", "")
+            or entry.get("description", "")
+            or content_value
+        )
+
+    def _extract_image(self, entry: feedparser.FeedParserDict) -> Optional[str]:
+        """Extract image URL from RSS entry."""
+        # Try media:content tag
+        if "media_content" in entry:
+            for media in entry.media_content:
+                if "url" in media and any(
+                    ext in media["url"].lower()
+                    for ext in [".jpg", ".jpeg", ".png", ".webp"]
+                ):
+                    return media["url"]
+
+        # Try media:thumbnail tag
+        if "media_thumbnail" in entry and entry.media_thumbnail:
+            return entry.media_thumbnail[0].get("url")
+
+        # Try enclosure tag
+        if "enclosures" in entry and entry.enclosures:
+            for enclosure in entry.enclosures:
+                if enclosure.get("type", "").startswith("image/"):
+                    return enclosure.get("href")
+
+        content = self._entry_html(entry)
+        if content:
+            soup = BeautifulSoup(content, "html.parser")
+            img_tag = soup.find("img")
+            if img_tag and img_tag.get("src"):
+                return img_tag["src"]
+
+        return None
+
+    def _make_url_absolute(self, url_str: str, base_url: str) -> str:
+        """Convert relative URL to absolute URL."""
+        if url_str.startswith("//"):
+            return f"https:{url_str}"
+        elif url_str.startswith("/"):
+            from urllib.parse import urlparse
+            parsed = urlparse(base_url)
+            return f"{parsed.scheme}://{parsed.netloc}{url_str}"
+        elif url_str.startswith("http"):
+            return url_str
+        else:
+            from urllib.parse import urljoin
+            return urljoin(base_url, url_str)
+
     # -------------------------------------------------------------------------
     # AI Generation Methods
     # -------------------------------------------------------------------------
 
+    async def _cached_summary(self, article_id: str, full_content: str) -> tuple[str, str]:
+        """Bilingual summaries from cache, generating and caching them on a miss."""
+        cached_summary = self.ai_cache.get_summary(article_id)
+        if cached_summary:
+            logger.info("💾 Cache Hit - Summary", [
+                ("Article ID", article_id),
+            ])
+            return (cached_summary["arabic_summary"], cached_summary["english_summary"])
+
+        with llm_gateway.track_usage() as spent:
+            arabic_summary, english_summary = await self._generate_bilingual_summary(full_content)
+        self.ai_cache.cache_summary(article_id, arabic_summary, english_summary, tokens=spent[0])
+        logger.info("🔄 Cache Miss - Generated Summary", [
+            ("Article ID", article_id),
+        ])
+        return (arabic_summary, english_summary)
+
+    async def _cached_title(
+        self, article_id: str, original_title: str, full_content: str
+    ) -> Optional[str]:
+        """AI title from cache, generating and caching it on a miss."""
+        cached_title = self.ai_cache.get_title(article_id)
+        if cached_title:
+            logger.info("💾 Cache Hit - Title", [
+                ("Article ID", article_id),
+            ])
+            return cached_title["english_title"]
+
+        with llm_gateway.track_usage() as spent:
+            ai_title = await self._generate_title(original_title, full_content)
+        if ai_title is not None:
+            self.ai_cache.cache_title(article_id, original_title, ai_title, tokens=spent[0])
+            logger.info("🔄 Cache Miss - Generated Title", [
+                ("Article ID", article_id),
+            ])
+        return ai_title
+
+    async def _generate_article_fields(
+        self,
+        article_id: str,
+        original_title: str,
+        content: str,
+        extra_fields: Optional[dict[str, str]] = None,
+    ) -> dict[str, Optional[str]]:
+        """
+        Title, bilingual summaries and key quote for one article.
+
+        DESIGN: These used to be three separate requests that each sent the
+        full article. Fields already cached are reused and the rest, plus any
+        extra_fields (name -> instruction, e.g. a category), are asked for in
+        a single JSON request. Each field is validated on its own; one that is
+        missing or rejected falls back to its dedicated generator, so a bad
+        structured response never costs more than the old separate calls.
+
+        Returns:
+            Dict with "title" (None if no usable title), "arabic_summary",
+            "english_summary", "key_quote" (may be None) and each extra field
+            as returned by the model (None if absent)
+        """
+        extra_fields = extra_fields or {}
+        fields: dict[str, Optional[str]] = {name: None for name in extra_fields}
+        quote_key = AICache.make_key("quote", content, version=QUOTE_PROMPT_VERSION)
+
+        cached_title = self.ai_cache.get_title(article_id)
+        cached_summary = self.ai_cache.get_summary(article_id)
+        cached_quote = self.ai_cache.get(quote_key)
+        fields["title"] = cached_title["english_title"] if cached_title else None
+        fields["arabic_summary"] = cached_summary["arabic_summary"] if cached_summary else None
+        fields["english_summary"] = cached_summary["english_summary"] if cached_summary else None
+        fields["key_quote"] = cached_quote if cached_quote and is_english_only(cached_quote) else None
+
+        wanted: dict[str, str] = {}
+        if fields["title"] is None:
+            wanted["title"] = self.TITLE_RULES
+        if fields["arabic_summary"] is None:
+            wanted["arabic_summary"] = (
+                "Arabic summary, 150-500 characters, complete sentences only: "
+                "what happened, who, where, why it matters"
+            )
+            wanted["english_summary"] = "The same summary in English, 150-500 characters"
+        if fields["key_quote"] is None:
+            wanted["key_quote"] = (
+                "The most compelling statement or quote from the article, in English "
+                "(translate if needed), 1-2 sentences under 200 characters, no quotation marks"
+            )
+        wanted.update(extra_fields)
+
+        data: dict = {}
+        share = 0
+        if wanted and llm_gateway.available:
+            spec = "\n".join(f'- "{name}": {rule}' for name, rule in wanted.items())
+            with llm_gateway.track_usage() as spent:
+                data = await llm_gateway.complete_json(
+                    system_prompt=f"""You are a news editor. Read the article and return a JSON object with exactly these keys:
+{spec}
+
+ACCURACY IS PARAMOUNT: use only facts, names and places stated in the article.""",
+                    user_prompt=f"Original title: {original_title}\n\nFull article content:\n{content}",
+                    max_tokens=1600,
+                    temperature=0.4,
+                    feature=self.content_type,
+                ) or {}
+            # Cost of the merged request, split evenly over the fields it asked for
+            share = spent[0] // len(wanted)
+
+        def response_text(name: str) -> str:
+            value = data.get(name)
+            return value.strip() if isinstance(value, str) else ""
+
+        if "title" in wanted:
+            title = response_text("title").strip('"').strip("'")
+            if title and self._valid_title(title):
+                self.ai_cache.cache_title(article_id, original_title, title, tokens=share)
+                fields["title"] = title
+
+        if "arabic_summary" in wanted:
+            arabic, english = response_text("arabic_summary"), response_text("english_summary")
+            validated = self._validate_summaries(arabic, english) if arabic and english else None
+            if validated:
+                self.ai_cache.cache_summary(article_id, *validated, tokens=share * 2)
+                fields["arabic_summary"], fields["english_summary"] = validated
+
+        if "key_quote" in wanted:
+            quote = response_text("key_quote")
+            quote = self._validate_quote(quote) if quote else None
+            if quote:
+                self.ai_cache.set(quote_key, quote, tokens=share)
+                fields["key_quote"] = quote
+
+        for name in extra_fields:
+            fields[name] = response_text(name) or None
+
+        # Per-field fallback to the dedicated generators, run concurrently
+        fallbacks = {}
+        if fields["title"] is None:
+            fallbacks["title"] = self._cached_title(article_id, original_title, content)
+        if fields["arabic_summary"] is None:
+            fallbacks["summary"] = self._cached_summary(article_id, content)
+        if "key_quote" in wanted and fields["key_quote"] is None:
+            fallbacks["key_quote"] = self._extract_key_quote(content)
+
+        logger.info("🤖 Article Fields Generated", [
+            ("Article ID", article_id),
+            ("Requested", ", ".join(wanted) or "none (all cached)"),
+            ("Fallbacks", ", ".join(fallbacks) or "none"),
+        ])
+
+        results = await asyncio.gather(*fallbacks.values())
+        for name, result in zip(fallbacks, results):
+            if name == "summary":
+                fields["arabic_summary"], fields["english_summary"] = result
+            else:
+                fields[name] = result
+        return fields
+
+    def _valid_title(self, title: str) -> bool:
+        """Whether a generated title is usable as-is."""
+        return is_english_only(title)
+
     async def _generate_title(self, original_title: str, content: str) -> Optional[str]:
         """
         Generate an English title using AI.
@@ -435,31 +976,27 @@ class BaseScraper:
         Returns:
             AI-generated English title, or None if generation fails
         """
-        if not self.openai_client:
+        if not llm_gateway.available:
             logger.warning("🤖 OpenAI Client Not Initialized For Title", [
                 ("Action", "Skipping article"),
                 ("Original", original_title[:50]),
             ])
             return None
 
-        # Check cache first
-        cache_key: str = f"title_{original_title[:100]}"
-        cached: Optional[str] = self.ai_cache.get(cache_key)
-        if cached:
-            logger.info("🤖 Cache Hit - Title", [
-                ("Original", original_title[:30]),
-                ("Cached", cached[:30]),
-            ])
-            return cached
+        # Identical requests share one cached or in-flight result
+        cache_key: str = AICache.make_key(
+            "title", original_title, content, version=TITLE_PROMPT_VERSION
+        )
 
-        logger.info("🤖 Generating Title", [
-            ("Original", original_title[:50]),
-            ("Content Length", f"{len(content)} chars"),
-        ])
+        async def generate() -> Optional[str]:
+            logger.info("🤖 Generating Title", [
+                ("Original", original_title[:50]),
+                ("Content Length", f"{len(content)} chars"),
+            ])
 
-        try:
-            response = await self._call_openai(
-                system_prompt="""You are a news headline writer. Generate a concise, engaging title in ENGLISH ONLY (3-7 words) for this article.
+            try:
+                response = await self._call_openai(
+                    system_prompt="""You are a news headline writer. Generate a concise, engaging title in ENGLISH ONLY (3-7 words) for this article.
 
 CRITICAL RULES:
 1. The title MUST be in English, not Arabic. Translate Arabic titles to English.
@@ -467,55 +1004,85 @@ CRITICAL RULES:
 3. DO NOT hallucinate or guess location names. If the article mentions "Aleppo" (حلب), use "Aleppo". If it mentions "Homs" (حمص), use "Homs".
 4. Read the content carefully to identify the correct city/location mentioned.
 5. Return ONLY the English title, no quotes or explanation.""",
-                user_prompt=f"Original title: {original_title}\n\nFull article content:\n{content}",
-                max_tokens=50,
-                temperature=0.3,
-            )
-            title: str = response.strip().strip('"').strip("'")
-
-            # Validate the title is actually English
-            if not is_english_only(title):
-                logger.warning("🤖 Generated Title Not English - Retrying", [
-                    ("Original", original_title[:30]),
-                    ("Generated", title[:30]),
-                ])
-                # Retry with more explicit instruction
-                response = await self._call_openai(
-                    system_prompt="Translate this Arabic headline to English. Return ONLY the English translation, nothing else.",
-                    user_prompt=original_title,
+                    user_prompt=f"Original title: {original_title}\n\nFull article content:\n{content}",
                     max_tokens=50,
-                    temperature=0.2,
+                    temperature=0.3,
                 )
-                title = response.strip().strip('"').strip("'")
+                title: str = response.strip().strip('"').strip("'")
 
-                # If still not English, generate a generic title from content
+                # Validate the title is actually English
                 if not is_english_only(title):
-                    logger.warning("🤖 Retry Failed - Generating From Content", [
+                    logger.warning("🤖 Generated Title Not English - Retrying", [
                         ("Original", original_title[:30]),
+                        ("Generated", title[:30]),
                     ])
+                    # Retry with more explicit instruction
                     response = await self._call_openai(
-                        system_prompt="Generate a 3-5 word English headline summarizing this article. English only.",
-                        user_prompt=f"Article content:\n{content[:500]}",
-                        max_tokens=30,
-                        temperature=0.3,
+                        system_prompt="Translate this Arabic headline to English. Return ONLY the English translation, nothing else.",
+                        user_prompt=original_title,
+                        max_tokens=50,
+                        temperature=0.2,
                     )
                     title = response.strip().strip('"').strip("'")
 
-            self.ai_cache.set(cache_key, title)
-            logger.success("🤖 Title Generated", [
-                ("Original", original_title[:30]),
-                ("Generated", title[:50]),
-            ])
-            return title
-        except Exception as e:
-            logger.warning("🤖 Failed to Generate Title", [
-                ("Error", str(e)),
-                ("Original", original_title[:30]),
-                ("Action", "Skipping article"),
-            ])
-            # Return None to signal that this article should be skipped
+                    # If still not English, generate a generic title from content
+                    if not is_english_only(title):
+                        logger.warning("🤖 Retry Failed - Generating From Content", [
+                            ("Original", original_title[:30]),
+                        ])
+                        response = await self._call_openai(
+                            system_prompt="Generate a 3-5 word English headline summarizing this article. English only.",
+                            user_prompt=f"Article content:\n{content[:500]}",
+                            max_tokens=30,
+                            temperature=0.3,
+                        )
+                        title = response.strip().strip('"').strip("'")
+
+                logger.success("🤖 Title Generated", [
+                    ("Original", original_title[:30]),
+                    ("Generated", title[:50]),
+                ])
+                return title
+            except Exception as e:
+                logger.warning("🤖 Failed to Generate Title", [
+                    ("Error", str(e)),
+                    ("Original", original_title[:30]),
+                    ("Action", "Skipping article"),
+                ])
+                # Return None to signal that this article should be skipped
+                return None
+
+        return await self.ai_cache.get_or_compute(cache_key, generate)
+
+    def _validate_quote(self, response: str) -> Optional[str]:
+        """
+        Clean an AI key quote and check it is a usable English sentence.
+
+        Returns:
+            The quote without surrounding quotation marks, or None if it is
+            the wrong length or not in English
+        """
+        quote = response.strip().strip('"').strip("'")
+
+        # Validate quote is reasonable length
+        if len(quote) < 20 or len(quote) > 250:
+            logger.tree("Key Quote Validation Failed", [
+                ("Reason", "Invalid length"),
+                ("Length", f"{len(quote)} chars"),
+                ("Quote Preview", quote[:50] if quote else "empty"),
+            ], emoji="❌")
             return None
 
+        # Validate quote is in English
+        if not is_english_only(quote):
+            logger.tree("Key Quote Validation Failed", [
+                ("Reason", "Not in English"),
+                ("Quote Preview", quote[:50]),
+            ], emoji="❌")
+            return None
+
+        return quote
+
     async def _extract_key_quote(self, content: str) -> Optional[str]:
         """
         Extract a compelling key quote from article content using AI.
@@ -526,38 +1093,25 @@ CRITICAL RULES:
         Returns:
             Extracted quote in English, or None if extraction fails
         """
-        if not self.openai_client:
+        if not llm_gateway.available:
             logger.tree("Key Quote Extraction Skipped", [
                 ("Reason", "OpenAI client not initialized"),
                 ("Content Length", f"{len(content)} chars"),
             ], emoji="⏭️")
             return None
 
-        # Check cache first (v2 = English-only validation added)
-        cache_key: str = f"quote_v2_{content[:100]}"
-        cached: Optional[str] = self.ai_cache.get(cache_key)
-        if cached:
-            # Double-check cached quote is English (safety net)
-            if is_english_only(cached):
-                logger.tree("Key Quote Cache Hit", [
-                    ("Quote", cached[:50]),
-                    ("Source", "AI Cache"),
-                ], emoji="💾")
-                return cached
-            else:
-                logger.tree("Key Quote Cache Invalidated", [
-                    ("Reason", "Cached quote not English"),
-                    ("Quote Preview", cached[:30]),
-                ], emoji="🔄")
+        # Identical requests share one cached or in-flight result
+        cache_key: str = AICache.make_key("quote", content, version=QUOTE_PROMPT_VERSION)
 
-        logger.tree("Extracting Key Quote", [
-            ("Content Length", f"{len(content)} chars"),
-            ("Method", "OpenAI API"),
-        ], emoji="🔍")
+        async def generate() -> Optional[str]:
+            logger.tree("Extracting Key Quote", [
+                ("Content Length", f"{len(content)} chars"),
+                ("Method", "OpenAI API"),
+            ], emoji="🔍")
 
-        try:
-            response = await self._call_openai(
-                system_prompt="""You are a news editor. Extract the most compelling quote or statement from this article and OUTPUT IN ENGLISH ONLY.
+            try:
+                response = await self._call_openai(
+                    system_prompt="""You are a news editor. Extract the most compelling quote or statement from this article and OUTPUT IN ENGLISH ONLY.
 
 CRITICAL RULES:
 1. OUTPUT MUST BE IN ENGLISH - translate Arabic content to English
@@ -574,45 +1128,30 @@ Examples of CORRECT output:
 - This marks the first diplomatic meeting between the two countries in 12 years
 
 Return ONLY the extracted quote IN ENGLISH, nothing else.""",
-                user_prompt=f"Extract a key quote IN ENGLISH from this article:\n\n{content[:2000]}",
-                max_tokens=100,
-                temperature=0.3,
-            )
+                    user_prompt=f"Extract a key quote IN ENGLISH from this article:\n\n{content[:2000]}",
+                    max_tokens=100,
+                    temperature=0.3,
+                )
 
-            quote = response.strip().strip('"').strip("'")
+                quote = self._validate_quote(response)
+                if quote is None:
+                    return None
 
-            # Validate quote is reasonable length
-            if len(quote) < 20 or len(quote) > 250:
-                logger.tree("Key Quote Validation Failed", [
-                    ("Reason", "Invalid length"),
+                logger.tree("Key Quote Extracted Successfully", [
+                    ("Quote", quote[:60]),
                     ("Length", f"{len(quote)} chars"),
-                    ("Quote Preview", quote[:50] if quote else "empty"),
-                ], emoji="❌")
-                return None
-
-            # Validate quote is in English
-            if not is_english_only(quote):
-                logger.tree("Key Quote Validation Failed", [
-                    ("Reason", "Not in English"),
-                    ("Quote Preview", quote[:50]),
+                ], emoji="✅")
+                return quote
+
+            except Exception as e:
+                logger.tree("Key Quote Extraction Failed", [
+                    ("Error Type", type(e).__name__),
+                    ("Error", str(e)[:80]),
+                    ("Content Length", f"{len(content)} chars"),
                 ], emoji="❌")
                 return None
 
-            self.ai_cache.set(cache_key, quote)
-            logger.tree("Key Quote Extracted Successfully", [
-                ("Quote", quote[:60]),
-                ("Length", f"{len(quote)} chars"),
-                ("Cached", "Yes"),
-            ], emoji="✅")
-            return quote
-
-        except Exception as e:
-            logger.tree("Key Quote Extraction Failed", [
-                ("Error Type", type(e).__name__),
-                ("Error", str(e)[:80]),
-                ("Content Length", f"{len(content)} chars"),
-            ], emoji="❌")
-            return None
+        return await self.ai_cache.get_or_compute(cache_key, generate)
 
     def _truncate_at_sentence(self, text: str, max_length: int) -> str:
         """
@@ -672,6 +1211,106 @@ Return ONLY the extracted quote IN ENGLISH, nothing else.""",
         ])
         return result
 
+    def _validate_summaries(
+        self,
+        arabic: str,
+        english: str,
+        min_length: int = 150,
+        max_length: int = 500,
+    ) -> Optional[tuple[str, str]]:
+        """
+        Check AI summaries and trim them to max_length at a sentence boundary.
+
+        Returns:
+            (arabic, english), or None if either is too short, garbage, or
+            the two are not actually different languages
+        """
+        # Validate summaries - reject if too short (likely just author name or garbage)
+        if len(arabic) < min_length or len(english) < min_length:
+            logger.warning("🤖 AI Summary Too Short - Rejected", [
+                ("Arabic Len", str(len(arabic))),
+                ("Arabic Preview", arabic[:50] if arabic else "empty"),
+                ("English Len", str(len(english))),
+                ("English Preview", english[:50] if english else "empty"),
+                ("Min Required", str(min_length)),
+                ("Action", "Using fallback"),
+            ])
+            return None
+
+        # Validate summaries - reject garbage/repeated content
+        def is_garbage_summary(text: str) -> tuple[bool, str]:
+            """Detect garbage summaries like repeated dates or patterns.
+
+            Returns:
+                Tuple of (is_garbage, reason)
+            """
+            import re
+
+            lines = [l.strip() for l in text.split('\n') if l.strip()]
+
+            # If more than 3 lines and most are identical, it's garbage
+            if len(lines) > 3:
+                unique_lines = set(lines)
+                if len(unique_lines) <= 2:  # Almost all lines are the same
+                    return (True, f"identical_lines ({len(unique_lines)} unique of {len(lines)})")
+
+            # Check for repeated short patterns (like "2025-12-08" repeated)
+            if len(lines) > 5:
+                first_line = lines[0]
+                repeat_count = lines.count(first_line)
+                if len(first_line) < 20 and repeat_count > len(lines) // 2:
+                    return (True, f"repeated_pattern ('{first_line[:20]}' x{repeat_count})")
+
+            # Check if content is mostly just dates or numbers
+            date_pattern = r'\d{4}-\d{2}-\d{2}'
+            date_matches = re.findall(date_pattern, text)
+            if len(date_matches) > 5 and len(text) < 200:
+                return (True, f"date_spam ({len(date_matches)} dates in {len(text)} chars)")
+
+            return (False, "")
+
+        arabic_garbage, arabic_reason = is_garbage_summary(arabic)
+        english_garbage, english_reason = is_garbage_summary(english)
+
+        if arabic_garbage or english_garbage:
+            logger.warning("🤖 AI Summary Is Garbage - Rejected", [
+                ("Arabic Garbage", str(arabic_garbage)),
+                ("Arabic Reason", arabic_reason if arabic_garbage else "OK"),
+                ("English Garbage", str(english_garbage)),
+                ("English Reason", english_reason if english_garbage else "OK"),
+                ("Arabic Preview", arabic[:100].replace('\n', ' ')),
+                ("English Preview", english[:100].replace('\n', ' ')),
+                ("Action", "Using fallback"),
+            ])
+            return None
+
+        # Safety truncation at sentence boundary (not mid-word)
+        truncated_arabic = False
+        truncated_english = False
+        if len(arabic) > max_length:
+            arabic = self._truncate_at_sentence(arabic, max_length)
+            truncated_arabic = True
+        if len(english) > max_length:
+            english = self._truncate_at_sentence(english, max_length)
+            truncated_english = True
+
+        # Validate that Arabic and English are actually different
+        if arabic == english or arabic[:100] == english[:100]:
+            logger.warning("🤖 AI Summary Not Bilingual - Rejected", [
+                ("Reason", "Arabic and English are identical"),
+                ("Action", "Using fallback"),
+            ])
+            return None
+
+        # Log successful generation
+        logger.success("🤖 Bilingual Summary Generated", [
+            ("Arabic Len", str(len(arabic))),
+            ("English Len", str(len(english))),
+            ("Arabic Truncated", str(truncated_arabic)),
+            ("English Truncated", str(truncated_english)),
+        ])
+        return (arabic, english)
+
     async def _generate_bilingual_summary(
         self,
         content: str,
@@ -704,35 +1343,30 @@ Return ONLY the extracted quote IN ENGLISH, nothing else.""",
             ])
             return (fallback, fallback)  # Return same content for both languages
 
-        if not self.openai_client:
+        if not llm_gateway.available:
             logger.warning("🤖 OpenAI Client Not Initialized", [
                 ("Action", "Using fallback summaries"),
             ])
             return create_fallback_summaries()
 
-        # Log input content info
-        logger.info("🤖 Generating Bilingual Summary", [
-            ("Content Length", f"{len(content)} chars"),
-            ("Content Preview", content[:100].replace('\n', ' ') + "..."),
-            ("Min Length", str(min_length)),
-            ("Max Length", str(max_length)),
-        ])
+        # Identical requests share one cached or in-flight result
+        cache_key: str = AICache.make_key(
+            "summary", content, str(min_length), str(max_length),
+            version=SUMMARY_PROMPT_VERSION,
+        )
 
-        # Check cache first
-        cache_key: str = f"summary_{content[:200]}"
-        cached: Optional[str] = self.ai_cache.get(cache_key)
-        if cached and isinstance(cached, str):
-            parts = cached.split("|||")
-            if len(parts) == 2:
-                logger.info("🤖 Cache Hit - Bilingual Summary", [
-                    ("Arabic Length", str(len(parts[0]))),
-                    ("English Length", str(len(parts[1]))),
-                ])
-                return (parts[0], parts[1])
+        async def generate() -> Optional[str]:
+            # Log input content info
+            logger.info("🤖 Generating Bilingual Summary", [
+                ("Content Length", f"{len(content)} chars"),
+                ("Content Preview", content[:100].replace('\n', ' ') + "..."),
+                ("Min Length", str(min_length)),
+                ("Max Length", str(max_length)),
+            ])
 
-        try:
-            response = await self._call_openai(
-                system_prompt=f"""You are a news summarizer. Generate summaries in Arabic AND English.
+            try:
+                response = await self._call_openai(
+                    system_prompt=f"""You are a news summarizer. Generate summaries in Arabic AND English.
 
 OUTPUT FORMAT (VERY IMPORTANT - follow exactly):
 [Arabic summary here]|||[English summary here]
@@ -748,140 +1382,63 @@ REQUIREMENTS:
 
 Example format:
 هذا ملخص باللغة العربية يحتوي على التفاصيل الكاملة للمقال.|||This is the English summary with full article details.""",
-                user_prompt=f"Summarize this article:\n\n{content}",
-                max_tokens=1200,
-                temperature=0.5,
-            )
-
-            # Log raw AI response for debugging
-            logger.debug("🤖 AI Raw Response", [
-                ("Length", str(len(response))),
-                ("Preview", response[:200].replace('\n', ' ') if response else "empty"),
-                ("Has Separator", str("|||" in response)),
-            ])
+                    user_prompt=f"Summarize this article:\n\n{content}",
+                    max_tokens=1200,
+                    temperature=0.5,
+                )
 
-            # Try primary separator first
-            parts = response.split("|||")
-
-            # Fallback: try other common separators if primary fails
-            if len(parts) < 2:
-                for sep in ["---", "===", "\n\n\n", "ENGLISH:", "English:"]:
-                    if sep in response:
-                        parts = response.split(sep, 1)
-                        if len(parts) >= 2:
-                            logger.info("🤖 Used Fallback Separator", [
-                                ("Separator", repr(sep)),
-                            ])
-                            break
-
-            if len(parts) >= 2:
-                arabic: str = parts[0].strip()
-                english: str = parts[1].strip()
-
-                # Validate summaries - reject if too short (likely just author name or garbage)
-                if len(arabic) < min_length or len(english) < min_length:
-                    logger.warning("🤖 AI Summary Too Short - Rejected", [
-                        ("Arabic Len", str(len(arabic))),
-                        ("Arabic Preview", arabic[:50] if arabic else "empty"),
-                        ("English Len", str(len(english))),
-                        ("English Preview", english[:50] if english else "empty"),
-                        ("Min Required", str(min_length)),
-                        ("Action", "Using fallback"),
-                    ])
-                    return create_fallback_summaries()
-
-                # Validate summaries - reject garbage/repeated content
-                def is_garbage_summary(text: str) -> tuple[bool, str]:
-                    """Detect garbage summaries like repeated dates or patterns.
-
-                    Returns:
-                        Tuple of (is_garbage, reason)
-                    """
-                    import re
-
-                    lines = [l.strip() for l in text.split('\n') if l.strip()]
-
-                    # If more than 3 lines and most are identical, it's garbage
-                    if len(lines) > 3:
-                        unique_lines = set(lines)
-                        if len(unique_lines) <= 2:  # Almost all lines are the same
-                            return (True, f"identical_lines ({len(unique_lines)} unique of {len(lines)})")
-
-                    # Check for repeated short patterns (like "2025-12-08" repeated)
-                    if len(lines) > 5:
-                        first_line = lines[0]
-                        repeat_count = lines.count(first_line)
-                        if len(first_line) < 20 and repeat_count > len(lines) // 2:
-                            return (True, f"repeated_pattern ('{first_line[:20]}' x{repeat_count})")
-
-                    # Check if content is mostly just dates or numbers
-                    date_pattern = r'\d{4}-\d{2}-\d{2}'
-                    date_matches = re.findall(date_pattern, text)
-                    if len(date_matches) > 5 and len(text) < 200:
-                        return (True, f"date_spam ({len(date_matches)} dates in {len(text)} chars)")
-
-                    return (False, "")
-
-                arabic_garbage, arabic_reason = is_garbage_summary(arabic)
-                english_garbage, english_reason = is_garbage_summary(english)
-
-                if arabic_garbage or english_garbage:
-                    logger.warning("🤖 AI Summary Is Garbage - Rejected", [
-                        ("Arabic Garbage", str(arabic_garbage)),
-                        ("Arabic Reason", arabic_reason if arabic_garbage else "OK"),
-                        ("English Garbage", str(english_garbage)),
-                        ("English Reason", english_reason if english_garbage else "OK"),
-                        ("Arabic Preview", arabic[:100].replace('\n', ' ')),
-                        ("English Preview", english[:100].replace('\n', ' ')),
-                        ("Action", "Using fallback"),
-                    ])
-                    return create_fallback_summaries()
-
-                # Safety truncation at sentence boundary (not mid-word)
-                truncated_arabic = False
-                truncated_english = False
-                if len(arabic) > max_length:
-                    arabic = self._truncate_at_sentence(arabic, max_length)
-                    truncated_arabic = True
-                if len(english) > max_length:
-                    english = self._truncate_at_sentence(english, max_length)
-                    truncated_english = True
-
-                # Validate that Arabic and English are actually different
-                if arabic == english or arabic[:100] == english[:100]:
-                    logger.warning("🤖 AI Summary Not Bilingual - Rejected", [
-                        ("Reason", "Arabic and English are identical"),
-                        ("Action", "Using fallback"),
-                    ])
-                    return create_fallback_summaries()
-
-                # Log successful generation
-                logger.success("🤖 Bilingual Summary Generated", [
-                    ("Arabic Len", str(len(arabic))),
-                    ("English Len", str(len(english))),
-                    ("Arabic Truncated", str(truncated_arabic)),
-                    ("English Truncated", str(truncated_english)),
+                # Log raw AI response for debugging
+                logger.debug("🤖 AI Raw Response", [
+                    ("Length", str(len(response))),
+                    ("Preview", response[:200].replace('\n', ' ') if response else "empty"),
+                    ("Has Separator", str("|||" in response)),
                 ])
 
-                # Cache the result
-                self.ai_cache.set(cache_key, f"{arabic}|||{english}")
-                return (arabic, english)
+                # Try primary separator first
+                parts = response.split("|||")
+
+                # Fallback: try other common separators if primary fails
+                if len(parts) < 2:
+                    for sep in ["---", "===", "\n\n\n", "ENGLISH:", "English:"]:
+                        if sep in response:
+                            parts = response.split(sep, 1)
+                            if len(parts) >= 2:
+                                logger.info("🤖 Used Fallback Separator", [
+                                    ("Separator", repr(sep)),
+                                ])
+                                break
+
+                if len(parts) >= 2:
+                    validated = self._validate_summaries(
+                        parts[0].strip(), parts[1].strip(), min_length, max_length
+                    )
+                    if validated is None:
+                        return None
+
+                    arabic, english = validated
+                    return f"{arabic}|||{english}"
+
+                # AI returned invalid format - use fallback
+                logger.warning("🤖 Invalid AI Summary Format", [
+                    ("Response Length", str(len(response)) if response else "0"),
+                    ("Response Preview", response[:150].replace('\n', ' ') if response else "empty"),
+                    ("Parts Found", str(len(parts))),
+                    ("Action", "Using fallback"),
+                ])
+                return None
 
-            # AI returned invalid format - use fallback
-            logger.warning("🤖 Invalid AI Summary Format", [
-                ("Response Length", str(len(response)) if response else "0"),
-                ("Response Preview", response[:150].replace('\n', ' ') if response else "empty"),
-                ("Parts Found", str(len(parts))),
-                ("Action", "Using fallback"),
-            ])
-            return create_fallback_summaries()
+            except Exception as e:
+                logger.warning("🤖 Failed to Generate Summaries", [
+                    ("Error", str(e)),
+                    ("Action", "Using fallback"),
+                ])
+                return None
 
-        except Exception as e:
-            logger.warning("🤖 Failed to Generate Summaries", [
-                ("Error", str(e)),
-                ("Action", "Using fallback"),
-            ])
-            return create_fallback_summaries()
+        cached = await self.ai_cache.get_or_compute(cache_key, generate)
+        parts = cached.split("|||") if cached else []
+        if len(parts) == 2:
+            return (parts[0], parts[1])
+        return create_fallback_summaries()
 
     async def _call_openai(
         self,
@@ -891,7 +1448,7 @@ Example format:
         temperature: float = 0.7,
     ) -> str:
         """
-        Make an OpenAI API call with exponential backoff retry and adaptive rate limiting.
+        Make an OpenAI API call through the shared LLM gateway.
 
         Args:
             system_prompt: System message for context
@@ -900,123 +1457,22 @@ Example format:
             temperature: Creativity level (0-1)
 
         Returns:
-            AI response text
+            AI response text ("" if unavailable or all retries failed)
 
         Raises:
             AuthenticationError: Invalid API key (no retry)
-            APIError: After all retries exhausted
         """
-        if not self.openai_client:
-            return ""
-
-        last_exception: Optional[Exception] = None
-
-        # Wait if rate limited
-        await _rate_limiter.wait_if_needed()
-
-        for attempt in range(OpenAIRetryConfig.MAX_RETRIES):
-            try:
-                # Track latency
-                start_time = time.time()
-
-                # Use asyncio.to_thread to make synchronous OpenAI call non-blocking
-                response = await asyncio.to_thread(
-                    self.openai_client.chat.completions.create,
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-
-                # Record latency
-                latency_ms = (time.time() - start_time) * 1000
-                _rate_limiter.record_latency(latency_ms)
-                self.record_metric("ai_latency_ms", latency_ms)
-
-                return response.choices[0].message.content.strip()
-
-            except AuthenticationError as e:
-                # Invalid API key - don't retry
-                logger.error("OpenAI Authentication Failed", [
-                    ("Error", "Invalid API key"),
-                    ("Action", "Check OPENAI_API_KEY environment variable"),
-                ])
-                raise
-
-            except RateLimitError as e:
-                # Parse Retry-After header if available
-                retry_after = getattr(e, 'retry_after', None)
-                if retry_after:
-                    _rate_limiter.set_retry_after(float(retry_after))
-                    delay = float(retry_after)
-                else:
-                    base_delay = OpenAIRetryConfig.BASE_DELAY * (OpenAIRetryConfig.EXPONENTIAL_BASE ** attempt)
-                    delay = _rate_limiter.get_delay_with_jitter(min(base_delay, OpenAIRetryConfig.MAX_DELAY))
-
-                logger.warning("OpenAI Rate Limited", [
-                    ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
-                    ("Retry In", f"{delay:.1f}s"),
-                    ("Throttle Level", f"{_rate_limiter.throttle_level:.1f}x"),
-                ])
-                self.record_metric("ai_rate_limit", 1)
-                last_exception = e
-                await asyncio.sleep(delay)
-
-            except APIConnectionError as e:
-                # Network error - retry with backoff + jitter
-                base_delay = OpenAIRetryConfig.BASE_DELAY * (OpenAIRetryConfig.EXPONENTIAL_BASE ** attempt)
-                delay = _rate_limiter.get_delay_with_jitter(min(base_delay, OpenAIRetryConfig.MAX_DELAY))
-
-                logger.warning("OpenAI Connection Error", [
-                    ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
-                    ("Error", str(e)[:100]),
-                    ("Retry In", f"{delay:.1f}s"),
-                ])
-                self.record_metric("ai_connection_error", 1)
-                last_exception = e
-                await asyncio.sleep(delay)
-
-            except APIError as e:
-                # Other API error - retry with backoff + jitter
-                base_delay = OpenAIRetryConfig.BASE_DELAY * (OpenAIRetryConfig.EXPONENTIAL_BASE ** attempt)
-                delay = _rate_limiter.get_delay_with_jitter(min(base_delay, OpenAIRetryConfig.MAX_DELAY))
-
-                logger.warning("OpenAI API Error", [
-                    ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
-                    ("Error", str(e)[:100]),
-                    ("Retry In", f"{delay:.1f}s"),
-                ])
-                self.record_metric("ai_api_error", 1)
-                last_exception = e
-                await asyncio.sleep(delay)
-
-            except TimeoutError as e:
-                # Timeout - retry with backoff + jitter
-                base_delay = OpenAIRetryConfig.BASE_DELAY * (OpenAIRetryConfig.EXPONENTIAL_BASE ** attempt)
-                delay = _rate_limiter.get_delay_with_jitter(min(base_delay, OpenAIRetryConfig.MAX_DELAY))
-
-                logger.warning("OpenAI Timeout", [
-                    ("Attempt", f"{attempt + 1}/{OpenAIRetryConfig.MAX_RETRIES}"),
-                    ("Retry In", f"{delay:.1f}s"),
-                ])
-                self.record_metric("ai_timeout", 1)
-                last_exception = e
-                await asyncio.sleep(delay)
-
-        # All retries exhausted
-        logger.error("OpenAI API Failed After Retries", [
-            ("Retries", str(OpenAIRetryConfig.MAX_RETRIES)),
-            ("Last Error", str(last_exception)[:100] if last_exception else "Unknown"),
-        ])
-        self.record_metric("ai_total_failure", 1)
-        return ""
+        return await llm_gateway.complete(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            feature=self.content_type,
+        )
 
 
 # =============================================================================
 # Module Export
 # =============================================================================
 
-__all__ = ["Article", "BaseScraper"]
+__all__ = ["Article", "BaseScraper", "FeedCandidate", "PipelineStats", "EXTRACTION_ERRORS"]
@@ -8,7 +8,7 @@ Sources:
 - Enab Baladi (عنب بلدي) - Primary Syrian news
 
 Features:
-- RSS feed parsing with fallback
+- Pipelined RSS processing (see BaseScraper._run_pipeline)
 - Image extraction from articles
 - AI-powered title generation
 - Bilingual summaries (Arabic + English)
@@ -20,14 +20,15 @@ Server: discord.gg/syria
 """
 
 import asyncio
-import feedparser
+import re
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import Optional
 
 from src.core.logger import logger
 from src.core.config import NEWS_FORUM_TAGS, NY_TZ
-from src.services.scrapers.base import BaseScraper, Article
+from src.services.scrapers.base import BaseScraper, Article, FeedCandidate, EXTRACTION_ERRORS
+from src.services.llm_gateway import llm_gateway
 
 
 class NewsScraper(BaseScraper):
@@ -72,8 +73,10 @@ class NewsScraper(BaseScraper):
 
         for source_key, source_info in self.NEWS_SOURCES.items():
             try:
-                articles = await self._fetch_from_source(
-                    source_key, source_info, cutoff_time, max_articles * 10
+                # Posted articles are filtered before extraction, so each
+                # source only needs to produce max_articles survivors
+                articles = await self._run_pipeline(
+                    source_key, source_info, cutoff_time, max_articles
                 )
                 all_articles.extend(articles)
                 logger.success(
@@ -114,336 +117,126 @@ class NewsScraper(BaseScraper):
             ])
             return []
 
-    async def _fetch_from_source(
-        self,
-        source_key: str,
-        source_info: dict[str, str],
-        cutoff_time: datetime,
-        max_articles: int,
-    ) -> list[Article]:
-        """Fetch articles from a single RSS source with parallel content extraction."""
-        import asyncio
-
-        articles: list[Article] = []
+    # -------------------------------------------------------------------------
+    # Pipeline Hooks
+    # -------------------------------------------------------------------------
 
-        feed = feedparser.parse(source_info["rss_url"])
+    def _feed_sources(self) -> dict[str, dict[str, str]]:
+        """RSS sources of this scraper."""
+        return self.NEWS_SOURCES
 
-        if not feed.entries:
-            logger.warning("📰 No Entries in Feed", [
-                ("Source", source_info['name']),
+    async def _extract_candidate(self, candidate: FeedCandidate) -> None:
+        """Fetch the article page and fill in its content, image and video."""
+        full_content, scraped_image, scraped_video = await self._extract_full_content(
+            candidate.url, candidate.source_key
+        )
+        candidate.full_content = full_content
+        candidate.scraped_image = scraped_image
+        candidate.video_url = scraped_video
+
+        # Prefer scraped image
+        if not candidate.image_url and scraped_image:
+            candidate.image_url = scraped_image
+
+    def _screen_candidate(self, candidate: FeedCandidate) -> Optional[str]:
+        """Skip articles without media, with failed or garbage content, or duplicates."""
+        full_content = candidate.full_content
+
+        # Skip articles without media
+        if not candidate.image_url and not candidate.video_url:
+            return "No image or video"
+
+        # Skip articles with failed/garbage content extraction
+        if any(err in full_content for err in EXTRACTION_ERRORS):
+            return f"Content extraction failed: {full_content[:50]}"
+
+        is_garbage, garbage_reason = self._is_garbage_content(full_content)
+        if is_garbage:
+            logger.warning("📰 Skipping Article With Garbage Content", [
+                ("Title", candidate.entry.get('title', 'Untitled')[:50]),
+                ("URL", candidate.url[:60]),
+                ("Reason", garbage_reason),
+                ("Content Preview", full_content[:150].replace('\n', ' ')),
+                ("Content Length", str(len(full_content))),
             ])
-            return articles
-
-        # Phase 1: Filter entries that pass initial checks
-        valid_entries: list[tuple] = []  # (entry, published_date, image_url, summary)
-
-        for entry in feed.entries[: max_articles * 2]:
-            article_url = entry.get("link", "")
-
-            # Check if article is quarantined (too many failures)
-            if self.is_quarantined(article_url):
-                logger.tree("Skipping Quarantined Article", [
-                    ("URL", article_url[:60]),
-                ], emoji="⏭️")
-                continue
-
-            # Parse date
-            published_date = self._parse_date(entry)
-            if not published_date or published_date < cutoff_time:
-                continue
-
-            # Extract image from RSS
-            image_url = await self._extract_image(entry)
-
-            # Get summary - handle content field which can be list or dict
-            content_field = entry.get("content", [{}])
-            content_value = ""
-            if isinstance(content_field, list) and content_field:
-                content_value = content_field[0].get("value", "")
-            elif isinstance(content_field, dict):
-                content_value = content_field.get("value", "")
-
-            summary = (
-                entry.get("summary", "")
-                or entry.get("description", "")
-                or content_value
-            )
-            summary = BeautifulSoup(summary, "html.parser").get_text()
-            summary = summary[:500] + "..." if len(summary) > 500 else summary
-
-            valid_entries.append((entry, published_date, image_url, summary))
-
-        if not valid_entries:
-            return articles
-
-        # Phase 2: Extract content in parallel (batch of 5)
-        PARALLEL_BATCH_SIZE = 5
-        logger.tree("Parallel Content Extraction Starting", [
-            ("Valid Entries", str(len(valid_entries))),
-            ("Batch Size", str(PARALLEL_BATCH_SIZE)),
-        ], emoji="⚡")
-
-        async def extract_content_wrapper(entry_data: tuple) -> Optional[tuple]:
-            """Wrapper to extract content and return with entry data."""
-            entry, published_date, image_url, summary = entry_data
-            article_url = entry.get("link", "")
-            try:
-                full_content, scraped_image, scraped_video = await self._extract_full_content(
-                    article_url, source_key
-                )
-                return (entry, published_date, image_url, summary, full_content, scraped_image, scraped_video)
-            except Exception as e:
-                logger.tree("Content Extraction Failed", [
-                    ("URL", article_url[:50]),
-                    ("Error", str(e)[:50]),
-                ], emoji="❌")
-                return None
-
-        # Process in batches
-        extracted_results: list[tuple] = []
-        for i in range(0, len(valid_entries), PARALLEL_BATCH_SIZE):
-            batch = valid_entries[i:i + PARALLEL_BATCH_SIZE]
-            batch_results = await asyncio.gather(
-                *[extract_content_wrapper(entry_data) for entry_data in batch],
-                return_exceptions=True
-            )
-            for result in batch_results:
-                if result and not isinstance(result, Exception):
-                    extracted_results.append(result)
-
-        logger.tree("Parallel Content Extraction Complete", [
-            ("Extracted", str(len(extracted_results))),
-            ("Failed", str(len(valid_entries) - len(extracted_results))),
-        ], emoji="✅")
-
-        # Phase 3: Process extracted content sequentially (AI calls)
-        for result in extracted_results:
-            try:
-                entry, published_date, image_url, summary, full_content, scraped_image, scraped_video = result
-                article_url = entry.get("link", "")
-
-                # Prefer scraped image
-                if not image_url and scraped_image:
-                    image_url = scraped_image
-
-                # Skip articles without media
-                if not image_url and not scraped_video:
-                    logger.info("📰 Skipping Article Without Media", [
-                        ("Title", entry.get('title', 'Untitled')[:50]),
-                    ])
-                    continue
-
-                # Skip articles with failed/garbage content extraction
-                error_messages = [
-                    "Content unavailable",
-                    "Could not fetch article content",
-                    "Could not extract article text",
-                    "Content extraction failed",
-                    "Article fetch timed out",
-                ]
-                if any(err in full_content for err in error_messages):
-                    logger.info("📰 Skipping Article With Failed Content Extraction", [
-                        ("Title", entry.get('title', 'Untitled')[:50]),
-                        ("Reason", full_content[:50]),
-                    ])
-                    continue
-
-                # Skip articles with garbage content (mostly dates, too short, etc.)
-                def is_garbage_content(text: str) -> tuple[bool, str]:
-                    """Detect garbage content that would produce bad AI summaries.
-
-                    Returns:
-                        Tuple of (is_garbage, reason)
-                    """
-                    import re
-
-                    # Too short to be a real article
-                    if len(text) < 100:
-                        return (True, f"too_short ({len(text)} chars)")
-
-                    # Check for repeated date patterns (like a news listing page)
-                    date_pattern = r'\d{4}-\d{2}-\d{2}'
-                    date_matches = re.findall(date_pattern, text)
-                    if len(date_matches) > 5 and len(text) < 500:
-                        return (True, f"date_spam ({len(date_matches)} dates in {len(text)} chars)")
-
-                    # Check for mostly repeated lines
-                    lines = [l.strip() for l in text.split('\n') if l.strip()]
-                    if len(lines) > 5:
-                        unique_lines = set(lines)
-                        unique_ratio = len(unique_lines) / len(lines)
-                        if unique_ratio < 0.33:  # Less than 1/3 unique
-                            return (True, f"repeated_lines ({len(unique_lines)}/{len(lines)} unique, {unique_ratio:.0%})")
-
-                    return (False, "")
-
-                is_garbage, garbage_reason = is_garbage_content(full_content)
-                if is_garbage:
-                    logger.warning("📰 Skipping Article With Garbage Content", [
-                        ("Title", entry.get('title', 'Untitled')[:50]),
-                        ("URL", article_url[:60]),
-                        ("Reason", garbage_reason),
-                        ("Content Preview", full_content[:150].replace('\n', ' ')),
-                        ("Content Length", str(len(full_content))),
-                    ])
-                    continue
-
-                # Check for content-based duplicates
-                is_dup, similarity = self.is_duplicate_content(full_content, article_url)
-                if is_dup:
-                    logger.warning("📰 Skipping Duplicate Content", [
-                        ("Title", entry.get('title', 'Untitled')[:50]),
-                        ("Similarity", f"{similarity:.2%}"),
-                    ])
-                    continue
-
-                # Generate AI content
-                article_id = self._extract_article_id(entry.get("link", ""))
-                original_title = entry.get("title", "Untitled")
-
-                # Check cache for title
-                cached_title = self.ai_cache.get_title(article_id)
-                if cached_title:
-                    ai_title = cached_title["english_title"]
-                    logger.info("💾 Cache Hit - Title", [
-                        ("Article ID", article_id),
-                    ])
-                else:
-                    ai_title = await self._generate_title(original_title, full_content)
-                    if ai_title is None:
-                        logger.warning("📰 Skipping Article - Title Generation Failed", [
-                            ("Title", original_title[:50]),
-                            ("URL", entry.get('link', '')[:60]),
-                        ])
-                        continue
-                    self.ai_cache.cache_title(article_id, original_title, ai_title)
-                    logger.info("🔄 Cache Miss - Generated Title", [
-                        ("Article ID", article_id),
-                    ])
-
-                # Check cache for summaries
-                cached_summary = self.ai_cache.get_summary(article_id)
-                if cached_summary:
-                    arabic_summary = cached_summary["arabic_summary"]
-                    english_summary = cached_summary["english_summary"]
-                    logger.info("💾 Cache Hit - Summary", [
-                        ("Article ID", article_id),
-                    ])
-                else:
-                    arabic_summary, english_summary = await self._generate_bilingual_summary(full_content)
-                    self.ai_cache.cache_summary(article_id, arabic_summary, english_summary)
-                    logger.info("🔄 Cache Miss - Generated Summary", [
-                        ("Article ID", article_id),
-                    ])
+            return f"Garbage content: {garbage_reason}"
 
-                # Categorize article
-                category_tag_id = await self._categorize_article(ai_title, full_content)
-
-                # Extract key quote from article
-                key_quote = await self._extract_key_quote(full_content)
-
-                article = Article(
-                    title=ai_title,
-                    url=article_url,
-                    summary=summary,
-                    full_content=full_content,
-                    arabic_summary=arabic_summary,
-                    english_summary=english_summary,
-                    image_url=image_url,
-                    video_url=scraped_video,
-                    published_date=published_date,
-                    source=source_info["name"],
-                    source_emoji=source_info["emoji"],
-                    category_tag_id=category_tag_id,
-                    key_quote=key_quote,
-                )
-
-                # Store content for future similarity checks
-                self.store_content_for_similarity(full_content, article_url)
-
-                # Record successful processing metric
-                self.record_metric("articles_processed", 1)
-
-                # Clear any previous failures for this article
-                self.clear_failure(article_url)
-
-                articles.append(article)
+        # Check for content-based duplicates
+        is_dup, similarity = self.is_duplicate_content(full_content, candidate.url)
+        if is_dup:
+            return f"Duplicate content ({similarity:.2%})"
 
-                if len(articles) >= max_articles:
-                    break
-
-            except Exception as e:
-                # Record failure to dead letter queue
-                error_msg = str(e)[:200]
-                failure_count = self.record_failure(article_url, error_msg)
-
-                logger.warning(
-                    f"Failed to parse article from {source_info['name']}: {error_msg[:100]}"
-                )
-
-                # Record failure metric
-                self.record_metric("article_failures", 1)
-
-                continue
+        # Store content now so articles enriched alongside it are compared too
+        self.store_content_for_similarity(full_content, candidate.url)
+        return None
 
-        return articles
+    async def _enrich_candidate(self, candidate: FeedCandidate) -> Optional[Article]:
+        """Generate title, summaries, quote and category for one article."""
+        article_id = candidate.article_id
+        full_content = candidate.full_content
+        original_title = candidate.entry.get("title", "Untitled")
 
-    def _parse_date(self, entry: feedparser.FeedParserDict) -> Optional[datetime]:
-        """Parse publication date from RSS entry."""
-        date_tuple = entry.get("published_parsed") or entry.get("updated_parsed")
+        # One structured request covers the uncached fields plus the category
+        fields = await self._generate_article_fields(
+            article_id, original_title, full_content,
+            extra_fields={"category": f"Exactly one of: {', '.join(self.CATEGORY_TAGS)}"},
+        )
+        ai_title = fields["title"]
+        if ai_title is None:
+            logger.warning("📰 Skipping Article - Title Generation Failed", [
+                ("Title", original_title[:50]),
+                ("URL", candidate.url[:60]),
+            ])
+            return None
 
-        if date_tuple:
-            try:
-                # Create datetime and make it timezone-aware (assume NY timezone for RSS feeds)
-                naive_dt = datetime(*date_tuple[:6])
-                return naive_dt.replace(tzinfo=NY_TZ)
-            except (TypeError, ValueError):
-                pass
-
-        return datetime.now(NY_TZ)
-
-    async def _extract_image(self, entry: feedparser.FeedParserDict) -> Optional[str]:
-        """Extract image URL from RSS entry."""
-        # Try media:content tag
-        if "media_content" in entry:
-            for media in entry.media_content:
-                if "url" in media and any(
-                    ext in media["url"].lower()
-                    for ext in [".jpg", ".jpeg", ".png", ".webp"]
-                ):
-                    return media["url"]
-
-        # Try media:thumbnail tag
-        if "media_thumbnail" in entry and entry.media_thumbnail:
-            return entry.media_thumbnail[0].get("url")
-
-        # Try enclosure tag
-        if "enclosures" in entry and entry.enclosures:
-            for enclosure in entry.enclosures:
-                if enclosure.get("type", "").startswith("image/"):
-                    return enclosure.get("href")
-
-        # Try content - handle content field which can be list or dict
-        content_field = entry.get("content", [{}])
-        content_value = ""
-        if isinstance(content_field, list) and content_field:
-            content_value = content_field[0].get("value", "")
-        elif isinstance(content_field, dict):
-            content_value = content_field.get("value", "")
-
-        content = (
-            entry.get("summary", "")
-            or entry.get("description", "")
-            or content_value
+        # Categorize article (separate call only if the merged request gave none)
+        if fields["category"]:
+            category_tag_id = self._category_tag_id(fields["category"])
+        else:
+            category_tag_id = await self._categorize_article(ai_title, full_content)
+
+        return Article(
+            title=ai_title,
+            url=candidate.url,
+            summary=candidate.summary,
+            full_content=full_content,
+            arabic_summary=fields["arabic_summary"],
+            english_summary=fields["english_summary"],
+            image_url=candidate.image_url,
+            video_url=candidate.video_url,
+            published_date=candidate.published_date,
+            source=candidate.source_info["name"],
+            source_emoji=candidate.source_info["emoji"],
+            category_tag_id=category_tag_id,
+            key_quote=fields["key_quote"],
         )
 
-        if content:
-            soup = BeautifulSoup(content, "html.parser")
-            img_tag = soup.find("img")
-            if img_tag and img_tag.get("src"):
-                return img_tag["src"]
+    @staticmethod
+    def _is_garbage_content(text: str) -> tuple[bool, str]:
+        """Detect garbage content that would produce bad AI summaries.
 
-        return None
+        Returns:
+            Tuple of (is_garbage, reason)
+        """
+        # Too short to be a real article
+        if len(text) < 100:
+            return (True, f"too_short ({len(text)} chars)")
+
+        # Check for repeated date patterns (like a news listing page)
+        date_pattern = r'\d{4}-\d{2}-\d{2}'
+        date_matches = re.findall(date_pattern, text)
+        if len(date_matches) > 5 and len(text) < 500:
+            return (True, f"date_spam ({len(date_matches)} dates in {len(text)} chars)")
+
+        # Check for mostly repeated lines
+        lines = [l.strip() for l in text.split('\n') if l.strip()]
+        if len(lines) > 5:
+            unique_lines = set(lines)
+            unique_ratio = len(unique_lines) / len(lines)
+            if unique_ratio < 0.33:  # Less than 1/3 unique
+                return (True, f"repeated_lines ({len(unique_lines)}/{len(lines)} unique, {unique_ratio:.0%})")
+
+        return (False, "")
 
     async def _extract_full_content(
         self, url: str, source_key: str
@@ -587,20 +380,6 @@ class NewsScraper(BaseScraper):
             ])
             return ("Content extraction failed", None, None)
 
-    def _make_url_absolute(self, url_str: str, base_url: str) -> str:
-        """Convert relative URL to absolute URL."""
-        if url_str.startswith("//"):
-            return f"https:{url_str}"
-        elif url_str.startswith("/"):
-            from urllib.parse import urlparse
-            parsed = urlparse(base_url)
-            return f"{parsed.scheme}://{parsed.netloc}{url_str}"
-        elif url_str.startswith("http"):
-            return url_str
-        else:
-            from urllib.parse import urljoin
-            return urljoin(base_url, url_str)
-
     # Mapping for invalid categories to valid ones
     CATEGORY_MAPPING: dict[str, str] = {
         "education": "social",
@@ -633,22 +412,15 @@ class NewsScraper(BaseScraper):
 
         Uses AI to analyze content and select appropriate category.
         """
-        if not self.openai_client:
+        if not llm_gateway.available:
             return None
 
         # Get valid categories from CATEGORY_TAGS
         valid_categories = list(self.CATEGORY_TAGS.keys())
 
         try:
-            import asyncio
-
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"""You are a news categorizer. Your task is to classify Syrian news articles.
+            response = await llm_gateway.complete(
+                system_prompt=f"""You are a news categorizer. Your task is to classify Syrian news articles.
 
 VALID CATEGORIES (you MUST respond with EXACTLY one of these):
 - military
@@ -669,57 +441,59 @@ CATEGORY DEFINITIONS:
 - social: Society, culture, humanitarian issues, education, sports, lifestyle
 
 IMPORTANT: Respond with ONLY one word from this exact list: {', '.join(valid_categories)}
-Do NOT use any other words. Do NOT add punctuation or explanation."""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Title: {title}\n\nContent: {content[:800]}"
-                    }
-                ],
+Do NOT use any other words. Do NOT add punctuation or explanation.""",
+                user_prompt=f"Title: {title}\n\nContent: {content[:800]}",
                 max_tokens=10,
                 temperature=0.1,  # Lower temperature for more consistent output
+                feature=self.content_type,
+                model="gpt-3.5-turbo",
             )
-
-            category = response.choices[0].message.content.strip().lower()
-            # Remove any punctuation that might have slipped in
-            category = category.replace(".", "").replace(",", "").replace(":", "").strip()
-
-            # Log raw response for debugging
-            logger.debug("📰 AI Category Response", [
-                ("Raw", response.choices[0].message.content),
-                ("Parsed", category),
-            ])
-
-            # Check if valid category
-            if category in self.CATEGORY_TAGS:
-                tag_id = self.CATEGORY_TAGS[category]
-                logger.info("📰 Article Categorized", [
-                    ("Category", category),
-                    ("Tag ID", str(tag_id)),
-                ])
-                return tag_id
-
-            # Try mapping invalid category to valid one
-            if category in self.CATEGORY_MAPPING:
-                mapped_category = self.CATEGORY_MAPPING[category]
-                tag_id = self.CATEGORY_TAGS[mapped_category]
-                logger.info("📰 Category Mapped", [
-                    ("Original", category),
-                    ("Mapped To", mapped_category),
-                    ("Tag ID", str(tag_id)),
-                ])
-                return tag_id
-
-            # Fallback to social
-            logger.warning("📰 Invalid Category", [
-                ("Category", category),
-                ("Valid Options", ", ".join(valid_categories)),
-                ("Fallback", "social"),
-            ])
-            return self.CATEGORY_TAGS["social"]
+            if not response:
+                return None
+            return self._category_tag_id(response)
 
         except Exception as e:
             logger.warning("📰 Categorization Failed", [
                 ("Error", str(e)[:100]),
             ])
             return None
+
+    def _category_tag_id(self, raw_category: str) -> int:
+        """Map an AI category answer to a forum tag ID (social if unrecognised)."""
+        category = raw_category.strip().lower()
+        # Remove any punctuation that might have slipped in
+        category = category.replace(".", "").replace(",", "").replace(":", "").strip()
+
+        # Log raw response for debugging
+        logger.debug("📰 AI Category Response", [
+            ("Raw", raw_category),
+            ("Parsed", category),
+        ])
+
+        # Check if valid category
+        if category in self.CATEGORY_TAGS:
+            tag_id = self.CATEGORY_TAGS[category]
+            logger.info("📰 Article Categorized", [
+                ("Category", category),
+                ("Tag ID", str(tag_id)),
+            ])
+            return tag_id
+
+        # Try mapping invalid category to valid one
+        if category in self.CATEGORY_MAPPING:
+            mapped_category = self.CATEGORY_MAPPING[category]
+            tag_id = self.CATEGORY_TAGS[mapped_category]
+            logger.info("📰 Category Mapped", [
+                ("Original", category),
+                ("Mapped To", mapped_category),
+                ("Tag ID", str(tag_id)),
+            ])
+            return tag_id
+
+        # Fallback to social
+        logger.warning("📰 Invalid Category", [
+            ("Category", category),
+            ("Valid Options", ", ".join(self.CATEGORY_TAGS)),
+            ("Fallback", "social"),
+        ])
+        return self.CATEGORY_TAGS["social"]
@@ -8,7 +8,7 @@ Sources:
 - Kooora.com (كووورة) - Leading Arabic sports website
 
 Features:
-- RSS feed parsing
+- Pipelined RSS processing (see BaseScraper._run_pipeline)
 - Image extraction from articles
 - AI-powered title generation
 - Bilingual summaries (Arabic + English)
@@ -20,14 +20,14 @@ Server: discord.gg/syria
 """
 
 import asyncio
-import feedparser
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import Optional
 
 from src.core.logger import logger
 from src.core.config import NY_TZ
-from src.services.scrapers.base import BaseScraper, Article
+from src.services.scrapers.base import BaseScraper, Article, FeedCandidate, EXTRACTION_ERRORS
+from src.services.llm_gateway import llm_gateway
 from src.utils.language import is_english_only
 
 
@@ -70,6 +70,11 @@ class SoccerScraper(BaseScraper):
         "Champions League",
     ]
 
+    TITLE_RULES: str = (
+        "Soccer headline in English, EXACTLY 3-5 words. Take team and player names "
+        "directly from the article; never guess them."
+    )
+
     def __init__(self) -> None:
         """Initialize the soccer scraper."""
         super().__init__(
@@ -95,8 +100,10 @@ class SoccerScraper(BaseScraper):
 
         for source_key, source_info in self.SOCCER_SOURCES.items():
             try:
-                articles = await self._fetch_from_source(
-                    source_key, source_info, cutoff_time, max_articles * 10
+                # Posted articles are filtered before extraction, so each
+                # source only needs to produce max_articles survivors
+                articles = await self._run_pipeline(
+                    source_key, source_info, cutoff_time, max_articles
                 )
                 all_articles.extend(articles)
                 logger.success(
@@ -137,214 +144,113 @@ class SoccerScraper(BaseScraper):
             ])
             return []
 
-    async def _fetch_from_source(
-        self,
-        source_key: str,
-        source_info: dict[str, str],
-        cutoff_time: datetime,
-        max_articles: int,
-    ) -> list[Article]:
-        """Fetch articles from Kooora RSS feed."""
-        articles: list[Article] = []
-
-        feed = feedparser.parse(source_info["rss_url"])
-
-        if not feed.entries:
-            logger.warning("⚽ No Entries in Feed", [
-                ("Source", source_info['name']),
-            ])
-            return articles
-
-        for entry in feed.entries[: max_articles * 2]:
-            try:
-                # Parse date
-                published_date = self._parse_date(entry)
-                if not published_date or published_date < cutoff_time:
-                    continue
-
-                # Extract image from RSS
-                image_url = await self._extract_image(entry)
-
-                # Get summary
-                content_field = entry.get("content", [{}])
-                content_value = ""
-                if isinstance(content_field, list) and content_field:
-                    content_value = content_field[0].get("value", "")
-                elif isinstance(content_field, dict):
-                    content_value = content_field.get("value", "")
-
-                summary = (
-                    entry.get("summary", "")
-                    or entry.get("description", "")
-                    or content_value
-                )
-                summary = BeautifulSoup(summary, "html.parser").get_text()
-                summary = summary[:500] + "..." if len(summary) > 500 else summary
-
-                # Extract full content and image
-                full_content, scraped_image = await self._extract_full_content(
-                    entry.get("link", ""), source_key
-                )
-
-                # Prefer scraped image
-                if not image_url and scraped_image:
-                    image_url = scraped_image
-
-                # Skip articles with fetch errors
-                error_messages = [
-                    "Article fetch timed out",
-                    "Could not fetch article content",
-                    "Could not extract article text",
-                    "Content extraction failed",
-                    "Content unavailable"
-                ]
-                if any(error_msg in full_content for error_msg in error_messages):
-                    continue
-
-                # Skip articles without images
-                if not image_url:
-                    continue
-
-                # Generate AI content
-                article_id = self._extract_article_id(entry.get("link", ""))
-                original_title = entry.get("title", "Untitled")
-
-                # Check cache for title
-                cached_title = self.ai_cache.get_title(article_id)
-                if cached_title:
-                    ai_title = cached_title["english_title"]
-                    logger.info("💾 Cache Hit - Title", [
-                        ("Article ID", article_id),
-                    ])
-                else:
-                    ai_title = await self._generate_soccer_title(original_title, full_content)
-                    if ai_title is None:
-                        logger.warning("⚽ Skipping Article - Title Generation Failed", [
-                            ("Title", original_title[:50]),
-                            ("URL", entry.get('link', '')[:60]),
-                        ])
-                        continue
-                    self.ai_cache.cache_title(article_id, original_title, ai_title)
-                    logger.info("🔄 Cache Miss - Generated Title", [
-                        ("Article ID", article_id),
-                    ])
+    # -------------------------------------------------------------------------
+    # Pipeline Hooks
+    # -------------------------------------------------------------------------
 
-                # Check cache for summaries
-                cached_summary = self.ai_cache.get_summary(article_id)
-                if cached_summary:
-                    arabic_summary = cached_summary["arabic_summary"]
-                    english_summary = cached_summary["english_summary"]
-                    logger.info("💾 Cache Hit - Summary", [
-                        ("Article ID", article_id),
-                    ])
-                else:
-                    arabic_summary, english_summary = await self._generate_bilingual_summary(full_content)
-                    self.ai_cache.cache_summary(article_id, arabic_summary, english_summary)
-                    logger.info("🔄 Cache Miss - Generated Summary", [
-                        ("Article ID", article_id),
-                    ])
+    def _feed_sources(self) -> dict[str, dict[str, str]]:
+        """RSS sources of this scraper."""
+        return self.SOCCER_SOURCES
 
-                # Check cache for team tag
-                cached_team = self.ai_cache.get_team_tag(article_id)
-                if cached_team:
-                    team_tag = cached_team
-                    logger.info("💾 Cache Hit - Team Tag", [
-                        ("Article ID", article_id),
-                    ])
-                else:
-                    team_tag = await self._detect_team_tag(ai_title, full_content)
-                    self.ai_cache.cache_team_tag(article_id, team_tag)
-                    logger.info("🔄 Cache Miss - Generated Team Tag", [
-                        ("Article ID", article_id),
-                    ])
+    async def _extract_candidate(self, candidate: FeedCandidate) -> None:
+        """Fetch the article page and fill in its content and image."""
+        full_content, scraped_image = await self._extract_full_content(
+            candidate.url, candidate.source_key
+        )
+        candidate.full_content = full_content
+        candidate.scraped_image = scraped_image
 
-                # Extract key quote
-                key_quote = await self._extract_key_quote(full_content)
-
-                article = Article(
-                    title=ai_title,
-                    url=entry.get("link", ""),
-                    summary=summary,
-                    full_content=full_content,
-                    arabic_summary=arabic_summary,
-                    english_summary=english_summary,
-                    image_url=image_url,
-                    published_date=published_date,
-                    source=source_info["name"],
-                    source_emoji=source_info["emoji"],
-                    team_tag=team_tag,
-                    key_quote=key_quote,
-                )
+        # Prefer scraped image
+        if not candidate.image_url and scraped_image:
+            candidate.image_url = scraped_image
 
-                articles.append(article)
+    def _screen_candidate(self, candidate: FeedCandidate) -> Optional[str]:
+        """Skip articles with fetch errors or without an image."""
+        if any(error_msg in candidate.full_content for error_msg in EXTRACTION_ERRORS):
+            return f"Content extraction failed: {candidate.full_content[:50]}"
 
-                if len(articles) >= max_articles:
-                    break
+        if not candidate.image_url:
+            return "No image"
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to parse soccer article from {source_info['name']}: {str(e)[:100]}"
-                )
-                continue
+        return None
 
-        return articles
+    async def _enrich_candidate(self, candidate: FeedCandidate) -> Optional[Article]:
+        """Generate title, summaries, quote and team tag for one article."""
+        article_id = candidate.article_id
+        full_content = candidate.full_content
+        original_title = candidate.entry.get("title", "Untitled")
+
+        # One structured request covers the uncached fields plus the team tag
+        cached_team = self.ai_cache.get_team_tag(article_id)
+        fields = await self._generate_article_fields(
+            article_id, original_title, full_content,
+            extra_fields={} if cached_team else {
+                "team": f"Exactly one of: {', '.join(self.TEAM_CATEGORIES)}. "
+                        "Use 'International' for multiple teams or general news",
+            },
+        )
+        ai_title = fields["title"]
+        if ai_title is None:
+            logger.warning("⚽ Skipping Article - Title Generation Failed", [
+                ("Title", original_title[:50]),
+                ("URL", candidate.url[:60]),
+            ])
+            return None
 
-    def _parse_date(self, entry: feedparser.FeedParserDict) -> Optional[datetime]:
-        """Parse publication date from RSS entry."""
-        date_tuple = entry.get("published_parsed") or entry.get("updated_parsed")
+        # Check cache for team tag
+        if cached_team:
+            team_tag = cached_team
+            logger.info("💾 Cache Hit - Team Tag", [
+                ("Article ID", article_id),
+            ])
+        else:
+            if fields["team"]:
+                team_tag = self._team_from_response(fields["team"])
+            else:
+                team_tag = await self._detect_team_tag(ai_title, full_content)
+            self.ai_cache.cache_team_tag(article_id, team_tag)
+            logger.info("🔄 Cache Miss - Generated Team Tag", [
+                ("Article ID", article_id),
+            ])
 
-        if date_tuple:
-            try:
-                # Create datetime and make it timezone-aware (assume NY timezone for RSS feeds)
-                naive_dt = datetime(*date_tuple[:6])
-                return naive_dt.replace(tzinfo=NY_TZ)
-            except (TypeError, ValueError):
-                pass
-
-        return datetime.now(NY_TZ)
-
-    async def _extract_image(self, entry: feedparser.FeedParserDict) -> Optional[str]:
-        """Extract image URL from RSS entry."""
-        # Try media:content tag
-        if "media_content" in entry:
-            for media in entry.media_content:
-                if "url" in media and any(
-                    ext in media["url"].lower()
-                    for ext in [".jpg", ".jpeg", ".png", ".webp"]
-                ):
-                    return media["url"]
-
-        # Try media:thumbnail tag
-        if "media_thumbnail" in entry and entry.media_thumbnail:
-            return entry.media_thumbnail[0].get("url")
-
-        # Try enclosure tag
-        if "enclosures" in entry and entry.enclosures:
-            for enclosure in entry.enclosures:
-                if enclosure.get("type", "").startswith("image/"):
-                    return enclosure.get("href")
-
-        # Try content
-        content_field = entry.get("content", [{}])
-        content_value = ""
-        if isinstance(content_field, list) and content_field:
-            content_value = content_field[0].get("value", "")
-        elif isinstance(content_field, dict):
-            content_value = content_field.get("value", "")
-
-        content = (
-            entry.get("summary", "")
-            or entry.get("description", "")
-            or content_value
+        return Article(
+            title=ai_title,
+            url=candidate.url,
+            summary=candidate.summary,
+            full_content=full_content,
+            arabic_summary=fields["arabic_summary"],
+            english_summary=fields["english_summary"],
+            image_url=candidate.image_url,
+            published_date=candidate.published_date,
+            source=candidate.source_info["name"],
+            source_emoji=candidate.source_info["emoji"],
+            team_tag=team_tag,
+            key_quote=fields["key_quote"],
         )
 
-        if content:
-            soup = BeautifulSoup(content, "html.parser")
-            img_tag = soup.find("img")
-            if img_tag and img_tag.get("src"):
-                return img_tag["src"]
-
-        return None
+    def _valid_title(self, title: str) -> bool:
+        """Soccer titles must be 3-7 English words."""
+        return 3 <= len(title.split()) <= 7 and is_english_only(title)
+
+    async def _cached_title(
+        self, article_id: str, original_title: str, full_content: str
+    ) -> Optional[str]:
+        """AI soccer title from cache, generating and caching it on a miss."""
+        cached_title = self.ai_cache.get_title(article_id)
+        if cached_title:
+            logger.info("💾 Cache Hit - Title", [
+                ("Article ID", article_id),
+            ])
+            return cached_title["english_title"]
+
+        with llm_gateway.track_usage() as spent:
+            ai_title = await self._generate_soccer_title(original_title, full_content)
+        if ai_title is not None:
+            self.ai_cache.cache_title(article_id, original_title, ai_title, tokens=spent[0])
+            logger.info("🔄 Cache Miss - Generated Title", [
+                ("Article ID", article_id),
+            ])
+        return ai_title
 
     async def _extract_full_content(
         self, url: str, source_key: str
@@ -429,20 +335,6 @@ class SoccerScraper(BaseScraper):
             ])
             return ("Content extraction failed", None)
 
-    def _make_url_absolute(self, url_str: str, base_url: str) -> str:
-        """Convert relative URL to absolute URL."""
-        if url_str.startswith("//"):
-            return f"https:{url_str}"
-        elif url_str.startswith("/"):
-            from urllib.parse import urlparse
-            parsed = urlparse(base_url)
-            return f"{parsed.scheme}://{parsed.netloc}{url_str}"
-        elif url_str.startswith("http"):
-            return url_str
-        else:
-            from urllib.parse import urljoin
-            return urljoin(base_url, url_str)
-
     async def _generate_soccer_title(self, original_title: str, content: str) -> Optional[str]:
         """
         Generate a concise 3-5 word English title for soccer articles.
@@ -454,7 +346,7 @@ class SoccerScraper(BaseScraper):
         Returns:
             Generated English title, or None if generation fails
         """
-        if not self.openai_client:
+        if not llm_gateway.available:
             logger.warning("⚽ OpenAI Client Not Initialized For Title", [
                 ("Action", "Skipping article"),
             ])
@@ -527,7 +419,7 @@ CRITICAL RULES:
         Returns:
             Team name string matching one of TEAM_CATEGORIES
         """
-        if not self.openai_client:
+        if not llm_gateway.available:
             return "International"
 
         try:
@@ -540,21 +432,25 @@ CRITICAL RULES:
                 temperature=0.3,
             )
 
-            detected_team = response.strip()
-            if detected_team in self.TEAM_CATEGORIES:
-                logger.info("⚽ Detected Team Tag", [
-                    ("Team", detected_team),
-                ])
-                return detected_team
-            else:
-                logger.warning("⚽ Invalid Team Returned", [
-                    ("Team", detected_team),
-                    ("Fallback", "International"),
-                ])
-                return "International"
+            return self._team_from_response(response)
 
         except Exception as e:
             logger.warning("⚽ Failed to Detect Team Tag", [
                 ("Error", str(e)[:100]),
             ])
             return "International"
+
+    def _team_from_response(self, response: str) -> str:
+        """Match an AI team answer to TEAM_CATEGORIES (International if unrecognised)."""
+        detected_team = response.strip()
+        if detected_team in self.TEAM_CATEGORIES:
+            logger.info("⚽ Detected Team Tag", [
+                ("Team", detected_team),
+            ])
+            return detected_team
+
+        logger.warning("⚽ Invalid Team Returned", [
+            ("Team", detected_team),
+            ("Fallback", "International"),
+        ])
+        return "International"
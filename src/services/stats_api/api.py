@@ -40,6 +40,7 @@ from src.services.stats_api.data_fetchers import (
     get_changelog, get_hot_debate, count_forum_threads,
     get_recent_threads, get_trending_debates, get_activity_sparkline
 )
+from src.services.stats_api.queries import StatsQueryBatch
 
 if TYPE_CHECKING:
     from src.bot import OthmanBot
@@ -123,6 +124,69 @@ class OthmanAPI:
             logger.debug("Failed to get system resources", [("Error", str(e))])
             return {}
 
+    def _get_database_stats(self, db) -> dict:
+        """Get database pool contention, vote queue, participation buffer and analytics embed queue metrics."""
+        stats = {}
+        try:
+            if db and hasattr(db, 'get_pool_stats'):
+                stats["pool"] = db.get_pool_stats()
+            if db and hasattr(db, 'get_ranking_stats'):
+                stats["rankings"] = db.get_ranking_stats()
+            if db and hasattr(db, 'get_ban_index_stats'):
+                stats["bans"] = db.get_ban_index_stats()
+            if db and hasattr(db, 'get_thread_meta_stats'):
+                stats["thread_meta"] = db.get_thread_meta_stats()
+            service = getattr(self._bot, 'debates_service', None)
+            if service and getattr(service, 'vote_queue', None):
+                stats["vote_queue"] = service.vote_queue.get_stats()
+            if service and getattr(service, 'participation', None):
+                stats["participation"] = service.participation.get_stats()
+            scheduler = getattr(self._bot, 'analytics_embed_scheduler', None)
+            if scheduler:
+                stats["analytics_embeds"] = scheduler.get_stats()
+            runner = getattr(self._bot, 'moderation_jobs', None)
+            if runner:
+                stats["moderation_jobs"] = runner.get_stats()
+        except Exception as e:
+            logger.debug("Failed to get database stats", [("Error", str(e))])
+        return stats
+
+    def _get_karma_card_stats(self) -> dict:
+        """Get karma card render latency, cache and browser pool metrics."""
+        try:
+            from src.services.karma_card import get_render_stats
+            return get_render_stats()
+        except Exception as e:
+            logger.debug("Failed to get karma card stats", [("Error", str(e))])
+            return {}
+
+    def _get_feed_cache_stats(self) -> dict:
+        """Get RSS feed cache hit/miss and bytes-saved counters."""
+        try:
+            from src.caches import feed_cache
+            return feed_cache.get_stats()
+        except Exception as e:
+            logger.debug("Failed to get feed cache stats", [("Error", str(e))])
+            return {}
+
+    def _get_ai_cache_stats(self) -> dict:
+        """Get AI response cache hit rates and saved tokens per cache type."""
+        try:
+            from src.utils.ai_cache import get_ai_cache_stats
+            return get_ai_cache_stats()
+        except Exception as e:
+            logger.debug("Failed to get AI cache stats", [("Error", str(e))])
+            return {}
+
+    def _get_llm_stats(self) -> dict:
+        """Get shared LLM gateway call, token and limiter counters."""
+        try:
+            from src.services.llm_gateway import llm_gateway
+            return llm_gateway.get_stats()
+        except Exception as e:
+            logger.debug("Failed to get LLM stats", [("Error", str(e))])
+            return {}
+
     def _get_bot_status(self) -> dict:
         """Get current bot status."""
         status = {
@@ -142,18 +206,11 @@ class OthmanAPI:
 
         return status
 
-    async def _get_all_time_stats(self, db) -> dict:
+    async def _get_all_time_stats(self, total_votes: int) -> dict:
         """Get all-time statistics."""
         total_commands = BASE_COMMAND_COUNT
-        total_votes = 0
         total_news = 0
 
-        if db:
-            try:
-                total_votes = db.get_total_votes()
-            except Exception as e:
-                logger.debug("Failed to get total votes", [("Error", str(e))])
-
         # Count news from both news and soccer channels
         if self._bot and self._bot.is_ready():
             news_channel_id = load_news_channel_id()
@@ -195,31 +252,53 @@ class OthmanAPI:
 
         try:
             db = self._bot.debates_service.db if hasattr(self._bot, 'debates_service') else None
-
-            # Get debate stats
-            total_debates = 0
-            votes_today = 0
-            leaderboard_raw = []
-            monthly_stats = {}
-            monthly_leaderboard_raw = []
             now = datetime.now(NY_TZ)
-            category_leaderboards = {}
 
+            # All debate stats come from one off-loop snapshot
+            batch = StatsQueryBatch(db)
             if db:
-                total_debates = db.get_active_debate_count()
-                votes_today = db.get_votes_today()
-                leaderboard_raw = db.get_leaderboard(limit=LEADERBOARD_DISPLAY_LIMIT)
-                monthly_stats = db.get_monthly_stats(now.year, now.month)
+                results = batch.results
+                batch.add("total_debates", db.get_active_debate_count)
+                batch.add("votes_today", db.get_votes_today)
+                batch.add("leaderboard", db.get_leaderboard, limit=LEADERBOARD_DISPLAY_LIMIT)
+                batch.add("monthly_stats", db.get_monthly_stats, now.year, now.month)
+                batch.add(
+                    "monthly_leaderboard", db.get_monthly_leaderboard,
+                    now.year, now.month, limit=LEADERBOARD_DISPLAY_LIMIT, default=[],
+                )
+                batch.add("category_leaderboards", db.get_category_leaderboards, limit=LEADERBOARD_DISPLAY_LIMIT, default={})
+                batch.add(
+                    "karma_changes",
+                    lambda: db.get_karma_changes_today(
+                        [u.user_id for u in results["leaderboard"]]
+                        + [u["user_id"] for u in results["monthly_leaderboard"]]
+                    ),
+                    default={},
+                )
+                batch.add("total_votes", db.get_total_votes, default=0)
+                batch.add("activity_sparkline", get_activity_sparkline, db)
+
+            news_channel_id = load_news_channel_id()
+            soccer_channel_id = load_soccer_channel_id()
 
-                try:
-                    monthly_leaderboard_raw = db.get_monthly_leaderboard(now.year, now.month, limit=LEADERBOARD_DISPLAY_LIMIT)
-                except Exception as e:
-                    logger.debug("Failed to get monthly leaderboard", [("Error", str(e))])
+            # Database reads overlap with the Discord API lookups
+            (
+                results, hot_debate, recent_news, recent_soccer, trending_debates,
+            ) = await asyncio.gather(
+                batch.run(),
+                get_hot_debate(self._bot),
+                get_recent_threads(self._bot, news_channel_id, limit=RECENT_ITEMS_LIMIT),
+                get_recent_threads(self._bot, soccer_channel_id, limit=RECENT_ITEMS_LIMIT),
+                get_trending_debates(self._bot, limit=TRENDING_LIMIT),
+            )
 
-                try:
-                    category_leaderboards = db.get_category_leaderboards(limit=LEADERBOARD_DISPLAY_LIMIT)
-                except Exception as e:
-                    logger.debug("Failed to get category leaderboards", [("Error", str(e))])
+            total_debates = results.get("total_debates", 0)
+            votes_today = results.get("votes_today", 0)
+            leaderboard_raw = results.get("leaderboard", [])
+            monthly_stats = results.get("monthly_stats", {})
+            monthly_leaderboard_raw = results.get("monthly_leaderboard", [])
+            category_leaderboards = results.get("category_leaderboards", {})
+            karma_changes = results.get("karma_changes", {})
 
             # Enrich all-time leaderboard with avatars
             leaderboard_tuples = [
@@ -228,20 +307,11 @@ class OthmanAPI:
             ]
             leaderboard = await enrich_users_with_avatars(self._bot, leaderboard_tuples)
 
-            # Get karma changes for leaderboard users
-            karma_changes = {}
-            if db and leaderboard:
-                try:
-                    user_ids = [u["user_id"] for u in leaderboard]
-                    karma_changes = db.get_karma_changes_today(user_ids)
-                except Exception as e:
-                    logger.debug("Failed to get karma changes", [("Error", str(e))])
-
             # Calculate max karma and add progress, karma change, tier
             max_karma = max((u["karma"] for u in leaderboard), default=1)
             for user in leaderboard:
                 user["progress"] = round((user["karma"] / max_karma) * 100, 1) if max_karma > 0 else 0
-                user["karma_change"] = karma_changes.get(user["user_id"], 0)
+                user["karma_change"] = karma_changes.get(int(user["user_id"]), 0)
                 user["tier"] = get_tier(user["karma"])
 
             # Enrich monthly leaderboard
@@ -251,18 +321,10 @@ class OthmanAPI:
             ]
             monthly_leaderboard = await enrich_users_with_avatars(self._bot, monthly_tuples)
 
-            monthly_karma_changes = {}
-            if db and monthly_leaderboard:
-                try:
-                    monthly_user_ids = [u["user_id"] for u in monthly_leaderboard]
-                    monthly_karma_changes = db.get_karma_changes_today(monthly_user_ids)
-                except Exception as e:
-                    logger.debug("Failed to get monthly karma changes", [("Error", str(e))])
-
             monthly_max_karma = max((u["karma"] for u in monthly_leaderboard), default=1)
             for user in monthly_leaderboard:
                 user["progress"] = round((user["karma"] / monthly_max_karma) * 100, 1) if monthly_max_karma > 0 else 0
-                user["karma_change"] = monthly_karma_changes.get(user["user_id"], 0)
+                user["karma_change"] = karma_changes.get(int(user["user_id"]), 0)
                 user["tier"] = get_tier(user["karma"])
 
             # Enrich category leaderboards
@@ -282,14 +344,7 @@ class OthmanAPI:
                 else:
                     enriched_categories[category] = []
 
-            # Get additional data
-            hot_debate = await get_hot_debate(self._bot)
-            news_channel_id = load_news_channel_id()
-            soccer_channel_id = load_soccer_channel_id()
-            recent_news = await get_recent_threads(self._bot, news_channel_id, limit=RECENT_ITEMS_LIMIT)
-            recent_soccer = await get_recent_threads(self._bot, soccer_channel_id, limit=RECENT_ITEMS_LIMIT)
-            trending_debates = await get_trending_debates(self._bot, limit=TRENDING_LIMIT)
-            activity_sparkline = get_activity_sparkline(db)
+            activity_sparkline = results.get("activity_sparkline", [0] * 7)
 
             # Build response
             response_data = {
@@ -300,7 +355,7 @@ class OthmanAPI:
                     "votes_today": votes_today,
                     "monthly": monthly_stats,
                 },
-                "all_time": await self._get_all_time_stats(db),
+                "all_time": await self._get_all_time_stats(results.get("total_votes", 0)),
                 "hot_debate": hot_debate,
                 "recent_news": recent_news,
                 "recent_soccer": recent_soccer,
@@ -312,10 +367,16 @@ class OthmanAPI:
                 "current_month": now.strftime("%B"),
                 "changelog": await get_changelog(),
                 "system": self._get_system_resources(),
+                "database": self._get_database_stats(db),
+                "karma_cards": self._get_karma_card_stats(),
+                "feed_cache": self._get_feed_cache_stats(),
+                "llm": self._get_llm_stats(),
+                "ai_cache": self._get_ai_cache_stats(),
                 "guild_banner": self._get_guild_banner_url(),
                 "generated_at": datetime.now(NY_TZ).isoformat(),
                 "response_time_ms": round((time.time() - start_time) * 1000, 1),
                 "cached": False,
+                "debug": batch.debug_info(),
             }
 
             await self._cache.set("stats", response_data)
@@ -363,9 +424,17 @@ class OthmanAPI:
                     headers={"Access-Control-Allow-Origin": "*"}
                 )
 
-            leaderboard_raw = db.get_leaderboard(limit=HISTORY_LIMIT_MAX)
-            total_users = db.get_total_users() if hasattr(db, 'get_total_users') else len(leaderboard_raw)
-            total_karma = db.get_total_karma() if hasattr(db, 'get_total_karma') else sum(u.total_karma for u in leaderboard_raw)
+            batch = StatsQueryBatch(db)
+            batch.add("leaderboard", db.get_leaderboard, limit=HISTORY_LIMIT_MAX)
+            if hasattr(db, 'get_total_users'):
+                batch.add("total_users", db.get_total_users)
+            if hasattr(db, 'get_total_karma'):
+                batch.add("total_karma", db.get_total_karma)
+            results = await batch.run()
+
+            leaderboard_raw = results["leaderboard"]
+            total_users = results.get("total_users", len(leaderboard_raw))
+            total_karma = results.get("total_karma", sum(u.total_karma for u in leaderboard_raw))
 
             leaderboard_tuples = [
                 (user.user_id, f"User {user.user_id}", user.total_karma)
@@ -386,6 +455,7 @@ class OthmanAPI:
                 "generated_at": datetime.now(NY_TZ).isoformat(),
                 "response_time_ms": round((time.time() - start_time) * 1000, 1),
                 "cached": False,
+                "debug": batch.debug_info(),
             }
 
             await self._cache.set("leaderboard", response_data)
@@ -444,10 +514,26 @@ class OthmanAPI:
                     headers={"Access-Control-Allow-Origin": "*"}
                 )
 
-            karma = db.get_user_karma(user_id)
-            rank = db.get_user_rank(user_id)
-            analytics = db.get_user_analytics(user_id)
-            streak = db.get_user_streak(user_id)
+            batch = StatsQueryBatch(db)
+            batch.add("karma", db.get_user_karma, user_id)
+            batch.add("rank", db.get_user_rank, user_id)
+            batch.add("analytics", db.get_user_analytics, user_id)
+            batch.add("streak", db.get_user_streak, user_id)
+            batch.add("rank_change", db.get_rank_change, user_id)
+            batch.add("period_karma", db.get_period_karma, user_id, default={})
+            batch.add("karma_history", db.get_karma_history, user_id, days=7)
+            batch.add("recent_debates", db.get_user_recent_debates, user_id, limit=RECENT_ITEMS_LIMIT)
+
+            # Database reads overlap with the Discord user lookup
+            results, (avatar_url, display_name, is_booster) = await asyncio.gather(
+                batch.run(),
+                fetch_user_data(self._bot, user_id, f"User {user_id}"),
+            )
+
+            karma = results["karma"]
+            rank = results["rank"]
+            analytics = results["analytics"]
+            streak = results["streak"]
 
             has_activity = (
                 karma.total_karma != 0 or
@@ -457,8 +543,6 @@ class OthmanAPI:
                 analytics.get("total_messages", 0) > 0
             )
 
-            avatar_url, display_name, is_booster = await fetch_user_data(self._bot, user_id, f"User {user_id}")
-
             if not has_activity and display_name == f"User {user_id}":
                 return web.json_response(
                     {"error": "User not found"},
@@ -466,9 +550,9 @@ class OthmanAPI:
                     headers={"Access-Control-Allow-Origin": "*"}
                 )
 
-            rank_change = db.get_rank_change(user_id)
-            karma_history = db.get_karma_history(user_id, days=7)
-            recent_debates_raw = db.get_user_recent_debates(user_id, limit=RECENT_ITEMS_LIMIT)
+            rank_change = results["rank_change"]
+            karma_history = results["karma_history"]
+            recent_debates_raw = results["recent_debates"]
 
             # Enrich recent debates with thread names
             recent_debates = []
@@ -516,6 +600,8 @@ class OthmanAPI:
                 "rank": rank,
                 "tier": tier,
                 "rank_change": rank_change,
+                "weekly_karma": results["period_karma"].get("weekly", 0),
+                "monthly_karma": results["period_karma"].get("monthly", 0),
                 "approval_rate": approval_rate,
                 "upvotes_received": karma.upvotes_received,
                 "downvotes_received": karma.downvotes_received,
@@ -529,6 +615,7 @@ class OthmanAPI:
                 "generated_at": datetime.now(NY_TZ).isoformat(),
                 "response_time_ms": round((time.time() - start_time) * 1000, 1),
                 "cached": False,
+                "debug": batch.debug_info(),
             }
 
             await self._cache.set(cache_key, response_data)
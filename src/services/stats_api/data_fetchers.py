@@ -395,31 +395,15 @@ def get_activity_sparkline(db) -> list[int]:
         return [0] * 7
 
     try:
-        conn = db._get_connection()
-        cursor = conn.cursor()
-        try:
-            # Get votes per day for the last 7 days
-            cursor.execute("""
-                SELECT DATE(created_at) as vote_date, COUNT(*) as vote_count
-                FROM votes
-                WHERE created_at >= DATE('now', '-7 days')
-                GROUP BY DATE(created_at)
-                ORDER BY vote_date ASC
-            """)
-            rows = cursor.fetchall()
-
-            # Create a dict of date -> count
-            date_counts = {row[0]: row[1] for row in rows}
-
-            # Build array for last 7 days
-            result = []
-            for i in range(6, -1, -1):
-                target_date = (datetime.now(NY_TZ) - timedelta(days=i)).strftime("%Y-%m-%d")
-                result.append(date_counts.get(target_date, 0))
-
-            return result
-        finally:
-            cursor.close()
+        date_counts = db.get_daily_vote_counts(days=7)
+
+        # Build array for last 7 days
+        result = []
+        for i in range(6, -1, -1):
+            target_date = (datetime.now(NY_TZ) - timedelta(days=i)).strftime("%Y-%m-%d")
+            result.append(date_counts.get(target_date, 0))
+
+        return result
     except Exception as e:
         logger.debug("Failed to get activity sparkline", [("Error", str(e))])
         return [0] * 7
@@ -0,0 +1,96 @@
+"""
+OthmanBot - Stats API Query Batch
+=================================
+
+Async facade that runs a request's database reads off the event loop
+inside one read snapshot, with per-query timing.
+
+Author: حَـــــنَّـــــا
+Server: discord.gg/syria
+"""
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from src.core.logger import logger
+
+
+# Marker for queries whose failure should fail the whole request
+_REQUIRED = object()
+
+
+class StatsQueryBatch:
+    """
+    Collects named database reads and runs them in a worker thread.
+
+    DESIGN: Handlers used to call the synchronous DebatesDatabase methods
+    directly on the event loop, stalling gateway processing for every
+    dashboard refresh. All reads for a request now run in one thread under
+    db.read_snapshot(), so they share a single pooled reader and see one
+    consistent view of the database. The handler awaits the batch alongside
+    its Discord API calls, so DB time and network time overlap.
+
+    Queries run in the order they were added; a later query may read an
+    earlier one's result from `batch.results`.
+    """
+
+    def __init__(self, db: Any) -> None:
+        """
+        Initialize an empty batch.
+
+        Args:
+            db: DebatesDatabase to read from (may be None)
+        """
+        self._db = db
+        self._queries: list[tuple[str, Callable[[], Any], Any]] = []
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+        self.total_ms: float = 0.0
+
+    def add(self, name: str, func: Callable[..., Any], *args: Any, default: Any = _REQUIRED, **kwargs: Any) -> "StatsQueryBatch":
+        """
+        Queue a query.
+
+        Args:
+            name: Key for the result in `results` and `timings`
+            func: Callable to run (usually a bound db method)
+            default: Value to use if the query raises; omit to re-raise
+        """
+        self._queries.append((name, lambda: func(*args, **kwargs), default))
+        return self
+
+    def _run_sync(self) -> dict[str, Any]:
+        """Run every query in order inside one snapshot (worker thread)."""
+        started = time.perf_counter()
+        with self._db.read_snapshot():
+            for name, call, default in self._queries:
+                query_started = time.perf_counter()
+                try:
+                    self.results[name] = call()
+                except Exception as e:
+                    if default is _REQUIRED:
+                        raise
+                    logger.debug(f"Failed to get {name.replace('_', ' ')}", [("Error", str(e))])
+                    self.results[name] = default
+                finally:
+                    self.timings[name] = round((time.perf_counter() - query_started) * 1000, 2)
+        self.total_ms = round((time.perf_counter() - started) * 1000, 2)
+        return self.results
+
+    async def run(self) -> dict[str, Any]:
+        """Run the batch off the event loop and return results by name."""
+        if not self._db or not self._queries:
+            return self.results
+        return await asyncio.to_thread(self._run_sync)
+
+    def debug_info(self) -> dict:
+        """Per-query timings for the response's debug metadata."""
+        return {
+            "snapshot": bool(self._db),
+            "db_total_ms": self.total_ms,
+            "queries_ms": dict(self.timings),
+        }
+
+
+__all__ = ["StatsQueryBatch"]
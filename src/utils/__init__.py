@@ -73,6 +73,8 @@ from .autocomplete import (
 from .similarity import (
     cosine_similarity,
     is_duplicate_content,
+    word_counts,
+    SimilarityIndex,
     SIMILARITY_THRESHOLD,
 )
 
@@ -139,5 +141,7 @@ __all__ = [
     # Similarity utilities
     "cosine_similarity",
     "is_duplicate_content",
+    "word_counts",
+    "SimilarityIndex",
     "SIMILARITY_THRESHOLD",
 ]
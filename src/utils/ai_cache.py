@@ -4,18 +4,76 @@ OthmanBot - AI Cache Utility
 
 SQLite-based cache for AI-generated responses to reduce API costs.
 
-Uses the unified othman.db database for storage.
+Uses the unified othman.db database for storage, with a bounded
+in-memory LRU in front of it and single-flight de-duplication of
+concurrent identical requests.
 
 Author: حَـــــنَّـــــا
 Server: discord.gg/syria
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
 
-from src.services.database import get_db
+from src.services.database import get_db, AI_CACHE_EXPIRATION_DAYS
+from src.core.config import AI_CACHE_MEMORY_ENTRIES, AI_CACHE_CLEANUP_INTERVAL
 from src.core.logger import logger
 
 
+# =============================================================================
+# Shared State
+# =============================================================================
+
+# Scrapers create a fresh AICache per run, so the memory tier, in-flight
+# requests and counters live at module level and are shared per cache type.
+
+# (cache_type, key) -> (value, tokens, created_at), least recently used first
+_memory: OrderedDict[tuple[str, str], tuple[str, int, float]] = OrderedDict()
+
+# (cache_type, key) -> result of the one request currently producing it
+_in_flight: dict[tuple[str, str], asyncio.Future] = {}
+
+# cache_type -> counters
+_stats: dict[str, dict[str, int]] = {}
+
+_last_cleanup: float = 0.0
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _counters(cache_type: str) -> dict[str, int]:
+    """Counters for one cache type, created on first use."""
+    return _stats.setdefault(cache_type, {
+        "memory_hits": 0,
+        "db_hits": 0,
+        "misses": 0,
+        "coalesced": 0,
+        "tokens_saved": 0,
+    })
+
+
+def get_ai_cache_stats() -> dict[str, dict]:
+    """Hit rates and token savings per cache type."""
+    result = {}
+    for cache_type, counters in _stats.items():
+        hits = counters["memory_hits"] + counters["db_hits"] + counters["coalesced"]
+        lookups = hits + counters["misses"]
+        result[cache_type] = {
+            **counters,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+    result["memory_entries"] = len(_memory)
+    return result
+
+
+# =============================================================================
+# AI Cache
+# =============================================================================
+
 class AICache:
     """
     SQLite-based cache for AI responses.
@@ -23,7 +81,13 @@ class AICache:
     Stores AI-generated content (titles, summaries) to avoid
     redundant OpenAI API calls for the same content.
 
-    Uses the unified database for persistence.
+    DESIGN: Keys for content-derived entries come from make_key(), a
+    SHA-256 of the whitespace-normalized full input plus the prompt
+    version, so two inputs sharing a long prefix no longer collide and a
+    prompt change invalidates old answers. The hottest entries are kept
+    in a shared in-memory LRU so repeat lookups skip SQLite, and
+    get_or_compute() lets concurrent identical requests share one call.
+    Each entry records the tokens it cost, which is what a hit saves.
     """
 
     def __init__(self, cache_type: str) -> None:
@@ -33,17 +97,42 @@ class AICache:
         Args:
             cache_type: Type of cache (e.g., "news", "soccer")
         """
+        global _last_cleanup
+
         self.cache_type: str = cache_type
         self._db = get_db()
+        self._stats = _counters(cache_type)
 
-        # Cleanup old entries on startup
-        self._db.cleanup_ai_cache()
+        # Cleanup old entries, at most once per interval rather than per instance
+        now = time.time()
+        if now - _last_cleanup >= AI_CACHE_CLEANUP_INTERVAL:
+            _last_cleanup = now
+            self._db.cleanup_ai_cache()
 
         logger.debug("AI Cache Initialized", [
             ("Type", cache_type),
-            ("Backend", "SQLite"),
+            ("Backend", "Memory + SQLite"),
         ])
 
+    @staticmethod
+    def make_key(kind: str, *parts: str, version: str = "v1") -> str:
+        """
+        Build a content-addressed key from the full input of an AI request.
+
+        Args:
+            kind: What is cached (e.g., "title", "summary")
+            parts: Every input that affects the response
+            version: Prompt version; bump it when the prompt changes
+
+        Returns:
+            Key of the form "<kind>:<version>:<sha256 hex>"
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(_WHITESPACE.sub(" ", part).strip().encode("utf-8"))
+            digest.update(b"\0")
+        return f"{kind}:{version}:{digest.hexdigest()}"
+
     def get(self, key: str) -> Optional[str]:
         """
         Get a cached value if not expired.
@@ -54,17 +143,70 @@ class AICache:
         Returns:
             Cached value or None if not found or expired
         """
-        return self._db.get_ai_cache(self.cache_type, key)
+        entry = self._lookup(key)
+        return entry[0] if entry else None
 
-    def set(self, key: str, value: str) -> None:
+    def set(self, key: str, value: str, tokens: int = 0) -> None:
         """
         Set a cache value with timestamp.
 
         Args:
             key: Cache key
             value: Value to cache
+            tokens: Tokens spent producing the value
+        """
+        self._remember(key, (value, tokens, time.time()))
+        self._db.set_ai_cache(self.cache_type, key, value, tokens)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Optional[str]]],
+    ) -> Optional[str]:
+        """
+        Return a cached value, or produce it with a single shared call.
+
+        Concurrent callers asking for the same key while it is being computed
+        wait for that one request instead of starting their own. Empty or
+        None results are returned but not cached.
+
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the value on a miss
+
+        Returns:
+            Cached or computed value, or None if computing failed
         """
-        self._db.set_ai_cache(self.cache_type, key, value)
+        # Imported here: src.services imports src.utils, which imports this module
+        from src.services.llm_gateway import llm_gateway
+
+        entry = self._lookup(key)
+        if entry:
+            return entry[0]
+
+        slot = (self.cache_type, key)
+        pending = _in_flight.get(slot)
+        if pending is not None:
+            self._stats["misses"] -= 1
+            self._stats["coalesced"] += 1
+            value = await asyncio.shield(pending)
+            entry = _memory.get(slot)
+            if value and entry:
+                self._stats["tokens_saved"] += entry[1]
+            return value
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        _in_flight[slot] = future
+        value: Optional[str] = None
+        try:
+            with llm_gateway.track_usage() as spent:
+                value = await compute()
+            if value:
+                self.set(key, value, tokens=spent[0])
+            return value
+        finally:
+            _in_flight.pop(slot, None)
+            future.set_result(value)
 
     def clear(self) -> None:
         """Clear all cached values for this type."""
@@ -72,8 +214,42 @@ class AICache:
             "DELETE FROM ai_cache WHERE cache_type = ?",
             (self.cache_type,)
         )
+        for slot in [slot for slot in _memory if slot[0] == self.cache_type]:
+            del _memory[slot]
         logger.info("AI Cache Cleared", [("Type", self.cache_type)])
 
+    def _lookup(self, key: str) -> Optional[tuple[str, int, float]]:
+        """Find an unexpired entry in memory, then SQLite, updating counters."""
+        slot = (self.cache_type, key)
+        expiry_time = time.time() - (AI_CACHE_EXPIRATION_DAYS * 86400)
+
+        entry = _memory.get(slot)
+        if entry and entry[2] > expiry_time:
+            _memory.move_to_end(slot)
+            self._stats["memory_hits"] += 1
+            self._stats["tokens_saved"] += entry[1]
+            return entry
+        if entry:
+            del _memory[slot]
+
+        entry = self._db.get_ai_cache_entry(self.cache_type, key)
+        if entry:
+            self._remember(key, entry)
+            self._stats["db_hits"] += 1
+            self._stats["tokens_saved"] += entry[1]
+            return entry
+
+        self._stats["misses"] += 1
+        return None
+
+    def _remember(self, key: str, entry: tuple[str, int, float]) -> None:
+        """Keep an entry in the shared memory tier, evicting the oldest."""
+        slot = (self.cache_type, key)
+        _memory[slot] = entry
+        _memory.move_to_end(slot)
+        while len(_memory) > AI_CACHE_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
     # -------------------------------------------------------------------------
     # Title Cache Methods
     # -------------------------------------------------------------------------
@@ -102,7 +278,9 @@ class AICache:
         ])
         return None
 
-    def cache_title(self, article_id: str, original_title: str, ai_title: str) -> None:
+    def cache_title(
+        self, article_id: str, original_title: str, ai_title: str, tokens: int = 0
+    ) -> None:
         """
         Cache title for an article.
 
@@ -110,9 +288,10 @@ class AICache:
             article_id: Unique article identifier
             original_title: Original article title
             ai_title: AI-cleaned/translated title
+            tokens: Tokens spent generating the title
         """
         key = f"title:{article_id}"
-        self.set(key, f"{original_title}|||{ai_title}")
+        self.set(key, f"{original_title}|||{ai_title}", tokens)
 
     # -------------------------------------------------------------------------
     # Summary Cache Methods
@@ -142,7 +321,9 @@ class AICache:
         ])
         return None
 
-    def cache_summary(self, article_id: str, arabic_summary: str, english_summary: str) -> None:
+    def cache_summary(
+        self, article_id: str, arabic_summary: str, english_summary: str, tokens: int = 0
+    ) -> None:
         """
         Cache summary for an article.
 
@@ -150,9 +331,10 @@ class AICache:
             article_id: Unique article identifier
             arabic_summary: Arabic summary text
             english_summary: English summary text
+            tokens: Tokens spent generating the summaries
         """
         key = f"summary:{article_id}"
-        self.set(key, f"{arabic_summary}|||{english_summary}")
+        self.set(key, f"{arabic_summary}|||{english_summary}", tokens)
 
     # -------------------------------------------------------------------------
     # Team Tag Cache Methods (for soccer articles)
@@ -193,4 +375,4 @@ class AICache:
         self.set(key, team_tag)
 
 
-__all__ = ["AICache"]
+__all__ = ["AICache", "get_ai_cache_stats"]
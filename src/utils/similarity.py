@@ -10,10 +10,19 @@ Server: discord.gg/syria
 
 import re
 import math
-from collections import Counter
+import random
+import threading
+from collections import Counter, OrderedDict
+from hashlib import blake2b
 from typing import Optional
 
 from src.core.logger import logger
+from src.core.config import (
+    CONTENT_SIMILARITY_WINDOW,
+    CONTENT_SIMILARITY_MODE,
+    MINHASH_PERMUTATIONS,
+    LSH_BANDS,
+)
 
 
 # =============================================================================
@@ -26,6 +35,10 @@ SIMILARITY_THRESHOLD = 0.75
 # Minimum text length for meaningful comparison
 MIN_TEXT_LENGTH = 100
 
+# MinHash: Mersenne prime modulus and fixed seed so signatures are stable
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_SEED = 1966
+
 
 # =============================================================================
 # Text Processing
@@ -68,6 +81,19 @@ def _get_word_vector(text: str) -> Counter:
     return Counter(tokens)
 
 
+def word_counts(text: str) -> dict[str, int]:
+    """Token counts for a text, in the form stored alongside content_hashes."""
+    return dict(_get_word_vector(text))
+
+
+def _normalize(counts: dict[str, int]) -> dict[str, float]:
+    """Scale a count vector to unit length (empty dict if no tokens)."""
+    magnitude = math.sqrt(sum(v ** 2 for v in counts.values()))
+    if magnitude == 0:
+        return {}
+    return {token: count / magnitude for token, count in counts.items()}
+
+
 # =============================================================================
 # Similarity Calculation
 # =============================================================================
@@ -159,6 +185,212 @@ def is_duplicate_content(
     return (is_duplicate, highest_similarity, matching_index if is_duplicate else None)
 
 
+# =============================================================================
+# Similarity Index
+# =============================================================================
+
+class SimilarityIndex:
+    """
+    In-memory near-duplicate index over the most recent articles.
+
+    DESIGN: cosine_similarity re-tokenizes both texts for every pair, so
+    checking one candidate against the window cost N tokenizations plus N
+    Counter builds. Here each stored article is tokenized once, kept as a
+    unit-length sparse vector, and posted into an inverted index
+    (token -> {article: weight}). Scoring a candidate is then one sparse
+    matrix-vector product over the postings of its own tokens, i.e. every
+    article in the window is scored in a single pass.
+
+    With mode "lsh", articles also get a MinHash signature bucketed into
+    LSH bands; only articles sharing a band with the candidate are scored,
+    so the window can hold thousands of articles at near-constant cost.
+    Scores are the same cosine values either way.
+    """
+
+    def __init__(
+        self,
+        window: int = CONTENT_SIMILARITY_WINDOW,
+        mode: str = CONTENT_SIMILARITY_MODE,
+        permutations: int = MINHASH_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            window: Maximum number of articles kept (oldest evicted first)
+            mode: "exact" scores the whole window; "lsh" scores LSH candidates
+            permutations: MinHash signature length (lsh mode)
+            bands: LSH bands; permutations must be divisible by it (lsh mode)
+        """
+        self._window = max(1, window)
+        self._use_lsh = mode == "lsh"
+        self._bands = max(1, bands)
+        self._rows = max(1, permutations // self._bands)
+
+        rng = random.Random(_MINHASH_SEED)
+        self._perms = [
+            (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+            for _ in range(self._bands * self._rows)
+        ]
+
+        self._lock = threading.Lock()
+        self._docs: OrderedDict[str, dict[str, float]] = OrderedDict()
+        self._postings: dict[str, dict[str, float]] = {}
+        self._signatures: dict[str, list[tuple]] = {}
+        self._buckets: dict[tuple, set[str]] = {}
+
+        # Metrics
+        self.queries = 0
+        self.scored = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def add(self, article_id: str, counts: dict[str, int], text_length: int) -> None:
+        """
+        Add or refresh an article as the newest entry.
+
+        Args:
+            article_id: Stable article ID
+            counts: Token counts from word_counts() of the stored text
+            text_length: Length of the stored text (short texts never match)
+        """
+        with self._lock:
+            self._remove(article_id)
+            if text_length < MIN_TEXT_LENGTH:
+                return
+            vector = _normalize(counts)
+            if not vector:
+                return
+
+            self._docs[article_id] = vector
+            for token, weight in vector.items():
+                self._postings.setdefault(token, {})[article_id] = weight
+
+            if self._use_lsh:
+                bands = self._band_keys(vector.keys())
+                self._signatures[article_id] = bands
+                for key in bands:
+                    self._buckets.setdefault(key, set()).add(article_id)
+
+            while len(self._docs) > self._window:
+                self._remove(next(iter(self._docs)))
+
+    def remove(self, article_id: str) -> None:
+        """Drop an article from the index."""
+        with self._lock:
+            self._remove(article_id)
+
+    def _remove(self, article_id: str) -> None:
+        """Drop an article (lock held)."""
+        vector = self._docs.pop(article_id, None)
+        if vector is None:
+            return
+        for token in vector:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(article_id, None)
+                if not posting:
+                    del self._postings[token]
+        for key in self._signatures.pop(article_id, []):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(article_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        text: str,
+        exclude_id: Optional[str] = None,
+    ) -> tuple[float, Optional[str], int]:
+        """
+        Score a candidate text against the indexed articles.
+
+        Args:
+            text: Full candidate text
+            exclude_id: Article ID to ignore (the candidate itself)
+
+        Returns:
+            Tuple of (highest_similarity, matching_article_id, articles_scored)
+        """
+        if not text or len(text) < MIN_TEXT_LENGTH:
+            return (0.0, None, 0)
+        vector = _normalize(word_counts(text))
+        if not vector:
+            return (0.0, None, 0)
+
+        with self._lock:
+            self.queries += 1
+            scores: dict[str, float] = {}
+
+            if self._use_lsh:
+                candidates: set[str] = set()
+                for key in self._band_keys(vector.keys()):
+                    candidates |= self._buckets.get(key, set())
+                candidates.discard(exclude_id)
+                for article_id in candidates:
+                    doc = self._docs[article_id]
+                    if len(doc) < len(vector):
+                        scores[article_id] = sum(w * vector.get(t, 0.0) for t, w in doc.items())
+                    else:
+                        scores[article_id] = sum(w * doc.get(t, 0.0) for t, w in vector.items())
+                scored = len(candidates)
+            else:
+                # Sparse matrix-vector product over the candidate's postings
+                for token, weight in vector.items():
+                    posting = self._postings.get(token)
+                    if not posting:
+                        continue
+                    for article_id, doc_weight in posting.items():
+                        scores[article_id] = scores.get(article_id, 0.0) + weight * doc_weight
+                scores.pop(exclude_id, None)
+                scored = len(self._docs) - (1 if exclude_id in self._docs else 0)
+
+            self.scored += scored
+
+        if not scores:
+            return (0.0, None, scored)
+        best_id = max(scores, key=scores.get)
+        return (min(scores[best_id], 1.0), best_id, scored)
+
+    def _band_keys(self, tokens) -> list[tuple]:
+        """MinHash signature of a token set, split into LSH band keys."""
+        hashes = [
+            int.from_bytes(blake2b(token.encode(), digest_size=8).digest(), "big")
+            for token in tokens
+        ]
+        signature = [
+            min((a * h + b) % _MINHASH_PRIME for h in hashes)
+            for a, b in self._perms
+        ]
+        return [
+            (band, tuple(signature[band * self._rows:(band + 1) * self._rows]))
+            for band in range(self._bands)
+        ]
+
+    def get_stats(self) -> dict:
+        """Index size and query counters."""
+        with self._lock:
+            return {
+                "mode": "lsh" if self._use_lsh else "exact",
+                "articles": len(self._docs),
+                "window": self._window,
+                "tokens": len(self._postings),
+                "queries": self.queries,
+                "avg_scored": round(self.scored / self.queries, 1) if self.queries else 0.0,
+            }
+
+
 # =============================================================================
 # Module Export
 # =============================================================================
@@ -166,5 +398,7 @@ def is_duplicate_content(
 __all__ = [
     "cosine_similarity",
     "is_duplicate_content",
+    "word_counts",
+    "SimilarityIndex",
     "SIMILARITY_THRESHOLD",
 ]